@@ -10,15 +10,66 @@ Three Life Cycle Conditions with Multiple Wall Thickness Cases:
 Each WT type can be checked at Top and Bottom positions.
 """
 
-import math
-from dataclasses import dataclass, asdict
-from typing import Dict, Any, List, Tuple
-
-import pandas as pd
-import streamlit as st
+from __future__ import annotations
 
-from reference_data import asme_b36_10
-from calculations import calcs_weight
+import atexit
+import functools
+import importlib
+import json
+import math
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, replace
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from batch import fleet, report
+from batch.cache import cache_key
+from reference_data import asme_b36_10, pipe_catalog
+from engine import instrument, lifecycle
+from engine.analyzer import (
+    PipeProperties,
+    LoadingCondition,
+    LifeCycleAnalyzer,
+    build_verification_notes,
+    format_safety_factor,
+)
+from engine.columnar import MANIFEST, list_datasets, open_dataset, resolve_dataset, sweep_root
+from engine.progress import ProgressToken, format_progress
+from engine.lifecycle import (
+    GRADE_PROPERTIES,
+    DEFAULT_WATER_DENSITY,
+    DESIGN_LIFE_YEARS,
+    CORROSION_RATE_PER_YEAR,
+    MILL_TOLERANCE,
+    HYDROTEST_FACTOR,
+)
+
+
+class _LazyModule:
+    """Import a module on first attribute access (keeps `import app` light)"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+# UI libraries are only imported once the Streamlit app actually renders
+pd = _LazyModule("pandas")
+st = _LazyModule("streamlit")
+go = _LazyModule("plotly.graph_objects")
 
 # -----------------------------------------------------------------------------
 # Constants and reference data
@@ -28,40 +79,8 @@ COLOR_SECONDARY = "#3b82f6"
 COLOR_SUCCESS = "#10b981"
 COLOR_ALERT = "#ef4444"
 
-GRADE_PROPERTIES = {
-    # API 5L Grades (Specification for Line Pipe)
-    # Format: Grade: {SMYS (ksi), UTS (ksi)}
-    "A25": {"smys_psi": 25000, "uts_psi": 45000},
-    "A": {"smys_psi": 30000, "uts_psi": 48000},
-    "B": {"smys_psi": 35000, "uts_psi": 60000},
-    "X-42": {"smys_psi": 42000, "uts_psi": 60000},
-    "X-46": {"smys_psi": 46000, "uts_psi": 63000},
-    "X-52": {"smys_psi": 52000, "uts_psi": 66000},
-    "X-56": {"smys_psi": 56000, "uts_psi": 71000},
-    "X-60": {"smys_psi": 60000, "uts_psi": 75000},
-    "X-65": {"smys_psi": 65000, "uts_psi": 78000},
-    "X-70": {"smys_psi": 70000, "uts_psi": 82000},
-    "X-80": {"smys_psi": 80000, "uts_psi": 90000},
-    "X-90": {"smys_psi": 90000, "uts_psi": 100000},
-    "X-100": {"smys_psi": 100000, "uts_psi": 110000},
-    "X-120": {"smys_psi": 120000, "uts_psi": 130000},
-}
-
-MANUFACTURING_COLLAPSE_FACTOR = {
-    "SMLS": 0.70,
-    "ERW": 0.75,
-    "DSAW": 0.60,
-}
-
-DEFAULT_E_PSI = 2.9e7
-DEFAULT_POISSON = 0.30
-DEFAULT_WATER_DENSITY = 64.0  # lb/ft^3
-
-# Design life and corrosion parameters (from Team 8 data)
-DESIGN_LIFE_YEARS = 20
-CORROSION_RATE_PER_YEAR = 0.004  # inch/year
-MILL_TOLERANCE = 0.125  # 12.5% = wall thickness factor 0.875
-HYDROTEST_FACTOR = 1.25
+# Grades, collapse factors, material defaults, corrosion / mill tolerance and
+# hydrotest factors are shared with the vectorized engine (engine/lifecycle.py)
 
 TEAM8_REFERENCE = {
     "Multiphase Riser (ID 3)": {
@@ -104,1190 +123,217 @@ def schedule_name_for_thickness(od: float, wt: float) -> str:
     return "/".join(names)
 
 
-# -----------------------------------------------------------------------------
-# Data classes
-# -----------------------------------------------------------------------------
-@dataclass
-class PipeProperties:
-    od_in: float
-    wt_in: float
-    grade: str
-    manufacturing: str
-    design_category: str  # "Pipeline" or "Riser"
-    fluid_type: str  # Gas, Oil, Multiphase, Wet Gas
-    fluid_sg: float
-    smys_psi: float
-    uts_psi: float
-    ovality_type: str  # "Reel-lay" or "Other Type"
-    ovality: float
-    E_psi: float = DEFAULT_E_PSI
-    poisson: float = DEFAULT_POISSON
-
-
-@dataclass
-class LoadingCondition:
-    design_pressure_psi: float
-    shut_in_pressure_psi: float
-    shut_in_location: str  # "Subsea Wellhead" or "Top of Riser"
-    water_depth_m: float
-    riser_length_m: float  # For longitudinal tension calculation
-
-
-# -----------------------------------------------------------------------------
-# Life Cycle Analyzer
-# -----------------------------------------------------------------------------
-class LifeCycleAnalyzer:
-    """Analyzes all three life cycle conditions: Installation, Hydrotest, Operation"""
-    
-    def __init__(self, pipe: PipeProperties, load: LoadingCondition):
-        self.pipe = pipe
-        self.load = load
-
-    @staticmethod
-    def _ft_from_m(depth_m: float) -> float:
-        return depth_m * 3.28084
-
-    def external_pressure_psi(self) -> float:
-        """Calculate hydrostatic external pressure"""
-        depth_ft = self._ft_from_m(self.load.water_depth_m)
-        return DEFAULT_WATER_DENSITY * depth_ft / 144.0
-
-    def external_pressure_psi_for_position(self, position: str) -> float:
-        """
-        Calculate external pressure based on riser position
-
-        Parameters:
-        -----------
-        position : str
-            "Top" or "Bottom"
-
-        Returns:
-        --------
-        float : External pressure in psi
-
-        Top Position: Atmospheric only (14.7 psi)
-        Bottom Position: Atmospheric + Hydrostatic
-
-        Physical Basis:
-        - Top of riser is at sea surface → atmospheric pressure
-        - Bottom of riser is at water depth → atmospheric + hydrostatic
-        """
-        ATMOSPHERIC_PSI = 14.7
-
-        if position.lower() == "top":
-            return ATMOSPHERIC_PSI
-        else:  # bottom
-            depth_ft = self._ft_from_m(self.load.water_depth_m)
-            hydrostatic_psi = DEFAULT_WATER_DENSITY * depth_ft / 144.0
-            return ATMOSPHERIC_PSI + hydrostatic_psi
-
-    def calculate_mop(self) -> float:
-        """
-        Calculate MOP (Maximum Operating Pressure) per API RP 1111
-
-        MOP = Shut-in Pressure - Hydrostatic Head of Riser Contents
-
-        The hydrostatic head is the pressure exerted by the fluid column
-        inside the riser from bottom to top.
-
-        Formula:
-        Hydrostatic Head (psi) = (fluid_sg × water_density_pcf) × riser_length_ft / 144
-
-        Where:
-        - fluid_sg: Fluid specific gravity (dimensionless)
-        - water_density_pcf: 64 lb/ft³ (seawater)
-        - riser_length_ft: Riser vertical length in feet
-        - 144: Conversion factor from lb/ft² to psi
-
-        Returns:
-        --------
-        float : MOP in psi
-
-        Notes:
-        - MOP is only different from shut-in when shut-in location is at Subsea Wellhead
-        - When shut-in is at Top of Riser, MOP = shut-in pressure (no adjustment)
-        - MOP represents the pressure at top of riser when shut-in valve closes at bottom
-        """
-        # If shut-in location is at top, MOP = shut-in (no adjustment needed)
-        if self.load.shut_in_location == "Top of Riser":
-            return self.load.shut_in_pressure_psi
-
-        # Calculate hydrostatic head of riser contents
-        riser_length_ft = self._ft_from_m(self.load.riser_length_m)
-        fluid_density_pcf = self.pipe.fluid_sg * DEFAULT_WATER_DENSITY  # lb/ft³
-        hydrostatic_head_psi = (fluid_density_pcf * riser_length_ft) / 144.0
-
-        # MOP = Shut-in pressure at bottom - hydrostatic head
-        mop = self.load.shut_in_pressure_psi - hydrostatic_head_psi
-
-        return max(mop, 0.0)  # Ensure non-negative
-
-    def calculate_hydrotest_pressure(self, position: str = "Top") -> float:
-        """
-        Calculate Hydrotest Pressure per API RP 1111 Appendix C and Table C.3
-
-        Per API RP 1111 Appendix C:
-        - Hydrotest pressure accounts for hydrostatic head of test fluid
-        - Test pressure at top of riser = (Design × 1.25) - Hydrostatic Head
-        - Test pressure at bottom = Design × 1.25 (full test pressure)
-
-        Formula (from Appendix C Table C.3):
-        Pt_top = (Pd × 1.25) - (ρ × g × H / 144)
-
-        Where:
-        - Pd: Design pressure (psi)
-        - 1.25: Hydrotest factor (inverse of 0.8 design factor)
-        - ρ: Test fluid density (lb/ft³)
-        - g: Gravitational constant (included in density)
-        - H: Riser height (ft)
-        - 144: Conversion from lb/ft² to psi
-
-        Parameters:
-        -----------
-        position : str
-            "Top" or "Bottom" - riser position being tested
-
-        Returns:
-        --------
-        float : Hydrotest pressure in psi
-
-        Notes:
-        - TOP position: Pressure reduced by hydrostatic head of test fluid column
-        - BOTTOM position: Full test pressure (1.25 × design)
-        - Test fluid assumed same as operating fluid (fluid_sg)
-        - Follows API RP 1111 Appendix C Example Calculation methodology
-        """
-        # Base hydrotest pressure (1.25 × design pressure)
-        base_hydrotest_pressure = self.load.design_pressure_psi * HYDROTEST_FACTOR
-
-        # For BOTTOM position, use full test pressure
-        if position.lower() == "bottom":
-            return base_hydrotest_pressure
-
-        # For TOP position, subtract hydrostatic head of test fluid
-        # (similar to MOP calculation but for test fluid)
-        riser_length_ft = self._ft_from_m(self.load.riser_length_m)
-
-        # Test fluid density (assuming test fluid same as operating fluid)
-        test_fluid_density_pcf = self.pipe.fluid_sg * DEFAULT_WATER_DENSITY  # lb/ft³
-
-        # Hydrostatic head of test fluid column
-        hydrostatic_head_psi = (test_fluid_density_pcf * riser_length_ft) / 144.0
-
-        # Hydrotest pressure at top = Base test pressure - Hydrostatic head
-        hydrotest_top = base_hydrotest_pressure - hydrostatic_head_psi
-
-        return max(hydrotest_top, 0.0)  # Ensure non-negative
-
-    def calculate_internal_pressure_at_position(self, position: str) -> float:
-        """
-        Calculate internal pressure at a specific riser position based on wellhead location.
-
-        This handles the hydrostatic pressure variation along the riser.
-
-        Parameters:
-        -----------
-        position : str
-            "Top" or "Bottom" - riser position being analyzed
-
-        Returns:
-        --------
-        float : Internal pressure in psi at the specified position
-
-        Logic:
-        ------
-        Case 1: Wellhead at "Subsea Wellhead" (Bottom of Riser)
-            - Bottom: Pi = Shut-in Pressure (full pressure at wellhead)
-            - Top: Pi = Shut-in Pressure - Hydrostatic Head of Riser Contents (MOP)
-
-        Case 2: Wellhead at "Top of Riser"
-            - Top: Pi = Shut-in Pressure (full pressure at wellhead)
-            - Bottom: Pi = Shut-in Pressure + Hydrostatic Head of Riser Contents
-        """
-        riser_length_ft = self._ft_from_m(self.load.riser_length_m)
-        fluid_density_pcf = self.pipe.fluid_sg * DEFAULT_WATER_DENSITY  # lb/ft³
-        hydrostatic_head_psi = (fluid_density_pcf * riser_length_ft) / 144.0
-
-        if self.load.shut_in_location == "Top of Riser":
-            # Wellhead at top: pressure increases going down
-            if position.lower() == "top":
-                return self.load.shut_in_pressure_psi
-            else:  # bottom
-                return self.load.shut_in_pressure_psi + hydrostatic_head_psi
-        else:  # "Subsea Wellhead" - Wellhead at bottom
-            # Wellhead at bottom: pressure decreases going up
-            if position.lower() == "bottom":
-                return self.load.shut_in_pressure_psi
-            else:  # top
-                return max(self.load.shut_in_pressure_psi - hydrostatic_head_psi, 0.0)
-
-    def get_internal_pressure_for_check(self, condition_name: str, check_type: str, position: str = "Top") -> float:
-        """
-        Determine internal pressure based on condition, check type, and position
-
-        Parameters:
-        -----------
-        condition_name : str
-            "Installation", "Hydrotest", or "Operation"
-        check_type : str
-            "burst", "collapse", "propagation", "hoop", "longitudinal", "combined"
-        position : str
-            "Top" or "Bottom" - riser position being analyzed
-
-        Returns:
-        --------
-        float : Internal pressure in psi
-
-        CRITICAL LOGIC FOR OPERATION CONDITION:
-
-        Wellhead Location affects internal pressure distribution:
-
-        Case 1: Wellhead at "Subsea Wellhead" (Bottom)
-            - Bottom Position: Higher internal pressure (at wellhead)
-            - Top Position: Lower internal pressure (MOP = shut-in - hydrostatic head)
+STANDARD_WT_PROGRESS_STEPS = 10   # progress updates of a Standard Thicknesses job
 
-        Case 2: Wellhead at "Top of Riser"
-            - Top Position: Shut-in pressure (at wellhead)
-            - Bottom Position: Higher internal pressure (shut-in + hydrostatic head)
 
-        Pressure Selection by Check Type at Bottom Position:
-        - Strength checks (burst, hoop, longitudinal, combined) → Use DESIGN PRESSURE
-        - Stability checks (collapse, propagation) → Use position-dependent internal pressure
-        """
-        if condition_name == "Installation":
-            # Empty pipe during installation
-            return 0.0
-
-        elif condition_name == "Hydrotest":
-            # Position-dependent hydrotest pressure per API RP 1111 Appendix C
-            # TOP: (Design × 1.25) - Hydrostatic Head of Test Fluid
-            # BOTTOM: Design × 1.25 (full test pressure)
-            return self.calculate_hydrotest_pressure(position)
-
-        elif condition_name == "Operation":
-            # CRITICAL: Position and wellhead-location dependent pressure logic
-
-            # Calculate position-dependent internal pressure
-            position_pressure = self.calculate_internal_pressure_at_position(position)
-
-            # TOP POSITION: Always use position-dependent pressure (MOP or shut-in based on wellhead loc)
-            if position.lower() == "top":
-                return position_pressure
-
-            # BOTTOM POSITION: Check-type dependent
-            else:
-                # Strength checks (burst, hoop, longitudinal, combined) - use design pressure
-                if check_type in ["burst", "hoop", "longitudinal", "combined"]:
-                    return self.load.design_pressure_psi
-
-                # Stability checks (collapse, propagation) - use position-dependent pressure
-                elif check_type in ["collapse", "propagation"]:
-                    return position_pressure
-
-        return 0.0
-
-    def calculate_longitudinal_load(self, wt_eff: float, p_internal: float,
-                                     p_external: float, condition_name: str,
-                                     position: str) -> Dict[str, Any]:
-        """
-        Calculate longitudinal tension per API RP 1111 Section 4.3.1.1
-
-        CRITICAL CHANGE: Position-dependent applied tension
-
-        Longitudinal Load Design:
-        T_eff = T_a - P_i × A_i + P_o × A_o
+def evaluate_standard_thicknesses(base_pipe: PipeProperties, load: LoadingCondition,
+                                  progress: Optional[ProgressToken] = None) -> pd.DataFrame:
+    """
+    Evaluate all standard thicknesses per ASME B36.10
+
+    All thicknesses x 16 sub-conditions are checked in vectorized engine
+    calls (engine.lifecycle) instead of one run_all_conditions each. With a
+    progress token, the thicknesses go in about STANDARD_WT_PROGRESS_STEPS
+    vectorized chunks, the token advances by each chunk's length and a
+    cancelled run returns the thicknesses evaluated so far; without one, all
+    of them go in a single call.
+    """
+    rows = pipe_catalog.rows_for_od(base_pipe.od_in)
+    if len(rows) == 0:
+        return pd.DataFrame()
 
-        Acceptance Criterion:
-        T_eff ≤ 0.60 × T_y
+    if progress is not None and progress.total is None:
+        progress.add_total(len(rows))
+    designs = lifecycle.thickness_sweep_arrays(base_pipe, load, rows["wt"])
+    # An OD lists ~20 thicknesses: default-sized chunks would report 0 -> 100% in one step
+    chunk_size = max(1, len(rows) // STANDARD_WT_PROGRESS_STEPS) if progress is not None else len(rows)
+    summaries = lifecycle.summarize_in_chunks(designs, chunk_size=chunk_size, progress=progress)
 
-        Position Effects:
-        - Top: T_a = void_submerged_weight × riser_length (maximum tension)
-        - Bottom: T_a = 0 (supported by mudline/seabed)
+    records: List[Dict[str, Any]] = []
+    for wt, schedule, summary in zip(rows["wt"].tolist(), rows["schedules"].tolist(), summaries):
+        min_sf = summary["min_sf"]
+        records.append({
+            "WT (in)": wt,
+            "Schedule": schedule,
+            "Limiting Condition": summary["limiting_condition"],
+            "Limiting Check": summary["limiting_check"],
+            "Safety Factor": format_safety_factor(min_sf),
+            "Utilization (%)": 0 if min_sf == float("inf") else round(100 / min_sf, 1),
+            "Status": "PASS" if summary["all_pass"] else "FAIL",
+        })
 
-        Where:
-        - T_a: Applied axial tension from self-weight (lb)
-        - T_eff: Effective tension accounting for pressure end-cap forces
-        - T_y: Yield tension = SMYS × A_steel
-        - P_i: Internal pressure (position-specific)
-        - P_o: External pressure (position-specific)
-        - A_i: Internal cross-sectional area
-        - A_o: External cross-sectional area
+    return pd.DataFrame(records)
 
-        BUOYANCY NOTE: void_submerged_weight already accounts for buoyancy
-        void_submerged = dry_weight - (water_density × displaced_volume)
-        """
-        # Calculate cross-sectional areas (in²)
-        od = self.pipe.od_in
-        id_val = od - 2 * wt_eff
-
-        a_outer = math.pi / 4 * od**2  # External area
-        a_inner = math.pi / 4 * id_val**2  # Internal area
-        a_steel = a_outer - a_inner  # Steel cross-section
-
-        # Calculate pipe weights using effective WT
-        weights = calcs_weight.calculate_pipe_weights(
-            od_inches=od,
-            wt_inches=wt_eff,
-            fluid_sg=self.pipe.fluid_sg,
-            use_seawater=True
-        )
 
-        # Applied tension T_a from self-weight - POSITION DEPENDENT
-        # BUOYANCY is accounted for in void_submerged_weight_plf
-        void_submerged_plf = weights['void_submerged_weight_plf']
-
-        if position.lower() == "top":
-            # Top of riser: Full tension from entire suspended weight
-            riser_length_ft = self._ft_from_m(self.load.riser_length_m)
-            t_a_lb = void_submerged_plf * riser_length_ft
-            riser_length_ft_display = riser_length_ft
-        else:  # bottom
-            # Bottom of riser: Supported by mudline/seabed
-            t_a_lb = 0.0
-            riser_length_ft_display = 0.0
-        
-        # Pressure end-cap forces
-        # Internal pressure creates upward force (reduces tension)
-        # External pressure creates downward force (increases tension)
-        force_internal_lb = p_internal * a_inner  # lb (reduces tension)
-        force_external_lb = p_external * a_outer  # lb (increases tension)
-        
-        # Effective tension (lb)
-        t_eff_lb = t_a_lb - force_internal_lb + force_external_lb
-        
-        # Yield tension (lb)
-        t_y_lb = self.pipe.smys_psi * a_steel
-        
-        # Allowable tension per API RP 1111: 0.60 × T_y
-        allowable_tension_lb = 0.60 * t_y_lb
-        
-        # Safety factor
-        if t_eff_lb <= 0:
-            # Compression case (not covered by this check)
-            safety_factor = float('inf')
-            passes = True
-            status = "Compression (N/A)"
-        else:
-            safety_factor = allowable_tension_lb / t_eff_lb
-            passes = safety_factor >= 1.0
-            status = "PASS" if passes else "FAIL"
-        
-        # Axial stress in pipe wall (psi)
-        axial_stress_psi = t_eff_lb / a_steel if a_steel > 0 else 0
-        
-        return {
-            "condition": condition_name,
-            "position": position,
-            "t_a_applied_lb": t_a_lb,
-            "t_a_applied_kips": t_a_lb / 1000,
-            "force_internal_lb": force_internal_lb,
-            "force_external_lb": force_external_lb,
-            "t_eff_effective_lb": t_eff_lb,
-            "t_eff_effective_kips": t_eff_lb / 1000,
-            "t_y_yield_lb": t_y_lb,
-            "t_y_yield_kips": t_y_lb / 1000,
-            "allowable_tension_lb": allowable_tension_lb,
-            "allowable_tension_kips": allowable_tension_lb / 1000,
-            "axial_stress_psi": axial_stress_psi,
-            "axial_stress_ksi": axial_stress_psi / 1000,
-            "safety_factor": safety_factor,
-            "passes": passes,
-            "status": status,
-            "criterion": "T_eff ≤ 0.60 × T_y (API RP 1111 Section 4.3.1.1)",
-            "a_outer_in2": a_outer,
-            "a_inner_in2": a_inner,
-            "a_steel_in2": a_steel,
-            "void_submerged_plf": void_submerged_plf,
-            "riser_length_ft": riser_length_ft_display,
-        }
+def find_closest_passing_standard_wt(base_pipe: PipeProperties, load: LoadingCondition, 
+                                      input_wt: float) -> Tuple[float, str]:
+    """
+    Find closest standard thickness >= input_wt that passes all conditions.
+    Uses floor-to-up approach (round up from input).
+    """
+    rows = pipe_catalog.rows_for_od(base_pipe.od_in)
+    if len(rows) == 0:
+        return None, "No standard thicknesses available"
     
-    def calculate_combined_load(self, wt_eff: float, p_internal: float,
-                                 p_external: float, condition_name: str,
-                                 position: str) -> Dict[str, Any]:
-        """
-        Calculate combined loading per API RP 1111 Section 4.3.1.2
-
-        Combined Load Design:
-        √[(P_i - P_o)² / P_b²] + (T_eff / T_y)² ≤ Design Factor
-
-        Design Factors:
-        - 0.90 for operational loads
-        - 0.96 for extreme loads (storm, earthquake)
-        - 0.96 for hydrotest loads
-
-        Position affects longitudinal component through T_eff calculation.
-
-        This is the most comprehensive check that combines:
-        1. Pressure loading (burst/collapse)
-        2. Longitudinal tension (from weight and pressure end-caps, position-dependent)
-        """
-        # Get longitudinal load results with position
-        longitudinal = self.calculate_longitudinal_load(
-            wt_eff, p_internal, p_external, condition_name, position
-        )
-        
-        # Get burst pressure using class method
-        burst_result = self.compute_burst(p_internal, p_external, wt_eff)
-        p_b = burst_result["pb"]  # Burst pressure capacity
-        
-        # Differential pressure (positive = burst, negative = collapse)
-        p_diff = p_internal - p_external
-        
-        # Pressure component: (P_i - P_o) / P_b
-        # For collapse cases (negative p_diff), we still use absolute value
-        # per API RP 1111 interpretation
-        pressure_component = (p_diff / p_b) if p_b > 0 else 0
-        
-        # Tension component: T_eff / T_y
-        t_eff = longitudinal["t_eff_effective_lb"]
-        t_y = longitudinal["t_y_yield_lb"]
-        tension_component = (t_eff / t_y) if t_y > 0 else 0
-        
-        # Combined load ratio
-        combined_ratio = math.sqrt(pressure_component**2 + tension_component**2)
-        
-        # Determine design factor based on condition
-        if condition_name == "Operation":
-            design_factor = 0.90  # Operational loads
-            factor_description = "0.90 (Operational)"
-        elif condition_name == "Hydrotest":
-            design_factor = 0.96  # Hydrotest loads
-            factor_description = "0.96 (Hydrotest)"
-        else:  # Installation
-            design_factor = 0.96  # Extreme loads (conservative)
-            factor_description = "0.96 (Extreme)"
-        
-        # Safety factor (design_factor / combined_ratio)
-        if combined_ratio > 0:
-            safety_factor = design_factor / combined_ratio
-        else:
-            safety_factor = float('inf')
-        
-        passes = combined_ratio <= design_factor
-        status = "PASS" if passes else "FAIL"
-        
-        return {
-            "condition": condition_name,
-            "position": position,
-            "p_internal_psi": p_internal,
-            "p_external_psi": p_external,
-            "p_diff_psi": p_diff,
-            "p_b_burst_psi": p_b,
-            "pressure_component": pressure_component,
-            "t_eff_lb": t_eff,
-            "t_y_lb": t_y,
-            "tension_component": tension_component,
-            "combined_ratio": combined_ratio,
-            "design_factor": design_factor,
-            "factor_description": factor_description,
-            "safety_factor": safety_factor,
-            "passes": passes,
-            "status": status,
-            "criterion": f"√[(P/Pb)² + (T/Ty)²] ≤ {design_factor} (API RP 1111 Section 4.3.1.2)",
-        }
-
-    def effective_wall_thickness(self, use_mill_tolerance: bool, use_corrosion: bool) -> float:
-        """
-        Calculate effective wall thickness per life cycle condition
-        - Installation/Hydrotest: WT × 0.875 (mill tolerance only)
-        - Operation: (WT × 0.875) - (corrosion_rate × design_life)
-        """
-        wt = self.pipe.wt_in
-        
-        # Apply mill tolerance (12.5% reduction = 0.875 factor)
-        if use_mill_tolerance:
-            wt = wt * (1.0 - MILL_TOLERANCE)
-        
-        # Apply corrosion (only for operation: rate × design life)
-        if use_corrosion:
-            corrosion_total = CORROSION_RATE_PER_YEAR * DESIGN_LIFE_YEARS
-            wt = wt - corrosion_total
-        
-        return max(wt, 0.001)  # Ensure positive
-
-    def _hoop_design_factor(self) -> float:
-        """Design factor per ASME B31.4/B31.8 based on category and fluid type"""
-        if self.pipe.design_category.lower() == "pipeline":
-            return 0.72
-        # Riser design factors
-        if self.pipe.fluid_type.lower() in ["gas", "wet gas"]:
-            return 0.50
-        if self.pipe.fluid_type.lower() in ["oil", "multiphase"]:
-            return 0.60
-        return 0.72
-
-    @staticmethod
-    def _burst_design_factor(design_category: str) -> float:
-        """Burst design factor per API RP 1111 Section 4.3.1"""
-        return 0.90 if design_category.lower() == "pipeline" else 0.75
-
-    def compute_burst(self, p_internal: float, p_external: float, wt_eff: float) -> Dict[str, Any]:
-        """
-        Burst pressure check per API RP 1111 Section 4.3.1
-
-        Formula: P_b = 0.45 × (SMYS + UTS) × ln(D / D_i)
-
-        Criterion: (P_i - P_o) ≤ f_d × f_e × f_t × P_b
-
-        Where:
-        - f_d = Design factor (0.75 for Riser/Flowline, 0.90 for Pipeline)
-        - f_e = Weld joint factor (1.0 for seamless)
-        - f_t = Temperature derating factor (1.0 for ambient)
-        - D_i = Inner diameter = D - 2t
-        """
-        fd = self._burst_design_factor(self.pipe.design_category)
-        fe = 1.0  # Weld joint factor
-        ft = 1.0  # Temperature factor
-        od = self.pipe.od_in
-        id_val = od - 2 * wt_eff
-        smys = self.pipe.smys_psi
-        uts = self.pipe.uts_psi
-
-        # Burst pressure per API RP 1111: P_b = 0.45 × (SMYS + UTS) × ln(D / D_i)
-        pb = 0.45 * (smys + uts) * math.log(od / id_val) if id_val > 0 else 0.0
-
-        # Allowable burst pressure
-        allowable_burst = fd * fe * ft * pb
-
-        # Net internal pressure
-        delta_p = p_internal - p_external
-
-        if delta_p <= 0:
-            sf = float("inf")
-        else:
-            sf = allowable_burst / delta_p
-
-        return {
-            "name": "Burst",
-            "pb": pb,
-            "allowable_burst": allowable_burst,
-            "safety_factor": sf,
-            "utilization": 0 if sf == float("inf") else 1 / sf,
-            "pass_fail": sf >= 1.0,
-            "details": {
-                "design_factor": fd,
-                "joint_factor": fe,
-                "temperature_factor": ft,
-                "delta_p": delta_p,
-                "p_internal": p_internal,
-                "p_external": p_external,
-                "od": od,
-                "id": id_val,
-                "wt_eff": wt_eff,
-                "smys": smys,
-                "uts": uts,
-            },
-        }
-
-    def compute_collapse(self, p_internal: float, p_external: float, wt_eff: float) -> Dict[str, Any]:
-        """
-        External collapse check per API RP 1111 Section 4.3.2
-
-        Formulas:
-        - Yield Collapse: P_y = 2 × SMYS × (t/D)
-        - Elastic Collapse: P_e = 2 × E × (t/D)³ / (1 - ν²)
-        - Critical Collapse (Murphy-Langner): P_c = P_y × P_e / √(P_y² + P_e²)
-
-        Criterion: (P_o - P_i) ≤ f_o × P_c
-
-        Where:
-        - f_o = Collapse factor (0.70 for SMLS/ERW, 0.60 for DSAW)
-        """
-        od = self.pipe.od_in
-        smys = self.pipe.smys_psi
-        E = self.pipe.E_psi
-        nu = self.pipe.poisson
-        ovality = self.pipe.ovality
-        f_o = MANUFACTURING_COLLAPSE_FACTOR.get(self.pipe.manufacturing.upper(), 0.70)
-
-        t_over_d = wt_eff / od
-        d_over_t = od / wt_eff if wt_eff > 0 else float('inf')
-
-        # Yield collapse: P_y = 2 × SMYS × (t/D)
-        py = 2 * smys * t_over_d
-
-        # Elastic collapse (simplified): P_e = 2 × E × (t/D)³ / (1 - ν²)
-        pe = (2 * E * (t_over_d ** 3)) / (1 - nu ** 2)
-
-        # Critical collapse: P_c = P_y × P_e / √(P_y² + P_e²)
-        pc = (py * pe) / math.sqrt(py ** 2 + pe ** 2) if (py > 0 and pe > 0) else 0.0
-
-        # Allowable collapse pressure
-        allowable_collapse = f_o * pc
-
-        # Determine collapse mode
-        if py > 0 and pe > 0:
-            py_pe_ratio = py / pe
-            if py_pe_ratio < 1.5:
-                collapse_mode = "Elastic"
-            elif py_pe_ratio < 4.0:
-                collapse_mode = "Plastic"
-            else:
-                collapse_mode = "Yield"
-        else:
-            py_pe_ratio = 0.0
-            collapse_mode = "N/A"
-
-        # Net external pressure
-        delta_p = p_external - p_internal
-        if delta_p <= 0:
-            sf = float("inf")
-        else:
-            sf = allowable_collapse / delta_p
-
-        return {
-            "name": "Collapse",
-            "py": py,
-            "pe": pe,
-            "pc": pc,
-            "allowable_collapse": allowable_collapse,
-            "collapse_factor": f_o,
-            "collapse_mode": collapse_mode,
-            "ovality": ovality,
-            "safety_factor": sf,
-            "utilization": 0 if sf == float("inf") else 1 / sf,
-            "pass_fail": sf >= 1.0,
-            "details": {
-                "delta_p": delta_p,
-                "p_internal": p_internal,
-                "p_external": p_external,
-                "od": od,
-                "wt_eff": wt_eff,
-                "t_over_d": t_over_d,
-                "d_over_t": d_over_t,
-                "smys": smys,
-                "E": E,
-                "poisson": nu,
-                "py_pe_ratio": py_pe_ratio,
-            },
-        }
-
-    def compute_propagation(self, p_internal: float, p_external: float, wt_eff: float) -> Dict[str, Any]:
-        """
-        Propagation buckling check per API RP 1111 Section 4.3.2.3
-
-        Formula: P_p = 35 × SMYS × (t/D)^2.5
-
-        Criterion: (P_o - P_i) ≤ f_p × P_p
-
-        Where:
-        - f_p = 0.80 (Propagation buckling design factor)
-        - P_p = Propagation pressure (the pressure at which a buckle propagates)
-
-        Note: Propagation buckling arrestors may be required if net external
-        pressure exceeds this limit.
-        """
-        od = self.pipe.od_in
-        smys = self.pipe.smys_psi
-        fp = 0.80
-        t_over_d = wt_eff / od
-        d_over_t = od / wt_eff if wt_eff > 0 else float('inf')
-
-        # Propagation pressure: P_p = 35 × SMYS × (t/D)^2.5
-        pp = 35 * smys * (t_over_d ** 2.5)
-
-        # Allowable propagation pressure
-        allowable_prop = fp * pp
-
-        # Net external pressure
-        delta_p = p_external - p_internal
-
-        if delta_p <= 0:
-            sf = float("inf")
-        else:
-            sf = allowable_prop / delta_p
-
-        return {
-            "name": "Propagation",
-            "pp": pp,
-            "allowable_prop": allowable_prop,
-            "design_factor": fp,
-            "safety_factor": sf,
-            "utilization": 0 if sf == float("inf") else 1 / sf,
-            "pass_fail": sf >= 1.0,
-            "details": {
-                "delta_p": delta_p,
-                "p_internal": p_internal,
-                "p_external": p_external,
-                "od": od,
-                "wt_eff": wt_eff,
-                "t_over_d": t_over_d,
-                "d_over_t": d_over_t,
-                "smys": smys,
-            },
-        }
-
-    def compute_hoop(self, p_internal: float, p_external: float, wt_eff: float) -> Dict[str, Any]:
-        """
-        Hoop stress check per ASME B31.4 Section 402.3
-
-        Formula (Barlow for thin-wall): S_H = (P_i - P_o) × D / (2 × t)
-
-        Where:
-        - S_H = Hoop stress (psi)
-        - P_i = Internal pressure (psi)
-        - P_o = External pressure (psi)
-        - D = Outside diameter (inches)
-        - t = Wall thickness (inches)
-
-        Criterion: S_H ≤ F × SMYS
+    # Catalog rows are sorted by WT: keep those >= input_wt
+    candidates = rows[rows["wt"] >= input_wt]
+    if len(candidates) == 0:
+        return None, "No standard thickness >= input thickness"
+    
+    # Evaluate every candidate at once and take the smallest that passes
+    result = lifecycle.evaluate_designs(lifecycle.thickness_sweep_arrays(base_pipe, load, candidates["wt"]))
+    passing = np.flatnonzero(result["all_pass"])
+    if len(passing):
+        row = candidates[passing[0]]
+        return float(row["wt"]), str(row["schedules"])
+    
+    return None, "No passing standard thickness found"
 
-        SPECIAL CASE: For Installation condition (empty pipe, Pi=0),
-        the hoop stress is caused by external pressure (compressive):
-        S_H = P_o × D / (2 × t)
 
-        This equation is applicable for D/t ≥ 20 (thin-wall assumption).
-        """
-        od = self.pipe.od_in
-        smys = self.pipe.smys_psi
-        design_factor = self._hoop_design_factor()
-        d_over_t = od / wt_eff if wt_eff > 0 else float('inf')
-
-        # Calculate differential pressure (always needed for details)
-        delta_p = p_internal - p_external
-
-        # Calculate hoop stress based on pressure conditions
-        if wt_eff <= 0 or od <= wt_eff:
-            hoop_stress = float("inf")
-        elif p_internal <= 0:
-            # Installation condition: empty pipe (Pi = 0)
-            # Hoop stress from external pressure (compressive)
-            # S_H = P_o × D / (2 × t)
-            hoop_stress = p_external * od / (2 * wt_eff)
-        else:
-            # Normal operation: differential pressure
-            # S_H = (P_i - P_o) × D / (2 × t)
-            if delta_p <= 0:
-                # External pressure exceeds internal - use absolute external pressure
-                hoop_stress = abs(delta_p) * od / (2 * wt_eff)
-            else:
-                hoop_stress = delta_p * od / (2 * wt_eff)
+# -----------------------------------------------------------------------------
+# Cached analysis
+# -----------------------------------------------------------------------------
+# Analyses are cached per process (shared by every session) keyed by a
+# canonical hash of the inputs, so reruns and other engineers opening the same
+# riser reuse the result instead of recomputing it.
+ANALYSIS_CACHE_ENTRIES = 256
+ANALYSIS_CACHE_TTL_SECONDS = 24 * 3600
 
-        # Allowable stress: S_allowable = F × SMYS
-        allowable = design_factor * smys
+_cached_analysis = None
 
-        # Safety factor: SF = S_allowable / S_H
-        if hoop_stress > 0:
-            sf = allowable / hoop_stress
-        else:
-            sf = float("inf")
-
-        return {
-            "name": "Hoop Stress",
-            "hoop_stress": hoop_stress,
-            "design_factor": design_factor,
-            "allowable": allowable,
-            "safety_factor": sf,
-            "utilization": 0 if sf == float("inf") else 1 / sf,
-            "pass_fail": sf >= 1.0,
-            "details": {
-                "delta_p": delta_p,
-                "p_internal": p_internal,
-                "p_external": p_external,
-                "od": od,
-                "wt_eff": wt_eff,
-                "d_over_t": d_over_t,
-                "smys": smys,
-            },
-        }
 
-    def analyze_condition(self, condition_name: str, p_internal: float, 
-                          use_mill_tolerance: bool, use_corrosion: bool) -> Dict[str, Any]:
-        """Analyze one life cycle condition"""
-        p_external = self.external_pressure_psi()
-        wt_eff = self.effective_wall_thickness(use_mill_tolerance, use_corrosion)
-        
-        # Calculate pipe weights for this condition
-        weights = calcs_weight.calculate_pipe_weights(
-            od_inches=self.pipe.od_in,
-            wt_inches=wt_eff,  # Use effective WT for this condition
-            fluid_sg=self.pipe.fluid_sg,
-            use_seawater=True
-        )
+def analysis_key(pipe: PipeProperties, load: LoadingCondition) -> str:
+    """
+    Canonical hash of an analysis input.
 
-        burst = self.compute_burst(p_internal, p_external, wt_eff)
-        collapse = self.compute_collapse(p_internal, p_external, wt_eff)
-        propagation = self.compute_propagation(p_internal, p_external, wt_eff)
-        hoop = self.compute_hoop(p_internal, p_external, wt_eff)
-        
-        # NEW: Calculate longitudinal tension (Section 4.3.1.1)
-        longitudinal = self.calculate_longitudinal_load(wt_eff, p_internal, condition_name)
-        
-        # NEW: Calculate combined loading (Section 4.3.1.2)
-        combined = self.calculate_combined_load(wt_eff, p_internal, condition_name)
+    Uses the batch result-cache key (sorted-key JSON of the dataclass fields,
+    calculation version stamp and active pipe catalog), so equal inputs hash
+    equally whatever their origin and a code change never returns a stale result.
+    """
+    return cache_key(asdict(pipe), asdict(load), kind='app-analysis')
 
-        checks = [burst, collapse, propagation, hoop]
-        limiting = min(
-            checks,
-            key=lambda c: c["safety_factor"] if c["safety_factor"] != float("inf") else float("inf"),
-        )
-        # Update all_pass to include longitudinal and combined checks
-        all_pass = all(c["pass_fail"] for c in checks) and longitudinal["passes"] and combined["passes"]
-
-        return {
-            "condition_name": condition_name,
-            "p_internal_psi": p_internal,
-            "p_external_psi": p_external,
-            "wt_nominal": self.pipe.wt_in,
-            "wt_effective": wt_eff,
-            "mill_tolerance_applied": use_mill_tolerance,
-            "corrosion_applied": use_corrosion,
-            "weights": weights,
-            "checks": checks,
-            "longitudinal": longitudinal,
-            "combined": combined,
-            "all_pass": all_pass,
-            "limiting": limiting,
-        }
 
-    def analyze_condition_at_position(
-        self,
-        condition_name: str,  # "Installation", "Hydrotest", "Operation"
-        position: str,        # "Top" or "Bottom"
-        use_mill_tolerance: bool,
-        use_corrosion: bool
-    ) -> Dict[str, Any]:
-        """
-        Analyze one life cycle condition at a specific riser position
-
-        This is the NEW core analysis method that replaces analyze_condition()
-        for the 6-condition analysis (3 stages × 2 positions).
-
-        Key Differences from Old Method:
-        1. Position-dependent external pressure (Po)
-        2. Check-type-dependent internal pressure (Pi) for Operation
-        3. Position-dependent axial loading (T_a)
-
-        Parameters:
-        -----------
-        condition_name : str
-            "Installation", "Hydrotest", or "Operation"
-        position : str
-            "Top" or "Bottom"
-        use_mill_tolerance : bool
-            Apply 12.5% mill tolerance to WT
-        use_corrosion : bool
-            Apply corrosion allowance to WT
-
-        Returns:
-        --------
-        Dict containing:
-        - Position-specific pressures for each check
-        - All 7 check results
-        - Overall pass/fail status
-        """
-        # Calculate position-specific external pressure
-        p_external = self.external_pressure_psi_for_position(position)
-
-        # Calculate effective wall thickness (unchanged logic)
-        wt_eff = self.effective_wall_thickness(use_mill_tolerance, use_corrosion)
-
-        # Calculate pipe weights for this condition
-        weights = calcs_weight.calculate_pipe_weights(
-            od_inches=self.pipe.od_in,
-            wt_inches=wt_eff,
-            fluid_sg=self.pipe.fluid_sg,
-            use_seawater=True
-        )
+def _analyze(key: str, _pipe: PipeProperties, _load: LoadingCondition) -> Dict[str, Any]:
+    """Run all life cycle conditions (Streamlit hashes only key: `_` args are skipped)"""
+    instrument.cache_miss("app.analysis")
+    return LifeCycleAnalyzer(_pipe, _load).run_all_conditions()
 
-        # Run pressure-only checks with check-type-specific internal pressure
-        # NOW WITH MOP SUPPORT: position affects collapse/propagation pressures
 
-        # 1. Burst check - uses design pressure (no MOP)
-        p_i_burst = self.get_internal_pressure_for_check(condition_name, "burst", position)
-        burst = self.compute_burst(p_i_burst, p_external, wt_eff)
+def run_analysis(pipe: PipeProperties, load: LoadingCondition) -> Dict[str, Any]:
+    """
+    LifeCycleAnalyzer(pipe, load).run_all_conditions() through st.cache_data.
 
-        # 2. Collapse check - uses shut-in/MOP depending on position
-        p_i_collapse = self.get_internal_pressure_for_check(condition_name, "collapse", position)
-        collapse = self.compute_collapse(p_i_collapse, p_external, wt_eff)
+    The cache holds at most ANALYSIS_CACHE_ENTRIES results for
+    ANALYSIS_CACHE_TTL_SECONDS; each hit returns a private copy. It is set up
+    on first use so that importing app does not import Streamlit.
+    """
+    global _cached_analysis
+    if _cached_analysis is None:
+        _cached_analysis = st.cache_data(max_entries=ANALYSIS_CACHE_ENTRIES, ttl=ANALYSIS_CACHE_TTL_SECONDS,
+                                         show_spinner="Running life cycle analysis...")(_analyze)
+    instrument.cache_lookup("app.analysis")
+    return _cached_analysis(analysis_key(pipe, load), pipe, load)
 
-        # 3. Propagation check - uses shut-in/MOP depending on position
-        p_i_propagation = self.get_internal_pressure_for_check(condition_name, "propagation", position)
-        propagation = self.compute_propagation(p_i_propagation, p_external, wt_eff)
 
-        # 4. Hoop check - uses design pressure (no MOP)
-        p_i_hoop = self.get_internal_pressure_for_check(condition_name, "hoop", position)
-        hoop = self.compute_hoop(p_i_hoop, p_external, wt_eff)
+# Standard thickness evaluations run on background threads, one job per input
+# hash, so the main results render without waiting for the schedule sweep.
+STANDARD_THICKNESS_WORKERS = 2
+STANDARD_THICKNESS_JOBS = 64      # finished jobs kept (least recently used dropped)
+STANDARD_THICKNESS_POLL_S = 0.5   # tab refresh interval while a job runs
 
-        # 5. Longitudinal tension - uses design pressure, POSITION-AWARE
-        p_i_longitudinal = self.get_internal_pressure_for_check(condition_name, "longitudinal", position)
-        longitudinal = self.calculate_longitudinal_load(
-            wt_eff, p_i_longitudinal, p_external, condition_name, position
-        )
+SWEEP_POINTS = 500   # default resolution of the utilization sweep charts
 
-        # 6. Combined loading - uses design pressure, POSITION-AWARE
-        p_i_combined = self.get_internal_pressure_for_check(condition_name, "combined", position)
-        combined = self.calculate_combined_load(
-            wt_eff, p_i_combined, p_external, condition_name, position
-        )
+COMPARE_COLUMNS = ("Alternative", "WT (in)", "Grade", "Manufacturing", "Shut-in Location")
+COMPARE_DIFF_PCT = 0.5   # utilization change (percentage points) highlighted against the first alternative
 
-        # Collect pressure-only checks
-        checks = [burst, collapse, propagation, hoop]
 
-        # Find limiting check among pressure-only checks
-        limiting = min(
-            checks,
-            key=lambda c: c["safety_factor"] if c["safety_factor"] != float("inf") else float("inf"),
-        )
+class StandardThicknessJobs:
+    """
+    Thread pool plus an LRU of (future, progress token) keyed by input hash.
 
-        # Overall pass/fail includes all 6 checks (4 pressure + longitudinal + combined)
-        all_pass = (
-            all(c["pass_fail"] for c in checks) and
-            longitudinal["passes"] and
-            combined["passes"]
-        )
+    Parameters:
+    -----------
+    workers : int
+        Evaluations running at once
+    max_jobs : int
+        Jobs remembered; the least recently used are dropped beyond it
+    """
 
-        # Calculate MOP for information display
-        mop_psi = self.calculate_mop()
-        mop_active = (
-            condition_name == "Operation" and
-            self.load.shut_in_location == "Subsea Wellhead" and
-            position.lower() == "top"
-        )
+    def __init__(self, workers: int = STANDARD_THICKNESS_WORKERS, max_jobs: int = STANDARD_THICKNESS_JOBS):
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="standard-thickness")
+        self._jobs: "OrderedDict[str, Tuple[Future, ProgressToken]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, pipe: PipeProperties, load: LoadingCondition) -> Tuple[Future, ProgressToken]:
+        """Start the evaluation for an input, or return its running / finished job."""
+        key = analysis_key(pipe, load)
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and not (job[0].done() and (job[0].cancelled() or job[0].exception())):
+                self._jobs.move_to_end(key)
+                return job
+            token = ProgressToken()
+            job = (self._executor.submit(standard_thickness_report, pipe, load, token), token)
+            self._jobs[key] = job
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+            return job
+
+
+def standard_thickness_report(pipe: PipeProperties, load: LoadingCondition,
+                              progress: Optional[ProgressToken] = None) -> Dict[str, Any]:
+    """
+    Everything the Standard Thicknesses tab shows.
 
-        return {
-            "condition_name": condition_name,
-            "position": position,
-            # Store pressures used for each check type (for UI display)
-            "p_internal_burst": p_i_burst,      # Used by: burst, hoop, longitudinal, combined
-            "p_internal_collapse": p_i_collapse,  # Used by: collapse, propagation
-            "p_external_psi": p_external,
-            "wt_nominal": self.pipe.wt_in,
-            "wt_effective": wt_eff,
-            "mill_tolerance_applied": use_mill_tolerance,
-            "corrosion_applied": use_corrosion,
-            "weights": weights,
-            "checks": checks,
-            "longitudinal": longitudinal,
-            "combined": combined,
-            "all_pass": all_pass,
-            "limiting": limiting,
-            # MOP information
-            "mop_psi": mop_psi,
-            "mop_active": mop_active,
-            "shut_in_location": self.load.shut_in_location,
-        }
+    Returns:
+    --------
+    dict : table (evaluate_standard_thicknesses DataFrame) and closest
+           (find_closest_passing_standard_wt result, None when nothing passes)
+    """
+    table = evaluate_standard_thicknesses(pipe, load, progress=progress)
+    closest = None
+    if not table.empty and (table["Status"] == "PASS").any():
+        closest = find_closest_passing_standard_wt(pipe, load, pipe.wt_in)
+    return {"table": table, "closest": closest}
 
-    def get_wt_type_description(self, use_mill_tolerance: bool, use_corrosion: bool) -> str:
-        """Generate description for wall thickness type"""
-        if not use_mill_tolerance and not use_corrosion:
-            return "Nominal"
-        elif use_mill_tolerance and not use_corrosion:
-            return "Nominal - Tolerance"
-        elif not use_mill_tolerance and use_corrosion:
-            return "Nominal - Corrosion"
-        else:  # both
-            return "Nominal - Tolerance - Corrosion"
-
-    def get_wt_type_short(self, use_mill_tolerance: bool, use_corrosion: bool) -> str:
-        """Generate short key for wall thickness type"""
-        if not use_mill_tolerance and not use_corrosion:
-            return "nominal"
-        elif use_mill_tolerance and not use_corrosion:
-            return "with_tol"
-        elif not use_mill_tolerance and use_corrosion:
-            return "with_corr"
-        else:  # both
-            return "with_tol_corr"
-
-    def run_all_conditions(self) -> Dict[str, Any]:
-        """
-        Analyze all life cycle conditions with multiple wall thickness types:
-
-        Installation (2 WT types × 2 positions = 4 sub-conditions):
-        - Nominal WT (no tolerance, no corrosion)
-        - Nominal - Tolerance (with mill tolerance)
-
-        Hydrotest (2 WT types × 2 positions = 4 sub-conditions):
-        - Nominal WT (no tolerance, no corrosion)
-        - Nominal - Tolerance (with mill tolerance)
-
-        Operation (4 WT types × 2 positions = 8 sub-conditions):
-        - Nominal WT (no tolerance, no corrosion)
-        - Nominal - Tolerance (with mill tolerance only)
-        - Nominal - Corrosion (with corrosion only)
-        - Nominal - Tolerance - Corrosion (with both)
-
-        Total: 16 sub-conditions
-
-        Returns:
-        --------
-        Dict with keys:
-        - pipe: Pipe properties
-        - loading: Loading conditions
-        - conditions: Nested dict organized by stage -> wt_type -> position
-        - all_conditions_pass: Boolean (True if all pass)
-        """
-        # Define wall thickness types for each life cycle stage
-        # Format: (use_mill_tolerance, use_corrosion)
-        installation_wt_types = [
-            (False, False),  # Nominal
-            (True, False),   # Nominal - Tolerance
-        ]
-
-        hydrotest_wt_types = [
-            (False, False),  # Nominal
-            (True, False),   # Nominal - Tolerance
-        ]
-
-        operation_wt_types = [
-            (False, False),  # Nominal
-            (True, False),   # Nominal - Tolerance
-            (False, True),   # Nominal - Corrosion
-            (True, True),    # Nominal - Tolerance - Corrosion
-        ]
-
-        positions = ["Top", "Bottom"]
-
-        results = {
-            "installation": {},
-            "hydrotest": {},
-            "operation": {},
-        }
 
-        # Analyze Installation conditions
-        for use_mill, use_corr in installation_wt_types:
-            wt_key = self.get_wt_type_short(use_mill, use_corr)
-            wt_desc = self.get_wt_type_description(use_mill, use_corr)
-            results["installation"][wt_key] = {
-                "description": wt_desc,
-                "positions": {}
-            }
-            for position in positions:
-                result = self.analyze_condition_at_position(
-                    condition_name="Installation",
-                    position=position,
-                    use_mill_tolerance=use_mill,
-                    use_corrosion=use_corr
-                )
-                result["wt_type_description"] = wt_desc
-                results["installation"][wt_key]["positions"][position.lower()] = result
-
-        # Analyze Hydrotest conditions
-        for use_mill, use_corr in hydrotest_wt_types:
-            wt_key = self.get_wt_type_short(use_mill, use_corr)
-            wt_desc = self.get_wt_type_description(use_mill, use_corr)
-            results["hydrotest"][wt_key] = {
-                "description": wt_desc,
-                "positions": {}
-            }
-            for position in positions:
-                result = self.analyze_condition_at_position(
-                    condition_name="Hydrotest",
-                    position=position,
-                    use_mill_tolerance=use_mill,
-                    use_corrosion=use_corr
-                )
-                result["wt_type_description"] = wt_desc
-                results["hydrotest"][wt_key]["positions"][position.lower()] = result
-
-        # Analyze Operation conditions
-        for use_mill, use_corr in operation_wt_types:
-            wt_key = self.get_wt_type_short(use_mill, use_corr)
-            wt_desc = self.get_wt_type_description(use_mill, use_corr)
-            results["operation"][wt_key] = {
-                "description": wt_desc,
-                "positions": {}
-            }
-            for position in positions:
-                result = self.analyze_condition_at_position(
-                    condition_name="Operation",
-                    position=position,
-                    use_mill_tolerance=use_mill,
-                    use_corrosion=use_corr
-                )
-                result["wt_type_description"] = wt_desc
-                results["operation"][wt_key]["positions"][position.lower()] = result
-
-        # Check if ALL conditions pass (iterate through all nested results)
-        all_pass = True
-        for stage_name, stage_data in results.items():
-            for wt_key, wt_data in stage_data.items():
-                for pos_key, pos_result in wt_data["positions"].items():
-                    if not pos_result["all_pass"]:
-                        all_pass = False
-
-        return {
-            "pipe": asdict(self.pipe),
-            "loading": asdict(self.load),
-            "conditions": results,
-            "all_conditions_pass": all_pass,
-        }
+def _new_standard_thickness_jobs() -> StandardThicknessJobs:
+    return StandardThicknessJobs()
 
 
-def evaluate_standard_thicknesses(base_pipe: PipeProperties, load: LoadingCondition) -> pd.DataFrame:
-    """Evaluate all standard thicknesses per ASME B36.10"""
-    thicknesses = asme_b36_10.get_standard_thicknesses(base_pipe.od_in)
-    if not thicknesses:
-        return pd.DataFrame()
+def standard_thickness_jobs() -> StandardThicknessJobs:
+    """The process-wide job registry (kept by st.cache_resource across reruns and sessions)"""
+    return st.cache_resource(show_spinner=False)(_new_standard_thickness_jobs)()
 
-    records: List[Dict[str, Any]] = []
-    for wt in thicknesses:
-        pipe_variant = PipeProperties(**{**asdict(base_pipe), "wt_in": wt})
-        analyzer = LifeCycleAnalyzer(pipe_variant, load)
-        result = analyzer.run_all_conditions()
-
-        # Find worst safety factor across ALL conditions (new nested structure)
-        min_sf = float("inf")
-        limiting_condition = ""
-        limiting_check = ""
-
-        for stage_name, stage_data in result["conditions"].items():
-            for wt_key, wt_data in stage_data.items():
-                for pos_key, pos_result in wt_data["positions"].items():
-                    if pos_result["limiting"]["safety_factor"] < min_sf:
-                        min_sf = pos_result["limiting"]["safety_factor"]
-                        # Create display name: "Installation - Nominal - Top"
-                        stage = pos_result["condition_name"]
-                        wt_desc = pos_result.get("wt_type_description", wt_data["description"])
-                        position = pos_result["position"]
-                        limiting_condition = f"{stage} ({wt_desc}) - {position}"
-                        limiting_check = pos_result["limiting"]["name"]
 
-        records.append({
-            "WT (in)": wt,
-            "Schedule": schedule_name_for_thickness(base_pipe.od_in, wt),
-            "Limiting Condition": limiting_condition,
-            "Limiting Check": limiting_check,
-            "Safety Factor": format_safety_factor(min_sf),
-            "Utilization (%)": 0 if min_sf == float("inf") else round(100 / min_sf, 1),
-            "Status": "PASS" if result["all_conditions_pass"] else "FAIL",
-        })
+# -----------------------------------------------------------------------------
+# UI helpers
+# -----------------------------------------------------------------------------
 
-    return pd.DataFrame(records)
+def fragment(func, run_every: Optional[float] = None):
+    """
+    func as an st.fragment: interacting with its widgets reruns only func,
+    not the whole script. Wrapped at call time so importing app does not
+    import Streamlit; Streamlit identifies the fragment by function and position.
+    """
+    return st.fragment(func, run_every=run_every)
 
 
-def find_closest_passing_standard_wt(base_pipe: PipeProperties, load: LoadingCondition, 
-                                      input_wt: float) -> Tuple[float, str]:
-    """
-    Find closest standard thickness >= input_wt that passes all conditions.
-    Uses floor-to-up approach (round up from input).
+def lazy_tabs(labels: List[str], key: str) -> List[Tuple[Any, bool]]:
     """
-    thicknesses = asme_b36_10.get_standard_thicknesses(base_pipe.od_in)
-    if not thicknesses:
-        return None, "No standard thicknesses available"
-    
-    # Filter thicknesses >= input_wt
-    candidates = [wt for wt in thicknesses if wt >= input_wt]
-    if not candidates:
-        return None, "No standard thickness >= input thickness"
-    
-    # Test each candidate starting from smallest
-    for wt in sorted(candidates):
-        pipe_variant = PipeProperties(**{**asdict(base_pipe), "wt_in": wt})
-        analyzer = LifeCycleAnalyzer(pipe_variant, load)
-        result = analyzer.run_all_conditions()
-        
-        if result["all_conditions_pass"]:
-            schedule = schedule_name_for_thickness(base_pipe.od_in, wt)
-            return wt, schedule
-    
-    return None, "No passing standard thickness found"
+    st.tabs where only the selected tab's content needs to run.
 
+    Returns (container, is_open) per tab. Selecting a tab reruns the
+    enclosing fragment; callers render a tab's content only when is_open.
+    Streamlit versions without lazy tabs report every tab as open.
+    """
+    try:
+        tabs = st.tabs(labels, key=key, on_change="rerun")
+    except TypeError:
+        return [(tab, True) for tab in st.tabs(labels)]
+    return [(tab, tab.open) for tab in tabs]
 
-# -----------------------------------------------------------------------------
-# UI helpers
-# -----------------------------------------------------------------------------
 
 def badge(label: str, color: str) -> str:
     return f"<span style='background:{color}; color:#ffffff; padding:4px 10px; border-radius:999px; font-weight:700;'>{label}</span>"
@@ -1533,6 +579,11 @@ def render_input_sections():
         st.caption(f"External pressure calculated at depth: {st.session_state.water_depth:.2f} m ({st.session_state.water_depth * 3.28084:.2f} ft)")
         st.caption(f"Seawater density: {DEFAULT_WATER_DENSITY} lb/ft³")
 
+    # Shown here because typing reruns only this section, not the results
+    calculated = st.session_state.get("analysis_inputs")
+    if calculated is not None and analysis_key(*calculated) != analysis_key(*build_pipe_and_load()):
+        st.warning("Inputs changed since the last calculation. Click Calculate to update the results.")
+
     st.markdown("</div>", unsafe_allow_html=True)
 
 
@@ -1558,74 +609,249 @@ def render_reference_section():
     st.markdown("</div>", unsafe_allow_html=True)
 
 
-def build_verification_notes(pipe: PipeProperties, load: LoadingCondition, result: Dict[str, Any]) -> List[str]:
-    """Build automated verification warnings"""
-    notes: List[str] = []
-    d_over_t = pipe.od_in / max(pipe.wt_in, 1e-6)
+# Saved sweeps are only opened below engine.columnar.sweep_root(), chosen from a
+# list rather than typed in, so a shared deployment exposes nothing else.
+SWEEP_CACHE_ENTRIES = 16   # sweeps whose passing-row index is kept
 
-    # Check operation condition WT (use operation with_tol_corr top as representative - worst case)
-    if "operation" in result["conditions"]:
-        op_data = result["conditions"]["operation"]
-        if "with_tol_corr" in op_data and "positions" in op_data["with_tol_corr"]:
-            op_wt = op_data["with_tol_corr"]["positions"]["top"]["wt_effective"]
-            if op_wt < 0.1:
-                notes.append(f"⚠️ Operation WT very thin ({op_wt:.4f} in) after corrosion and mill tolerance")
 
-    if d_over_t > 120:
-        notes.append(f"⚠️ High D/t ratio ({d_over_t:.1f}); check fabrication tolerances")
+def _passing_rows(path: str, mtime_ns: int) -> np.ndarray:
+    """Row numbers of the passing designs of a sweep (cached per path and manifest mtime)"""
+    return np.flatnonzero(open_dataset(path)["all_pass"])
 
-    if load.shut_in_pressure_psi > load.design_pressure_psi * 1.5:
-        notes.append("⚠️ Shut-in pressure > 1.5× design; confirm well control assumptions")
 
-    if pipe.fluid_sg < 0.02 or pipe.fluid_sg > 1.2:
-        notes.append(f"⚠️ Fluid SG ({pipe.fluid_sg}) outside typical range")
+_cached_passing_rows = None
 
-    # Check if any condition fails (new nested structure)
-    for stage_name, stage_data in result["conditions"].items():
-        for wt_key, wt_data in stage_data.items():
-            for pos_key, pos_result in wt_data["positions"].items():
-                if not pos_result["all_pass"]:
-                    # Format condition name nicely
-                    stage = pos_result["condition_name"]
-                    wt_desc = pos_result.get("wt_type_description", wt_data["description"])
-                    position = pos_result["position"]
-                    notes.append(f"❌ {stage} ({wt_desc}) - {position} fails")
 
-    return notes
+def passing_rows(path) -> np.ndarray:
+    """_passing_rows through st.cache_data: one scan per written sweep, not per rerun"""
+    global _cached_passing_rows
+    if _cached_passing_rows is None:
+        _cached_passing_rows = st.cache_data(max_entries=SWEEP_CACHE_ENTRIES, show_spinner=False)(_passing_rows)
+    return _cached_passing_rows(str(path), (Path(path) / MANIFEST).stat().st_mtime_ns)
 
 
-def format_safety_factor(sf: float, check_name: str = "", p_internal: float = 0.0) -> str:
-    """
-    Format safety factor for display with descriptive text for infinite values
+def render_sweep_browser():
+    """Page through a saved sweep (lifecycle.export_sweep) without loading it"""
+    st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+    with st.expander("Saved Sweep Results (Columnar Files)", expanded=False):
+        root = sweep_root()
+        names = list_datasets(root)
+        if not names:
+            st.info(f"No saved sweeps in {root}. Write one with `python -m batch.sweep risers.csv`.")
+        name = st.selectbox("Sweep", names, index=None, key="sweep_dir",
+                            placeholder="Choose a sweep") if names else None
+        if name:
+            try:
+                path = resolve_dataset(root, name)
+                ds = open_dataset(path)
+            except (OSError, ValueError, KeyError) as e:
+                st.error(f"Cannot open sweep: {e}")
+            else:
+                cols = st.columns(3)
+                cols[0].metric("Designs", f"{len(ds):,}")
+                cols[1].metric("Size on Disk", f"{ds.nbytes / 1e6:,.1f} MB")
+                cols[2].metric("Status", "Complete" if ds.complete else "Incomplete")
+
+                rows = None
+                if "all_pass" in ds.columns and st.checkbox("Passing designs only", key="sweep_passing"):
+                    rows = passing_rows(path)
+                total = len(ds) if rows is None else len(rows)
+                page_rows = 1000
+                pages = max(1, -(-total // page_rows))
+                page = int(st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages,
+                                           value=1, key="sweep_page"))
+                start, stop = (page - 1) * page_rows, min(page * page_rows, total)
+                if rows is None:
+                    df = ds.to_pandas(start=start, stop=stop)
+                else:
+                    df = ds.to_pandas(rows=rows[start:stop])
+                st.dataframe(df, use_container_width=True)
+                st.caption(f"Showing {start:,}-{stop:,} of {total:,} design(s); "
+                           f"only these rows are read from the memory-mapped columns.")
+    st.markdown("</div>", unsafe_allow_html=True)
 
-    Parameters:
-    -----------
-    sf : float
-        Safety factor value
-    check_name : str
-        Name of check (for context)
-    p_internal : float
-        Internal pressure (for determining N/A reason)
 
-    Returns:
-    --------
-    str : Formatted safety factor text
+BULK_WORKERS = 2           # bulk runs in progress at once (per server process)
+BULK_POLL_S = 0.5          # bulk progress refresh interval
+BULK_FILE_TTL_S = 6 * 3600   # finished full results files kept for download
+BULK_DOWNLOAD_PART_BYTES = 64 * 1024 * 1024   # most a download click reads into memory
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
 
-    Replaces float('inf') with user-friendly descriptions:
-    - "N/A (No internal pressure)" for burst/hoop during installation
-    - "N/A (Favorable loading)" for reverse loading cases
-    - ">999" for extremely high safety factors
+class BulkRuns:
     """
-    if sf == float('inf'):
-        # Determine reason for infinite safety factor
-        if p_internal <= 0 and check_name in ["Burst", "Hoop Stress"]:
-            return "N/A (No internal pressure)"
-        else:
-            return "N/A (Favorable loading)"
-    elif sf > 999:
-        return ">999"
-    else:
-        return f"{sf:.2f}"
+    Background bulk runs and their full results files.
+
+    The files live in one temporary directory per server process, removed at
+    exit. Starting a run in a session cancels the session's previous run and
+    deletes its file once it has stopped; files of finished runs are deleted
+    BULK_FILE_TTL_S after they were written, which also covers sessions that
+    were closed without starting another run.
+    """
+
+    def __init__(self, workers: int = BULK_WORKERS, ttl_s: float = BULK_FILE_TTL_S):
+        self.ttl_s = ttl_s
+        self.directory = tempfile.mkdtemp(prefix="riser_bulk_")
+        atexit.register(shutil.rmtree, self.directory, True)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk-analysis")
+        self._jobs: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def start(self, risers: List[fleet.Riser], previous: Optional[Tuple[Future, fleet.FleetRun]] = None
+              ) -> Tuple[Future, fleet.FleetRun]:
+        """Start a run, discarding the session's previous one (future, run) if given."""
+        if previous is not None:
+            self.discard(*previous)
+        self.prune()
+        fd, path = tempfile.mkstemp(prefix="riser_fleet_", suffix=".jsonl.gz", dir=self.directory)
+        os.close(fd)
+        run = fleet.FleetRun(risers, path)
+        future = self._executor.submit(run.run)
+        with self._lock:
+            self._jobs[path] = future
+        return future, run
+
+    def discard(self, future: Future, run: fleet.FleetRun) -> None:
+        """Cancel a run and delete its file as soon as it has stopped."""
+        future.cancel()
+        run.progress.cancel()
+        with self._lock:
+            self._jobs.pop(run.path, None)
+        future.add_done_callback(lambda _: _remove_file(run.path))
+
+    def prune(self) -> int:
+        """Delete the files of finished runs older than ttl_s; returns how many."""
+        now = time.time()
+        with self._lock:
+            expired = [path for path, future in self._jobs.items()
+                       if future.done() and (not os.path.exists(path) or now - os.path.getmtime(path) > self.ttl_s)]
+            for path in expired:
+                del self._jobs[path]
+        for path in expired:
+            _remove_file(path)
+        return len(expired)
+
+
+def download_parts(path: str, part_bytes: int = BULK_DOWNLOAD_PART_BYTES) -> List[Tuple[int, int]]:
+    """(offset, length) byte ranges of at most part_bytes covering a file"""
+    size = os.path.getsize(path)
+    return [(start, min(part_bytes, size - start)) for start in range(0, size, part_bytes)] or [(0, 0)]
+
+
+def read_part(path: str, start: int, length: int) -> bytes:
+    """One byte range of a file (called by the download button when clicked)"""
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(length)
+
+
+def _new_bulk_runs() -> BulkRuns:
+    return BulkRuns()
+
+
+def bulk_runs() -> BulkRuns:
+    """The process-wide bulk run registry (kept by st.cache_resource across reruns and sessions)"""
+    return st.cache_resource(show_spinner=False)(_new_bulk_runs)()
+
+
+def bulk_summary_frame(summary: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Bulk summary records (batch.fleet.analyze_fleet) as a display table, highest utilization first"""
+    df = pd.DataFrame([{
+        "Riser": r["name"],
+        "OD (in)": r["od_in"],
+        "WT (in)": r["wt_in"],
+        "Grade": r["grade"],
+        "Depth (m)": r["water_depth_m"],
+        "Design P (psi)": r["design_pressure_psi"],
+        "Status": "PASS" if r["all_pass"] else "FAIL",
+        "Utilization (%)": None if r["utilization"] is None else round(100 * r["utilization"], 1),
+        "Min SF": r["min_sf"],
+        "Limiting Condition": r["limiting_condition"],
+        "Limiting Check": r["limiting_check"],
+    } for r in summary])
+    if df.empty:
+        return df
+    return df.sort_values("Utilization (%)", ascending=False, na_position="last", ignore_index=True)
+
+
+def _bulk_progress(future: Future, run: fleet.FleetRun):
+    """Live progress of a bulk run; reruns the app once it has finished"""
+    if future.done():
+        st.rerun()
+    snap = run.progress.snapshot()
+    cols = st.columns([4, 1])
+    cols[0].progress(snap["fraction"] or 0.0, text="Full results: " + format_progress(snap, "riser(s)"))
+    if cols[1].button("Cancel", key="bulk_cancel", use_container_width=True):
+        run.progress.cancel()
+    if run.summary is not None:
+        st.dataframe(bulk_summary_frame(run.summary), use_container_width=True, hide_index=True)
+
+
+def render_bulk_section():
+    """Upload a CSV / JSON of risers and analyze them in the background"""
+    st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+    with st.expander("Bulk Riser Analysis (CSV / JSON Upload)", expanded=False):
+        st.caption("One riser per row with the columns name, od, wt, grade, design_pressure, shut_in_pressure, "
+                   "water_depth, fluid_type, fluid_sg (optional: manufacturing, design_category, ovality_type, "
+                   "shut_in_location, riser_length, smys_psi, uts_psi). Units as in the form above.")
+        upload = st.file_uploader("Riser file", type=["csv", "json"], key="bulk_file")
+        if upload is not None:
+            try:
+                risers, rejected = fleet.parse_risers(upload.getvalue(), upload.name)
+            except (ValueError, UnicodeDecodeError) as e:
+                st.error(f"Cannot read {upload.name}: {e}")
+                risers, rejected = [], []
+            if rejected:
+                st.warning(f"{len(rejected)} row(s) rejected; they are not analyzed.")
+                st.dataframe(pd.DataFrame([{"Row": r["row"], "Riser": r["name"], "Problems": "; ".join(r["errors"])}
+                                           for r in rejected]), use_container_width=True, hide_index=True)
+            if risers and st.button(f"Analyze {len(risers)} riser(s)", type="primary", key="bulk_run"):
+                st.session_state.bulk_job = bulk_runs().start(risers, st.session_state.get("bulk_job"))
+
+        job = st.session_state.get("bulk_job")
+        if job is not None:
+            future, run = job
+            if not future.done():
+                fragment(_bulk_progress, run_every=BULK_POLL_S)(future, run)
+            elif future.exception() is not None:
+                st.error(f"Bulk analysis failed: {future.exception()}")
+            else:
+                df = bulk_summary_frame(future.result())
+                failing = int((df["Status"] == "FAIL").sum()) if not df.empty else 0
+                cols = st.columns(3)
+                cols[0].metric("Risers", f"{len(df):,}")
+                cols[1].metric("Failing", f"{failing:,}")
+                cols[2].metric("Full Results", f"{run.written:,}" + ("" if run.written == len(df) else " (cancelled)"))
+                st.dataframe(df, use_container_width=True, hide_index=True)
+                if os.path.exists(run.path):
+                    # Streamlit holds a download in memory, so a click reads at most one
+                    # BULK_DOWNLOAD_PART_BYTES range of the file, only when clicked
+                    parts = download_parts(run.path)
+                    if len(parts) == 1:
+                        st.download_button("⬇️ Download full results (.jsonl.gz)",
+                                           functools.partial(read_part, run.path, *parts[0]),
+                                           file_name="riser_fleet_results.jsonl.gz", mime="application/gzip",
+                                           key="bulk_download")
+                    else:
+                        st.caption(f"The full results file is {os.path.getsize(run.path) / 1e6:,.1f} MB, offered in "
+                                   f"{len(parts)} parts. Join them in order (`cat riser_fleet_results.jsonl.gz.* > "
+                                   f"riser_fleet_results.jsonl.gz`, or `copy /b` on Windows), or read the file "
+                                   f"on the server: `{run.path}`")
+                        cols = st.columns(min(len(parts), 4))
+                        for i, (start, length) in enumerate(parts):
+                            cols[i % len(cols)].download_button(
+                                f"⬇️ Part {i + 1} of {len(parts)}", functools.partial(read_part, run.path, start, length),
+                                file_name=f"riser_fleet_results.jsonl.gz.{i + 1:03d}", mime="application/octet-stream",
+                                key=f"bulk_download_{i}")
+                else:
+                    st.info("The full results file has expired. Run the analysis again to download it.")
+    st.markdown("</div>", unsafe_allow_html=True)
 
 
 def render_position_results(position_name: str, cond_result: Dict[str, Any]):
@@ -2173,197 +1399,547 @@ def render_wt_type_results(wt_key: str, wt_data: Dict[str, Any], stage_name: str
     st.caption(f"Effective WT: {eff_wt:.4f} in (Nominal: {nom_wt:.4f} in)")
 
     # Position tabs
-    position_tabs = st.tabs(["Top Position", "Bottom Position"])
+    # Only the open position builds its tables and expanders
+    position_tabs = lazy_tabs(["Top Position", "Bottom Position"], key=f"{stage_name.lower()}_{wt_key}_position_tabs")
+    for (tab, is_open), position in zip(position_tabs, ["Top", "Bottom"]):
+        with tab:
+            if is_open:
+                render_position_results(position, wt_data["positions"][position.lower()])
 
-    with position_tabs[0]:
-        render_position_results("Top", wt_data["positions"]["top"])
 
-    with position_tabs[1]:
-        render_position_results("Bottom", wt_data["positions"]["bottom"])
+def _standard_thickness_progress(future: Future, token: ProgressToken):
+    """Progress of a running evaluation; reruns the app once it has finished"""
+    if future.done():
+        st.rerun()
+    snap = token.snapshot()
+    st.progress(snap["fraction"] or 0.0, text=format_progress(snap, "thickness(es)"))
 
 
-def render_results(result: Dict[str, Any], pipe: PipeProperties, load: LoadingCondition):
-    """Render complete results with all life cycle conditions and WT types"""
-    st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+def render_standard_thicknesses(pipe: PipeProperties, load: LoadingCondition):
+    """
+    Standard Thicknesses tab. The evaluation runs in the background (see
+    StandardThicknessJobs); until it finishes the tab polls its progress
+    while the other tabs are already shown.
+    """
+    future, token = standard_thickness_jobs().submit(pipe, load)
+    if not future.done():
+        fragment(_standard_thickness_progress, run_every=STANDARD_THICKNESS_POLL_S)(future, token)
+        return
+
+    report = future.result()
+    df_std = report["table"]
+    if df_std.empty:
+        st.warning("No standard thicknesses found for this OD.")
+    else:
+        st.dataframe(df_std, use_container_width=True, hide_index=True)
+        passing = df_std[df_std["Status"] == "PASS"]
+        if not passing.empty:
+            first_pass = passing.iloc[0]
+            st.success(
+                f"✅ Least passing thickness: **{first_pass['WT (in)']:.4f} in** (Schedule: {first_pass['Schedule']})"
+            )
+            st.info(
+                f"Limiting: {first_pass['Limiting Condition']} - {first_pass['Limiting Check']} with SF {first_pass['Safety Factor']}"
+            )
 
-    tabs = st.tabs(["Summary", "Installation", "Hydrotest", "Operation", "Standard Thicknesses", "Verification"])
+            # Find closest standard >= input WT
+            closest_wt, closest_sch = report["closest"]
+            if closest_wt:
+                if closest_wt == pipe.wt_in:
+                    st.success(f"✅ Input WT ({pipe.wt_in:.4f} in) matches standard thickness (Sch. {closest_sch}) and passes all conditions.")
+                else:
+                    st.info(f"📊 Closest standard thickness ≥ input ({pipe.wt_in:.4f} in): **{closest_wt:.4f} in** (Sch. {closest_sch})")
+            else:
+                st.warning(f"⚠️ {closest_sch}")
+        else:
+            st.error("❌ No standard thickness meets all criteria. Consider:")
+            st.markdown("- Increasing pipe grade (X-60, X-65)")
+            st.markdown("- Reducing design/shut-in pressures")
+            st.markdown("- Decreasing water depth")
+            st.markdown("- Using custom (non-standard) wall thickness")
 
-    with tabs[0]:
-        st.subheader("Life Cycle Analysis Summary")
 
-        all_pass = result["all_conditions_pass"]
-        total_conditions = sum(
-            len(stage_data) * 2  # 2 positions per WT type
-            for stage_data in result["conditions"].values()
-        )
-        status_html = status_pill(f"ALL {total_conditions} CONDITIONS PASS" if all_pass else "SOME CONDITIONS FAIL", all_pass)
-        st.markdown(f"Overall: {status_html}", unsafe_allow_html=True)
-
-        st.markdown("---")
-
-        # Summary table - organized by stage, WT type, position
-        summary_records = []
-
-        for stage_name in ["installation", "hydrotest", "operation"]:
-            stage_data = result["conditions"][stage_name]
-            for wt_key, wt_data in stage_data.items():
-                for pos_key, pos_result in wt_data["positions"].items():
-                    stage_display = pos_result["condition_name"]
-                    wt_desc = wt_data["description"]
-                    position = pos_result["position"]
-                    display_name = f"{stage_display} - {wt_desc} - {position}"
-
-                    summary_records.append({
-                        "Stage": stage_display,
-                        "Wall Thickness Type": wt_desc,
-                        "Position": position,
-                        "Effective WT (in)": f"{pos_result['wt_effective']:.4f}",
-                        "Po (psi)": f"{pos_result['p_external_psi']:.0f}",
-                        "Pi Burst (psi)": f"{pos_result['p_internal_burst']:.0f}",
-                        "Pi Collapse (psi)": f"{pos_result['p_internal_collapse']:.0f}",
-                        "Limiting Check": pos_result["limiting"]["name"],
-                        "Min SF": format_safety_factor(pos_result["limiting"]["safety_factor"]),
-                        "Status": "PASS" if pos_result["all_pass"] else "FAIL",
-                    })
-
-        df_summary = pd.DataFrame(summary_records)
-        st.dataframe(df_summary, use_container_width=True, hide_index=True)
-
-        if all_pass:
-            st.success(f"✅ The selected wall thickness satisfies all design criteria for all {total_conditions} conditions.")
-        else:
-            st.error("❌ Wall thickness does NOT meet all criteria. Review failed conditions and consider increasing thickness.")
+def sweep_range(pipe: PipeProperties, load: LoadingCondition, parameter: str) -> Tuple[float, float, float]:
+    """Default (low, high, current value) of a sweep around the current inputs"""
+    if parameter == "wt":
+        current = pipe.wt_in
+        return max(0.25 * current, 0.01), min(3.0 * current, 0.49 * pipe.od_in), current
+    current = load.water_depth_m if parameter == "water_depth_m" else load.design_pressure_psi
+    return 0.0, max(2.0 * current, 100.0), current
 
-    with tabs[1]:
-        st.markdown("### Installation Condition")
-        st.info("""
-        **Installation:** Empty pipe (Pi=0), external pressure + bending during lay.
 
-        **Wall Thickness Types:**
-        - **Nominal:** Full wall thickness (as manufactured)
-        - **Nominal - Tolerance:** Wall thickness with mill tolerance (-12.5%) applied
-        """)
+def utilization_figure(sweep: Dict[str, np.ndarray], parameter: str, current: float,
+                       check: Optional[str] = None) -> go.Figure:
+    """
+    Utilization curves of a lifecycle.utilization_sweep as WebGL line traces.
 
-        installation_data = result["conditions"]["installation"]
+    Parameters:
+    -----------
+    sweep : dict
+        lifecycle.utilization_sweep() output
+    parameter : str
+        Swept input (key of lifecycle.SWEEP_PARAMETERS), for the x axis
+    current : float
+        Current input value, marked with a vertical line
+    check : str, optional
+        None: governing utilization of each check over the 16 sub-conditions.
+        A name from lifecycle.UTILIZATION_CHECKS: that check in every sub-condition.
+    """
+    x = sweep["values"]
+    labels = np.array(lifecycle.PLAN_LABELS, dtype=object)
+    fig = go.Figure()
+    if check is None:
+        for k, name in enumerate(lifecycle.UTILIZATION_CHECKS):
+            fig.add_trace(go.Scattergl(
+                x=x, y=sweep["governing"][:, k], mode="lines", name=name,
+                customdata=labels[sweep["governing_condition"][:, k]],
+                hovertemplate="%{y:.3f} (%{customdata})<extra>" + name + "</extra>",
+            ))
+    else:
+        k = lifecycle.UTILIZATION_CHECKS.index(check)
+        for j, label in enumerate(lifecycle.PLAN_LABELS):
+            fig.add_trace(go.Scattergl(x=x, y=sweep["utilization"][:, j, k], mode="lines", name=label,
+                                       hovertemplate="%{y:.3f}<extra>" + label + "</extra>"))
+    fig.add_hline(y=1.0, line_dash="dash", line_color=COLOR_ALERT, annotation_text="Allowable")
+    fig.add_vline(x=current, line_dash="dot", line_color=COLOR_PRIMARY, annotation_text="Current")
+    fig.update_layout(
+        xaxis_title=lifecycle.SWEEP_PARAMETERS[parameter],
+        yaxis_title="Utilization (1 / SF)",
+        hovermode="x",
+        height=480,
+        margin=dict(l=10, r=10, t=30, b=10),
+        legend=dict(font=dict(size=10)),
+    )
+    return fig
+
+
+def render_sweep_charts(pipe: PipeProperties, load: LoadingCondition):
+    """Utilization vs wall thickness / water depth / design pressure from one engine call"""
+    cols = st.columns([2, 2, 1, 1, 1])
+    parameter = cols[0].selectbox("Sweep", list(lifecycle.SWEEP_PARAMETERS),
+                                  format_func=lifecycle.SWEEP_PARAMETERS.get, key="chart_parameter")
+    view = cols[1].selectbox("Show", ["Governing (all checks)"] + list(lifecycle.UTILIZATION_CHECKS),
+                             key="chart_view")
+    low, high, current = sweep_range(pipe, load, parameter)
+    low = cols[2].number_input("From", value=float(low), min_value=0.0, key=f"chart_low_{parameter}")
+    high = cols[3].number_input("To", value=float(high), min_value=0.0, key=f"chart_high_{parameter}")
+    points = int(cols[4].number_input("Points", value=SWEEP_POINTS, min_value=10, max_value=20000,
+                                      step=100, key="chart_points"))
+    if high <= low:
+        st.warning("The sweep range is empty: 'To' must be greater than 'From'.")
+        return
+
+    start = time.perf_counter()
+    sweep = lifecycle.utilization_sweep(pipe, load, parameter, np.linspace(low, high, points))
+    elapsed_ms = (time.perf_counter() - start) * 1e3
+
+    check = None if view.startswith("Governing") else view
+    st.plotly_chart(utilization_figure(sweep, parameter, current, check), use_container_width=True)
+
+    passing = sweep["values"][sweep["all_pass"]]
+    label = lifecycle.SWEEP_PARAMETERS[parameter]
+    if len(passing):
+        st.caption(f"All 16 sub-conditions pass for {label} from {passing.min():.4g} to {passing.max():.4g} "
+                   f"within the swept range.")
+    else:
+        st.caption(f"No {label} in the swept range passes all 16 sub-conditions.")
+    st.caption(f"{points:,} points × {len(lifecycle.PLAN)} sub-conditions evaluated in {elapsed_ms:.1f} ms "
+               f"(one vectorized engine call). Other inputs are held at their current values.")
 
-        # Create tabs for each WT type
-        wt_types = list(installation_data.keys())
-        wt_tabs = st.tabs([installation_data[wt]["description"] for wt in wt_types])
 
-        for i, wt_key in enumerate(wt_types):
-            with wt_tabs[i]:
-                render_wt_type_results(wt_key, installation_data[wt_key], "Installation")
+def _blank(value: Any) -> bool:
+    return value is None or value == "" or (isinstance(value, float) and math.isnan(value))
 
-    with tabs[2]:
-        st.markdown("### Hydrotest Condition")
 
-        # Get hydrotest pressure values
-        ht_nominal = result["conditions"]["hydrotest"]["nominal"]["positions"]["top"]
-        ht_top_pressure = ht_nominal.get("p_internal_burst", load.design_pressure_psi * HYDROTEST_FACTOR)
-        ht_bottom_pressure = result["conditions"]["hydrotest"]["nominal"]["positions"]["bottom"].get(
-            "p_internal_burst", load.design_pressure_psi * HYDROTEST_FACTOR
-        )
+def alternative_designs(pipe: PipeProperties, load: LoadingCondition, alternatives: List[Dict[str, Any]]
+                        ) -> Tuple[List[str], List[PipeProperties], List[LoadingCondition], List[str]]:
+    """
+    Pipes and loadings of the comparison alternatives
 
-        st.info(f"""
-        **Hydrotest Pressure Strategy (Per API RP 1111 Appendix C, Table C.3):**
+    Parameters:
+    -----------
+    pipe, load : PipeProperties, LoadingCondition
+        Calculated inputs; every field an alternative leaves blank keeps its value
+    alternatives : list of dict
+        Rows keyed by COMPARE_COLUMNS (WT, grade, manufacturing, shut-in location)
 
-        **🔵 TOP Position:** Pt = (Design × 1.25) - Hydrostatic Head = **{ht_top_pressure:.0f} psi**
-        **🔴 BOTTOM Position:** Pt = Design × 1.25 = **{ht_bottom_pressure:.0f} psi**
+    Returns:
+    --------
+    tuple : (names, pipes, loads, problems) - names are made unique; rows with
+            an impossible wall thickness are skipped and described in problems
+    """
+    names: List[str] = []
+    pipes: List[PipeProperties] = []
+    loads: List[LoadingCondition] = []
+    problems: List[str] = []
+    for i, row in enumerate(alternatives, start=1):
+        name = str(row.get("Alternative") or f"Alternative {i}").strip() or f"Alternative {i}"
+        while name in names:
+            name += "'"
+        wt = pipe.wt_in if _blank(row.get("WT (in)")) else float(row["WT (in)"])
+        if not 0 < wt < pipe.od_in / 2:
+            problems.append(f"{name}: WT must be between 0 and OD / 2 ({pipe.od_in / 2:g} in); row skipped")
+            continue
+        grade = pipe.grade if _blank(row.get("Grade")) else row["Grade"]
+        grade_props = GRADE_PROPERTIES[grade]
+        names.append(name)
+        pipes.append(replace(
+            pipe,
+            wt_in=wt,
+            grade=grade,
+            smys_psi=pipe.smys_psi if grade == pipe.grade else grade_props["smys_psi"],
+            uts_psi=pipe.uts_psi if grade == pipe.grade else grade_props["uts_psi"],
+            manufacturing=pipe.manufacturing if _blank(row.get("Manufacturing")) else row["Manufacturing"],
+        ))
+        loads.append(replace(
+            load,
+            shut_in_location=load.shut_in_location if _blank(row.get("Shut-in Location")) else row["Shut-in Location"],
+        ))
+    return names, pipes, loads, problems
+
+
+def comparison_frame(comparison: Dict[str, np.ndarray], names: List[str], check: Optional[str] = None) -> pd.DataFrame:
+    """Utilization (%) with one column per alternative: sub-condition x check rows, or one check's 16 rows"""
+    utilization = comparison["utilization"] * 100   # (N, 16, 6)
+    if check is None:
+        index = pd.MultiIndex.from_product([lifecycle.PLAN_LABELS, lifecycle.UTILIZATION_CHECKS],
+                                           names=["Sub-condition", "Check"])
+        values = utilization.reshape(len(names), -1).T
+    else:
+        index = pd.Index(lifecycle.PLAN_LABELS, name="Sub-condition")
+        values = utilization[:, :, lifecycle.UTILIZATION_CHECKS.index(check)].T
+    return pd.DataFrame(values, index=index, columns=names).round(1)
+
+
+def comparison_summary_frame(comparison: Dict[str, np.ndarray], names: List[str]) -> pd.DataFrame:
+    """Governing utilization, sub-condition, check and status of every alternative"""
+    governing = comparison["governing"]
+    checks = np.argmax(governing, axis=1)
+    rows = {}
+    for n, name in enumerate(names):
+        k = int(checks[n])
+        rows[name] = {
+            "Max Utilization (%)": f"{governing[n, k] * 100:.1f}",
+            "Governing Sub-condition": lifecycle.PLAN_LABELS[int(comparison["governing_condition"][n, k])],
+            "Governing Check": lifecycle.UTILIZATION_CHECKS[k],
+            "Failing Sub-conditions": f"{int((~comparison['row_pass'][n]).sum())} / {len(lifecycle.PLAN)}",
+            "Status": "PASS" if comparison["all_pass"][n] else "FAIL",
+        }
+    return pd.DataFrame(rows)
+
+
+def comparison_styles(df: pd.DataFrame) -> pd.DataFrame:
+    """Cell CSS: failing utilization in red, changes against the first column in green (lower) / amber (higher)"""
+    base = df.iloc[:, [0]].to_numpy()
+    values = df.to_numpy()
+    lower = values <= base - COMPARE_DIFF_PCT
+    higher = values >= base + COMPARE_DIFF_PCT
+    lower[:, 0] = higher[:, 0] = False
+    styles = np.where(lower, "background-color: #d1fae5", "")
+    styles = np.where(higher, "background-color: #fef3c7", styles)
+    styles = np.where(values >= 100, f"background-color: #fee2e2; color: {COLOR_ALERT}; font-weight: 600", styles)
+    return pd.DataFrame(styles, index=df.index, columns=df.columns)
+
+
+def render_comparison(pipe: PipeProperties, load: LoadingCondition):
+    """Side-by-side utilization of design alternatives (one vectorized engine call per edit)"""
+    st.caption("Each row is an alternative to the calculated design. Blank cells keep the calculated input; "
+               "add rows at the bottom of the table.")
+    base = {"Alternative": "Calculated", "WT (in)": pipe.wt_in, "Grade": pipe.grade,
+            "Manufacturing": pipe.manufacturing, "Shut-in Location": load.shut_in_location}
+    seed = pd.DataFrame([base, dict(base, Alternative="Alternative 2")], columns=list(COMPARE_COLUMNS))
+    edited = st.data_editor(
+        seed,
+        num_rows="dynamic",
+        hide_index=True,
+        use_container_width=True,
+        key="compare_alternatives",
+        column_config={
+            "Alternative": st.column_config.TextColumn("Alternative"),
+            "WT (in)": st.column_config.NumberColumn("WT (in)", min_value=0.0, step=0.001, format="%.4f"),
+            "Grade": st.column_config.SelectboxColumn("Grade", options=list(GRADE_PROPERTIES)),
+            "Manufacturing": st.column_config.SelectboxColumn(
+                "Manufacturing", options=list(lifecycle.MANUFACTURING_COLLAPSE_FACTOR)),
+            "Shut-in Location": st.column_config.SelectboxColumn(
+                "Shut-in Location", options=["Subsea Wellhead", "Top of Riser"]),
+        },
+    )
 
-        **Wall Thickness Types:**
-        - **Nominal:** Full wall thickness (new pipe)
-        - **Nominal - Tolerance:** With mill tolerance (-12.5%) applied
-        """)
+    names, pipes, loads, problems = alternative_designs(pipe, load, edited.to_dict("records"))
+    for problem in problems:
+        st.warning(problem)
+    if not pipes:
+        return
 
-        hydrotest_data = result["conditions"]["hydrotest"]
-        wt_types = list(hydrotest_data.keys())
-        wt_tabs = st.tabs([hydrotest_data[wt]["description"] for wt in wt_types])
+    start = time.perf_counter()
+    comparison = lifecycle.compare_designs(pipes, loads)
+    elapsed_ms = (time.perf_counter() - start) * 1e3
 
-        for i, wt_key in enumerate(wt_types):
-            with wt_tabs[i]:
-                render_wt_type_results(wt_key, hydrotest_data[wt_key], "Hydrotest")
+    st.dataframe(comparison_summary_frame(comparison, names), use_container_width=True)
+    view = st.selectbox("Show", ["All checks"] + list(lifecycle.UTILIZATION_CHECKS), key="compare_view")
+    df = comparison_frame(comparison, names, None if view == "All checks" else view)
+    st.dataframe(df.style.apply(comparison_styles, axis=None).format("{:.1f}"), use_container_width=True,
+                 height=min(38 + 35 * len(df), 720))
+    st.caption(f"Utilization (%) = 100 / SF. Red: fails; green / amber: at least {COMPARE_DIFF_PCT:g} points "
+               f"lower / higher than '{names[0]}'. {len(pipes)} alternatives × {len(lifecycle.PLAN)} "
+               f"sub-conditions evaluated in {elapsed_ms:.1f} ms (one vectorized engine call).")
 
-    with tabs[3]:
-        st.markdown("### Operation Condition")
 
-        # Get pressure info
-        op_top = result["conditions"]["operation"]["with_tol_corr"]["positions"]["top"]
-        shut_in_loc = op_top.get("shut_in_location", "Subsea Wellhead")
+def render_results(result: Dict[str, Any], pipe: PipeProperties, load: LoadingCondition):
+    """Render complete results with all life cycle conditions and WT types"""
+    st.markdown("<div class='section-card'>", unsafe_allow_html=True)
 
-        # Calculate internal pressures based on wellhead location
-        analyzer = LifeCycleAnalyzer(pipe, load)
-        top_pressure = analyzer.calculate_internal_pressure_at_position("Top")
-        bottom_pressure = analyzer.calculate_internal_pressure_at_position("Bottom")
+    tabs = lazy_tabs(["Summary", "Installation", "Hydrotest", "Operation", "Standard Thicknesses", "Sweeps",
+                      "Compare", "Verification"], key="result_tabs")
 
-        st.info(f"""
-        **Operation Pressure Strategy (Wellhead Location: {shut_in_loc}):**
+    tab, is_open = tabs[0]
+    with tab:
+        if is_open:
+            st.subheader("Life Cycle Analysis Summary")
 
-        {"**🔵 TOP Position:** Pi = Shut-in Pressure (wellhead at top)" if shut_in_loc == "Top of Riser" else f"**🔵 TOP Position:** Pi = MOP = {top_pressure:.0f} psi (shut-in - hydrostatic head)"}
-        {"**🔴 BOTTOM Position:** Pi = Shut-in + Hydrostatic Head = " + f"{bottom_pressure:.0f} psi" if shut_in_loc == "Top of Riser" else f"**🔴 BOTTOM Position:** Pi = Shut-in = {bottom_pressure:.0f} psi (wellhead at bottom)"}
+            all_pass = result["all_conditions_pass"]
+            total_conditions = sum(
+                len(stage_data) * 2  # 2 positions per WT type
+                for stage_data in result["conditions"].values()
+            )
+            status_html = status_pill(f"ALL {total_conditions} CONDITIONS PASS" if all_pass else "SOME CONDITIONS FAIL", all_pass)
+            st.markdown(f"Overall: {status_html}", unsafe_allow_html=True)
 
-        **Wall Thickness Types (4 combinations):**
-        - **Nominal:** Full wall thickness
-        - **Nominal - Tolerance:** With mill tolerance (-12.5%)
-        - **Nominal - Corrosion:** With corrosion allowance ({CORROSION_RATE_PER_YEAR*DESIGN_LIFE_YEARS:.3f} in)
-        - **Nominal - Tolerance - Corrosion:** Both applied (worst case)
-        """)
+            st.markdown("---")
 
-        operation_data = result["conditions"]["operation"]
-        wt_types = list(operation_data.keys())
-        wt_tabs = st.tabs([operation_data[wt]["description"] for wt in wt_types])
+            # Summary table - organized by stage, WT type, position
+            summary_records = []
 
-        for i, wt_key in enumerate(wt_types):
-            with wt_tabs[i]:
-                render_wt_type_results(wt_key, operation_data[wt_key], "Operation")
+            for stage_name in ["installation", "hydrotest", "operation"]:
+                stage_data = result["conditions"][stage_name]
+                for wt_key, wt_data in stage_data.items():
+                    for pos_key, pos_result in wt_data["positions"].items():
+                        stage_display = pos_result["condition_name"]
+                        wt_desc = wt_data["description"]
+                        position = pos_result["position"]
+                        display_name = f"{stage_display} - {wt_desc} - {position}"
+
+                        summary_records.append({
+                            "Stage": stage_display,
+                            "Wall Thickness Type": wt_desc,
+                            "Position": position,
+                            "Effective WT (in)": f"{pos_result['wt_effective']:.4f}",
+                            "Po (psi)": f"{pos_result['p_external_psi']:.0f}",
+                            "Pi Burst (psi)": f"{pos_result['p_internal_burst']:.0f}",
+                            "Pi Collapse (psi)": f"{pos_result['p_internal_collapse']:.0f}",
+                            "Limiting Check": pos_result["limiting"]["name"],
+                            "Min SF": format_safety_factor(pos_result["limiting"]["safety_factor"]),
+                            "Status": "PASS" if pos_result["all_pass"] else "FAIL",
+                        })
+
+            df_summary = pd.DataFrame(summary_records)
+            st.dataframe(df_summary, use_container_width=True, hide_index=True)
+
+            if all_pass:
+                st.success(f"✅ The selected wall thickness satisfies all design criteria for all {total_conditions} conditions.")
+            else:
+                st.error("❌ Wall thickness does NOT meet all criteria. Review failed conditions and consider increasing thickness.")
+
+            title = f"{pipe.od_in:g} in OD x {pipe.wt_in:g} in WT {pipe.grade} Riser"
+            # Rendered only when clicked, not on every rerun of the Summary tab
+            st.download_button("⬇️ Download HTML report",
+                               functools.partial(report.render_riser_report, title, pipe, load, result),
+                               file_name="riser_report.html", mime="text/html", key="report_download")
+
+    tab, is_open = tabs[1]
+    with tab:
+        if is_open:
+            st.markdown("### Installation Condition")
+            st.info("""
+            **Installation:** Empty pipe (Pi=0), external pressure + bending during lay.
+
+            **Wall Thickness Types:**
+            - **Nominal:** Full wall thickness (as manufactured)
+            - **Nominal - Tolerance:** Wall thickness with mill tolerance (-12.5%) applied
+            """)
+
+            installation_data = result["conditions"]["installation"]
+
+            # Create tabs for each WT type
+            wt_types = list(installation_data.keys())
+            wt_tabs = lazy_tabs([installation_data[wt]["description"] for wt in wt_types], key="installation_wt_tabs")
+
+            for (wt_tab, wt_open), wt_key in zip(wt_tabs, wt_types):
+                with wt_tab:
+                    if wt_open:
+                        render_wt_type_results(wt_key, installation_data[wt_key], "Installation")
+
+    tab, is_open = tabs[2]
+    with tab:
+        if is_open:
+            st.markdown("### Hydrotest Condition")
+
+            # Get hydrotest pressure values
+            ht_nominal = result["conditions"]["hydrotest"]["nominal"]["positions"]["top"]
+            ht_top_pressure = ht_nominal.get("p_internal_burst", load.design_pressure_psi * HYDROTEST_FACTOR)
+            ht_bottom_pressure = result["conditions"]["hydrotest"]["nominal"]["positions"]["bottom"].get(
+                "p_internal_burst", load.design_pressure_psi * HYDROTEST_FACTOR
+            )
 
-    with tabs[4]:
-        st.subheader("Standard Thickness Evaluation (ASME B36.10)")
-        df_std = evaluate_standard_thicknesses(pipe, load)
-        if df_std.empty:
-            st.warning("No standard thicknesses found for this OD.")
-        else:
-            st.dataframe(df_std, use_container_width=True, hide_index=True)
-            passing = df_std[df_std["Status"] == "PASS"]
-            if not passing.empty:
-                first_pass = passing.iloc[0]
-                st.success(
-                    f"✅ Least passing thickness: **{first_pass['WT (in)']:.4f} in** (Schedule: {first_pass['Schedule']})"
-                )
-                st.info(
-                    f"Limiting: {first_pass['Limiting Condition']} - {first_pass['Limiting Check']} with SF {first_pass['Safety Factor']}"
-                )
-
-                # Find closest standard >= input WT
-                closest_wt, closest_sch = find_closest_passing_standard_wt(pipe, load, pipe.wt_in)
-                if closest_wt:
-                    if closest_wt == pipe.wt_in:
-                        st.success(f"✅ Input WT ({pipe.wt_in:.4f} in) matches standard thickness (Sch. {closest_sch}) and passes all conditions.")
-                    else:
-                        st.info(f"📊 Closest standard thickness ≥ input ({pipe.wt_in:.4f} in): **{closest_wt:.4f} in** (Sch. {closest_sch})")
-                else:
-                    st.warning(f"⚠️ {closest_sch}")
+            st.info(f"""
+            **Hydrotest Pressure Strategy (Per API RP 1111 Appendix C, Table C.3):**
+
+            **🔵 TOP Position:** Pt = (Design × 1.25) - Hydrostatic Head = **{ht_top_pressure:.0f} psi**
+            **🔴 BOTTOM Position:** Pt = Design × 1.25 = **{ht_bottom_pressure:.0f} psi**
+
+            **Wall Thickness Types:**
+            - **Nominal:** Full wall thickness (new pipe)
+            - **Nominal - Tolerance:** With mill tolerance (-12.5%) applied
+            """)
+
+            hydrotest_data = result["conditions"]["hydrotest"]
+            wt_types = list(hydrotest_data.keys())
+            wt_tabs = lazy_tabs([hydrotest_data[wt]["description"] for wt in wt_types], key="hydrotest_wt_tabs")
+
+            for (wt_tab, wt_open), wt_key in zip(wt_tabs, wt_types):
+                with wt_tab:
+                    if wt_open:
+                        render_wt_type_results(wt_key, hydrotest_data[wt_key], "Hydrotest")
+
+    tab, is_open = tabs[3]
+    with tab:
+        if is_open:
+            st.markdown("### Operation Condition")
+
+            # Get pressure info
+            op_top = result["conditions"]["operation"]["with_tol_corr"]["positions"]["top"]
+            shut_in_loc = op_top.get("shut_in_location", "Subsea Wellhead")
+
+            # Calculate internal pressures based on wellhead location
+            analyzer = LifeCycleAnalyzer(pipe, load)
+            top_pressure = analyzer.calculate_internal_pressure_at_position("Top")
+            bottom_pressure = analyzer.calculate_internal_pressure_at_position("Bottom")
+
+            st.info(f"""
+            **Operation Pressure Strategy (Wellhead Location: {shut_in_loc}):**
+
+            {"**🔵 TOP Position:** Pi = Shut-in Pressure (wellhead at top)" if shut_in_loc == "Top of Riser" else f"**🔵 TOP Position:** Pi = MOP = {top_pressure:.0f} psi (shut-in - hydrostatic head)"}
+            {"**🔴 BOTTOM Position:** Pi = Shut-in + Hydrostatic Head = " + f"{bottom_pressure:.0f} psi" if shut_in_loc == "Top of Riser" else f"**🔴 BOTTOM Position:** Pi = Shut-in = {bottom_pressure:.0f} psi (wellhead at bottom)"}
+
+            **Wall Thickness Types (4 combinations):**
+            - **Nominal:** Full wall thickness
+            - **Nominal - Tolerance:** With mill tolerance (-12.5%)
+            - **Nominal - Corrosion:** With corrosion allowance ({CORROSION_RATE_PER_YEAR*DESIGN_LIFE_YEARS:.3f} in)
+            - **Nominal - Tolerance - Corrosion:** Both applied (worst case)
+            """)
+
+            operation_data = result["conditions"]["operation"]
+            wt_types = list(operation_data.keys())
+            wt_tabs = lazy_tabs([operation_data[wt]["description"] for wt in wt_types], key="operation_wt_tabs")
+
+            for (wt_tab, wt_open), wt_key in zip(wt_tabs, wt_types):
+                with wt_tab:
+                    if wt_open:
+                        render_wt_type_results(wt_key, operation_data[wt_key], "Operation")
+
+    tab, is_open = tabs[4]
+    with tab:
+        if is_open:
+            st.subheader("Standard Thickness Evaluation (ASME B36.10)")
+            render_standard_thicknesses(pipe, load)
+
+    tab, is_open = tabs[5]
+    with tab:
+        if is_open:
+            st.subheader("Utilization Sweeps")
+            fragment(render_sweep_charts)(pipe, load)
+
+    tab, is_open = tabs[6]
+    with tab:
+        if is_open:
+            st.subheader("Compare Alternatives")
+            fragment(render_comparison)(pipe, load)
+
+    tab, is_open = tabs[7]
+    with tab:
+        if is_open:
+            st.subheader("Input Verification")
+            notes = build_verification_notes(pipe, load, result)
+            if notes:
+                for note in notes:
+                    st.warning(note)
             else:
-                st.error("❌ No standard thickness meets all criteria. Consider:")
-                st.markdown("- Increasing pipe grade (X-60, X-65)")
-                st.markdown("- Reducing design/shut-in pressures")
-                st.markdown("- Decreasing water depth")
-                st.markdown("- Using custom (non-standard) wall thickness")
-
-    with tabs[5]:
-        st.subheader("Input Verification")
-        notes = build_verification_notes(pipe, load, result)
-        if notes:
-            for note in notes:
-                st.warning(note)
-        else:
-            st.success("✅ All inputs within typical design ranges. No flags detected.")
+                st.success("✅ All inputs within typical design ranges. No flags detected.")
 
-        with st.expander("Detailed Input Summary", expanded=False):
-            st.json({"pipe": result["pipe"], "loading": result["loading"]}, expanded=False)
+            with st.expander("Detailed Input Summary", expanded=False):
+                st.json({"pipe": result["pipe"], "loading": result["loading"]}, expanded=False)
 
     st.markdown("</div>", unsafe_allow_html=True)
 
 
+def instrumentation_frames(snap: Dict[str, Any]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """(timers, caches) display tables of an engine.instrument snapshot, slowest total first"""
+    timers = pd.DataFrame([{
+        "Timer": name,
+        "Calls": t["count"],
+        "Total (ms)": t["total_ms"],
+        "Mean (µs)": t["mean_us"],
+        "p50 (µs)": t["p50_us"],
+        "p95 (µs)": t["p95_us"],
+        "p99 (µs)": t["p99_us"],
+        "Max (µs)": t["max_us"],
+        "Peak Alloc (KiB)": t.get("alloc_peak_kib_mean"),
+    } for name, t in snap["timers"].items()])
+    if not timers.empty:
+        timers = timers.sort_values("Total (ms)", ascending=False, ignore_index=True)
+    caches = pd.DataFrame([{
+        "Cache": name,
+        "Lookups": c["lookups"],
+        "Hits": c["hits"],
+        "Misses": c["misses"],
+        "Hit Rate (%)": None if c["hit_rate"] is None else round(100 * c["hit_rate"], 1),
+    } for name, c in snap["caches"].items()])
+    return timers, caches
+
+
+def render_instrumentation():
+    """Opt-in timing counters of the analyzer hot paths (engine.instrument) for this server process"""
+    st.markdown("<div class='section-card'>", unsafe_allow_html=True)
+    with st.expander("Performance Instrumentation", expanded=False):
+        st.caption("Call counts, time per check and cache hit rates across all sessions of this server "
+                   "process. Collecting costs a few microseconds per check; tracing allocations slows "
+                   "analyses several-fold.")
+        st.session_state.setdefault("instrument_on", instrument.enabled())
+        st.session_state.setdefault("instrument_allocations", instrument.allocations_enabled())
+        cols = st.columns(3)
+        collect = cols[0].checkbox("Collect timings", key="instrument_on")
+        allocations = cols[1].checkbox("Trace allocations", key="instrument_allocations", disabled=not collect)
+        if not collect:
+            instrument.disable()
+        elif not instrument.enabled() or instrument.allocations_enabled() != allocations:
+            instrument.disable()
+            instrument.enable(allocations=allocations)
+        if cols[2].button("Reset counters", key="instrument_reset", use_container_width=True):
+            instrument.reset()
+
+        snap = instrument.snapshot()
+        timers, caches = instrumentation_frames(snap)
+        if timers.empty:
+            st.info("No timed calls yet: enable collection and run an analysis.")
+        else:
+            st.dataframe(timers, use_container_width=True, hide_index=True)
+        if not caches.empty:
+            st.dataframe(caches, use_container_width=True, hide_index=True)
+        st.download_button("⬇️ Download counters (JSON)", json.dumps(snap, indent=2),
+                           file_name="riser_instrumentation.json", mime="application/json",
+                           key="instrument_download")
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def render_analysis():
+    """Results of the last calculated inputs (kept across reruns, served from the cache)"""
+    if st.session_state.get("analysis_inputs") is None:
+        st.info("📝 Enter all design parameters manually, then click Calculate. Use Team 8 auto-load buttons for quick reference data entry.")
+        return
+    pipe, load = st.session_state.analysis_inputs
+    render_results(run_analysis(pipe, load), pipe, load)
+
+
 # -----------------------------------------------------------------------------
 # Streamlit app
 # -----------------------------------------------------------------------------
@@ -2374,19 +1950,20 @@ def main():
     render_hero()
     initialize_state()
 
-    render_input_sections()
-    render_reference_section()
+    # Each section is a fragment: editing a widget reruns only its own section.
+    # Results are invalidated explicitly: Calculate and the reference buttons
+    # rerun the whole app, typing in the inputs does not.
+    fragment(render_input_sections)()
+    fragment(render_reference_section)()
+    fragment(render_sweep_browser)()
+    fragment(render_bulk_section)()
 
     st.markdown("<div class='section-card'>", unsafe_allow_html=True)
     if st.button("🔍 Calculate All Life Cycle Conditions", type="primary", use_container_width=True):
-        pipe, load = build_pipe_and_load()
-        analyzer = LifeCycleAnalyzer(pipe, load)
-        result = analyzer.run_all_conditions()
-
-        render_results(result, pipe, load)
-    else:
-        st.info("📝 Enter all design parameters manually, then click Calculate. Use Team 8 auto-load buttons for quick reference data entry.")
+        st.session_state.analysis_inputs = build_pipe_and_load()
+    fragment(render_analysis)()
     st.markdown("</div>", unsafe_allow_html=True)
+    fragment(render_instrumentation)()
 
     st.markdown("---")
     st.caption(
@@ -0,0 +1,16 @@
+"""
+Batch analysis tools for running many riser scenarios at once
+
+This package contains:
+- runner: Scenario discovery, per-scenario work units and JSON summaries
+- schema: Compiled scenario input validation
+- streaming: Constant-memory JSON / JSON Lines readers and read-ahead queue
+- cache: Content-addressed on-disk result cache
+- checkpoint: Append-only checkpoint file for --resume
+- store: SQLite store of riser definitions and results (python -m batch.store)
+- fleet: CSV / JSON upload of app-model risers for the web app's bulk mode
+- sweep: Riser files written as columnar sweeps for the app's browser (python -m batch.sweep)
+- report: Self-contained HTML design reports per riser (python -m batch.report)
+- synthetic: Reproducible synthetic scenarios fitted to the reference data (python -m batch.synthetic)
+- cli: Command line entry point (python -m batch)
+"""
@@ -0,0 +1,9 @@
+"""Allow running the batch CLI with ``python -m batch``."""
+
+import sys
+
+from batch.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
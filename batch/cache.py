@@ -0,0 +1,286 @@
+"""
+Content-Addressed Result Cache - skip recomputing unchanged scenarios
+
+Results are stored on local disk under a key derived from:
+- the scenario dict (canonical JSON: sorted keys, no whitespace)
+- project_info
+- a version stamp hashed from the calculation source files
+- the fingerprint of the active external pipe catalog, if any
+
+Any change to a scenario, to project_info or to the calculation modules
+therefore produces a new key; stale entries are never returned and simply
+age out through size-bounded LRU eviction.
+
+Concurrency: entries are written to a temporary file and atomically renamed
+into place, so readers in other worker processes see either the complete
+entry or nothing. Eviction is serialized through a lock file; a lock left by
+a crashed process is broken after LOCK_STALE_SECONDS.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from engine import instrument
+from reference_data import asme_b36_10
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Source files whose contents define the calculation version stamp
+VERSIONED_SOURCES = [
+    'main.py',
+    'calculations/*.py',
+    'engine/*.py',
+    'reference_data/asme_b36_10.py',
+]
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+EVICT_CHECK_INTERVAL = 64   # writes between directory size checks
+LOCK_STALE_SECONDS = 60.0
+
+_version_stamp: Optional[str] = None
+
+
+def calculation_version() -> str:
+    """
+    Return a short hash of the calculation source files.
+
+    Computed once per process. Editing any versioned source invalidates
+    every cached result.
+    """
+    global _version_stamp
+    if _version_stamp is None:
+        digest = hashlib.sha256()
+        for pattern in VERSIONED_SOURCES:
+            for path in sorted(ROOT_DIR.glob(pattern)):
+                digest.update(path.relative_to(ROOT_DIR).as_posix().encode())
+                digest.update(path.read_bytes())
+        _version_stamp = digest.hexdigest()[:16]
+    return _version_stamp
+
+
+def canonical_json(obj: Any) -> str:
+    """Serialize obj deterministically (sorted keys, compact separators)."""
+    return json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=True)
+
+
+def cache_key(scenario: Dict[str, Any], project_info: Dict[str, Any],
+              kind: str = 'analysis', version: Optional[str] = None) -> str:
+    """
+    Build the content address for a scenario result.
+
+    Parameters:
+    -----------
+    scenario : dict
+        Scenario configuration
+    project_info : dict
+        Project-level information
+    kind : str
+        Namespace for the cached value ('analysis' for the full
+        main.analyze_scenario result, 'summary' for batch records)
+    version : str, optional
+        Calculation version stamp (default: calculation_version())
+
+    Returns:
+    --------
+    str : Hex SHA-256 digest
+    """
+    payload = canonical_json({
+        'kind': kind,
+        'version': version or calculation_version(),
+        'catalog': asme_b36_10.active_catalog_id(),
+        'scenario': scenario,
+        'project_info': project_info or {},
+    })
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    Size-bounded on-disk cache of JSON-serializable results.
+
+    Parameters:
+    -----------
+    directory : str or Path
+        Cache directory (created if missing); may be shared by processes
+    max_bytes : int
+        Total size budget; least recently used entries are evicted beyond it
+    """
+
+    def __init__(self, directory, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                value = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            # Missing, evicted by another process, or unreadable - all misses
+            self.misses += 1
+            instrument.cache_lookup('batch.result_cache', hit=False)
+            return None
+        try:
+            os.utime(path)  # refresh LRU position
+        except OSError:
+            pass
+        self.hits += 1
+        instrument.cache_lookup('batch.result_cache', hit=True)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Atomically store value under key."""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix='.tmp-', suffix='.part')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(value, f, separators=(',', ':'))
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        self.writes += 1
+        if self.writes % EVICT_CHECK_INTERVAL == 0:
+            self.evict()
+
+    def get_or_compute(self, key: str, compute) -> Any:
+        """Return the cached value for key, computing and storing it on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            if value is not None:
+                self.put(key, value)
+        return value
+
+    def _entries(self):
+        for path in self.directory.glob('??/*.json'):
+            if path.name.startswith('.tmp-'):
+                continue   # in-flight write of another process
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            yield path, st.st_size, st.st_mtime
+
+    def size_bytes(self) -> int:
+        """Total size of all cached entries."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits max_bytes.
+
+        Only one process evicts at a time; others skip the pass instead of
+        waiting. Returns the number of entries removed by this call.
+        """
+        lock_path = self.directory / '.evict.lock'
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            self._break_stale_lock(lock_path)  # holder crashed - retry next time
+            return 0
+        token = f'{os.getpid()}-{time.time_ns()}-{id(self)}'.encode()
+        os.write(fd, token)
+
+        removed = 0
+        try:
+            entries = list(self._entries())
+            total = sum(size for _, size, _ in entries)
+            if total <= self.max_bytes:
+                return 0
+            # Evict down to 90% of the budget so the next few writes don't re-trigger
+            target = int(self.max_bytes * 0.9)
+            for path, size, _ in sorted(entries, key=lambda e: e[2]):
+                if total <= target:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                removed += 1
+        finally:
+            os.close(fd)
+            try:
+                # A pass that outlived LOCK_STALE_SECONDS may have had its lock
+                # broken and re-taken; only remove the lock if it is still ours
+                if lock_path.read_bytes() == token:
+                    os.unlink(lock_path)
+            except OSError:
+                pass
+        self.evictions += removed
+        return removed
+
+    @staticmethod
+    def _break_stale_lock(lock_path: Path) -> None:
+        """
+        Delete lock_path if it is older than LOCK_STALE_SECONDS.
+
+        The age check and the unlink run while holding a second O_EXCL claim
+        file, so two processes can never both break the same stale lock and
+        have one of them delete the fresh lock the other took in between.
+        """
+        claim_path = lock_path.with_name(lock_path.name + '.break')
+        try:
+            fd = os.open(claim_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                # The claim is held for two syscalls; an old one means a crash
+                if time.time() - claim_path.stat().st_mtime > LOCK_STALE_SECONDS:
+                    os.unlink(claim_path)
+            except OSError:
+                pass
+            return
+        try:
+            if time.time() - lock_path.stat().st_mtime > LOCK_STALE_SECONDS:
+                os.unlink(lock_path)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+            try:
+                os.unlink(claim_path)
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        for path, _, _ in list(self._entries()):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process plus current on-disk usage."""
+        lookups = self.hits + self.misses
+        entries = list(self._entries())
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'writes': self.writes,
+            'evictions': self.evictions,
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+            'max_bytes': self.max_bytes,
+            'version': calculation_version(),
+        }
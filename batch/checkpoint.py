@@ -0,0 +1,213 @@
+"""
+Checkpoint and Resume - survive crashes in long batch campaigns
+
+Every finished record is appended to a local checkpoint file (JSON Lines)
+together with a key identifying its work unit:
+
+    {"key": "<unit key>", "record": {...summary record...}}
+
+The unit key hashes the unit id, the scenario, project_info, the
+calculation version and the active pipe catalog (see batch.cache), so after a restart with --resume a
+unit is skipped only if exactly the same input was already analyzed by the
+same code. Edited scenarios or calculation changes are recomputed.
+
+Writes never block the worker pool: records are handed to a background
+thread that appends them in batches and fsyncs once per batch (at most every
+`interval_s` seconds or `batch_records` records). A crash can lose at most
+the last unsynced batch, and a torn final line is repaired on reopen.
+"""
+
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Set
+
+from batch.cache import calculation_version, canonical_json
+from reference_data import asme_b36_10
+
+DEFAULT_INTERVAL_S = 2.0      # maximum time between fsyncs
+DEFAULT_BATCH_RECORDS = 1024  # records per write + fsync
+
+_STOP = object()
+
+
+def unit_key(unit: Dict[str, Any], version: Optional[str] = None) -> str:
+    """Content key of a work unit: id, scenario, project_info and code version."""
+    payload = canonical_json([
+        unit['unit_id'],
+        unit.get('scenario'),
+        unit.get('project_info') or {},
+        unit.get('error'),
+        version or calculation_version(),
+        asme_b36_10.active_catalog_id(),
+    ])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+
+def repair(path: Path) -> None:
+    """Drop a partially written last line (crash during append)."""
+    with open(path, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b'\n':
+            return
+        # Scan back to the last complete line
+        pos = size
+        block = 64 * 1024
+        while pos > 0:
+            start = max(0, pos - block)
+            f.seek(start)
+            chunk = f.read(pos - start)
+            newline = chunk.rfind(b'\n')
+            if newline >= 0:
+                f.truncate(start + newline + 1)
+                return
+            pos = start
+        f.truncate(0)
+
+
+def iter_entries(path) -> Iterator[Dict[str, Any]]:
+    """Yield checkpoint entries ({'key', 'record'}), skipping unreadable lines."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entry, dict) and 'key' in entry and 'record' in entry:
+                yield entry
+
+
+def load_completed(path) -> Set[str]:
+    """Unit keys already recorded in a checkpoint file (empty if missing)."""
+    if not Path(path).exists():
+        return set()
+    return {entry['key'] for entry in iter_entries(path)}
+
+
+def iter_records(path, keys: Optional[Set[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the records stored in a checkpoint file, in completion order.
+
+    With `keys`, only records whose unit key is in the set are yielded, each
+    once (keys are removed from the set as they are found).
+    """
+    if not Path(path).exists():
+        return
+    for entry in iter_entries(path):
+        if keys is None:
+            yield entry['record']
+        elif entry['key'] in keys:
+            keys.discard(entry['key'])
+            yield entry['record']
+
+
+def skip_completed(units: Iterable[Dict[str, Any]], completed: Set[str],
+                   keys: Dict[str, str], reused: Set[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Drop units whose key is in `completed` (collecting those keys in `reused`)
+    and remember the key of every unit that is run in `keys` (unit id -> key)
+    so its record can be checkpointed.
+    """
+    for unit in units:
+        key = unit_key(unit)
+        if key in completed:
+            reused.add(key)
+            continue
+        keys[unit['unit_id']] = key
+        yield unit
+
+
+class CheckpointWriter:
+    """
+    Append-only checkpoint file written by a background thread.
+
+    Parameters:
+    -----------
+    path : str or Path
+        Checkpoint file (created if missing, appended to otherwise)
+    interval_s : float
+        Maximum time a finished record waits before being fsynced
+    batch_records : int
+        Records written and fsynced together
+    """
+
+    def __init__(self, path, interval_s: float = DEFAULT_INTERVAL_S,
+                 batch_records: int = DEFAULT_BATCH_RECORDS):
+        self.path = Path(path)
+        self.interval_s = interval_s
+        self.batch_records = max(1, batch_records)
+        self.written = 0
+        self.syncs = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._error: Optional[BaseException] = None
+        if self.path.exists():
+            repair(self.path)
+        self._file = open(self.path, 'ab')
+        self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def add(self, key: str, record_json: str) -> None:
+        """
+        Queue a finished record, already serialized as strict JSON (the
+        output line, so records are not encoded twice). Never blocks on I/O.
+        """
+        if self._error is not None:
+            raise self._error
+        self._queue.put((key, record_json))
+
+    def close(self) -> None:
+        """Write and fsync everything queued, then close the file."""
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._file.close()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _flush(self, lines) -> None:
+        if not lines:
+            return
+        self._file.write(b''.join(lines))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.written += len(lines)
+        self.syncs += 1
+        lines.clear()
+
+    def _run(self) -> None:
+        lines = []
+        deadline = None
+        try:
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    self._flush(lines)
+                    deadline = None
+                    continue
+                if item is _STOP:
+                    self._flush(lines)
+                    return
+                key, record_json = item
+                lines.append(f'{{"key":"{key}","record":{record_json}}}\n'.encode('utf-8'))
+                if deadline is None:
+                    deadline = time.monotonic() + self.interval_s
+                if len(lines) >= self.batch_records:
+                    self._flush(lines)
+                    deadline = None
+        except BaseException as e:  # surfaced to the producer on add/close
+            self._error = e
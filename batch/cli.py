@@ -0,0 +1,395 @@
+"""
+Batch CLI - analyze many scenario files concurrently
+
+Usage:
+    python -m batch reference_data/input_data.json
+    python -m batch "runs/**/*.json" scenarios/ --workers 8 --output results.jsonl
+    python -m batch campaign/ --checkpoint campaign.ckpt --resume --output results.jsonl
+
+Each finished scenario is written immediately as one JSON line (JSON Lines),
+so downstream tools can consume results while the run is still going. Inputs
+are streamed through a bounded read-ahead queue and the number of scenarios
+in flight is bounded, which keeps memory constant no matter how many
+scenarios the inputs contain. With --cache-dir, summaries of scenarios
+already analyzed by the same calculation code are served from disk.
+
+With --checkpoint, finished results are also appended to a checkpoint file
+so a crashed or cancelled campaign continues where it stopped with --resume.
+With --catalog, standard wall thicknesses come from a vendor CSV catalog
+(see reference_data.external_catalog) instead of ASME B36.10. With --store,
+riser definitions and results are also recorded in a SQLite store
+(see batch.store) for later queries across runs.
+
+Every scenario is checked against the input schema (batch.schema) as it is
+read. Invalid scenarios are never analyzed; every problem is reported with its
+path, either as an error record or, with --reject FILE, in a reject file.
+
+Ctrl+C stops the run cleanly: no new chunks start, finished results are
+still written, and the exit code is 130. A second Ctrl+C aborts at once.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from batch import checkpoint, runner, schema, streaming
+from batch.cache import DEFAULT_MAX_BYTES, ResultCache
+from batch.store import DEFAULT_BATCH_SIZE, ResultSink, RiserStore
+from engine.progress import ProgressToken, cancel_on_interrupt, terminal_reporter
+from reference_data import asme_b36_10, external_catalog
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m batch",
+        description="Run riser design analysis over many scenario files and stream JSON Lines results.",
+    )
+    parser.add_argument(
+        "inputs", nargs="+",
+        help="Scenario JSON / JSON Lines files, glob patterns or directories (searched recursively)",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-",
+        help="Output JSON Lines file (default: stdout)",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=os.cpu_count() or 1,
+        help="Worker processes (1 runs inline without a pool)",
+    )
+    parser.add_argument(
+        "--max-pending", type=int, default=None,
+        help="Maximum scenarios in flight at once (default: 4 x workers x chunk size)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=32,
+        help="Scenarios evaluated together in one vectorized engine call",
+    )
+    parser.add_argument(
+        "--queue-size", type=int, default=256,
+        help="Scenarios read ahead by the background reader (bounded queue)",
+    )
+    parser.add_argument(
+        "--cache-dir", default=None,
+        help="Directory of the on-disk result cache (shared by all workers; default: no cache)",
+    )
+    parser.add_argument(
+        "--cache-max-mb", type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+        help="Cache size limit in MB; least recently used entries are evicted beyond it",
+    )
+    parser.add_argument(
+        "--catalog", default=None, metavar="CSV",
+        help="Vendor pipe catalog used for standard thickness lookups instead of ASME B36.10 "
+             "(converted once to a memory-mapped file next to the CSV)",
+    )
+    parser.add_argument(
+        "--checkpoint", default=None, metavar="FILE",
+        help="Append every finished result to this checkpoint file (JSON Lines)",
+    )
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="Skip units already completed in --checkpoint and continue the campaign",
+    )
+    parser.add_argument(
+        "--checkpoint-interval", type=float, default=checkpoint.DEFAULT_INTERVAL_S,
+        help="Maximum seconds between checkpoint fsyncs (written off the worker path)",
+    )
+    parser.add_argument(
+        "--validate", action=argparse.BooleanOptionalAction, default=True,
+        help="Check every scenario against the input schema before analysis (default: on)",
+    )
+    parser.add_argument(
+        "--reject", default=None, metavar="FILE",
+        help="Write invalid scenarios with all their errors to this JSON Lines file instead of "
+             "the output (default: error records in the output)",
+    )
+    parser.add_argument(
+        "--store", default=None, metavar="DB",
+        help="Also record riser definitions and results in this SQLite store (see batch.store)",
+    )
+    parser.add_argument(
+        "--store-label", default=None,
+        help="Label of this run in --store",
+    )
+    parser.add_argument(
+        "--progress", action=argparse.BooleanOptionalAction, default=None,
+        help="Show a progress line on stderr (default: only when stderr is a terminal)",
+    )
+    return parser
+
+
+def _chunks(units: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    it = iter(units)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_units(units: Iterable[Dict[str, Any]], workers: int = 1,
+              max_pending: Optional[int] = None, cache_dir: Optional[str] = None,
+              cache_max_bytes: Optional[int] = None, chunk_size: int = 32,
+              progress: Optional[ProgressToken] = None,
+              catalog_path: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Run work units and yield summary records in completion order.
+
+    Parameters:
+    -----------
+    units : iterable of dict
+        Work units from runner.iter_units (consumed lazily)
+    workers : int
+        Number of worker processes; 1 runs everything in this process
+    max_pending : int, optional
+        Upper bound on submitted-but-unfinished units (default 4 x workers x chunk_size)
+    cache_dir : str, optional
+        Result cache directory opened in every worker (default: no cache)
+    cache_max_bytes : int, optional
+        Result cache size limit
+    chunk_size : int
+        Units per vectorized engine call (and per worker task)
+    progress : ProgressToken, optional
+        Advanced per finished chunk. Once cancelled, no new chunks start:
+        chunks not yet running are dropped and those already running are
+        still yielded, so the output holds every finished unit.
+    catalog_path : str, optional
+        External pipe catalog loaded in every worker (default: ASME B36.10)
+
+    Yields:
+    -------
+    dict : Summary record for each unit as soon as its chunk finishes
+    """
+    chunk_size = max(1, chunk_size)
+
+    def finished(records):
+        if progress is not None:
+            progress.advance(len(records))
+        return records
+
+    if workers <= 1:
+        runner.init_worker(cache_dir, cache_max_bytes, catalog_path)
+        for chunk in _chunks(units, chunk_size):
+            if progress is not None and progress.cancelled:
+                return
+            yield from finished(runner.run_chunk(chunk))
+        return
+
+    max_chunks = max(1, (max_pending or workers * 4 * chunk_size) // chunk_size)
+    with ProcessPoolExecutor(max_workers=workers, initializer=runner.init_worker,
+                             initargs=(cache_dir, cache_max_bytes, catalog_path)) as pool:
+        pending = set()
+        for chunk in _chunks(units, chunk_size):
+            if progress is not None and progress.cancelled:
+                break
+            pending.add(pool.submit(runner.run_chunk, chunk))
+            if len(pending) >= max_chunks:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from finished(future.result())
+        while pending:
+            if progress is not None and progress.cancelled:
+                pending = {f for f in pending if not f.cancel()}
+                if not pending:
+                    break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from finished(future.result())
+
+
+def _counted(units: Iterable[Dict[str, Any]], progress: ProgressToken) -> Iterator[Dict[str, Any]]:
+    """
+    Set the progress total once every unit has been read. Inputs are
+    streamed, so the total (and ETA) is unknown until the reader finishes.
+    """
+    count = 0
+    for unit in units:
+        count += 1
+        yield unit
+    progress.add_total(count)
+
+
+def _rejected(units: Iterable[Dict[str, Any]], out: TextIO, progress: ProgressToken,
+              tally: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+    """Divert units that failed validation to the reject file."""
+    for unit in units:
+        if 'validation_errors' not in unit:
+            yield unit
+            continue
+        out.write(json.dumps({'id': unit['unit_id'], 'source': unit['source'],
+                              'errors': unit['validation_errors'], 'scenario': unit['scenario']},
+                             separators=(',', ':'), default=str) + "\n")
+        tally['rejected'] += 1
+        progress.advance()
+
+
+def _stored(units: Iterable[Dict[str, Any]], riser_store: RiserStore,
+            batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """Pass units through while saving their riser definitions in batches."""
+    pending: List[Dict[str, Any]] = []
+    try:
+        for unit in units:
+            pending.append(unit)
+            if len(pending) >= batch_size:
+                riser_store.add_risers(pending, batch_size)
+                pending = []
+            yield unit
+    finally:
+        riser_store.add_risers(pending, batch_size)
+
+
+def write_records(records: Iterable[Dict[str, Any]], out: TextIO,
+                  on_write: Optional[Callable[[Dict[str, Any], str], None]] = None) -> Dict[str, int]:
+    """
+    Write records as JSON Lines, flushing after each one. Returns counts;
+    'cache_hits' / 'cache_lookups' are added when records came from a cached run.
+    on_write(record, line) is called after each record has been written.
+    """
+    counts = {'total': 0, 'errors': 0}
+    for record in records:
+        line = runner.dumps_record(record)
+        out.write(line + "\n")
+        out.flush()
+        if on_write is not None:
+            on_write(record, line)
+        counts['total'] += 1
+        if 'error' in record:
+            counts['errors'] += 1
+        if 'cached' in record:
+            counts['cache_lookups'] = counts.get('cache_lookups', 0) + 1
+            counts['cache_hits'] = counts.get('cache_hits', 0) + int(record['cached'])
+    return counts
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Batch CLI entry point. Returns a process exit code."""
+    args = build_parser().parse_args(argv)
+
+    files = runner.expand_inputs(args.inputs)
+    if not files:
+        print(f"Error: No scenario files matched {args.inputs}", file=sys.stderr)
+        return 2
+
+    if args.resume and not args.checkpoint:
+        print("Error: --resume requires --checkpoint FILE", file=sys.stderr)
+        return 2
+    if args.checkpoint and not args.resume and os.path.exists(args.checkpoint):
+        print(f"Error: Checkpoint {args.checkpoint} already exists; pass --resume to continue it "
+              f"or delete it to start over", file=sys.stderr)
+        return 2
+
+    catalog_path = None
+    if args.catalog:
+        # Convert (once) and activate here, so unit keys include the catalog and
+        # workers only memory-map the finished binary file
+        try:
+            catalog = external_catalog.load_catalog(args.catalog)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot load catalog {args.catalog}: {e}", file=sys.stderr)
+            return 2
+        asme_b36_10.use_catalog(catalog)
+        catalog_path = str(catalog.path)
+
+    show_progress = sys.stderr.isatty() if args.progress is None else args.progress
+    progress = ProgressToken(callback=terminal_reporter(sys.stderr, "scenario(s)") if show_progress else None)
+    units = runner.iter_units(files)
+    if args.validate:
+        units = schema.validate_units(units)
+    resumed: Iterable[Dict[str, Any]] = []
+    writer = None
+    if args.checkpoint:
+        completed = checkpoint.load_completed(args.checkpoint) if args.resume else set()
+        keys: Dict[str, str] = {}
+        reused: set = set()
+        units = checkpoint.skip_completed(units, completed, keys, reused)
+        if completed:
+            # Read after the run, when `reused` holds every skipped unit; entries
+            # for edited or removed scenarios stay in the file but are not output
+            resumed = checkpoint.iter_records(args.checkpoint, reused)
+        writer = checkpoint.CheckpointWriter(args.checkpoint, interval_s=args.checkpoint_interval)
+        if completed:
+            print(f"Resuming: {len(completed)} unit(s) already completed in {args.checkpoint}",
+                  file=sys.stderr)
+
+    units = streaming.prefetch(_counted(units, progress), maxsize=args.queue_size)
+    reject_out = None
+    tally = {'rejected': 0}
+    if args.reject:
+        reject_out = open(args.reject, "w")
+        units = _rejected(units, reject_out, progress, tally)
+    riser_store = sink = None
+    if args.store:
+        # Used from this thread only: units are consumed here, after the read-ahead queue
+        riser_store = RiserStore(args.store)
+        sink = ResultSink(riser_store, riser_store.start_run(args.store_label))
+        units = _stored(units, riser_store)
+    cache_max_bytes = int(args.cache_max_mb * 1024 * 1024)
+    records = run_units(units, workers=args.workers, max_pending=args.max_pending,
+                        cache_dir=args.cache_dir, cache_max_bytes=cache_max_bytes,
+                        chunk_size=args.chunk_size, progress=progress,
+                        catalog_path=catalog_path)
+    # Results restored from the checkpoint are appended so the output is complete
+    records = itertools.chain(records, resumed)
+    on_write = None
+    if writer is not None or sink is not None:
+        def on_write(record, line):
+            # Checkpoint a unit only once its result is in the output
+            if writer is not None:
+                key = keys.pop(record['id'], None)
+                if key is not None:
+                    writer.add(key, line)
+            if sink is not None:
+                sink.add(record)
+
+    try:
+        with cancel_on_interrupt(progress):
+            if args.output == "-":
+                try:
+                    counts = write_records(records, sys.stdout, on_write)
+                except BrokenPipeError:
+                    # Downstream consumer (e.g. `head`) closed the pipe - stop quietly
+                    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+                    return 0
+            else:
+                with open(args.output, "w") as out:
+                    counts = write_records(records, out, on_write)
+    finally:
+        if writer is not None:
+            writer.close()
+        if riser_store is not None:
+            sink.flush()
+            riser_store.close()
+        if reject_out is not None:
+            reject_out.close()
+    if show_progress:
+        progress.finish()
+        print(file=sys.stderr)
+
+    if progress.cancelled:
+        print(
+            f"Cancelled: {counts['total']} scenario(s) finished and written before stopping.",
+            file=sys.stderr,
+        )
+    print(
+        f"Analyzed {counts['total']} scenario(s) from {len(files)} file(s); {counts['errors']} error(s).",
+        file=sys.stderr,
+    )
+    if tally['rejected']:
+        print(f"Rejected {tally['rejected']} invalid scenario(s) to {args.reject}", file=sys.stderr)
+    if args.cache_dir:
+        # Workers keep their own counters, so the hit rate is taken from the records
+        hits, lookups = counts.get('cache_hits', 0), counts.get('cache_lookups', 0)
+        rate = hits / lookups if lookups else 0.0
+        usage = ResultCache(args.cache_dir, max_bytes=cache_max_bytes).stats()
+        print(
+            f"Cache: {hits}/{lookups} hit(s) ({rate:.1%}); "
+            f"{usage['entries']} entries, {usage['bytes'] / (1024 * 1024):.1f} MB in {args.cache_dir}",
+            file=sys.stderr,
+        )
+    if progress.cancelled:
+        return 130
+    return 1 if counts['errors'] or tally['rejected'] else 0
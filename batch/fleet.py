@@ -0,0 +1,346 @@
+"""
+Fleet Analysis - bulk analysis of app-model risers
+
+The Streamlit app's bulk mode reads a CSV or JSON file of risers described
+with the app's inputs (psi units, 16 sub-condition life cycle plan), one
+riser per row:
+
+    name,od,wt,grade,design_pressure,shut_in_pressure,water_depth,fluid_type,fluid_sg
+    Riser A,16,0.75,X-52,1400,1236,920,Multiphase,0.57
+
+Column names are the TEAM8_REFERENCE keys of app.py; the PipeProperties /
+LoadingCondition field names (od_in, design_pressure_psi, ...) are accepted
+too. JSON files hold a list of such objects, {"risers": [...]} or a
+name -> object mapping. Every row is validated (batch.schema) and bad rows
+are reported with all their problems instead of failing the file.
+
+analyze_fleet() evaluates every riser in vectorized chunks (engine.lifecycle)
+for the summary table; write_full_results() streams the complete
+run_all_conditions result of each riser to a gzip JSON Lines file, computed
+by a process pool because the scalar analyzer is CPU-bound Python.
+"""
+
+import csv
+import gzip
+import io
+import json
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from batch.schema import Field, compile_schema
+from engine import lifecycle
+from engine.analyzer import LifeCycleAnalyzer, LoadingCondition, PipeProperties
+from engine.lifecycle import GRADE_PROPERTIES
+from engine.progress import ProgressToken
+
+# Input column -> canonical field name (TEAM8_REFERENCE keys)
+ALIASES = {
+    'riser': 'name', 'riser_name': 'name', 'id': 'name',
+    'od_in': 'od', 'wt_in': 'wt',
+    'design_pressure_psi': 'design_pressure',
+    'shut_in_pressure_psi': 'shut_in_pressure',
+    'water_depth_m': 'water_depth',
+    'riser_length_m': 'riser_length',
+}
+
+OVALITY_BY_TYPE = {"Other Type": 0.005, "Reel-lay": 0.01}   # API RP 1111 (as in app.py)
+
+RISER_SCHEMA: Dict[str, Any] = {
+    'name': Field('string', required=False),
+    'od': Field('number', gt=0),
+    'wt': Field('number', gt=0),
+    'grade': Field('string', choices=tuple(GRADE_PROPERTIES)),
+    'manufacturing': Field('string', required=False, choices=tuple(lifecycle.MANUFACTURING_COLLAPSE_FACTOR)),
+    'design_category': Field('string', required=False, choices=('Riser', 'Pipeline')),
+    'fluid_type': Field('string', choices=('Gas', 'Oil', 'Multiphase', 'Wet Gas')),
+    'fluid_sg': Field('number', gt=0),
+    'ovality_type': Field('string', required=False, choices=tuple(OVALITY_BY_TYPE)),
+    'design_pressure': Field('number', ge=0),
+    'shut_in_pressure': Field('number', ge=0),
+    'shut_in_location': Field('string', required=False, choices=('Subsea Wellhead', 'Top of Riser')),
+    'water_depth': Field('number', ge=0),
+    'riser_length': Field('number', required=False, ge=0),
+    'smys_psi': Field('number', required=False, gt=0),
+    'uts_psi': Field('number', required=False, gt=0),
+}
+_NUMBER_FIELDS = {name for name, field in RISER_SCHEMA.items() if field.kind == 'number'}
+_validate_riser = compile_schema(RISER_SCHEMA, 'validate_riser')
+
+# Physical limits of PipeProperties / LoadingCondition built directly
+# (e.g. by the analysis service) rather than from a riser file row
+DESIGN_SCHEMA: Dict[str, Any] = {
+    'pipe': {
+        'od_in': Field('number', gt=0),
+        'wt_in': Field('number', gt=0),
+        'fluid_sg': Field('number', gt=0),
+        'smys_psi': Field('number', gt=0),
+        'uts_psi': Field('number', gt=0),
+        'ovality': Field('number', ge=0, lt=1),
+        'E_psi': Field('number', gt=0),
+        'poisson': Field('number', gt=0, lt=0.5),
+    },
+    'load': {
+        'design_pressure_psi': Field('number', ge=0),
+        'shut_in_pressure_psi': Field('number', ge=0),
+        'water_depth_m': Field('number', ge=0),
+        'riser_length_m': Field('number', ge=0),
+    },
+}
+_validate_design = compile_schema(DESIGN_SCHEMA, 'validate_design')
+
+FULL_RESULTS_CHUNK = 25        # risers per process pool task
+INLINE_FULL_RESULTS_MAX = 50   # smaller fleets skip the pool start-up cost
+
+Riser = Tuple[str, PipeProperties, LoadingCondition]
+
+
+def _normalize(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Canonical keys; empty CSV cells dropped and numeric strings converted."""
+    out = {}
+    for key, value in record.items():
+        if key is None:
+            continue
+        key = str(key).strip()
+        key = ALIASES.get(key.lower(), key.lower())
+        if isinstance(value, str):
+            value = value.strip()
+            if value == '':
+                continue
+            if key in _NUMBER_FIELDS:
+                try:
+                    value = float(value)
+                except ValueError:
+                    pass   # reported by the schema as "must be a number"
+        out[key] = value
+    return out
+
+
+def _records(data: bytes, filename: str) -> List[Dict[str, Any]]:
+    text = data.decode('utf-8-sig')
+    if filename.lower().endswith('.json'):
+        doc = json.loads(text)
+        if isinstance(doc, dict):
+            doc = doc.get('risers', doc)
+        if isinstance(doc, dict):
+            return [dict(value, name=value.get('name', key)) if isinstance(value, dict) else value
+                    for key, value in doc.items()]
+        if not isinstance(doc, list):
+            raise ValueError("JSON must be a list of risers, {'risers': [...]} or a name -> riser mapping")
+        return doc
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+def build_riser(fields: Dict[str, Any]) -> Tuple[PipeProperties, LoadingCondition]:
+    """PipeProperties / LoadingCondition from a validated, normalized record."""
+    grade = GRADE_PROPERTIES[fields['grade']]
+    ovality_type = fields.get('ovality_type', 'Other Type')
+    pipe = PipeProperties(
+        od_in=fields['od'],
+        wt_in=fields['wt'],
+        grade=fields['grade'],
+        manufacturing=fields.get('manufacturing', 'SMLS'),
+        design_category=fields.get('design_category', 'Riser'),
+        fluid_type=fields['fluid_type'],
+        fluid_sg=fields['fluid_sg'],
+        smys_psi=fields.get('smys_psi', grade['smys_psi']),
+        uts_psi=fields.get('uts_psi', grade['uts_psi']),
+        ovality_type=ovality_type,
+        ovality=OVALITY_BY_TYPE[ovality_type],
+    )
+    load = LoadingCondition(
+        design_pressure_psi=fields['design_pressure'],
+        shut_in_pressure_psi=fields['shut_in_pressure'],
+        shut_in_location=fields.get('shut_in_location', 'Subsea Wellhead'),
+        water_depth_m=fields['water_depth'],
+        riser_length_m=fields.get('riser_length', fields['water_depth']),
+    )
+    return pipe, load
+
+
+def design_errors(pipe: PipeProperties, load: LoadingCondition) -> List[str]:
+    """Physical problems of a design ("pipe.wt_in: must be > 0", ...), empty if valid."""
+    errors = _validate_design({'pipe': asdict(pipe), 'load': asdict(load)})
+    if not errors and pipe.wt_in * 2 >= pipe.od_in:
+        errors.append('pipe.wt_in: must be less than od_in / 2')
+    return errors
+
+
+def parse_risers(data: bytes, filename: str) -> Tuple[List[Riser], List[Dict[str, Any]]]:
+    """
+    Read a CSV or JSON riser file.
+
+    Parameters:
+    -----------
+    data : bytes
+        File contents (UTF-8)
+    filename : str
+        Original file name; '.json' selects JSON, anything else CSV
+
+    Returns:
+    --------
+    tuple : (risers, rejected)
+        risers - list of (name, PipeProperties, LoadingCondition)
+        rejected - list of {row, name, errors} for rows that failed validation
+        (row is 1-based, the CSV header not counted)
+    """
+    risers: List[Riser] = []
+    rejected: List[Dict[str, Any]] = []
+    for row, record in enumerate(_records(data, filename), start=1):
+        if not isinstance(record, dict):
+            rejected.append({'row': row, 'name': None, 'errors': ['must be an object']})
+            continue
+        fields = _normalize(record)
+        name = str(fields.get('name', f"Riser {row}"))
+        errors = _validate_riser(fields)
+        if not errors and fields['wt'] * 2 >= fields['od']:
+            errors = ['wt: must be less than od / 2']
+        if errors:
+            rejected.append({'row': row, 'name': name, 'errors': errors})
+            continue
+        fields['name'] = name
+        risers.append((name,) + build_riser(fields))
+    return risers, rejected
+
+
+def _finite(value: float) -> Optional[float]:
+    return value if math.isfinite(value) else None
+
+
+def analyze_fleet(risers: Sequence[Riser], progress: Optional[ProgressToken] = None,
+                  chunk_size: int = lifecycle.DEFAULT_CHUNK_SIZE) -> List[Dict[str, Any]]:
+    """
+    Summary record per riser from vectorized engine chunks.
+
+    Returns:
+    --------
+    list of dict : name, od_in, wt_in, grade, water_depth_m, design_pressure_psi,
+                   all_pass, min_sf, utilization (1 / min_sf), limiting_condition,
+                   limiting_check (min_sf / utilization / labels are None when no
+                   pressure check sees a demand). With a progress token, a
+                   cancelled run returns the risers finished so far.
+    """
+    if progress is not None and progress.total is None:
+        progress.add_total(len(risers))
+    records: List[Dict[str, Any]] = []
+    for start in range(0, len(risers), chunk_size):
+        if progress is not None and progress.cancelled:
+            break
+        chunk = risers[start:start + chunk_size]
+        pipes = [pipe for _, pipe, _ in chunk]
+        loads = [load for _, _, load in chunk]
+        summary = lifecycle.summary_arrays(lifecycle.evaluate_designs(lifecycle.design_arrays(pipes, loads)))
+        for i, (name, pipe, load) in enumerate(chunk):
+            min_sf = _finite(float(summary['min_sf'][i]))
+            condition, check = int(summary['limiting_condition'][i]), int(summary['limiting_check'][i])
+            records.append({
+                'name': name,
+                'od_in': pipe.od_in,
+                'wt_in': pipe.wt_in,
+                'grade': pipe.grade,
+                'water_depth_m': load.water_depth_m,
+                'design_pressure_psi': load.design_pressure_psi,
+                'all_pass': bool(summary['all_pass'][i]),
+                'min_sf': min_sf,
+                'utilization': None if min_sf is None else 1.0 / min_sf,
+                'limiting_condition': lifecycle.PLAN_LABELS[condition] if condition >= 0 else None,
+                'limiting_check': lifecycle.CHECK_NAMES[check] if check >= 0 else None,
+            })
+        if progress is not None:
+            progress.advance(len(chunk))
+    return records
+
+
+def _strict(obj: Any) -> Any:
+    """Non-finite floats -> None, recursively, so the output is strict JSON."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _strict(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_strict(v) for v in obj]
+    return obj
+
+
+def full_result_lines(risers: Sequence[Riser]) -> List[str]:
+    """One JSON line {name, result} per riser with the full run_all_conditions output."""
+    return [json.dumps({'name': name, 'result': _strict(LifeCycleAnalyzer(pipe, load).run_all_conditions())},
+                       allow_nan=False, separators=(',', ':'), default=float)
+            for name, pipe, load in risers]
+
+
+def write_full_results(risers: Sequence[Riser], path, workers: Optional[int] = None,
+                       progress: Optional[ProgressToken] = None) -> int:
+    """
+    Stream full results of every riser to a gzip JSON Lines file, in input order.
+
+    Parameters:
+    -----------
+    risers : sequence of (name, PipeProperties, LoadingCondition)
+    path : str or Path
+        Output file (.jsonl.gz)
+    workers : int, optional
+        Process pool size (default: CPU count, at most 4); fleets of up to
+        INLINE_FULL_RESULTS_MAX risers are computed in the calling thread
+    progress : ProgressToken, optional
+        Advanced per chunk; cancellation stops after the chunk in progress
+
+    Returns:
+    --------
+    int : Number of risers written
+    """
+    chunks = [risers[i:i + FULL_RESULTS_CHUNK] for i in range(0, len(risers), FULL_RESULTS_CHUNK)]
+    if progress is not None and progress.total is None:
+        progress.add_total(len(risers))
+    written = 0
+    with gzip.open(path, 'wt', encoding='utf-8') as out:
+        if len(risers) <= INLINE_FULL_RESULTS_MAX:
+            results = map(full_result_lines, chunks)
+            pool = None
+        else:
+            # spawn: the caller may be a thread of a server process (Streamlit)
+            pool = ProcessPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1),
+                                       mp_context=multiprocessing.get_context('spawn'))
+            results = pool.map(full_result_lines, chunks)
+        try:
+            for lines in results:
+                out.write('\n'.join(lines) + '\n')
+                written += len(lines)
+                if progress is not None and not progress.advance(len(lines)):
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+    return written
+
+
+class FleetRun:
+    """
+    One bulk analysis, run in a background thread by the app: the summary
+    table first (vectorized, fast), then the full results file.
+
+    Parameters:
+    -----------
+    risers : sequence of (name, PipeProperties, LoadingCondition)
+    path : str or Path
+        Full results file (.jsonl.gz)
+    workers : int, optional
+        Process pool size for write_full_results
+    """
+
+    def __init__(self, risers: Sequence[Riser], path, workers: Optional[int] = None):
+        self.risers = list(risers)
+        self.path = path
+        self.workers = workers
+        self.summary: Optional[List[Dict[str, Any]]] = None
+        self.written = 0
+        self.progress = ProgressToken(total=len(self.risers))
+
+    def run(self) -> List[Dict[str, Any]]:
+        """Compute the summary, then stream the full results; returns the summary."""
+        self.summary = analyze_fleet(self.risers)
+        self.written = write_full_results(self.risers, self.path, workers=self.workers, progress=self.progress)
+        return self.summary
@@ -0,0 +1,384 @@
+"""
+Riser Reports - self-contained HTML calculation reports for sign-off
+
+Each riser gets one HTML file holding its inputs, the 16 sub-condition
+summary, every check of every sub-condition and the automated verification
+notes (engine.analyzer.build_verification_notes); index.html links them all
+with the governing safety factor of each riser. The files carry their CSS
+inline and print cleanly on A4 ("Print to PDF" in any browser), so they can
+be attached to a design review as they are.
+
+    python -m batch.report risers.csv -o reports/ [--workers N]
+
+The riser file is read as by the app's bulk mode (batch.fleet). Templates
+are Jinja2, compiled once per process; reports of large fleets are rendered
+by a process pool whose workers write each file as soon as it is rendered,
+so memory does not grow with the fleet.
+"""
+
+import argparse
+import functools
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from batch import fleet
+from batch.cache import calculation_version
+from batch.fleet import Riser
+from engine.analyzer import (
+    LifeCycleAnalyzer,
+    LoadingCondition,
+    PipeProperties,
+    build_verification_notes,
+    format_safety_factor,
+)
+from engine.progress import ProgressToken
+
+REPORT_CHUNK = 10          # risers per process pool task
+INLINE_REPORTS_MAX = 20    # smaller fleets skip the pool start-up cost
+
+STAGES = ("installation", "hydrotest", "operation")
+
+_STYLE = """
+  @page { size: A4; margin: 14mm; }
+  * { box-sizing: border-box; }
+  body { font-family: "Segoe UI", Arial, sans-serif; font-size: 10.5pt; color: #0f172a; margin: 0 auto;
+         max-width: 1100px; padding: 16px; -webkit-print-color-adjust: exact; print-color-adjust: exact; }
+  h1 { color: #1e3a8a; font-size: 19pt; margin: 0 0 4px; }
+  h2 { color: #1e3a8a; font-size: 13.5pt; border-bottom: 2px solid #3b82f6; padding-bottom: 3px; margin-top: 22px; }
+  h3 { font-size: 11pt; margin: 14px 0 4px; }
+  .meta { color: #475569; font-size: 9pt; }
+  table { border-collapse: collapse; width: 100%; margin: 6px 0; }
+  th, td { border: 1px solid #cbd5e1; padding: 3px 6px; text-align: left; }
+  th { background: #e2e8f0; }
+  td.num { text-align: right; font-variant-numeric: tabular-nums; }
+  .pass { color: #047857; font-weight: 600; }
+  .fail { color: #b91c1c; font-weight: 600; }
+  .pill { display: inline-block; padding: 2px 10px; border-radius: 10px; color: #fff; font-weight: 600; }
+  .pill.pass { background: #10b981; color: #fff; }
+  .pill.fail { background: #ef4444; color: #fff; }
+  .inputs { display: grid; grid-template-columns: 1fr 1fr; gap: 0 16px; }
+  .condition { break-inside: avoid; page-break-inside: avoid; }
+  .notes li { margin: 2px 0; }
+  @media print { .no-print { display: none; } h2 { break-after: avoid; } }
+"""
+
+TEMPLATES = {
+    "base.html": """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{% block title %}{% endblock %}</title>
+<style>{{ style }}</style>
+</head>
+<body>
+{% block body %}{% endblock %}
+<p class="meta">Generated {{ generated }} &middot; calculation version {{ version }} &middot;
+API RP 1111 + ASME B31.4/B31.8</p>
+</body>
+</html>
+""",
+    "riser.html": """{% extends "base.html" %}
+{% block title %}{{ name }} - Riser Design Report{% endblock %}
+{% block body %}
+{% if index_href %}<p class="no-print"><a href="{{ index_href }}">&larr; All risers</a></p>{% endif %}
+<h1>{{ name }}</h1>
+<p>Riser design check, 16 life cycle sub-conditions:
+<span class="pill {{ 'pass' if all_pass else 'fail' }}">{{ 'ALL CONDITIONS PASS' if all_pass else 'SOME CONDITIONS FAIL' }}</span></p>
+
+<h2>Inputs</h2>
+<div class="inputs">
+<table>
+<tr><th colspan="2">Pipe</th></tr>
+{% for label, value in pipe_rows %}<tr><td>{{ label }}</td><td class="num">{{ value }}</td></tr>
+{% endfor %}</table>
+<table>
+<tr><th colspan="2">Loading</th></tr>
+{% for label, value in load_rows %}<tr><td>{{ label }}</td><td class="num">{{ value }}</td></tr>
+{% endfor %}</table>
+</div>
+
+<h2>Verification Notes</h2>
+{% if notes %}<ul class="notes">{% for note in notes %}<li>{{ note }}</li>{% endfor %}</ul>
+{% else %}<p class="pass">All inputs within typical design ranges. No flags detected.</p>{% endif %}
+
+<h2>Life Cycle Summary</h2>
+<table>
+<tr><th>Stage</th><th>Wall Thickness Type</th><th>Position</th><th>Effective WT (in)</th><th>Po (psi)</th>
+<th>Pi Burst (psi)</th><th>Pi Collapse (psi)</th><th>Limiting Check</th><th>Min SF</th><th>Status</th></tr>
+{% for c in conditions %}<tr><td>{{ c.stage }}</td><td>{{ c.wt_type }}</td><td>{{ c.position }}</td>
+<td class="num">{{ '%.4f' % c.wt_effective }}</td><td class="num">{{ '%.0f' % c.p_external }}</td>
+<td class="num">{{ '%.0f' % c.p_burst }}</td><td class="num">{{ '%.0f' % c.p_collapse }}</td>
+<td>{{ c.limiting }}</td><td class="num">{{ c.min_sf }}</td><td class="{{ c.status|lower }}">{{ c.status }}</td></tr>
+{% endfor %}</table>
+
+<h2>Checks by Condition</h2>
+{% for c in conditions %}<div class="condition">
+<h3>{{ c.stage }} &middot; {{ c.wt_type }} &middot; {{ c.position }}</h3>
+<table>
+<tr><th>Check</th><th>Safety Factor</th><th>Utilization (%)</th><th>Status</th></tr>
+{% for chk in c.checks %}<tr><td>{{ chk.name }}</td><td class="num">{{ chk.sf }}</td>
+<td class="num">{{ '%.1f' % chk.utilization }}</td><td class="{{ 'pass' if chk.passed else 'fail' }}">{{ chk.status }}</td></tr>
+{% endfor %}</table>
+</div>
+{% endfor %}
+{% endblock %}
+""",
+    "index.html": """{% extends "base.html" %}
+{% block title %}Riser Design Reports{% endblock %}
+{% block body %}
+<h1>Riser Design Reports</h1>
+<p>{{ rows|length }} riser(s), {{ rows|rejectattr('all_pass')|list|length }} failing.</p>
+<table>
+<tr><th>#</th><th>Riser</th><th>OD (in)</th><th>WT (in)</th><th>Grade</th><th>Min SF</th>
+<th>Limiting Condition</th><th>Notes</th><th>Status</th></tr>
+{% for row in rows %}<tr><td class="num">{{ loop.index }}</td><td><a href="{{ row.file }}">{{ row.name }}</a></td>
+<td class="num">{{ row.od_in }}</td><td class="num">{{ row.wt_in }}</td><td>{{ row.grade }}</td>
+<td class="num">{{ row.min_sf_text }}</td><td>{{ row.limiting or '' }}</td><td class="num">{{ row.notes }}</td>
+<td class="{{ 'pass' if row.all_pass else 'fail' }}">{{ 'PASS' if row.all_pass else 'FAIL' }}</td></tr>
+{% endfor %}</table>
+{% endblock %}
+""",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _environment():
+    """Jinja2 environment with every template compiled (once per process)."""
+    import jinja2   # only report generation pays for the import
+
+    env = jinja2.Environment(loader=jinja2.DictLoader(TEMPLATES), autoescape=True,
+                             undefined=jinja2.StrictUndefined, auto_reload=False)
+    env.globals.update(style=_STYLE, version=calculation_version())
+    for name in TEMPLATES:
+        env.get_template(name)
+    return env
+
+
+def _check_rows(pos_result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Check name, formatted SF, utilization and status as in the app's checks table."""
+    p_internal = pos_result.get("p_internal_burst", 0)
+    rows = [(chk["name"], chk["safety_factor"], chk["pass_fail"], "PASS" if chk["pass_fail"] else "FAIL")
+            for chk in pos_result["checks"]]
+    for name, key in (("Longitudinal Tension", "longitudinal"), ("Combined Loading", "combined")):
+        check = pos_result[key]
+        rows.append((name, check["safety_factor"], check["passes"], check["status"]))
+    return [{
+        "name": name,
+        "sf": format_safety_factor(sf, name, p_internal),
+        "utilization": 0.0 if sf == float("inf") else 100.0 / sf,
+        "passed": passed,
+        "status": status,
+    } for name, sf, passed, status in rows]
+
+
+def _condition_rows(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    rows = []
+    for stage_name in STAGES:
+        for wt_data in result["conditions"][stage_name].values():
+            for pos_result in wt_data["positions"].values():
+                rows.append({
+                    "stage": pos_result["condition_name"],
+                    "wt_type": wt_data["description"],
+                    "position": pos_result["position"],
+                    "wt_effective": pos_result["wt_effective"],
+                    "p_external": pos_result["p_external_psi"],
+                    "p_burst": pos_result["p_internal_burst"],
+                    "p_collapse": pos_result["p_internal_collapse"],
+                    "limiting": pos_result["limiting"]["name"],
+                    "limiting_sf": pos_result["limiting"]["safety_factor"],
+                    "min_sf": format_safety_factor(pos_result["limiting"]["safety_factor"]),
+                    "status": "PASS" if pos_result["all_pass"] else "FAIL",
+                    "checks": _check_rows(pos_result),
+                })
+    return rows
+
+
+def _input_rows(pipe: PipeProperties, load: LoadingCondition) -> Tuple[list, list]:
+    pipe_rows = [
+        ("Outer diameter (in)", f"{pipe.od_in:g}"),
+        ("Wall thickness (in)", f"{pipe.wt_in:g}"),
+        ("Grade", pipe.grade),
+        ("SMYS / UTS (psi)", f"{pipe.smys_psi:,.0f} / {pipe.uts_psi:,.0f}"),
+        ("Manufacturing", pipe.manufacturing),
+        ("Design category", pipe.design_category),
+        ("Fluid", f"{pipe.fluid_type} (SG {pipe.fluid_sg:g})"),
+        ("Ovality", f"{pipe.ovality:g} ({pipe.ovality_type})"),
+    ]
+    load_rows = [
+        ("Design pressure (psi)", f"{load.design_pressure_psi:,.0f}"),
+        ("Shut-in pressure (psi)", f"{load.shut_in_pressure_psi:,.0f}"),
+        ("Shut-in location", load.shut_in_location),
+        ("Water depth (m)", f"{load.water_depth_m:g}"),
+        ("Riser length (m)", f"{load.riser_length_m:g}"),
+    ]
+    return pipe_rows, load_rows
+
+
+def _context(name: str, pipe: PipeProperties, load: LoadingCondition, result: Dict[str, Any]) -> Dict[str, Any]:
+    pipe_rows, load_rows = _input_rows(pipe, load)
+    return {
+        "name": name,
+        "all_pass": result["all_conditions_pass"],
+        "pipe_rows": pipe_rows,
+        "load_rows": load_rows,
+        "notes": build_verification_notes(pipe, load, result),
+        "conditions": _condition_rows(result),
+    }
+
+
+def render_riser_report(name: str, pipe: PipeProperties, load: LoadingCondition,
+                        result: Optional[Dict[str, Any]] = None, generated: Optional[str] = None,
+                        index_href: Optional[str] = None) -> str:
+    """
+    Self-contained HTML report of one riser.
+
+    Parameters:
+    -----------
+    name : str
+        Riser name (report title)
+    pipe, load : PipeProperties, LoadingCondition
+    result : dict, optional
+        run_all_conditions() output (computed when omitted)
+    generated : str, optional
+        Timestamp printed in the footer (default: now)
+    index_href : str, optional
+        Link back to the fleet index (screen only)
+
+    Returns:
+    --------
+    str : HTML document
+    """
+    if result is None:
+        result = LifeCycleAnalyzer(pipe, load).run_all_conditions()
+    return _environment().get_template("riser.html").render(
+        _context(name, pipe, load, result),
+        generated=generated or time.strftime("%Y-%m-%d %H:%M"),
+        index_href=index_href,
+    )
+
+
+def report_filename(number: int, name: str) -> str:
+    """Unique, file-system safe report name: 0001-riser-a.html"""
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", name).strip("-").lower()[:60] or "riser"
+    return f"{number:04d}-{slug}.html"
+
+
+def _write_chunk(chunk: Sequence[Tuple[int, Riser]], directory: str, generated: str) -> List[Dict[str, Any]]:
+    """Render and write the reports of one chunk; returns their index rows."""
+    riser_template = _environment().get_template("riser.html")
+    rows = []
+    for number, (name, pipe, load) in chunk:
+        context = _context(name, pipe, load, LifeCycleAnalyzer(pipe, load).run_all_conditions())
+        filename = report_filename(number, name)
+        html = riser_template.render(context, generated=generated, index_href="index.html")
+        with open(os.path.join(directory, filename), "w", encoding="utf-8") as f:
+            f.write(html)
+        governing = min(context["conditions"], key=lambda c: c["limiting_sf"])
+        rows.append({
+            "name": name,
+            "file": filename,
+            "od_in": f"{pipe.od_in:g}",
+            "wt_in": f"{pipe.wt_in:g}",
+            "grade": pipe.grade,
+            "all_pass": context["all_pass"],
+            "min_sf": governing["limiting_sf"],
+            "min_sf_text": governing["min_sf"],
+            "limiting": f"{governing['stage']} - {governing['wt_type']} - {governing['position']} "
+                        f"({governing['limiting']})",
+            "notes": len(context["notes"]),
+        })
+    return rows
+
+
+def write_reports(risers: Sequence[Riser], directory, workers: Optional[int] = None,
+                  progress: Optional[ProgressToken] = None) -> List[Dict[str, Any]]:
+    """
+    Write one HTML report per riser plus index.html into a directory.
+
+    Parameters:
+    -----------
+    risers : sequence of (name, PipeProperties, LoadingCondition)
+    directory : str or Path
+        Output directory (created if missing; existing reports are overwritten)
+    workers : int, optional
+        Process pool size (default: CPU count, at most 4); fleets of up to
+        INLINE_REPORTS_MAX risers are rendered in the calling thread
+    progress : ProgressToken, optional
+        Advanced per chunk; cancellation stops after the chunk in progress
+        (the index then lists the reports written so far)
+
+    Returns:
+    --------
+    list of dict : Index rows in input order (name, file, od_in, wt_in, grade,
+                   all_pass, min_sf, min_sf_text, limiting, notes)
+    """
+    directory = str(directory)
+    os.makedirs(directory, exist_ok=True)
+    generated = time.strftime("%Y-%m-%d %H:%M")
+    numbered = list(enumerate(risers, start=1))
+    chunks = [numbered[i:i + REPORT_CHUNK] for i in range(0, len(numbered), REPORT_CHUNK)]
+    if progress is not None and progress.total is None:
+        progress.add_total(len(risers))
+
+    rows: List[Dict[str, Any]] = []
+    args = ([directory] * len(chunks), [generated] * len(chunks))
+    if len(risers) <= INLINE_REPORTS_MAX:
+        results = map(_write_chunk, chunks, *args)
+        pool = None
+    else:
+        # spawn: the caller may be a thread of a server process (Streamlit)
+        pool = ProcessPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1),
+                                   mp_context=multiprocessing.get_context("spawn"))
+        results = pool.map(_write_chunk, chunks, *args)
+    try:
+        for chunk_rows in results:
+            rows.extend(chunk_rows)
+            if progress is not None and not progress.advance(len(chunk_rows)):
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    html = _environment().get_template("index.html").render(rows=rows, generated=generated)
+    with open(os.path.join(directory, "index.html"), "w", encoding="utf-8") as f:
+        f.write(html)
+    return rows
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m batch.report",
+        description="Write self-contained HTML design reports for a CSV / JSON riser file",
+    )
+    parser.add_argument("input", help="Riser file (.csv or .json, columns as in the app's bulk mode)")
+    parser.add_argument("-o", "--output", default="reports", help="Output directory (default: reports)")
+    parser.add_argument("-w", "--workers", type=int, help="Worker processes (default: CPU count, at most 4)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Report CLI entry point. Returns a process exit code."""
+    args = build_parser().parse_args(argv)
+    try:
+        risers, rejected = fleet.parse_risers(Path(args.input).read_bytes(), args.input)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    for row in rejected:
+        print(f"Row {row['row']} ({row['name']}) skipped: {'; '.join(row['errors'])}", file=sys.stderr)
+    start = time.perf_counter()
+    rows = write_reports(risers, args.output, workers=args.workers)
+    failing = sum(not row["all_pass"] for row in rows)
+    print(f"Wrote {len(rows)} report(s) ({failing} failing) to {Path(args.output) / 'index.html'} "
+          f"in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+    return 1 if rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
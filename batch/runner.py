@@ -0,0 +1,297 @@
+"""
+Batch Runner - scenario discovery and per-scenario work units
+
+Scenario files may use any of the layouts already found in reference_data/:
+- {"project_info": {...}, "scenarios": [...]}   (input_data.json)
+- {"risers": {"<id>": {...}, ...}}              (riser_database.json)
+- a single scenario object
+- JSON Lines, one scenario per line (.jsonl / .ndjson)
+
+Every scenario becomes one work unit. Workers evaluate units in chunks with
+the vectorized engine (engine.scenario), which produces the same summary as
+reducing a full main.analyze_scenario result, so the parent process only ever
+holds one small record per finished unit. When a result cache is configured
+(see batch.cache), summaries of unchanged scenarios are read back from disk
+instead of being recomputed.
+"""
+
+import glob
+import json
+import math
+import os
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from batch import streaming
+from batch.cache import ResultCache, cache_key
+from engine import scenario as engine_scenario
+from reference_data import asme_b36_10, external_catalog
+
+
+CONDITION_ORDER = engine_scenario.CONDITION_ORDER
+CHECK_ORDER = engine_scenario.CHECK_ORDER
+SCENARIO_SUFFIXES = {'.json'} | streaming.JSONL_SUFFIXES
+
+# Per-process result cache, set by configure_cache (also the pool initializer)
+_cache: Optional[ResultCache] = None
+
+
+def configure_cache(directory: Optional[str], max_bytes: Optional[int] = None) -> None:
+    """
+    Enable (or with directory=None, disable) the result cache in this process.
+
+    Used directly for inline runs and as the ProcessPoolExecutor initializer
+    so every worker opens the same shared cache directory.
+    """
+    global _cache
+    if directory is None:
+        _cache = None
+    elif max_bytes is None:
+        _cache = ResultCache(directory)
+    else:
+        _cache = ResultCache(directory, max_bytes=max_bytes)
+
+
+def get_cache() -> Optional[ResultCache]:
+    """Return the result cache configured in this process, if any."""
+    return _cache
+
+
+def configure_catalog(path: Optional[str]) -> None:
+    """
+    Answer standard thickness lookups from an external pipe catalog (CSV or
+    converted binary file), or with path=None from the built-in ASME table.
+    Workers memory-map the same binary file, so its pages are shared.
+    """
+    if path is None:
+        asme_b36_10.use_catalog(None)
+    else:
+        asme_b36_10.use_catalog(external_catalog.load_catalog(path))
+
+
+def init_worker(cache_dir: Optional[str], cache_max_bytes: Optional[int] = None,
+                catalog_path: Optional[str] = None) -> None:
+    """ProcessPoolExecutor initializer: result cache and pipe catalog."""
+    configure_cache(cache_dir, cache_max_bytes)
+    configure_catalog(catalog_path)
+
+
+def expand_inputs(patterns: List[str]) -> List[Path]:
+    """
+    Expand glob patterns and directories into a sorted list of scenario files.
+
+    Parameters:
+    -----------
+    patterns : list of str
+        File paths, glob patterns (``data/*.json``, ``runs/**/*.json``)
+        or directories (searched recursively for .json/.jsonl/.ndjson)
+
+    Returns:
+    --------
+    list : Unique file paths in a stable order
+    """
+    files: List[Path] = []
+    seen = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(p for p in path.rglob('*') if p.suffix.lower() in SCENARIO_SUFFIXES)
+        elif any(ch in pattern for ch in '*?['):
+            matches = sorted(Path(p) for p in glob.glob(pattern, recursive=True))
+        else:
+            matches = [path]
+
+        for match in matches:
+            key = os.path.abspath(match)
+            if key not in seen and match.is_file():
+                seen.add(key)
+                files.append(match)
+    return files
+
+
+def iter_file_units(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one work unit per scenario contained in a scenario file.
+
+    Scenarios are streamed (see batch.streaming), so a file with millions of
+    scenarios is never fully materialized. JSON Lines records that fail to
+    parse become units carrying an 'error' so they are reported, not fatal.
+    A JSON document that cannot be read or parsed ends with one error unit
+    '{path}#file' after the scenarios streamed before the problem.
+
+    Parameters:
+    -----------
+    path : Path
+        Scenario JSON or JSON Lines file
+
+    Yields:
+    -------
+    dict : Work unit with keys 'unit_id', 'source', 'project_info', 'scenario'
+    """
+    header: Dict[str, Any] = {}
+    scenarios = streaming.iter_scenarios(path, header)
+    while True:
+        try:
+            key, scenario = next(scenarios)
+        except StopIteration:
+            return
+        except (OSError, ValueError) as e:  # incl. JSONDecodeError / UnicodeDecodeError
+            yield {
+                'unit_id': f"{path}#file",
+                'source': str(path),
+                'project_info': header.get('project_info', {}),
+                'scenario': None,
+                'error': f"Unreadable file: {type(e).__name__}: {e}",
+            }
+            return
+        unit = {
+            'unit_id': f"{path}#{key}",
+            'source': str(path),
+            'project_info': header.get('project_info', {}),
+            'scenario': scenario,
+        }
+        if isinstance(scenario, json.JSONDecodeError):
+            unit['scenario'] = None
+            unit['error'] = f"Invalid JSON: {scenario}"
+        yield unit
+
+
+def iter_units(files: List[Path]) -> Iterator[Dict[str, Any]]:
+    """Yield work units for every scenario in every file, lazily per file."""
+    for path in files:
+        yield from iter_file_units(path)
+
+
+def _finite(value: Any) -> Optional[float]:
+    """Return value as float, or None for inf/NaN so output stays strict JSON."""
+    if value is None:
+        return None
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def summarize_analysis(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a main.analyze_scenario result to a compact summary record.
+
+    Utilizations are reported at the recommended thickness. When no standard
+    thickness passes, the thickest standard size is reported instead so the
+    governing failure remains visible.
+
+    Parameters:
+    -----------
+    result : dict
+        Output of main.analyze_scenario
+
+    Returns:
+    --------
+    dict : Summary with least/recommended thickness, per-condition
+           utilizations and the governing check
+    """
+    recommended = result['recommended_thickness']
+    entries = result['results']
+    entry = None
+    if recommended is not None:
+        entry = next(r for r in entries if r['wall_thickness'] == recommended)
+    elif entries:
+        entry = entries[-1]
+
+    utilizations: Dict[str, Dict[str, Optional[float]]] = {}
+    governing = None
+    if entry is not None:
+        for cond_key in CONDITION_ORDER:
+            cond = entry['conditions'][cond_key]
+            utilizations[cond_key] = {}
+            for check in CHECK_ORDER:
+                util = _finite(cond[check]['utilization'])
+                utilizations[cond_key][check] = util
+                if util is not None and (governing is None or util > governing['utilization']):
+                    governing = {'condition': cond_key, 'check': check, 'utilization': util}
+
+    return {
+        'scenario_name': result['scenario_name'],
+        'scenario_type': result['scenario_type'],
+        'od': result['od'],
+        'grade': result['grade'],
+        'least_thickness': result['least_thickness'],
+        'recommended_thickness': recommended,
+        'all_pass': recommended is not None,
+        'evaluated_thickness': entry['wall_thickness'] if entry else None,
+        'utilizations': utilizations,
+        'governing': governing,
+    }
+
+
+def run_chunk(units: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Analyze a chunk of work units with one vectorized engine call.
+
+    Errors are captured in the records rather than raised so one malformed
+    scenario does not abort the whole batch. With a cache configured each
+    record carries 'cached': true/false and only misses are computed.
+    'elapsed_ms' of computed records is the chunk time divided evenly.
+
+    Returns:
+    --------
+    list : Summary records in the same order as `units`
+    """
+    start = time.perf_counter()
+    records: List[Dict[str, Any]] = []
+    todo: List[int] = []
+    keys: Dict[int, str] = {}
+    for i, unit in enumerate(units):
+        record: Dict[str, Any] = {'id': unit['unit_id'], 'source': unit['source']}
+        records.append(record)
+        if unit.get('error'):
+            record['error'] = unit['error']
+            if 'validation_errors' in unit:
+                record['validation_errors'] = unit['validation_errors']
+            continue
+        if _cache is not None:
+            try:
+                keys[i] = cache_key(unit['scenario'], unit['project_info'], kind='summary')
+            except (TypeError, ValueError):
+                pass  # not JSON-serializable - analyze uncached and let the engine report it
+            else:
+                summary = _cache.get(keys[i])
+                if summary is not None:
+                    record.update(summary)
+                    record['cached'] = True
+                    record['elapsed_ms'] = round((time.perf_counter() - start) * 1000.0, 3)
+                    continue
+                record['cached'] = False
+        todo.append(i)
+
+    if todo:
+        compute_start = time.perf_counter()
+        results = engine_scenario.summarize_scenarios(
+            [(units[i]['scenario'], units[i]['project_info']) for i in todo]
+        )
+        elapsed_ms = round((time.perf_counter() - compute_start) * 1000.0 / len(todo), 3)
+        for i, result in zip(todo, results):
+            record = records[i]
+            if result is None:
+                od = units[i]['scenario'].get('geometry', {}).get('od_inches')
+                record['error'] = f"No standard thicknesses available for OD {od}"
+            elif isinstance(result, Exception):
+                record['error'] = f"{type(result).__name__}: {result}"
+                record['traceback'] = ''.join(
+                    traceback.format_exception(type(result), result, result.__traceback__, limit=3))
+            else:
+                record.update(result)
+                if i in keys:
+                    _cache.put(keys[i], result)
+            record['elapsed_ms'] = elapsed_ms
+    return records
+
+
+def run_unit(unit: Dict[str, Any]) -> Dict[str, Any]:
+    """Analyze one work unit and return its summary record (see run_chunk)."""
+    return run_chunk([unit])[0]
+
+
+def dumps_record(record: Dict[str, Any]) -> str:
+    """Serialize a summary record as one strict-JSON line (no trailing newline)."""
+    return json.dumps(record, allow_nan=False, separators=(',', ':'))
@@ -0,0 +1,207 @@
+"""
+Scenario Schema - up-front validation of scenario inputs
+
+main.analyze_scenario and engine.scenario index nested scenario keys
+directly, so a malformed scenario fails with a bare KeyError / TypeError in
+the middle of a run. The schema below describes every field they read. It is
+compiled once into a generated Python function (plain nested `if`s, no
+interpretation of the schema per scenario) that reports every problem in one
+pass, each with its path:
+
+    validate = compile_schema(SCENARIO_SCHEMA)
+    validate({"geometry": {"od_inches": -1}, ...})
+    -> ["name: required", "geometry.od_inches: must be > 0", ...]
+
+validate_scenario() uses the precompiled SCENARIO_SCHEMA validator and
+costs a few microseconds per scenario. The batch CLI runs it on every unit as
+it is read (see validate_units) and writes invalid ones to a reject file.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class Field(NamedTuple):
+    """
+    One scalar field of a schema.
+
+    kind : 'number', 'string' or 'boolean' (numbers exclude booleans)
+    required : the key must be present
+    nullable : None is accepted
+    gt / ge / lt / le : numeric bounds
+    choices : accepted string values
+    """
+    kind: str
+    required: bool = True
+    nullable: bool = False
+    gt: Optional[float] = None
+    ge: Optional[float] = None
+    lt: Optional[float] = None
+    le: Optional[float] = None
+    choices: Optional[Tuple[str, ...]] = None
+
+
+# Values with factors in calcs_burst / calcs_collapse (others silently get defaults)
+SCENARIO_TYPES = ('Riser', 'Flowline', 'Pipeline')
+MANUFACTURING_METHODS = ('Seamless', 'ERW', 'DSAW', 'SAW', 'EFW', 'Cold Expanded')
+
+# Fields read by main.analyze_scenario / engine.scenario.scenario_parameters
+SCENARIO_SCHEMA: Dict[str, Any] = {
+    'name': Field('string'),
+    'type': Field('string', choices=SCENARIO_TYPES),
+    'riser_type': Field('string', required=False),
+    'manufacturing': Field('string', choices=MANUFACTURING_METHODS),
+    'geometry': {
+        'od_inches': Field('number', gt=0),
+        'ovality': Field('number', ge=0, lt=1),
+        'corrosion_allowance_inches': Field('number', required=False, ge=0),
+        'mill_tolerance_percent': Field('number', required=False, ge=0, lt=100),
+    },
+    'material': {
+        'grade': Field('string'),
+        'smys_ksi': Field('number', gt=0),
+        'uts_ksi': Field('number', gt=0),
+        'modulus_of_elasticity_ksi': Field('number', gt=0),
+        'poisson_ratio': Field('number', gt=0, lt=0.5),
+    },
+    'loads': {
+        'design_internal_pressure_psi': Field('number', ge=0),
+        'design_external_pressure_psi': Field('number', nullable=True, ge=0),
+        'hydrotest_pressure_psi': Field('number', required=False, ge=0),
+        'bending_strain': Field('number', ge=0),
+        'bending_strain_installation': Field('number', required=False, ge=0),
+        'depth_lat_m': Field('number', required=False, ge=0),
+        'depth_hat_m': Field('number', required=False, ge=0),
+        'depth_m': Field('number', required=False, ge=0),
+        'fluid_content': Field('string', required=False),
+        'use_annulus_pressure': Field('boolean'),
+    },
+}
+
+# project_info values read by the calculations (all optional)
+PROJECT_INFO_SCHEMA: Dict[str, Any] = {
+    'water_density_seawater': Field('number', required=False, gt=0),
+    'hydrotest_factor': Field('number', required=False, gt=0),
+}
+
+_KIND_TESTS = {
+    'number': "(type({v}) is float or type({v}) is int)",
+    'string': "type({v}) is str",
+    'boolean': "type({v}) is bool",
+}
+_KIND_NAMES = {'number': 'a number', 'string': 'a string', 'boolean': 'true or false'}
+
+
+def _emit_field(lines: List[str], indent: str, var: str, path: str, field: Field, consts: Dict[str, Any]) -> None:
+    test = _KIND_TESTS[field.kind].format(v=var)
+    if field.nullable:
+        lines.append(f"{indent}if {var} is not None:")
+        indent += "    "
+    lines.append(f"{indent}if not {test}:")
+    lines.append(f"{indent}    add({path!r} + ': must be {_KIND_NAMES[field.kind]}')")
+    checks = []
+    for op, bound, text in (('<=', field.gt, '>'), ('<', field.ge, '>='),
+                            ('>=', field.lt, '<'), ('>', field.le, '<=')):
+        if bound is not None:
+            checks.append((f"{var} {op} {bound!r}", f"must be {text} {bound!r}"))
+    if field.kind == 'number':
+        checks.append((f"{var} != {var} or {var} in (_INF, -_INF)", "must be finite"))
+    if field.choices:
+        name = f"_CHOICES_{len(consts)}"
+        consts[name] = frozenset(field.choices)
+        checks.append((f"{var} not in {name}", "must be one of " + ", ".join(field.choices)))
+    for condition, message in checks:
+        lines.append(f"{indent}elif {condition}:")
+        lines.append(f"{indent}    add({(path + ': ' + message)!r})")
+
+
+def _emit_object(lines: List[str], indent: str, var: str, prefix: str, schema: Dict[str, Any],
+                 consts: Dict[str, Any], depth: int) -> None:
+    for key, spec in schema.items():
+        path = f"{prefix}{key}"
+        child = f"v{depth}"   # one local per nesting level
+        lines.append(f"{indent}{child} = {var}.get({key!r}, _MISSING)")
+        if isinstance(spec, dict):
+            lines.append(f"{indent}if {child} is _MISSING:")
+            lines.append(f"{indent}    add({path!r} + ': required')")
+            lines.append(f"{indent}elif type({child}) is not dict:")
+            lines.append(f"{indent}    add({path!r} + ': must be an object')")
+            lines.append(f"{indent}else:")
+            _emit_object(lines, indent + "    ", child, path + ".", spec, consts, depth + 1)
+        else:
+            lines.append(f"{indent}if {child} is _MISSING:")
+            if spec.required:
+                lines.append(f"{indent}    add({path!r} + ': required')")
+            else:
+                lines.append(f"{indent}    pass")
+            lines.append(f"{indent}else:")
+            _emit_field(lines, indent + "    ", child, path, spec, consts)
+
+
+def compile_schema(schema: Dict[str, Any], name: str = 'validate') -> Callable[[Any], List[str]]:
+    """
+    Compile a schema (nested dicts of Field) into a validation function.
+
+    Parameters:
+    -----------
+    schema : dict
+        Field name -> Field, or a nested schema dict for sub-objects
+    name : str
+        Name of the generated function (shown in tracebacks)
+
+    Returns:
+    --------
+    callable : validate(obj) -> list of "path: problem" strings (empty if valid)
+    """
+    consts: Dict[str, Any] = {}
+    lines = [f"def {name}(obj):",
+             "    errors = []",
+             "    add = errors.append",
+             "    if type(obj) is not dict:",
+             "        return ['must be an object']"]
+    _emit_object(lines, "    ", "obj", "", schema, consts, 0)
+    lines.append("    return errors")
+    source = "\n".join(lines)
+    namespace: Dict[str, Any] = {'_MISSING': object(), '_INF': float('inf'), **consts}
+    exec(compile(source, f"<schema {name}>", "exec"), namespace)
+    validator = namespace[name]
+    validator.source = source
+    return validator
+
+
+_validate_scenario = compile_schema(SCENARIO_SCHEMA, 'validate_scenario')
+_validate_project_info = compile_schema(PROJECT_INFO_SCHEMA, 'validate_project_info')
+
+
+def validate_scenario(scenario: Any, project_info: Optional[Dict[str, Any]] = None) -> List[str]:
+    """
+    Every problem with a scenario (and its project_info), as "path: problem".
+
+    Returns:
+    --------
+    list : Empty for a valid scenario
+    """
+    errors = _validate_scenario(scenario)
+    if project_info:
+        errors += ['project_info.' + e for e in _validate_project_info(project_info)]
+    return errors
+
+
+def validate_units(units: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Validate work units as they stream past. An invalid unit gets 'error'
+    (so workers skip it) and 'validation_errors' with every problem found.
+    project_info, shared by the units of a file, is checked once per file.
+    """
+    info, info_errors = None, []
+    for unit in units:
+        if not unit.get('error'):
+            project_info = unit.get('project_info')
+            if project_info is not info:
+                info = project_info
+                info_errors = ['project_info.' + e for e in _validate_project_info(project_info)] \
+                    if project_info else []
+            errors = _validate_scenario(unit.get('scenario')) + info_errors
+            if errors:
+                unit['error'] = f"Invalid scenario: {len(errors)} error(s)"
+                unit['validation_errors'] = errors
+        yield unit
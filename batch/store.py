@@ -0,0 +1,447 @@
+"""
+Riser Store - SQLite database of riser definitions and analysis results
+
+One local file holds the fleet of riser definitions and every batch result
+ever written to it, so reruns accumulate instead of being thrown away:
+
+- risers:       one row per riser (riser_key of the work unit id), with OD, grade and the
+                deepest water depth as indexed columns and the full
+                scenario as JSON
+- runs:         one row per batch run (time, label, calculation version)
+- results:      one row per summary record, with the governing check indexed
+- utilizations: one row per (result, condition, check) for threshold queries
+
+Inserts are bulk executemany() calls inside one transaction per batch.
+Queries read the latest result of each riser by default, e.g.
+
+    with RiserStore("fleet.db") as store:
+        hot = store.query(condition="operation", check="collapse", min_utilization=0.9)
+
+Command line:
+    python -m batch.store fleet.db import reference_data/riser_database.json
+    python -m batch.store fleet.db query --condition operation --check collapse --min 0.9
+    python -m batch.store fleet.db stats
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from batch import runner
+from batch.cache import calculation_version
+
+DEFAULT_BATCH_SIZE = 1000   # rows per insert transaction
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS risers (
+    riser_id   TEXT PRIMARY KEY,
+    name       TEXT,
+    type       TEXT,
+    od         REAL,
+    grade      TEXT,
+    depth_m    REAL,
+    source     TEXT,
+    definition TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS risers_od ON risers(od);
+CREATE INDEX IF NOT EXISTS risers_grade ON risers(grade);
+CREATE INDEX IF NOT EXISTS risers_depth ON risers(depth_m);
+
+CREATE TABLE IF NOT EXISTS runs (
+    run_id     INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    label      TEXT,
+    version    TEXT
+);
+
+CREATE TABLE IF NOT EXISTS results (
+    result_id             INTEGER PRIMARY KEY,
+    run_id                INTEGER NOT NULL REFERENCES runs(run_id),
+    riser_id              TEXT NOT NULL,
+    od                    REAL,
+    grade                 TEXT,
+    recommended_thickness REAL,
+    all_pass              INTEGER,
+    governing_condition   TEXT,
+    governing_check       TEXT,
+    governing_utilization REAL,
+    error                 TEXT,
+    record                TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_riser ON results(riser_id, result_id);
+CREATE INDEX IF NOT EXISTS results_governing ON results(governing_check, governing_utilization);
+CREATE INDEX IF NOT EXISTS results_run ON results(run_id);
+
+CREATE TABLE IF NOT EXISTS utilizations (
+    result_id   INTEGER NOT NULL,
+    condition   TEXT NOT NULL,
+    check_name  TEXT NOT NULL,
+    utilization REAL,
+    PRIMARY KEY (result_id, condition, check_name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS utilizations_value ON utilizations(condition, check_name, utilization);
+"""
+
+
+def _batches(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    batch: List[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def riser_key(unit_id: str) -> str:
+    """
+    Store key of a work unit id '{path}#{key}': the real path of the file, so
+    loading it by a relative or an absolute path adds to the same riser.
+    Ids without '#' are kept as they are.
+    """
+    path, sep, key = unit_id.rpartition('#')
+    if not sep:
+        return unit_id
+    return f"{os.path.realpath(path)}#{key}"
+
+
+def riser_row(riser_id: str, scenario: Dict[str, Any], source: Optional[str] = None) -> tuple:
+    """Indexed columns of a scenario (deepest of HAT / LAT / depth_m as depth_m)."""
+    geometry = scenario.get('geometry') or {}
+    material = scenario.get('material') or {}
+    loads = scenario.get('loads') or {}
+    depths = [loads.get(k) for k in ('depth_hat_m', 'depth_lat_m', 'depth_m')]
+    depths = [d for d in depths if isinstance(d, (int, float))]
+    return (
+        riser_id,
+        scenario.get('name'),
+        scenario.get('type'),
+        geometry.get('od_inches'),
+        material.get('grade'),
+        max(depths) if depths else None,
+        source,
+        json.dumps(scenario, separators=(',', ':')),
+    )
+
+
+class RiserStore:
+    """
+    SQLite store of riser definitions and analysis results.
+
+    Parameters:
+    -----------
+    path : str or Path
+        Database file (created with the schema if missing); ':memory:' for tests
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        if self.path != ':memory:':
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+    def add_risers(self, units: Iterable[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Insert or replace riser definitions from work units (runner.iter_units).
+
+        Returns:
+        --------
+        int : Number of risers written (units with read errors are skipped)
+        """
+        rows = (riser_row(riser_key(u['unit_id']), u['scenario'],
+                          os.path.realpath(u['source']) if u.get('source') else None)
+                for u in units if isinstance(u.get('scenario'), dict))
+        count = 0
+        for batch in _batches(rows, batch_size):
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO risers VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch)
+            count += len(batch)
+        return count
+
+    def import_files(self, patterns: List[str]) -> int:
+        """Import every scenario in files / globs / directories as risers."""
+        return self.add_risers(runner.iter_units(runner.expand_inputs(patterns)))
+
+    def start_run(self, label: Optional[str] = None) -> int:
+        """Register a batch run and return its run_id."""
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (started_at, label, version) VALUES (?, ?, ?)",
+                (time.time(), label, calculation_version()))
+        return cursor.lastrowid
+
+    def add_results(self, records: Iterable[Dict[str, Any]], run_id: int,
+                    batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Insert summary records (runner.run_chunk output) for a run.
+
+        result_ids are assigned by SQLite (INTEGER PRIMARY KEY), so
+        concurrent writers never collide.
+
+        Returns:
+        --------
+        int : Number of records written
+        """
+        count = 0
+        for batch in _batches(records, batch_size):
+            with self.conn:
+                util_rows = []
+                for record in batch:
+                    governing = record.get('governing') or {}
+                    result_id = self.conn.execute(
+                        "INSERT INTO results (run_id, riser_id, od, grade, recommended_thickness, all_pass, "
+                        "governing_condition, governing_check, governing_utilization, error, record) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", (
+                            run_id, riser_key(record['id']), record.get('od'), record.get('grade'),
+                            record.get('recommended_thickness'),
+                            None if 'all_pass' not in record else int(bool(record['all_pass'])),
+                            governing.get('condition'), governing.get('check'),
+                            governing.get('utilization'), record.get('error'),
+                            runner.dumps_record(record),
+                        )).lastrowid
+                    for condition, checks in (record.get('utilizations') or {}).items():
+                        for check, value in checks.items():
+                            util_rows.append((result_id, condition, check, value))
+                self.conn.executemany(
+                    "INSERT INTO utilizations VALUES (?, ?, ?, ?)", util_rows)
+            count += len(batch)
+        return count
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+    def get_riser(self, riser_id: str) -> Optional[Dict[str, Any]]:
+        """Scenario dict of a riser (work unit id or riser_key), or None."""
+        row = self.conn.execute(
+            "SELECT definition FROM risers WHERE riser_id = ?", (riser_key(riser_id),)).fetchone()
+        return json.loads(row['definition']) if row else None
+
+    def risers(self, od: Optional[float] = None, grade: Optional[str] = None,
+               min_depth: Optional[float] = None, max_depth: Optional[float] = None,
+               od_tolerance: float = 0.01) -> List[Dict[str, Any]]:
+        """
+        Riser rows matching every given filter (indexed columns only).
+
+        Returns:
+        --------
+        list : Dicts with riser_id, name, type, od, grade, depth_m, source
+        """
+        where, params = self._riser_filters(od, grade, min_depth, max_depth, od_tolerance, 'r')
+        rows = self.conn.execute(
+            "SELECT r.riser_id, r.name, r.type, r.od, r.grade, r.depth_m, r.source "
+            f"FROM risers r {where} ORDER BY r.riser_id", params)
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def _riser_filters(od, grade, min_depth, max_depth, od_tolerance, alias):
+        clauses, params = [], []
+        if od is not None:
+            clauses.append(f"{alias}.od BETWEEN ? AND ?")
+            params += [od - od_tolerance, od + od_tolerance]
+        if grade is not None:
+            clauses.append(f"{alias}.grade = ?")
+            params.append(grade)
+        if min_depth is not None:
+            clauses.append(f"{alias}.depth_m >= ?")
+            params.append(min_depth)
+        if max_depth is not None:
+            clauses.append(f"{alias}.depth_m <= ?")
+            params.append(max_depth)
+        return ("WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, condition: Optional[str] = None, check: Optional[str] = None,
+              min_utilization: Optional[float] = None, governing_check: Optional[str] = None,
+              od: Optional[float] = None, grade: Optional[str] = None,
+              min_depth: Optional[float] = None, max_depth: Optional[float] = None,
+              run_id: Optional[int] = None, latest: bool = True) -> List[Dict[str, Any]]:
+        """
+        Results matching every given filter.
+
+        Parameters:
+        -----------
+        condition, check : str, optional
+            Utilization to filter on (e.g. 'operation', 'collapse'); requires
+            min_utilization
+        min_utilization : float, optional
+            Keep results whose condition/check utilization (or, without
+            condition/check, governing utilization) exceeds this value
+        governing_check : str, optional
+            Keep results governed by this check (e.g. 'burst')
+        od, grade, min_depth, max_depth : optional
+            Riser filters (results of risers not in the store are dropped)
+        run_id : int, optional
+            Only results of this run
+        latest : bool
+            Only the most recent result of each riser (default True); with
+            run_id, the most recent one within that run
+
+        Returns:
+        --------
+        list : Result records (as written by the batch CLI) with 'run_id'
+               and, when filtered on a condition/check, 'utilization'
+        """
+        clauses, params = [], []
+        joins = ""
+        select = "res.run_id, res.record"
+        if condition is not None or check is not None:
+            if condition is None or check is None or min_utilization is None:
+                raise ValueError("condition, check and min_utilization must be given together")
+            joins += " JOIN utilizations u ON u.result_id = res.result_id"
+            clauses += ["u.condition = ?", "u.check_name = ?", "u.utilization > ?"]
+            params += [condition, check, min_utilization]
+            select += ", u.utilization"
+        elif min_utilization is not None:
+            clauses.append("res.governing_utilization > ?")
+            params.append(min_utilization)
+        if governing_check is not None:
+            clauses.append("res.governing_check = ?")
+            params.append(governing_check)
+        if run_id is not None:
+            clauses.append("res.run_id = ?")
+            params.append(run_id)
+        if latest:
+            clauses.append("res.result_id = (SELECT MAX(l.result_id) FROM results l "
+                           "WHERE l.riser_id = res.riser_id"
+                           + (" AND l.run_id = res.run_id)" if run_id is not None else ")"))
+        if any(f is not None for f in (od, grade, min_depth, max_depth)):
+            joins += " JOIN risers r ON r.riser_id = res.riser_id"
+            where, riser_params = self._riser_filters(od, grade, min_depth, max_depth, 0.01, 'r')
+            clauses.append(where[len("WHERE "):])
+            params += riser_params
+
+        sql = f"SELECT {select} FROM results res{joins}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY res.result_id"
+        out = []
+        for row in self.conn.execute(sql, params):
+            record = json.loads(row['record'])
+            record['run_id'] = row['run_id']
+            if 'utilization' in row.keys():
+                record['utilization'] = row['utilization']
+            out.append(record)
+        return out
+
+    def history(self, riser_id: str) -> List[Dict[str, Any]]:
+        """Every stored result of one riser (work unit id or riser_key), oldest first."""
+        rows = self.conn.execute(
+            "SELECT run_id, record FROM results WHERE riser_id = ? ORDER BY result_id",
+            (riser_key(riser_id),))
+        return [dict(json.loads(row['record']), run_id=row['run_id']) for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        """Row counts of the store."""
+        return {table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ('risers', 'runs', 'results', 'utilizations')}
+
+
+class ResultSink:
+    """
+    Buffered writer of streamed records (e.g. from the batch CLI) into a
+    store: records are inserted in one transaction per `batch_size`.
+
+    Parameters:
+    -----------
+    store : RiserStore
+    run_id : int
+        Run the records belong to (RiserStore.start_run)
+    batch_size : int
+        Records per insert transaction
+    """
+
+    def __init__(self, store: RiserStore, run_id: int, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.store = store
+        self.run_id = run_id
+        self.batch_size = max(1, batch_size)
+        self.written = 0
+        self._pending: List[Dict[str, Any]] = []
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self._pending.append(record)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self.written += self.store.add_results(self._pending, self.run_id, self.batch_size)
+            self._pending = []
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m batch.store",
+        description="Import risers into and query results from a SQLite riser store.",
+    )
+    parser.add_argument("database", help="SQLite store file (created if missing)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    imp = commands.add_parser("import", help="Import scenario files as riser definitions")
+    imp.add_argument("inputs", nargs="+", help="Scenario files, glob patterns or directories")
+
+    query = commands.add_parser("query", help="Print matching results as JSON Lines")
+    query.add_argument("--condition", help="Condition of --min (installation, hydrotest, operation)")
+    query.add_argument("--check", help="Check of --min (burst, collapse, propagation, bending, hoop)")
+    query.add_argument("--min", type=float, dest="min_utilization",
+                       help="Utilization threshold (governing utilization without --condition/--check)")
+    query.add_argument("--governing", dest="governing_check", help="Governing check")
+    query.add_argument("--od", type=float, help="Outer diameter (in)")
+    query.add_argument("--grade", help="Material grade, e.g. 'API 5L X-65'")
+    query.add_argument("--min-depth", type=float, help="Minimum water depth (m)")
+    query.add_argument("--max-depth", type=float, help="Maximum water depth (m)")
+    query.add_argument("--run", type=int, dest="run_id", help="Only results of this run")
+    query.add_argument("--all-runs", action="store_true",
+                       help="Include earlier results of each riser, not only the latest")
+
+    commands.add_parser("stats", help="Print row counts")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Store CLI entry point. Returns a process exit code."""
+    args = build_parser().parse_args(argv)
+    with RiserStore(args.database) as store:
+        if args.command == "import":
+            count = store.import_files(args.inputs)
+            print(f"Imported {count} riser(s) into {args.database}", file=sys.stderr)
+        elif args.command == "query":
+            try:
+                records = store.query(
+                    condition=args.condition, check=args.check, min_utilization=args.min_utilization,
+                    governing_check=args.governing_check, od=args.od, grade=args.grade,
+                    min_depth=args.min_depth, max_depth=args.max_depth, run_id=args.run_id,
+                    latest=not args.all_runs)
+            except ValueError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 2
+            for record in records:
+                print(runner.dumps_record(record))
+            print(f"{len(records)} result(s)", file=sys.stderr)
+        else:
+            print(json.dumps(store.stats(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""
+Streaming Scenario Readers - constant-memory input for very large batches
+
+main.load_input_data parses a whole file with json.load, which materializes
+every scenario before any work starts. The readers here yield scenarios one
+at a time instead:
+
+- JSON Lines (.jsonl / .ndjson): one scenario object per line. A line of the
+  form {"project_info": {...}} sets project info for the lines that follow.
+- JSON documents: an incremental stdlib parser streams the elements of a
+  top-level "scenarios" array (or the members of a "risers" object, or a
+  top-level array) while decoding the small surrounding values normally.
+
+prefetch() moves reading onto a background thread that feeds a bounded
+queue, so parsing overlaps with analysis without ever buffering more than
+`maxsize` scenarios.
+"""
+
+import json
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+CHUNK_SIZE = 1 << 16
+MAX_VALUE_CHARS = 1 << 26  # one scenario / riser value; larger ones are rejected, not buffered
+JSONL_SUFFIXES = {'.jsonl', '.ndjson'}
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+class _StreamBuffer:
+    """Sliding text window over a file for incremental JSON decoding."""
+
+    def __init__(self, f, chunk_size: Optional[int] = None):
+        self.f = f
+        self.chunk_size = chunk_size or CHUNK_SIZE
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size: Optional[int] = None) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop the consumed prefix so the window never grows past one value
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> Optional[str]:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return None
+
+    def expect(self, chars: str) -> str:
+        ch = self.peek()
+        if ch is None or ch not in chars:
+            raise ValueError(f"Expected one of {chars!r} but found {ch!r}")
+        self.pos += 1
+        return ch
+
+    def _truncated(self, error: json.JSONDecodeError) -> bool:
+        # More input can only help when the value runs into the window edge:
+        # an open string, or a bad token within the last few characters
+        # (a partial literal, number or \uXXXX escape)
+        return error.msg.startswith('Unterminated string') or error.pos >= len(self.buf) - 16
+
+    def value(self) -> Any:
+        """
+        Decode one complete JSON value, reading more input as needed.
+
+        A malformed value raises json.JSONDecodeError at once; only a value
+        cut off by the window edge reads on, in doubling reads so the
+        re-parses stay linear, up to MAX_VALUE_CHARS.
+        """
+        self.peek()
+        read_size = self.chunk_size
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if self.eof or not self._truncated(e):
+                    raise
+                end = None
+            # A number ending exactly at the window edge may continue in the next chunk
+            if end is not None and (end < len(self.buf) or self.eof):
+                self.pos = end
+                return obj
+            if len(self.buf) - self.pos > MAX_VALUE_CHARS:
+                raise ValueError(f"JSON value exceeds {MAX_VALUE_CHARS:,} characters")
+            # At EOF the next pass decodes the same window and raises or returns
+            self._fill(read_size)
+            read_size *= 2
+
+
+def _iter_array(stream: _StreamBuffer) -> Iterator[Tuple[str, Any]]:
+    stream.expect('[')
+    if stream.peek() == ']':
+        stream.pos += 1
+        return
+    index = 0
+    while True:
+        yield str(index), stream.value()
+        index += 1
+        if stream.expect(',]') == ']':
+            return
+
+
+def _iter_object(stream: _StreamBuffer) -> Iterator[Tuple[str, Any]]:
+    stream.expect('{')
+    if stream.peek() == '}':
+        stream.pos += 1
+        return
+    while True:
+        key = stream.value()
+        stream.expect(':')
+        yield key, stream.value()
+        if stream.expect(',}') == '}':
+            return
+
+
+def iter_json_scenarios(path: Path, header: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Incrementally stream scenarios from a JSON document.
+
+    Parameters:
+    -----------
+    path : Path
+        JSON file with a top-level "scenarios" array, "risers" object,
+        top-level array, or a single scenario object
+    header : dict, optional
+        Receives the non-streamed top-level values (e.g. "project_info")
+        as they are decoded. Values that appear after the streamed
+        collection are only visible to scenarios that follow them.
+
+    Yields:
+    -------
+    tuple : (key, scenario) where key is the array index or riser id
+    """
+    header = {} if header is None else header
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = _StreamBuffer(f)
+        first = stream.peek()
+        if first == '[':
+            yield from _iter_array(stream)
+            return
+        if first != '{':
+            raise ValueError(f"{path}: top-level JSON value must be an object or array")
+
+        streamed = False
+        stream.expect('{')
+        if stream.peek() == '}':
+            stream.pos += 1
+        else:
+            while True:
+                key = stream.value()
+                stream.expect(':')
+                opener = stream.peek()
+                if key == 'scenarios' and opener == '[':
+                    streamed = True
+                    yield from _iter_array(stream)
+                elif key == 'risers' and opener == '{':
+                    streamed = True
+                    yield from _iter_object(stream)
+                else:
+                    header[key] = stream.value()
+                if stream.expect(',}') == '}':
+                    break
+
+        if not streamed:
+            # No collection found - the document itself is one scenario
+            yield '0', dict(header)
+
+
+def iter_jsonl_scenarios(path: Path, header: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[str, Any]]:
+    """
+    Stream scenarios from a JSON Lines file.
+
+    Blank lines are skipped. A line holding only a "project_info" object
+    updates `header` for subsequent scenarios. Lines that are not valid JSON
+    are yielded as json.JSONDecodeError instances so the caller can reject
+    that record and continue.
+
+    Yields:
+    -------
+    tuple : (line number, scenario dict or JSONDecodeError)
+    """
+    header = {} if header is None else header
+    with open(path, 'r', encoding='utf-8') as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield str(lineno), e
+                continue
+            if isinstance(obj, dict) and set(obj) == {'project_info'}:
+                header['project_info'] = obj['project_info']
+                continue
+            yield str(lineno), obj
+
+
+def iter_scenarios(path: Path, header: Optional[Dict[str, Any]] = None) -> Iterator[Tuple[str, Any]]:
+    """Pick the streaming reader for a file based on its suffix."""
+    path = Path(path)
+    if path.suffix.lower() in JSONL_SUFFIXES:
+        return iter_jsonl_scenarios(path, header)
+    return iter_json_scenarios(path, header)
+
+
+_DONE = object()
+
+
+class _ReaderError:
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def prefetch(items: Iterable[Any], maxsize: int = 256) -> Iterator[Any]:
+    """
+    Read `items` on a background thread into a bounded queue.
+
+    The producer blocks once `maxsize` items are waiting, so memory stays
+    bounded regardless of input size. Exceptions raised while reading are
+    re-raised in the consumer. Closing the generator stops the reader.
+
+    Parameters:
+    -----------
+    items : iterable
+        Source iterator (e.g. runner.iter_units)
+    maxsize : int
+        Maximum number of read-ahead items
+    """
+    q: queue.Queue = queue.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _reader():
+        try:
+            for item in items:
+                if not _put(item):
+                    return
+        except BaseException as e:  # re-raised on the consumer side
+            _put(_ReaderError(e))
+            return
+        _put(_DONE)
+
+    thread = threading.Thread(target=_reader, name="scenario-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = q.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _ReaderError):
+                raise item.exc
+            yield item
+    finally:
+        stop.set()
@@ -0,0 +1,99 @@
+"""
+Sweep Export - write a riser file's designs as a columnar sweep
+
+Evaluates every riser of a CSV / JSON riser file (read as by the app's bulk
+mode, batch.fleet), optionally at many wall thicknesses each, and writes the
+results chunk by chunk with engine.lifecycle.export_sweep. By default the
+sweep goes below engine.columnar.sweep_root(), where the web app's Saved
+Sweep Results browser lists it.
+
+Usage:
+    python -m batch.sweep risers.csv                            # one design per riser -> sweeps/risers
+    python -m batch.sweep risers.csv --wt 0.2 1.5 100000 -o od16   # each riser at 100k thicknesses
+    python -m batch.sweep risers.csv --detail -o /data/sweeps/full # also the (N, 16) arrays
+
+Exit code 1 when rows were rejected, 2 when the file cannot be read or has
+no valid rows.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from batch import fleet
+from batch.fleet import Riser
+from engine import lifecycle
+from engine.columnar import sweep_root
+
+
+def sweep_designs(risers: Sequence[Riser], thicknesses: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    Design columns of a riser list: one row per riser, or one row per riser
+    and wall thickness (riser-major) when thicknesses are given.
+    """
+    if thicknesses is None:
+        return lifecycle.design_arrays([pipe for _, pipe, _ in risers], [load for _, _, load in risers])
+    parts = [lifecycle.thickness_sweep_arrays(pipe, load, thicknesses) for _, pipe, load in risers]
+    return {k: np.concatenate([part[k] for part in parts]) for k in parts[0]}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m batch.sweep",
+        description="Evaluate a CSV / JSON riser file and write the results as a columnar sweep",
+    )
+    parser.add_argument("input", help="Riser file (.csv or .json, columns as in the app's bulk mode)")
+    parser.add_argument("-o", "--output",
+                        help="Output directory; relative paths are below the sweep root "
+                             "($RISER_SWEEP_ROOT, default: sweeps/). Default: the input file name")
+    parser.add_argument("--wt", nargs=3, metavar=("FROM", "TO", "N"),
+                        help="Evaluate each riser at N wall thicknesses from FROM to TO (in)")
+    parser.add_argument("--chunk-size", type=int, default=lifecycle.DEFAULT_CHUNK_SIZE,
+                        help=f"Designs per evaluation and written chunk (default: {lifecycle.DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--detail", action="store_true",
+                        help="Also write the per sub-condition limiting_sf and row_pass arrays")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Sweep CLI entry point. Returns a process exit code."""
+    args = build_parser().parse_args(argv)
+    thicknesses = None
+    if args.wt:
+        try:
+            low, high, count = float(args.wt[0]), float(args.wt[1]), int(args.wt[2])
+        except ValueError:
+            print("Error: --wt takes FROM TO N (numbers, N an integer)", file=sys.stderr)
+            return 2
+        if not 0 < low < high or count < 2:
+            print("Error: --wt needs 0 < FROM < TO and N >= 2", file=sys.stderr)
+            return 2
+        thicknesses = np.linspace(low, high, count)
+    try:
+        risers, rejected = fleet.parse_risers(Path(args.input).read_bytes(), args.input)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    for row in rejected:
+        print(f"Row {row['row']} ({row['name']}) skipped: {'; '.join(row['errors'])}", file=sys.stderr)
+    if not risers:
+        print("Error: no valid risers to sweep", file=sys.stderr)
+        return 2
+
+    output = sweep_root() / (args.output or Path(args.input).stem)
+    designs = sweep_designs(risers, thicknesses)
+    start = time.perf_counter()
+    ds = lifecycle.export_sweep(designs, output, chunk_size=args.chunk_size, detail=args.detail,
+                                attrs={"source": str(args.input), "risers": len(risers),
+                                       "thicknesses": None if thicknesses is None else list(args.wt)})
+    print(f"Wrote {len(ds):,} design(s) to {output} "
+          f"({ds.nbytes / 1e6:,.1f} MB) in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+    return 1 if rejected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
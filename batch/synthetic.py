@@ -0,0 +1,437 @@
+"""
+Synthetic Scenarios - reproducible scale-test workloads fitted to the reference data
+
+The 24 risers of riser_database.json and the scenarios of input_data.json
+are too few for throughput testing. fit_model() fits simple distributions
+to their fields:
+
+- categorical frequencies: type, riser type (per type), manufacturing, grade,
+  fluid content, bending strains, ovality, corrosion allowance, mill
+  tolerance, elastic modulus, Poisson ratio, and the external / annulus
+  pressure mode (external pressure as a ratio of the design pressure)
+- log-normal (clipped to half the smallest / 1.5x the largest observation):
+  outer diameter, snapped to the nearest OD of the active pipe table
+  (ASME B36.10 unless a catalog is active), design pressure, LAT depth
+- exponential: HAT - LAT depth range; hydrotest pressure is the design
+  pressure times the median observed hydrotest factor
+
+iter_synthetic() streams any number of scenarios from a model, drawing in
+blocks of BLOCK with NumPy's default generator: the same seed always gives
+the same stream, and the first n scenarios do not depend on how many are
+requested. Scenarios pass batch.schema.validate_scenario; with
+kind='riser' the stream holds bulk-riser rows (batch.fleet) instead, with a
+standard wall thickness around the Barlow minimum and a fluid SG drawn from
+FLUID_SG_RANGES.
+
+Usage:
+    python -m batch.synthetic -n 100000 --seed 7 -o synthetic.jsonl   # python -m batch synthetic.jsonl
+    python -m batch.synthetic -n 100 -o synthetic.json                 # {"project_info", "scenarios"} document
+    python -m batch.synthetic -n 5000 -o risers.csv                    # bulk risers (app, batch.report)
+    python -m batch.synthetic --show-model                             # print the fitted distributions
+"""
+
+import argparse
+import csv
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+import numpy as np
+
+from batch import streaming
+from batch.schema import validate_scenario
+from calculations.calcs_hoop import calculate_required_thickness_barlow
+from engine.lifecycle import GRADE_PROPERTIES, MANUFACTURING_COLLAPSE_FACTOR
+from reference_data import asme_b36_10
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_SOURCES = [
+    ROOT_DIR / 'reference_data' / 'riser_database.json',
+    ROOT_DIR / 'reference_data' / 'input_data.json',
+]
+
+BLOCK = 1024   # scenarios drawn per NumPy call
+
+# Fluid specific gravity per fluid content (bulk riser rows only; scenarios
+# carry no SG): Team 8 references (Multiphase 0.57, Oil 0.82), project_info
+# oil density 53 lb/ft3 (SG 0.85), gas floored at the app's minimum of 0.02
+FLUID_SG_RANGES = {
+    'Gas': (0.02, 0.10),
+    'Wet Gas': (0.10, 0.40),
+    'Multiphase': (0.45, 0.70),
+    'Oil': (0.75, 0.90),
+}
+SHUT_IN_RATIO = (0.85, 0.89)   # shut-in / design pressure of the Team 8 references
+WT_MARGIN = (0.8, 2.0)         # standard WT chosen at or above this multiple of the Barlow minimum
+
+# Scenario manufacturing method -> bulk riser code (others use the fleet default)
+FLEET_MANUFACTURING = {'Seamless': 'SMLS', 'ERW': 'ERW', 'DSAW': 'DSAW', 'SAW': 'DSAW'}
+RISER_COLUMNS = ['name', 'od', 'wt', 'grade', 'manufacturing', 'design_category', 'fluid_type', 'fluid_sg',
+                 'ovality_type', 'design_pressure', 'shut_in_pressure', 'water_depth']
+FORMATS = ('jsonl', 'json', 'csv')
+
+
+# -----------------------------------------------------------------------------
+# Fitting
+# -----------------------------------------------------------------------------
+
+def _categorical(values: Iterable[Any]) -> Dict[str, list]:
+    counts: Dict[Any, int] = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    total = sum(counts.values())
+    return {'values': list(counts), 'weights': [n / total for n in counts.values()]}
+
+
+def _lognormal(values: List[float]) -> Dict[str, float]:
+    logs = np.log(values)
+    return {'log_mean': float(logs.mean()), 'log_std': float(logs.std()),
+            'min': 0.5 * min(values), 'max': 1.5 * max(values)}
+
+
+def _grade(name: str) -> Optional[str]:
+    """GRADE_PROPERTIES key of a scenario grade ('API 5L X-65' -> 'X-65')."""
+    key = name.replace('API 5L', '').strip()
+    return key if key in GRADE_PROPERTIES else None
+
+
+def fit_model(scenarios: Iterable[Dict[str, Any]], project_info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Fit the generator's distributions to reference scenarios.
+
+    Parameters:
+    -----------
+    scenarios : iterable of dict
+        Scenarios in the input_data.json format; invalid ones are skipped
+    project_info : dict, optional
+        Copied into the model and written with the generated scenarios
+
+    Returns:
+    --------
+    dict : JSON-ready model for iter_synthetic (see --show-model)
+    """
+    project_info = project_info or {}
+    valid = [s for s in scenarios if isinstance(s, dict) and not validate_scenario(s, project_info)
+             and _grade(s['material']['grade']) is not None]
+    if not valid:
+        raise ValueError("No valid scenarios with a known grade to fit")
+
+    loads = [s['loads'] for s in valid]
+    design = [l['design_internal_pressure_psi'] for l in loads]
+    hydro = [l['hydrotest_pressure_psi'] / l['design_internal_pressure_psi'] for l in loads
+             if l.get('hydrotest_pressure_psi') and l['design_internal_pressure_psi'] > 0]
+    lat = [l.get('depth_lat_m', l.get('depth_m', l.get('depth_hat_m'))) for l in loads]
+    hat = [l.get('depth_hat_m', l.get('depth_m', d)) for l, d in zip(loads, lat)]
+    positive_lat = [d for d in lat if d is not None and d > 0]
+    ranges = [h - d for d, h in zip(lat, hat) if d is not None and h is not None and h >= d]
+
+    riser_types: Dict[str, list] = {}
+    for s in valid:
+        riser_types.setdefault(s['type'], []).append(s.get('riser_type', ''))
+
+    def pressure_mode(l):
+        external = l['design_external_pressure_psi']
+        ratio = None if external is None or l['design_internal_pressure_psi'] <= 0 else \
+            round(external / l['design_internal_pressure_psi'], 4)
+        return (l['use_annulus_pressure'], ratio)
+
+    return {
+        'project_info': project_info,
+        'scenarios_fitted': len(valid),
+        'type': _categorical(s['type'] for s in valid),
+        'riser_type': {t: _categorical(values) for t, values in riser_types.items()},
+        'manufacturing': _categorical(s['manufacturing'] for s in valid),
+        'grade': _categorical(_grade(s['material']['grade']) for s in valid),
+        'od_in': _lognormal([s['geometry']['od_inches'] for s in valid]),
+        'design_pressure_psi': _lognormal([p for p in design if p > 0] or [1.0]),
+        'hydrotest_factor': float(np.median(hydro)) if hydro else project_info.get('hydrotest_factor', 1.25),
+        'pressure_mode': _categorical(pressure_mode(l) for l in loads),
+        'depth_lat_m': _lognormal(positive_lat or [1.0]),
+        'depth_range_m': float(np.mean(ranges)) if ranges else 0.0,
+        'bending': _categorical((l['bending_strain'], l.get('bending_strain_installation')) for l in loads),
+        'ovality': _categorical(s['geometry']['ovality'] for s in valid),
+        'corrosion_allowance_in': _categorical(s['geometry'].get('corrosion_allowance_inches') for s in valid),
+        'mill_tolerance_percent': _categorical(s['geometry'].get('mill_tolerance_percent') for s in valid),
+        'modulus_ksi': _categorical(s['material']['modulus_of_elasticity_ksi'] for s in valid),
+        'poisson_ratio': _categorical(s['material']['poisson_ratio'] for s in valid),
+        'fluid_content': _categorical(l['fluid_content'] for l in loads if l.get('fluid_content')
+                                      ) if any(l.get('fluid_content') for l in loads) else None,
+    }
+
+
+def load_model(sources: Optional[List[Path]] = None) -> Dict[str, Any]:
+    """fit_model() over scenario files (default: DEFAULT_SOURCES); project_info from the first that has one."""
+    scenarios, project_info = [], None
+    for path in sources or DEFAULT_SOURCES:
+        header: Dict[str, Any] = {}
+        scenarios.extend(scenario for _, scenario in streaming.iter_scenarios(Path(path), header))
+        if project_info is None and 'project_info' in header:
+            project_info = header['project_info']
+    return fit_model(scenarios, project_info)
+
+
+# -----------------------------------------------------------------------------
+# Generation
+# -----------------------------------------------------------------------------
+
+def _pick(rng: np.random.Generator, dist: Optional[Dict[str, list]], n: int) -> np.ndarray:
+    if dist is None:
+        rng.random(n)   # keep the draw sequence independent of the model's contents
+        return np.zeros(n, dtype=int)
+    cumulative = np.cumsum(dist['weights'])
+    return np.minimum(np.searchsorted(cumulative, rng.random(n) * cumulative[-1], side='right'),
+                      len(dist['values']) - 1)
+
+
+def _draw_lognormal(rng: np.random.Generator, dist: Dict[str, float], n: int) -> np.ndarray:
+    return np.clip(rng.lognormal(dist['log_mean'], dist['log_std'], n), dist['min'], dist['max'])
+
+
+def _block(model: Dict[str, Any], rng: np.random.Generator, ods: np.ndarray, n: int) -> Dict[str, np.ndarray]:
+    """Draw n scenarios' worth of columns (always every column, in a fixed order)."""
+    od = _draw_lognormal(rng, model['od_in'], n)
+    lat = _draw_lognormal(rng, model['depth_lat_m'], n)
+    return {
+        'type': _pick(rng, model['type'], n),
+        'riser_type_u': rng.random(n),
+        'manufacturing': _pick(rng, model['manufacturing'], n),
+        'grade': _pick(rng, model['grade'], n),
+        'od': ods[np.abs(od[:, None] - ods[None, :]).argmin(axis=1)],
+        'design': np.round(_draw_lognormal(rng, model['design_pressure_psi'], n), 1),
+        'pressure_mode': _pick(rng, model['pressure_mode'], n),
+        'lat': np.round(lat, 1),
+        'hat': np.round(lat + rng.exponential(model['depth_range_m'] or 1.0, n) * (model['depth_range_m'] > 0), 1),
+        'bending': _pick(rng, model['bending'], n),
+        'ovality': _pick(rng, model['ovality'], n),
+        'corrosion': _pick(rng, model['corrosion_allowance_in'], n),
+        'mill': _pick(rng, model['mill_tolerance_percent'], n),
+        'modulus': _pick(rng, model['modulus_ksi'], n),
+        'poisson': _pick(rng, model['poisson_ratio'], n),
+        'fluid': _pick(rng, model['fluid_content'], n),
+        'fluid_u': rng.random(n),
+        'shut_in_u': rng.random(n),
+        'wt_u': rng.random(n),
+    }
+
+
+def _scenario(model: Dict[str, Any], cols: Dict[str, np.ndarray], i: int, number: int) -> Dict[str, Any]:
+    kind = model['type']['values'][cols['type'][i]]
+    riser_dist = model['riser_type'][kind]
+    cumulative = np.cumsum(riser_dist['weights'])
+    riser_type = riser_dist['values'][min(int(np.searchsorted(cumulative, cols['riser_type_u'][i] * cumulative[-1],
+                                                              side='right')), len(cumulative) - 1)]
+    grade = model['grade']['values'][cols['grade'][i]]
+    od = float(cols['od'][i])
+    design = float(cols['design'][i])
+    annulus, ratio = model['pressure_mode']['values'][cols['pressure_mode'][i]]
+    bending, bending_installation = model['bending']['values'][cols['bending'][i]]
+
+    geometry = {'od_inches': od, 'ovality': model['ovality']['values'][cols['ovality'][i]]}
+    for key, dist, col in (('corrosion_allowance_inches', 'corrosion_allowance_in', 'corrosion'),
+                           ('mill_tolerance_percent', 'mill_tolerance_percent', 'mill')):
+        value = model[dist]['values'][cols[col][i]]
+        if value is not None:
+            geometry[key] = value
+    loads = {
+        'design_internal_pressure_psi': design,
+        'design_external_pressure_psi': None if ratio is None else round(design * ratio, 1),
+        'hydrotest_pressure_psi': round(design * model['hydrotest_factor'], 2),
+        'bending_strain': bending,
+    }
+    if bending_installation is not None:
+        loads['bending_strain_installation'] = bending_installation
+    loads['depth_lat_m'] = float(cols['lat'][i])
+    loads['depth_hat_m'] = float(cols['hat'][i])
+    if model['fluid_content'] is not None:
+        loads['fluid_content'] = model['fluid_content']['values'][cols['fluid'][i]]
+    loads['use_annulus_pressure'] = annulus
+    return {
+        'name': f"Synthetic {number:07d}: {riser_type or kind} {od:g} in {grade}",
+        'type': kind,
+        'riser_type': riser_type,
+        'manufacturing': model['manufacturing']['values'][cols['manufacturing'][i]],
+        'geometry': geometry,
+        'material': {
+            'grade': f"API 5L {grade}",
+            'smys_ksi': GRADE_PROPERTIES[grade]['smys_psi'] / 1000.0,
+            'uts_ksi': GRADE_PROPERTIES[grade]['uts_psi'] / 1000.0,
+            'modulus_of_elasticity_ksi': model['modulus_ksi']['values'][cols['modulus'][i]],
+            'poisson_ratio': model['poisson_ratio']['values'][cols['poisson'][i]],
+        },
+        'loads': loads,
+    }
+
+
+def _riser_row(scenario: Dict[str, Any], cols: Dict[str, np.ndarray], i: int,
+               thicknesses: Dict[float, List[float]]) -> Dict[str, Any]:
+    """Bulk riser row (batch.fleet columns) for a generated scenario."""
+    geometry, material, loads = scenario['geometry'], scenario['material'], scenario['loads']
+    od, grade = geometry['od_inches'], material['grade'].replace('API 5L', '').strip()
+    design = loads['design_internal_pressure_psi']
+    target = (calculate_required_thickness_barlow(design, od, GRADE_PROPERTIES[grade]['smys_psi'])
+              * (WT_MARGIN[0] + (WT_MARGIN[1] - WT_MARGIN[0]) * cols['wt_u'][i])
+              + geometry.get('corrosion_allowance_inches', 0.0))
+    if od not in thicknesses:
+        thicknesses[od] = sorted(asme_b36_10.get_standard_thicknesses(od) or []) or [round(od / 20.0, 3)]
+    wt = next((t for t in thicknesses[od] if t >= target), thicknesses[od][-1])
+    fluid = loads.get('fluid_content', 'Multiphase')
+    low, high = FLUID_SG_RANGES.get(fluid, FLUID_SG_RANGES['Multiphase'])
+    shut_in = SHUT_IN_RATIO[0] + (SHUT_IN_RATIO[1] - SHUT_IN_RATIO[0]) * cols['shut_in_u'][i]
+    row = {
+        'name': scenario['name'],
+        'od': od,
+        'wt': wt,
+        'grade': grade,
+        'manufacturing': FLEET_MANUFACTURING.get(scenario['manufacturing']),
+        'design_category': 'Riser' if scenario['type'] == 'Riser' else 'Pipeline',
+        'fluid_type': fluid if fluid in FLUID_SG_RANGES else 'Multiphase',
+        'fluid_sg': round(low + (high - low) * float(cols['fluid_u'][i]), 3),
+        'ovality_type': 'Reel-lay' if geometry['ovality'] >= 0.01 else 'Other Type',
+        'design_pressure': design,
+        'shut_in_pressure': round(design * shut_in, 1),
+        'water_depth': loads['depth_hat_m'],
+    }
+    if row['manufacturing'] not in MANUFACTURING_COLLAPSE_FACTOR:
+        del row['manufacturing']
+    return row
+
+
+def iter_synthetic(model: Dict[str, Any], count: Optional[int] = None, seed: int = 0,
+                   kind: str = 'scenario') -> Iterator[Dict[str, Any]]:
+    """
+    Stream synthetic scenarios (or bulk riser rows) from a fitted model.
+
+    Parameters:
+    -----------
+    model : dict
+        From fit_model / load_model
+    count : int, optional
+        Number of items; None streams without end
+    seed : int
+        Generator seed; equal seeds give equal streams
+    kind : str
+        'scenario' (input_data.json format) or 'riser' (batch.fleet row)
+
+    Yields:
+    -------
+    dict : One scenario or riser row, numbered from 1
+    """
+    if kind not in ('scenario', 'riser'):
+        raise ValueError(f"kind must be 'scenario' or 'riser', not {kind!r}")
+    rng = np.random.default_rng(seed)
+    ods = np.array(asme_b36_10.get_available_od_sizes(), dtype=float)
+    thicknesses: Dict[float, List[float]] = {}
+    number = 0
+    while count is None or number < count:
+        cols = _block(model, rng, ods, BLOCK)
+        for i in range(BLOCK):
+            if count is not None and number >= count:
+                return
+            number += 1
+            scenario = _scenario(model, cols, i, number)
+            yield scenario if kind == 'scenario' else _riser_row(scenario, cols, i, thicknesses)
+
+
+# -----------------------------------------------------------------------------
+# Output
+# -----------------------------------------------------------------------------
+
+def write_synthetic(items: Iterable[Dict[str, Any]], out: TextIO, fmt: str,
+                    project_info: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Stream items to `out` without holding them in memory.
+
+    Parameters:
+    -----------
+    items : iterable of dict
+        Scenarios for 'jsonl' / 'json', riser rows for 'csv'
+    fmt : str
+        'jsonl': a {"project_info"} line, then one scenario per line;
+        'json': a {"project_info", "scenarios"} document (main.py layout);
+        'csv': bulk riser rows with RISER_COLUMNS
+    project_info : dict, optional
+        Written ahead of the scenarios (JSON formats)
+
+    Returns:
+    --------
+    int : Number of items written
+    """
+    written = 0
+    if fmt == 'csv':
+        writer = csv.DictWriter(out, fieldnames=RISER_COLUMNS, lineterminator='\n')
+        writer.writeheader()
+        for row in items:
+            writer.writerow(row)
+            written += 1
+        return written
+    if fmt == 'jsonl':
+        out.write(json.dumps({'project_info': project_info or {}}) + '\n')
+        for item in items:
+            out.write(json.dumps(item, separators=(',', ':')) + '\n')
+            written += 1
+        return written
+    if fmt == 'json':
+        out.write('{"project_info": ' + json.dumps(project_info or {}) + ',\n "scenarios": [')
+        for item in items:
+            out.write((',\n  ' if written else '\n  ') + json.dumps(item))
+            written += 1
+        out.write('\n ]\n}\n')
+        return written
+    raise ValueError(f"Unknown format {fmt!r} (expected one of {', '.join(FORMATS)})")
+
+
+def _format_for(path: Optional[str]) -> str:
+    suffix = Path(path).suffix.lower() if path and path != '-' else ''
+    if suffix == '.csv':
+        return 'csv'
+    if suffix == '.json':
+        return 'json'
+    return 'jsonl'
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m batch.synthetic",
+        description="Generate reproducible synthetic riser scenarios fitted to the reference data.",
+    )
+    parser.add_argument("-n", "--count", type=int, default=1000, help="Scenarios to generate (default: 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="Output file; .jsonl (default, stdout '-'), .json or .csv (bulk riser rows)")
+    parser.add_argument("--format", choices=FORMATS, help="Override the format implied by the output suffix")
+    parser.add_argument("--source", action="append", metavar="FILE",
+                        help="Scenario file to fit (repeatable; default: riser_database.json and input_data.json)")
+    parser.add_argument("--show-model", action="store_true", help="Print the fitted model as JSON and exit")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Synthetic scenario CLI entry point. Returns a process exit code."""
+    args = build_parser().parse_args(argv)
+    if args.count < 0:
+        print("Error: --count must be >= 0", file=sys.stderr)
+        return 2
+    try:
+        model = load_model([Path(p) for p in args.source] if args.source else None)
+    except (OSError, ValueError) as e:
+        print(f"Error: cannot fit the model: {e}", file=sys.stderr)
+        return 2
+    if args.show_model:
+        print(json.dumps(model, indent=2))
+        return 0
+
+    fmt = args.format or _format_for(args.output)
+    items = iter_synthetic(model, args.count, seed=args.seed, kind='riser' if fmt == 'csv' else 'scenario')
+    if args.output == '-':
+        written = write_synthetic(items, sys.stdout, fmt, model['project_info'])
+    else:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            written = write_synthetic(items, f, fmt, model['project_info'])
+        print(f"Wrote {written:,} synthetic {'riser(s)' if fmt == 'csv' else 'scenario(s)'} to {args.output}",
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+"""
+Performance benchmarks for the riser calculations
+
+This package contains:
+- harness: Timing with warmup and repeat statistics, tracemalloc memory measurement, JSON baselines and comparison
+- suite: Registered benchmarks (calcs, analyzer, app, main and batch paths)
+- cli: Command line entry point with the regression gate (python -m bench)
+- profile: Per-check timing counters of a bulk analysis (python -m bench.profile)
+"""
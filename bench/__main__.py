@@ -0,0 +1,9 @@
+"""Allow running the benchmark CLI with ``python -m bench``."""
+
+import sys
+
+from bench.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
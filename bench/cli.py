@@ -0,0 +1,125 @@
+"""
+Benchmark CLI - run the suite and gate on regressions
+
+Usage:
+    python -m bench                          # run everything, compare with bench/baseline.json
+    python -m bench --quick -k calcs -k analyzer
+    python -m bench --save                   # record (merge) the results as the baseline
+    python -m bench --threshold 0.10 --json bench_output.json
+    python -m bench --memory -k batch --sites 3  # peak / retained memory under tracemalloc
+
+The exit code is 1 when any benchmark's median is slower than its baseline
+by more than --threshold (default 20%), 2 on usage errors or when there is
+no baseline to gate against, else 0. Benchmarks without a baseline entry are
+reported as 'new' and never fail.
+With --memory each benchmark runs once under tracemalloc instead and the
+gate compares peak bytes (default threshold 10%) against a separate
+baseline, bench/baseline_memory.json.
+bench/baseline.json and bench/baseline_memory.json are committed reference
+baselines with the fingerprint of the machine that recorded them. Timings
+are machine-specific: a warning is printed when Python, NumPy, CPU count or
+architecture differ, and a CI machine should record its own with --save
+before gating.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from bench import harness, suite
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_MEMORY_BASELINE = Path(__file__).resolve().parent / "baseline_memory.json"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m bench",
+        description="Time the riser calculation benchmarks and compare them with a stored baseline.",
+    )
+    parser.add_argument("-k", "--filter", action="append", default=[], metavar="PATTERN",
+                        help="Only benchmarks whose name contains PATTERN (repeatable)")
+    parser.add_argument("--quick", action="store_true", help="Skip the 1M-design benchmarks")
+    parser.add_argument("--list", action="store_true", help="List the selected benchmarks and exit")
+    parser.add_argument("--memory", action="store_true",
+                        help="Measure peak / retained memory with tracemalloc instead of time")
+    parser.add_argument("--sites", type=int, default=0, metavar="N",
+                        help="With --memory, print the N largest allocation sites per benchmark")
+    parser.add_argument("--baseline",
+                        help=f"Baseline JSON file (default: {DEFAULT_BASELINE.name}, or "
+                             f"{DEFAULT_MEMORY_BASELINE.name} with --memory, in the bench package)")
+    parser.add_argument("--save", action="store_true",
+                        help="Write the results into the baseline (merged with entries not run) instead of gating")
+    parser.add_argument("--threshold", type=float,
+                        help="Allowed fractional slowdown of the median (default: 0.20) or growth of the "
+                             "peak with --memory (default: 0.10) before failing")
+    parser.add_argument("--repeat", type=int, help="Samples per benchmark (default: 7, 3 for 1M designs)")
+    parser.add_argument("--min-time", type=float, default=harness.DEFAULT_MIN_TIME_S,
+                        help="Minimum seconds per sample; faster benchmarks are looped (default: 0.05)")
+    parser.add_argument("--json", dest="json_output", help="Also write results and comparison to this JSON file")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark CLI entry point. Returns a process exit code."""
+    args = build_parser().parse_args(argv)
+    if args.threshold is None:
+        args.threshold = harness.DEFAULT_MEMORY_THRESHOLD if args.memory else harness.DEFAULT_THRESHOLD
+    if args.baseline is None:
+        args.baseline = str(DEFAULT_MEMORY_BASELINE if args.memory else DEFAULT_BASELINE)
+    if (args.threshold < 0 or (args.repeat is not None and args.repeat < 1) or args.min_time <= 0
+            or args.sites < 0):
+        print("Error: --threshold must be >= 0, --repeat >= 1, --min-time > 0 and --sites >= 0", file=sys.stderr)
+        return 2
+    selected = suite.select(args.filter, quick=args.quick)
+    if not selected:
+        print("Error: no benchmark matches the filters", file=sys.stderr)
+        return 2
+    if args.list:
+        for bench in selected:
+            print(f"{bench.group:<9} {bench.name}{'  (large)' if bench.large else ''}")
+        return 0
+
+    try:
+        baseline = None if args.save else harness.load_baseline(args.baseline)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    def log(message: str) -> None:
+        print(message, file=sys.stderr, flush=True)
+
+    if args.memory:
+        results = harness.run_memory(selected, top=max(args.sites, harness.DEFAULT_TOP_SITES), log=log)
+        rows = harness.compare(results, baseline, threshold=args.threshold, metric="peak_bytes")
+        print(harness.format_memory_report(rows, results, sites=args.sites))
+    else:
+        results = harness.run(selected, repeat=args.repeat, min_time_s=args.min_time, log=log)
+        rows = harness.compare(results, baseline, threshold=args.threshold)
+        print(harness.format_report(rows, results))
+
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump({"machine": harness.machine_info(), "threshold": args.threshold,
+                       "results": results, "comparison": rows}, f, indent=2)
+
+    if args.save:
+        harness.save_baseline(args.baseline, results)
+        print(f"Saved {len(results)} benchmark(s) to {args.baseline}", file=sys.stderr)
+        return 0
+    if baseline is None:
+        print(f"Error: no baseline at {args.baseline}; run with --save to record one", file=sys.stderr)
+        return 2
+
+    mismatch = harness.machine_mismatch(baseline)
+    if mismatch:
+        print(f"Warning: baseline recorded with a different {', '.join(mismatch)}", file=sys.stderr)
+    regressed = [row["name"] for row in rows if row["status"] == "regressed"]
+    if regressed:
+        print(f"{len(regressed)} benchmark(s) {'grew' if args.memory else 'regressed'} by more than "
+              f"{args.threshold:.0%}: {', '.join(regressed)}", file=sys.stderr)
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%} ({len(rows)} benchmark(s))", file=sys.stderr)
+    return 0
@@ -0,0 +1,406 @@
+"""
+Benchmark Harness - timing, statistics and baseline comparison
+
+Each benchmark is a setup function returning the callable to time (setup
+work such as building inputs is not measured). measure() warms the callable
+up, picks a loop count so one sample lasts at least min_time_s (like
+timeit.Timer.autorange) and times `repeat` samples with timeit, garbage
+collection disabled while timing.
+Per-call times are summarized as min / median / mean / stdev; comparisons
+against a stored baseline use the median.
+
+measure_memory() runs the callable once under tracemalloc instead: peak
+bytes during the call, bytes still held by its result (retained), bytes not
+released once the result is dropped, the same per design (Benchmark.items)
+and the source lines that allocated most of the retained memory (and, for
+long calls that peak far above what they keep, of the memory live near the
+peak). Memory baselines are compared on peak_bytes.
+
+Baselines are JSON files:
+
+    {"version": 1, "created": "...", "machine": {...},
+     "benchmarks": {"<name>": {"median_s": ..., "min_s": ..., ...}}}
+"""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BASELINE_VERSION = 1
+DEFAULT_THRESHOLD = 0.20    # fractional slowdown of the median reported as a regression
+DEFAULT_REPEAT = 7
+DEFAULT_MIN_TIME_S = 0.05   # shortest sample; fast callables are looped inside a sample
+DEFAULT_MEMORY_THRESHOLD = 0.10   # fractional growth of the peak reported as a regression
+DEFAULT_TOP_SITES = 5       # allocation sites kept per memory measurement
+TRACE_FRAMES = 1            # tracemalloc frames per allocation (sites are grouped by line)
+PEAK_SAMPLE_INTERVAL_S = 0.05   # heap level polling while looking for the sites live at the peak
+PEAK_SAMPLE_GROWTH = 1.10       # snapshot again only after the heap grew by 10%
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class Benchmark:
+    """
+    One registered benchmark.
+
+    Parameters:
+    -----------
+    name : str
+        Unique dotted name, e.g. 'calcs.calcs_burst.calculate_burst_pressure'
+    setup : callable
+        Builds the inputs and returns the zero-argument callable to time
+    group : str
+        Report section (calcs, analyzer, app, main, batch)
+    large : bool
+        Long-running (1M designs); skipped by --quick
+    repeat : int, optional
+        Samples to take (default DEFAULT_REPEAT)
+    warmup : int
+        Untimed calls before calibration (the calibration calls warm up too)
+    items : int
+        Designs (risers, scenarios) handled per call, for bytes per design;
+        a callable's own `items` attribute takes precedence
+    """
+    name: str
+    setup: Callable[[], Callable[[], Any]]
+    group: str
+    large: bool = False
+    repeat: Optional[int] = None
+    warmup: int = 1
+    items: int = 1
+
+
+def machine_info() -> Dict[str, Any]:
+    """Interpreter and host description stored with a baseline."""
+    import numpy as np
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _calibrate(timer: timeit.Timer, min_time_s: float) -> int:
+    """Loop count (1, 2, 5, 10, 20, ...) for which one sample lasts at least min_time_s."""
+    number = 1
+    while True:
+        for factor in (1, 2, 5):
+            if timer.timeit(number * factor) >= min_time_s:
+                return number * factor
+        number *= 10
+
+
+def measure(bench: Benchmark, repeat: Optional[int] = None,
+            min_time_s: float = DEFAULT_MIN_TIME_S) -> Dict[str, Any]:
+    """
+    Time one benchmark.
+
+    Parameters:
+    -----------
+    bench : Benchmark
+    repeat : int, optional
+        Samples (default: bench.repeat, else DEFAULT_REPEAT)
+    min_time_s : float
+        Minimum duration of one sample; fast callables are looped
+
+    Returns:
+    --------
+    dict : min_s, median_s, mean_s, stdev_s (seconds per call), repeat, number
+    """
+    func = bench.setup()
+    for _ in range(bench.warmup):
+        func()
+    timer = timeit.Timer(func)
+    number = _calibrate(timer, min_time_s)
+    samples = [t / number for t in timer.repeat(repeat or bench.repeat or DEFAULT_REPEAT, number)]
+    return {
+        "min_s": min(samples),
+        "median_s": statistics.median(samples),
+        "mean_s": statistics.fmean(samples),
+        "stdev_s": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "repeat": len(samples),
+        "number": number,
+    }
+
+
+def run(benchmarks: List[Benchmark], repeat: Optional[int] = None, min_time_s: float = DEFAULT_MIN_TIME_S,
+        log: Optional[Callable[[str], None]] = None) -> Dict[str, Dict[str, Any]]:
+    """Measure benchmarks in order; returns name -> measure() stats."""
+    results = {}
+    for i, bench in enumerate(benchmarks, start=1):
+        if log is not None:
+            log(f"[{i}/{len(benchmarks)}] {bench.name}")
+        results[bench.name] = measure(bench, repeat=repeat, min_time_s=min_time_s)
+    return results
+
+
+def _site(frame: tracemalloc.Frame) -> str:
+    """'file:line' relative to the repository, else to the longest matching sys.path entry."""
+    path = Path(frame.filename)
+    for root in [ROOT_DIR] + sorted((Path(p) for p in sys.path if p), key=lambda p: -len(str(p))):
+        try:
+            return f"{path.relative_to(root).as_posix()}:{frame.lineno}"
+        except ValueError:
+            continue
+    return f"{path.as_posix()}:{frame.lineno}"
+
+
+def _sites(snapshot: tracemalloc.Snapshot, before: tracemalloc.Snapshot, top: int) -> List[Dict[str, Any]]:
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    stats = snapshot.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+    return [{"site": _site(stat.traceback[0]), "bytes": stat.size_diff, "count": stat.count_diff}
+            for stat in stats if stat.size_diff > 0][:top]
+
+
+class _PeakSampler(threading.Thread):
+    """Snapshot the traced heap whenever it has grown by PEAK_SAMPLE_GROWTH since the last snapshot."""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.done = threading.Event()
+        self.level = 0
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def run(self):
+        while not self.done.wait(PEAK_SAMPLE_INTERVAL_S):
+            current = tracemalloc.get_traced_memory()[0]
+            if current > self.level * PEAK_SAMPLE_GROWTH:
+                self.snapshot, self.level = tracemalloc.take_snapshot(), current
+
+
+def measure_memory(bench: Benchmark, top: int = DEFAULT_TOP_SITES) -> Dict[str, Any]:
+    """
+    Measure one call of a benchmark under tracemalloc.
+
+    The warmup calls run untraced first, so one-off costs (imports, caches
+    filled on first use) are not counted. When the peak is well above what
+    the result retains (streaming or chunked work) and the call is long
+    enough to sample, a second traced call finds the sites live near the
+    peak; its snapshots would inflate the figures, so they come from the
+    first call only.
+
+    Parameters:
+    -----------
+    bench : Benchmark
+    top : int
+        Allocation sites to report (0: none, and no second call)
+
+    Returns:
+    --------
+    dict : peak_bytes (above the starting level), retained_bytes (held while
+           the result is alive), unreleased_bytes (still held after dropping
+           the result), items, peak_bytes_per_item, retained_bytes_per_item,
+           elapsed_s (slowed down by tracing), top_sites - the source lines
+           holding most of the retained memory, as {site, bytes, count} - and
+           peak_sites, the same near the peak (empty when not sampled)
+    """
+    func = bench.setup()
+    items = getattr(func, "items", bench.items)
+    for _ in range(bench.warmup):
+        func()
+    gc.collect()
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(TRACE_FRAMES)
+    try:
+        before = tracemalloc.take_snapshot()
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        del result
+        gc.collect()
+        released = tracemalloc.get_traced_memory()[0]
+        peak_bytes, retained = max(peak - base, 0), current - base
+
+        peak_sites = []
+        if top and elapsed >= 2 * PEAK_SAMPLE_INTERVAL_S and peak_bytes > 2 * max(retained, 0) + (1 << 20):
+            sampler = _PeakSampler()
+            sampler.start()
+            try:
+                result = func()
+            finally:
+                sampler.done.set()
+                sampler.join()
+            del result
+            if sampler.snapshot is not None:
+                peak_sites = _sites(sampler.snapshot, before, top)
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    return {
+        "peak_bytes": peak_bytes,
+        "retained_bytes": retained,
+        "unreleased_bytes": released - base,
+        "items": items,
+        "peak_bytes_per_item": peak_bytes / items,
+        "retained_bytes_per_item": retained / items,
+        "elapsed_s": elapsed,
+        "top_sites": _sites(after, before, top) if top else [],
+        "peak_sites": peak_sites,
+    }
+
+
+def run_memory(benchmarks: List[Benchmark], top: int = DEFAULT_TOP_SITES,
+               log: Optional[Callable[[str], None]] = None) -> Dict[str, Dict[str, Any]]:
+    """Memory-measure benchmarks in order; returns name -> measure_memory() stats."""
+    results = {}
+    for i, bench in enumerate(benchmarks, start=1):
+        if log is not None:
+            log(f"[{i}/{len(benchmarks)}] {bench.name}")
+        results[bench.name] = measure_memory(bench, top=top)
+    return results
+
+
+def load_baseline(path) -> Optional[Dict[str, Any]]:
+    """Baseline document, or None when the file does not exist."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        doc = json.load(f)
+    if doc.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version {doc.get('version')!r} in {path}")
+    return doc
+
+
+def save_baseline(path, results: Dict[str, Dict[str, Any]], merge: bool = True) -> Dict[str, Any]:
+    """
+    Write results as the baseline.
+
+    With merge (default) entries of benchmarks that were not run are kept,
+    so a filtered run only updates its own benchmarks.
+    """
+    existing = load_baseline(path) if merge else None
+    benchmarks = dict(existing["benchmarks"]) if existing else {}
+    benchmarks.update(results)
+    doc = {
+        "version": BASELINE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": machine_info(),
+        "benchmarks": dict(sorted(benchmarks.items())),
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+    return doc
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Optional[Dict[str, Any]],
+            threshold: float = DEFAULT_THRESHOLD, metric: str = "median_s") -> List[Dict[str, Any]]:
+    """
+    Compare one statistic (median per-call time by default) against a baseline.
+
+    Returns:
+    --------
+    list of dict : name, metric, current, baseline (None when new), ratio
+                   (current / baseline) and status - 'regressed' when above
+                   baseline × (1 + threshold), 'improved' when below
+                   baseline × (1 - threshold), else 'ok' or 'new'
+    """
+    stored = (baseline or {}).get("benchmarks", {})
+    rows = []
+    for name, stats in results.items():
+        current = stats[metric]
+        base = stored.get(name, {}).get(metric)
+        row = {"name": name, "metric": metric, "current": current, "baseline": base, "ratio": None}
+        if base is None:
+            row["status"] = "new"
+        elif base <= 0:
+            # Nothing allocated in the baseline: any allocation now is a regression
+            row["status"] = "ok" if current <= base else "regressed"
+        else:
+            row["ratio"] = current / base
+            if row["ratio"] > 1 + threshold:
+                row["status"] = "regressed"
+            elif row["ratio"] < 1 - threshold:
+                row["status"] = "improved"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def format_seconds(seconds: Optional[float]) -> str:
+    """Human-readable duration with a unit that keeps 3-4 significant digits."""
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def format_bytes(size: Optional[float]) -> str:
+    """Human-readable byte count (binary units)."""
+    if size is None:
+        return "-"
+    for unit, scale in (("GiB", 1 << 30), ("MiB", 1 << 20), ("KiB", 1 << 10)):
+        if abs(size) >= scale:
+            return f"{size / scale:.3g} {unit}"
+    return f"{size:.0f} B"
+
+
+def _change(row: Dict[str, Any]) -> str:
+    return "-" if row["ratio"] is None else f"{(row['ratio'] - 1) * 100:+.1f}%"
+
+
+def format_report(rows: List[Dict[str, Any]], results: Dict[str, Dict[str, Any]]) -> str:
+    """Plain-text table of a compare() result."""
+    width = max([len(r["name"]) for r in rows] + [9])
+    lines = [f"{'Benchmark':<{width}}  {'median':>9}  {'stdev':>9}  {'baseline':>9}  {'change':>8}  status"]
+    for row in rows:
+        stats = results[row["name"]]
+        lines.append(f"{row['name']:<{width}}  {format_seconds(row['current']):>9}  "
+                     f"{format_seconds(stats['stdev_s']):>9}  {format_seconds(row['baseline']):>9}  "
+                     f"{_change(row):>8}  {row['status']}")
+    return "\n".join(lines)
+
+
+def format_memory_report(rows: List[Dict[str, Any]], results: Dict[str, Dict[str, Any]], sites: int = 0) -> str:
+    """Plain-text table of a compare(..., metric='peak_bytes') result, with up to `sites` sites per benchmark."""
+    width = max([len(r["name"]) for r in rows] + [9])
+    lines = [f"{'Benchmark':<{width}}  {'peak':>9}  {'per design':>10}  {'retained':>9}  "
+             f"{'baseline':>9}  {'change':>8}  status"]
+    for row in rows:
+        stats = results[row["name"]]
+        lines.append(f"{row['name']:<{width}}  {format_bytes(row['current']):>9}  "
+                     f"{format_bytes(stats['peak_bytes_per_item']):>10}  {format_bytes(stats['retained_bytes']):>9}  "
+                     f"{format_bytes(row['baseline']):>9}  {_change(row):>8}  {row['status']}")
+        for label, key in (("retained", "top_sites"), ("at peak", "peak_sites")):
+            for site in stats[key][:sites]:
+                lines.append(f"{'':<{width}}    {label:<8}  {format_bytes(site['bytes']):>9}  "
+                             f"{site['count']:>9,} block(s)  {site['site']}")
+    return "\n".join(lines)
+
+
+def machine_mismatch(baseline: Optional[Dict[str, Any]]) -> List[str]:
+    """Machine fields that differ from the baseline's (comparisons may not be meaningful)."""
+    if not baseline or "machine" not in baseline:
+        return []
+    current = machine_info()
+    return [key for key in ("python", "numpy", "machine", "cpu_count")
+            if baseline["machine"].get(key) != current.get(key)]
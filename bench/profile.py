@@ -0,0 +1,92 @@
+"""
+Profile CLI - where the analyzer's time goes under a bulk load
+
+Usage:
+    python -m bench.profile                         # 200 risers around the reference riser
+    python -m bench.profile risers.csv --json profile.json
+    python -m bench.profile -n 1000 --allocations   # also trace memory per analysis
+
+Runs batch.fleet.full_result_lines (the bulk mode's full-results path: one
+run_all_conditions per riser plus JSON serialization) in this process with
+engine.instrument enabled, then prints call counts, cumulative time and
+p50/p95/p99 per check. Worker processes of a real batch run can be profiled
+with RISER_INSTRUMENT=1 and RISER_INSTRUMENT_FILE=prof-{pid}.json instead.
+Exit code 2 when the riser file cannot be read or has no valid rows.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from engine import instrument
+
+DEFAULT_RISERS = 200
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m bench.profile",
+        description="Analyze a set of risers with timing counters enabled and report time per check.",
+    )
+    parser.add_argument("input", nargs="?",
+                        help="Riser file (.csv or .json, columns as in the app's bulk mode); "
+                             "default: generated risers around the reference riser")
+    parser.add_argument("-n", "--risers", type=int, default=DEFAULT_RISERS,
+                        help=f"Generated risers when no file is given (default: {DEFAULT_RISERS})")
+    parser.add_argument("--allocations", action="store_true",
+                        help="Trace peak / retained memory per analysis with tracemalloc (slow)")
+    parser.add_argument("--json", dest="json_output", help="Also write the counters to this JSON file")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Profile CLI entry point. Returns a process exit code."""
+    from batch import fleet
+    from bench import suite
+
+    args = build_parser().parse_args(argv)
+    if args.input:
+        try:
+            risers, rejected = fleet.parse_risers(Path(args.input).read_bytes(), args.input)
+        except (OSError, ValueError, UnicodeDecodeError) as e:
+            print(f"Error: cannot read {args.input}: {e}", file=sys.stderr)
+            return 2
+        if rejected:
+            print(f"Warning: {len(rejected)} row(s) rejected", file=sys.stderr)
+    else:
+        if args.risers < 1:
+            print("Error: --risers must be >= 1", file=sys.stderr)
+            return 2
+        risers = suite.fleet_risers(args.risers)
+    if not risers:
+        print("Error: no valid risers to analyze", file=sys.stderr)
+        return 2
+
+    was_enabled, had_allocations = instrument.enabled(), instrument.allocations_enabled()
+    instrument.reset()
+    instrument.enable(allocations=args.allocations)
+    try:
+        start = time.perf_counter()
+        fleet.full_result_lines(risers)
+        wall_s = time.perf_counter() - start
+        snap = instrument.snapshot()
+    finally:
+        instrument.disable()
+        if was_enabled:
+            instrument.enable(allocations=had_allocations)
+
+    print(instrument.format_table(snap))
+    analyses = snap["timers"].get("analyzer.run_all_conditions", {}).get("total_ms", 0.0) / 1e3
+    print(f"\n{len(risers):,} riser(s) in {wall_s:.3f} s; run_all_conditions {analyses:.3f} s "
+          f"({analyses / wall_s:.0%}), the rest is serialization and instrumentation overhead", file=sys.stderr)
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump({"risers": len(risers), "wall_s": round(wall_s, 6), **snap}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
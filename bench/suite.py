@@ -0,0 +1,222 @@
+"""
+Benchmark Suite - the registered benchmarks
+
+Groups:
+- calcs: every public function of calculations/calcs_*.py on the reference
+  16 in riser (verify_* self-checks excluded)
+- analyzer: LifeCycleAnalyzer.run_all_conditions (16 sub-conditions)
+- app: evaluate_standard_thicknesses, find_closest_passing_standard_wt
+- main: main.analyze_scenario on the first scenario of input_data.json
+- batch: scenario batches (batch.runner.run_chunk) and bulk riser summaries
+  (batch.fleet.analyze_fleet) of 1 and 1k items; design summaries
+  (engine.lifecycle.summarize_in_chunks) and columnar sweep export
+  (engine.lifecycle.export_sweep) of 1, 1k and 1M designs (1M: --quick skips)
+
+Setups import what they time, so listing the suite is cheap and each
+benchmark only pays for its own imports. Sized benchmarks register the
+designs they handle per call (items) for the bytes per design of --memory.
+"""
+
+import functools
+import importlib
+import json
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bench.harness import Benchmark
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+SIZES = {"1": 1, "1k": 1_000, "1M": 1_000_000}
+
+# Reference riser (Team 8 multiphase riser, ID 3) in the units of each API
+OD, WT, SMYS, UTS, E = 16.0, 0.75, 52000.0, 66000.0, 2.9e7
+P_INTERNAL, P_EXTERNAL, P_CRITICAL = 1400.0, 1300.0, 3913.8
+REFERENCE_RISER = {
+    "od": OD, "wt": WT, "grade": "X-52", "fluid_type": "Multiphase", "fluid_sg": 0.57,
+    "design_pressure": 1400.0, "shut_in_pressure": 1236.0, "water_depth": 920.0,
+}
+
+# calcs module function -> positional arguments
+CALCS_CALLS: Dict[str, Tuple[Any, ...]] = {
+    "calcs_bending.calculate_bending_strain_limit": (OD, WT, SMYS, E),
+    "calcs_bending.calculate_ovality_function": (0.005,),
+    "calcs_bending.check_combined_bending_pressure": (OD, WT, SMYS, E, P_INTERNAL, P_EXTERNAL, 0.001, P_CRITICAL),
+    "calcs_bending.calculate_allowable_bending_with_pressure": (0.023, P_INTERNAL, P_EXTERNAL, P_CRITICAL),
+    "calcs_burst.calculate_burst_pressure": (OD, WT, SMYS, UTS),
+    "calcs_burst.get_design_factor": ("Riser",),
+    "calcs_burst.get_weld_factor": ("SMLS",),
+    "calcs_burst.get_temperature_factor": (),
+    "calcs_burst.check_burst_criteria": (OD, WT, SMYS, UTS, P_INTERNAL, 14.7, "Riser", "SMLS"),
+    "calcs_collapse.calculate_yield_collapse": (OD, WT, SMYS),
+    "calcs_collapse.calculate_elastic_collapse": (OD, WT, E, 0.3, 0.005),
+    "calcs_collapse.calculate_critical_collapse": (4875.0, 6564.6),
+    "calcs_collapse.get_collapse_factor": ("SMLS",),
+    "calcs_collapse.check_collapse_criteria": (OD, WT, SMYS, E, 0.0, P_EXTERNAL, "SMLS"),
+    "calcs_hoop.calculate_hoop_stress_barlow": (P_INTERNAL, OD, WT),
+    "calcs_hoop.calculate_hoop_stress_lame": (P_INTERNAL, 14.7, OD, WT),
+    "calcs_hoop.get_design_factor_asme": (),
+    "calcs_hoop.check_hoop_stress_criteria": (OD, WT, P_INTERNAL, SMYS),
+    "calcs_hoop.calculate_required_thickness_barlow": (P_INTERNAL, OD, SMYS),
+    "calcs_propagation.calculate_propagation_pressure": (OD, WT, SMYS),
+    "calcs_propagation.check_propagation_criteria": (OD, WT, SMYS, P_EXTERNAL),
+    "calcs_propagation.calculate_minimum_thickness_for_propagation": (OD, SMYS, P_EXTERNAL),
+    "calcs_weight.calculate_pipe_weights": (OD, WT, 0.57),
+    "calcs_weight.calculate_axial_stress_from_weight": (100.0, 3000.0, OD, WT),
+    "calcs_weight.calculate_combined_stress_von_mises": (5000.0, 20000.0),
+}
+
+
+def register(name: str, group: str, large: bool = False, repeat: Optional[int] = None, warmup: int = 1,
+             items: int = 1):
+    """Decorator adding a setup function to BENCHMARKS."""
+    def decorator(setup: Callable[[], Callable[[], Any]]):
+        if name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark '{name}'")
+        BENCHMARKS[name] = Benchmark(name, setup, group, large=large, repeat=repeat, warmup=warmup, items=items)
+        return setup
+    return decorator
+
+
+def select(patterns: List[str] = (), quick: bool = False) -> List[Benchmark]:
+    """Benchmarks whose name contains any of the patterns (all when none), minus large ones if quick."""
+    return [bench for name, bench in BENCHMARKS.items()
+            if (not patterns or any(p in name for p in patterns)) and not (quick and bench.large)]
+
+
+# -----------------------------------------------------------------------------
+# Inputs
+# -----------------------------------------------------------------------------
+
+def reference_riser():
+    """(PipeProperties, LoadingCondition) of REFERENCE_RISER."""
+    from batch.fleet import build_riser
+
+    return build_riser(REFERENCE_RISER)
+
+
+def design_columns(n: int) -> Dict[str, Any]:
+    """n engine designs: the reference riser swept over wall thickness and water depth."""
+    import numpy as np
+    from engine import lifecycle
+
+    pipe, load = reference_riser()
+    cols = lifecycle.thickness_sweep_arrays(pipe, load, np.linspace(0.3, 1.5, n))
+    cols["water_depth_m"] = np.linspace(100.0, 2500.0, n)[::-1].copy()
+    return cols
+
+
+def fleet_risers(n: int) -> List[Any]:
+    """n (name, pipe, load) bulk risers around the reference riser."""
+    from dataclasses import replace
+
+    pipe, load = reference_riser()
+    return [(f"R{i}", replace(pipe, wt_in=0.3 + 1.2 * i / max(n - 1, 1)),
+             replace(load, water_depth_m=100.0 + (i % 25) * 100.0)) for i in range(n)]
+
+
+def scenario_units(n: int) -> List[Dict[str, Any]]:
+    """n batch work units cycling through the scenarios of input_data.json."""
+    with open(ROOT_DIR / "reference_data" / "input_data.json", "r") as f:
+        data = json.load(f)
+    scenarios = data["scenarios"]
+    return [{"unit_id": f"bench#{i}", "source": "bench", "project_info": data["project_info"],
+             "scenario": scenarios[i % len(scenarios)]} for i in range(n)]
+
+
+# -----------------------------------------------------------------------------
+# Benchmarks
+# -----------------------------------------------------------------------------
+
+def _calcs_setup(path: str) -> Callable[[], Any]:
+    module, function = path.split(".")
+    func = getattr(importlib.import_module(f"calculations.{module}"), function)
+    return functools.partial(func, *CALCS_CALLS[path])
+
+
+for _path in CALCS_CALLS:
+    register(f"calcs.{_path}", "calcs")(functools.partial(_calcs_setup, _path))
+
+
+@register("analyzer.run_all_conditions", "analyzer")
+def _run_all_conditions():
+    from engine.analyzer import LifeCycleAnalyzer
+
+    analyzer = LifeCycleAnalyzer(*reference_riser())
+    return analyzer.run_all_conditions
+
+
+@register("app.evaluate_standard_thicknesses", "app")
+def _evaluate_standard_thicknesses():
+    import app
+
+    from reference_data import pipe_catalog
+
+    pipe, load = reference_riser()
+    evaluate = functools.partial(app.evaluate_standard_thicknesses, pipe, load)
+    evaluate.items = len(pipe_catalog.rows_for_od(pipe.od_in))   # one design per standard thickness
+    return evaluate
+
+
+@register("app.find_closest_passing_standard_wt", "app")
+def _find_closest_passing_standard_wt():
+    import app
+
+    pipe, load = reference_riser()
+    return functools.partial(app.find_closest_passing_standard_wt, pipe, load, pipe.wt_in)
+
+
+@register("main.analyze_scenario", "main")
+def _analyze_scenario():
+    import main
+
+    unit = scenario_units(1)[0]
+    return functools.partial(main.analyze_scenario, unit["scenario"], unit["project_info"])
+
+
+def _run_chunk(n: int):
+    from batch import runner
+
+    units = scenario_units(n)
+    return functools.partial(runner.run_chunk, units)
+
+
+def _analyze_fleet(n: int):
+    from batch import fleet
+
+    risers = fleet_risers(n)
+    return functools.partial(fleet.analyze_fleet, risers)
+
+
+def _summarize_in_chunks(n: int):
+    from engine import lifecycle
+
+    designs = design_columns(n)
+    return functools.partial(lifecycle.summarize_in_chunks, designs)
+
+
+def _export_sweep(n: int):
+    from engine import lifecycle
+
+    designs = design_columns(n)
+    workdir = tempfile.TemporaryDirectory(prefix="riser_bench_")   # removed with the callable
+
+    def export():
+        return lifecycle.export_sweep(designs, f"{workdir.name}/sweep")
+    export.workdir = workdir
+    return export
+
+
+# Scenario batches and bulk riser lists are built per scenario / riser in
+# Python, so they stop at 1k; the columnar engine paths go to 1M designs.
+for _label, _n in SIZES.items():
+    _large = _n >= 1_000_000
+    _options = {"large": _large, "repeat": 3 if _large else None, "warmup": 0 if _large else 1, "items": _n}
+    if not _large:
+        register(f"batch.run_chunk[{_label}]", "batch", items=_n)(functools.partial(_run_chunk, _n))
+        register(f"batch.analyze_fleet[{_label}]", "batch", items=_n)(functools.partial(_analyze_fleet, _n))
+    register(f"batch.summarize_in_chunks[{_label}]", "batch", **_options)(functools.partial(_summarize_in_chunks, _n))
+    register(f"batch.export_sweep[{_label}]", "batch", **_options)(functools.partial(_export_sweep, _n))
@@ -0,0 +1,13 @@
+"""
+Shared vectorized analysis engine for main.py, app.py and the batch tools
+
+This package contains:
+- kernels: NumPy implementations of the API RP 1111 / ASME B31.4 formulas
+- scenario: main.py's HAT/LAT life cycle model over thickness grids (ksi)
+- lifecycle: app.py's 16 sub-condition life cycle plan over many designs (psi)
+- analyzer: app.py's PipeProperties / LoadingCondition / LifeCycleAnalyzer
+  (stdlib + NumPy only, no Streamlit or pandas)
+- progress: Progress / cancellation token polled between chunks
+- instrument: Opt-in timing, cache and allocation counters of the analyzer hot paths
+- columnar: Chunked .npy column files + JSON manifest, memory-mapped on reload
+"""
@@ -0,0 +1,1199 @@
+"""
+Life Cycle Analyzer - import-light home of the app.py analysis classes
+
+PipeProperties, LoadingCondition and LifeCycleAnalyzer depend only on the
+standard library, NumPy (through engine.lifecycle) and the calculation
+modules. Process-pool workers, tests and services can import them without
+pulling in Streamlit or pandas; app.py re-exports them for the UI.
+build_verification_notes and format_safety_factor are shared by the app's
+result tabs and the HTML reports of batch.report. The hot methods are wrapped
+with engine.instrument.timed (a no-op unless instrumentation is enabled).
+"""
+
+import math
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List
+
+from calculations import calcs_weight
+from engine import instrument, lifecycle
+from engine.lifecycle import (
+    MANUFACTURING_COLLAPSE_FACTOR,
+    DEFAULT_E_PSI,
+    DEFAULT_POISSON,
+    DEFAULT_WATER_DENSITY,
+    DESIGN_LIFE_YEARS,
+    CORROSION_RATE_PER_YEAR,
+    MILL_TOLERANCE,
+    HYDROTEST_FACTOR,
+)
+
+
+# -----------------------------------------------------------------------------
+# Data classes
+# -----------------------------------------------------------------------------
+@dataclass
+class PipeProperties:
+    od_in: float
+    wt_in: float
+    grade: str
+    manufacturing: str
+    design_category: str  # "Pipeline" or "Riser"
+    fluid_type: str  # Gas, Oil, Multiphase, Wet Gas
+    fluid_sg: float
+    smys_psi: float
+    uts_psi: float
+    ovality_type: str  # "Reel-lay" or "Other Type"
+    ovality: float
+    E_psi: float = DEFAULT_E_PSI
+    poisson: float = DEFAULT_POISSON
+
+
+@dataclass
+class LoadingCondition:
+    design_pressure_psi: float
+    shut_in_pressure_psi: float
+    shut_in_location: str  # "Subsea Wellhead" or "Top of Riser"
+    water_depth_m: float
+    riser_length_m: float  # For longitudinal tension calculation
+
+
+# -----------------------------------------------------------------------------
+# Life Cycle Analyzer
+# -----------------------------------------------------------------------------
+class LifeCycleAnalyzer:
+    """Analyzes all three life cycle conditions: Installation, Hydrotest, Operation"""
+    
+    def __init__(self, pipe: PipeProperties, load: LoadingCondition):
+        self.pipe = pipe
+        self.load = load
+
+    @staticmethod
+    def _ft_from_m(depth_m: float) -> float:
+        return depth_m * 3.28084
+
+    def external_pressure_psi(self) -> float:
+        """Calculate hydrostatic external pressure"""
+        depth_ft = self._ft_from_m(self.load.water_depth_m)
+        return DEFAULT_WATER_DENSITY * depth_ft / 144.0
+
+    def external_pressure_psi_for_position(self, position: str) -> float:
+        """
+        Calculate external pressure based on riser position
+
+        Parameters:
+        -----------
+        position : str
+            "Top" or "Bottom"
+
+        Returns:
+        --------
+        float : External pressure in psi
+
+        Top Position: Atmospheric only (14.7 psi)
+        Bottom Position: Atmospheric + Hydrostatic
+
+        Physical Basis:
+        - Top of riser is at sea surface → atmospheric pressure
+        - Bottom of riser is at water depth → atmospheric + hydrostatic
+        """
+        ATMOSPHERIC_PSI = 14.7
+
+        if position.lower() == "top":
+            return ATMOSPHERIC_PSI
+        else:  # bottom
+            depth_ft = self._ft_from_m(self.load.water_depth_m)
+            hydrostatic_psi = DEFAULT_WATER_DENSITY * depth_ft / 144.0
+            return ATMOSPHERIC_PSI + hydrostatic_psi
+
+    def calculate_mop(self) -> float:
+        """
+        Calculate MOP (Maximum Operating Pressure) per API RP 1111
+
+        MOP = Shut-in Pressure - Hydrostatic Head of Riser Contents
+
+        The hydrostatic head is the pressure exerted by the fluid column
+        inside the riser from bottom to top.
+
+        Formula:
+        Hydrostatic Head (psi) = (fluid_sg × water_density_pcf) × riser_length_ft / 144
+
+        Where:
+        - fluid_sg: Fluid specific gravity (dimensionless)
+        - water_density_pcf: 64 lb/ft³ (seawater)
+        - riser_length_ft: Riser vertical length in feet
+        - 144: Conversion factor from lb/ft² to psi
+
+        Returns:
+        --------
+        float : MOP in psi
+
+        Notes:
+        - MOP is only different from shut-in when shut-in location is at Subsea Wellhead
+        - When shut-in is at Top of Riser, MOP = shut-in pressure (no adjustment)
+        - MOP represents the pressure at top of riser when shut-in valve closes at bottom
+        """
+        # If shut-in location is at top, MOP = shut-in (no adjustment needed)
+        if self.load.shut_in_location == "Top of Riser":
+            return self.load.shut_in_pressure_psi
+
+        # Calculate hydrostatic head of riser contents
+        riser_length_ft = self._ft_from_m(self.load.riser_length_m)
+        fluid_density_pcf = self.pipe.fluid_sg * DEFAULT_WATER_DENSITY  # lb/ft³
+        hydrostatic_head_psi = (fluid_density_pcf * riser_length_ft) / 144.0
+
+        # MOP = Shut-in pressure at bottom - hydrostatic head
+        mop = self.load.shut_in_pressure_psi - hydrostatic_head_psi
+
+        return max(mop, 0.0)  # Ensure non-negative
+
+    def calculate_hydrotest_pressure(self, position: str = "Top") -> float:
+        """
+        Calculate Hydrotest Pressure per API RP 1111 Appendix C and Table C.3
+
+        Per API RP 1111 Appendix C:
+        - Hydrotest pressure accounts for hydrostatic head of test fluid
+        - Test pressure at top of riser = (Design × 1.25) - Hydrostatic Head
+        - Test pressure at bottom = Design × 1.25 (full test pressure)
+
+        Formula (from Appendix C Table C.3):
+        Pt_top = (Pd × 1.25) - (ρ × g × H / 144)
+
+        Where:
+        - Pd: Design pressure (psi)
+        - 1.25: Hydrotest factor (inverse of 0.8 design factor)
+        - ρ: Test fluid density (lb/ft³)
+        - g: Gravitational constant (included in density)
+        - H: Riser height (ft)
+        - 144: Conversion from lb/ft² to psi
+
+        Parameters:
+        -----------
+        position : str
+            "Top" or "Bottom" - riser position being tested
+
+        Returns:
+        --------
+        float : Hydrotest pressure in psi
+
+        Notes:
+        - TOP position: Pressure reduced by hydrostatic head of test fluid column
+        - BOTTOM position: Full test pressure (1.25 × design)
+        - Test fluid assumed same as operating fluid (fluid_sg)
+        - Follows API RP 1111 Appendix C Example Calculation methodology
+        """
+        # Base hydrotest pressure (1.25 × design pressure)
+        base_hydrotest_pressure = self.load.design_pressure_psi * HYDROTEST_FACTOR
+
+        # For BOTTOM position, use full test pressure
+        if position.lower() == "bottom":
+            return base_hydrotest_pressure
+
+        # For TOP position, subtract hydrostatic head of test fluid
+        # (similar to MOP calculation but for test fluid)
+        riser_length_ft = self._ft_from_m(self.load.riser_length_m)
+
+        # Test fluid density (assuming test fluid same as operating fluid)
+        test_fluid_density_pcf = self.pipe.fluid_sg * DEFAULT_WATER_DENSITY  # lb/ft³
+
+        # Hydrostatic head of test fluid column
+        hydrostatic_head_psi = (test_fluid_density_pcf * riser_length_ft) / 144.0
+
+        # Hydrotest pressure at top = Base test pressure - Hydrostatic head
+        hydrotest_top = base_hydrotest_pressure - hydrostatic_head_psi
+
+        return max(hydrotest_top, 0.0)  # Ensure non-negative
+
+    def calculate_internal_pressure_at_position(self, position: str) -> float:
+        """
+        Calculate internal pressure at a specific riser position based on wellhead location.
+
+        This handles the hydrostatic pressure variation along the riser.
+
+        Parameters:
+        -----------
+        position : str
+            "Top" or "Bottom" - riser position being analyzed
+
+        Returns:
+        --------
+        float : Internal pressure in psi at the specified position
+
+        Logic:
+        ------
+        Case 1: Wellhead at "Subsea Wellhead" (Bottom of Riser)
+            - Bottom: Pi = Shut-in Pressure (full pressure at wellhead)
+            - Top: Pi = Shut-in Pressure - Hydrostatic Head of Riser Contents (MOP)
+
+        Case 2: Wellhead at "Top of Riser"
+            - Top: Pi = Shut-in Pressure (full pressure at wellhead)
+            - Bottom: Pi = Shut-in Pressure + Hydrostatic Head of Riser Contents
+        """
+        riser_length_ft = self._ft_from_m(self.load.riser_length_m)
+        fluid_density_pcf = self.pipe.fluid_sg * DEFAULT_WATER_DENSITY  # lb/ft³
+        hydrostatic_head_psi = (fluid_density_pcf * riser_length_ft) / 144.0
+
+        if self.load.shut_in_location == "Top of Riser":
+            # Wellhead at top: pressure increases going down
+            if position.lower() == "top":
+                return self.load.shut_in_pressure_psi
+            else:  # bottom
+                return self.load.shut_in_pressure_psi + hydrostatic_head_psi
+        else:  # "Subsea Wellhead" - Wellhead at bottom
+            # Wellhead at bottom: pressure decreases going up
+            if position.lower() == "bottom":
+                return self.load.shut_in_pressure_psi
+            else:  # top
+                return max(self.load.shut_in_pressure_psi - hydrostatic_head_psi, 0.0)
+
+    def get_internal_pressure_for_check(self, condition_name: str, check_type: str, position: str = "Top") -> float:
+        """
+        Determine internal pressure based on condition, check type, and position
+
+        Parameters:
+        -----------
+        condition_name : str
+            "Installation", "Hydrotest", or "Operation"
+        check_type : str
+            "burst", "collapse", "propagation", "hoop", "longitudinal", "combined"
+        position : str
+            "Top" or "Bottom" - riser position being analyzed
+
+        Returns:
+        --------
+        float : Internal pressure in psi
+
+        CRITICAL LOGIC FOR OPERATION CONDITION:
+
+        Wellhead Location affects internal pressure distribution:
+
+        Case 1: Wellhead at "Subsea Wellhead" (Bottom)
+            - Bottom Position: Higher internal pressure (at wellhead)
+            - Top Position: Lower internal pressure (MOP = shut-in - hydrostatic head)
+
+        Case 2: Wellhead at "Top of Riser"
+            - Top Position: Shut-in pressure (at wellhead)
+            - Bottom Position: Higher internal pressure (shut-in + hydrostatic head)
+
+        Pressure Selection by Check Type at Bottom Position:
+        - Strength checks (burst, hoop, longitudinal, combined) → Use DESIGN PRESSURE
+        - Stability checks (collapse, propagation) → Use position-dependent internal pressure
+        """
+        if condition_name == "Installation":
+            # Empty pipe during installation
+            return 0.0
+
+        elif condition_name == "Hydrotest":
+            # Position-dependent hydrotest pressure per API RP 1111 Appendix C
+            # TOP: (Design × 1.25) - Hydrostatic Head of Test Fluid
+            # BOTTOM: Design × 1.25 (full test pressure)
+            return self.calculate_hydrotest_pressure(position)
+
+        elif condition_name == "Operation":
+            # CRITICAL: Position and wellhead-location dependent pressure logic
+
+            # Calculate position-dependent internal pressure
+            position_pressure = self.calculate_internal_pressure_at_position(position)
+
+            # TOP POSITION: Always use position-dependent pressure (MOP or shut-in based on wellhead loc)
+            if position.lower() == "top":
+                return position_pressure
+
+            # BOTTOM POSITION: Check-type dependent
+            else:
+                # Strength checks (burst, hoop, longitudinal, combined) - use design pressure
+                if check_type in ["burst", "hoop", "longitudinal", "combined"]:
+                    return self.load.design_pressure_psi
+
+                # Stability checks (collapse, propagation) - use position-dependent pressure
+                elif check_type in ["collapse", "propagation"]:
+                    return position_pressure
+
+        return 0.0
+
+    @instrument.timed("analyzer.calculate_longitudinal_load")
+    def calculate_longitudinal_load(self, wt_eff: float, p_internal: float,
+                                     p_external: float, condition_name: str,
+                                     position: str) -> Dict[str, Any]:
+        """
+        Calculate longitudinal tension per API RP 1111 Section 4.3.1.1
+
+        CRITICAL CHANGE: Position-dependent applied tension
+
+        Longitudinal Load Design:
+        T_eff = T_a - P_i × A_i + P_o × A_o
+
+        Acceptance Criterion:
+        T_eff ≤ 0.60 × T_y
+
+        Position Effects:
+        - Top: T_a = void_submerged_weight × riser_length (maximum tension)
+        - Bottom: T_a = 0 (supported by mudline/seabed)
+
+        Where:
+        - T_a: Applied axial tension from self-weight (lb)
+        - T_eff: Effective tension accounting for pressure end-cap forces
+        - T_y: Yield tension = SMYS × A_steel
+        - P_i: Internal pressure (position-specific)
+        - P_o: External pressure (position-specific)
+        - A_i: Internal cross-sectional area
+        - A_o: External cross-sectional area
+
+        BUOYANCY NOTE: void_submerged_weight already accounts for buoyancy
+        void_submerged = dry_weight - (water_density × displaced_volume)
+        """
+        # Calculate cross-sectional areas (in²)
+        od = self.pipe.od_in
+        id_val = od - 2 * wt_eff
+
+        a_outer = math.pi / 4 * od**2  # External area
+        a_inner = math.pi / 4 * id_val**2  # Internal area
+        a_steel = a_outer - a_inner  # Steel cross-section
+
+        # Calculate pipe weights using effective WT
+        weights = calcs_weight.calculate_pipe_weights(
+            od_inches=od,
+            wt_inches=wt_eff,
+            fluid_sg=self.pipe.fluid_sg,
+            use_seawater=True
+        )
+
+        # Applied tension T_a from self-weight - POSITION DEPENDENT
+        # BUOYANCY is accounted for in void_submerged_weight_plf
+        void_submerged_plf = weights['void_submerged_weight_plf']
+
+        if position.lower() == "top":
+            # Top of riser: Full tension from entire suspended weight
+            riser_length_ft = self._ft_from_m(self.load.riser_length_m)
+            t_a_lb = void_submerged_plf * riser_length_ft
+            riser_length_ft_display = riser_length_ft
+        else:  # bottom
+            # Bottom of riser: Supported by mudline/seabed
+            t_a_lb = 0.0
+            riser_length_ft_display = 0.0
+        
+        # Pressure end-cap forces
+        # Internal pressure creates upward force (reduces tension)
+        # External pressure creates downward force (increases tension)
+        force_internal_lb = p_internal * a_inner  # lb (reduces tension)
+        force_external_lb = p_external * a_outer  # lb (increases tension)
+        
+        # Effective tension (lb)
+        t_eff_lb = t_a_lb - force_internal_lb + force_external_lb
+        
+        # Yield tension (lb)
+        t_y_lb = self.pipe.smys_psi * a_steel
+        
+        # Allowable tension per API RP 1111: 0.60 × T_y
+        allowable_tension_lb = 0.60 * t_y_lb
+        
+        # Safety factor
+        if t_eff_lb <= 0:
+            # Compression case (not covered by this check)
+            safety_factor = float('inf')
+            passes = True
+            status = "Compression (N/A)"
+        else:
+            safety_factor = allowable_tension_lb / t_eff_lb
+            passes = safety_factor >= 1.0
+            status = "PASS" if passes else "FAIL"
+        
+        # Axial stress in pipe wall (psi)
+        axial_stress_psi = t_eff_lb / a_steel if a_steel > 0 else 0
+        
+        return {
+            "condition": condition_name,
+            "position": position,
+            "t_a_applied_lb": t_a_lb,
+            "t_a_applied_kips": t_a_lb / 1000,
+            "force_internal_lb": force_internal_lb,
+            "force_external_lb": force_external_lb,
+            "t_eff_effective_lb": t_eff_lb,
+            "t_eff_effective_kips": t_eff_lb / 1000,
+            "t_y_yield_lb": t_y_lb,
+            "t_y_yield_kips": t_y_lb / 1000,
+            "allowable_tension_lb": allowable_tension_lb,
+            "allowable_tension_kips": allowable_tension_lb / 1000,
+            "axial_stress_psi": axial_stress_psi,
+            "axial_stress_ksi": axial_stress_psi / 1000,
+            "safety_factor": safety_factor,
+            "passes": passes,
+            "status": status,
+            "criterion": "T_eff ≤ 0.60 × T_y (API RP 1111 Section 4.3.1.1)",
+            "a_outer_in2": a_outer,
+            "a_inner_in2": a_inner,
+            "a_steel_in2": a_steel,
+            "void_submerged_plf": void_submerged_plf,
+            "riser_length_ft": riser_length_ft_display,
+        }
+    
+    @instrument.timed("analyzer.calculate_combined_load")
+    def calculate_combined_load(self, wt_eff: float, p_internal: float,
+                                 p_external: float, condition_name: str,
+                                 position: str) -> Dict[str, Any]:
+        """
+        Calculate combined loading per API RP 1111 Section 4.3.1.2
+
+        Combined Load Design:
+        √[(P_i - P_o)² / P_b²] + (T_eff / T_y)² ≤ Design Factor
+
+        Design Factors:
+        - 0.90 for operational loads
+        - 0.96 for extreme loads (storm, earthquake)
+        - 0.96 for hydrotest loads
+
+        Position affects longitudinal component through T_eff calculation.
+
+        This is the most comprehensive check that combines:
+        1. Pressure loading (burst/collapse)
+        2. Longitudinal tension (from weight and pressure end-caps, position-dependent)
+        """
+        # Get longitudinal load results with position
+        longitudinal = self.calculate_longitudinal_load(
+            wt_eff, p_internal, p_external, condition_name, position
+        )
+        
+        # Get burst pressure using class method
+        burst_result = self.compute_burst(p_internal, p_external, wt_eff)
+        p_b = burst_result["pb"]  # Burst pressure capacity
+        
+        # Differential pressure (positive = burst, negative = collapse)
+        p_diff = p_internal - p_external
+        
+        # Pressure component: (P_i - P_o) / P_b
+        # For collapse cases (negative p_diff), we still use absolute value
+        # per API RP 1111 interpretation
+        pressure_component = (p_diff / p_b) if p_b > 0 else 0
+        
+        # Tension component: T_eff / T_y
+        t_eff = longitudinal["t_eff_effective_lb"]
+        t_y = longitudinal["t_y_yield_lb"]
+        tension_component = (t_eff / t_y) if t_y > 0 else 0
+        
+        # Combined load ratio
+        combined_ratio = math.sqrt(pressure_component**2 + tension_component**2)
+        
+        # Determine design factor based on condition
+        if condition_name == "Operation":
+            design_factor = 0.90  # Operational loads
+            factor_description = "0.90 (Operational)"
+        elif condition_name == "Hydrotest":
+            design_factor = 0.96  # Hydrotest loads
+            factor_description = "0.96 (Hydrotest)"
+        else:  # Installation
+            design_factor = 0.96  # Extreme loads (conservative)
+            factor_description = "0.96 (Extreme)"
+        
+        # Safety factor (design_factor / combined_ratio)
+        if combined_ratio > 0:
+            safety_factor = design_factor / combined_ratio
+        else:
+            safety_factor = float('inf')
+        
+        passes = combined_ratio <= design_factor
+        status = "PASS" if passes else "FAIL"
+        
+        return {
+            "condition": condition_name,
+            "position": position,
+            "p_internal_psi": p_internal,
+            "p_external_psi": p_external,
+            "p_diff_psi": p_diff,
+            "p_b_burst_psi": p_b,
+            "pressure_component": pressure_component,
+            "t_eff_lb": t_eff,
+            "t_y_lb": t_y,
+            "tension_component": tension_component,
+            "combined_ratio": combined_ratio,
+            "design_factor": design_factor,
+            "factor_description": factor_description,
+            "safety_factor": safety_factor,
+            "passes": passes,
+            "status": status,
+            "criterion": f"√[(P/Pb)² + (T/Ty)²] ≤ {design_factor} (API RP 1111 Section 4.3.1.2)",
+        }
+
+    def effective_wall_thickness(self, use_mill_tolerance: bool, use_corrosion: bool) -> float:
+        """
+        Calculate effective wall thickness per life cycle condition
+        - Installation/Hydrotest: WT × 0.875 (mill tolerance only)
+        - Operation: (WT × 0.875) - (corrosion_rate × design_life)
+        """
+        wt = self.pipe.wt_in
+        
+        # Apply mill tolerance (12.5% reduction = 0.875 factor)
+        if use_mill_tolerance:
+            wt = wt * (1.0 - MILL_TOLERANCE)
+        
+        # Apply corrosion (only for operation: rate × design life)
+        if use_corrosion:
+            corrosion_total = CORROSION_RATE_PER_YEAR * DESIGN_LIFE_YEARS
+            wt = wt - corrosion_total
+        
+        return max(wt, 0.001)  # Ensure positive
+
+    def _hoop_design_factor(self) -> float:
+        """Design factor per ASME B31.4/B31.8 based on category and fluid type"""
+        return lifecycle.hoop_design_factor(self.pipe.design_category, self.pipe.fluid_type)
+
+    @staticmethod
+    def _burst_design_factor(design_category: str) -> float:
+        """Burst design factor per API RP 1111 Section 4.3.1"""
+        return lifecycle.burst_design_factor(design_category)
+
+    @instrument.timed("analyzer.compute_burst")
+    def compute_burst(self, p_internal: float, p_external: float, wt_eff: float) -> Dict[str, Any]:
+        """
+        Burst pressure check per API RP 1111 Section 4.3.1
+
+        Formula: P_b = 0.45 × (SMYS + UTS) × ln(D / D_i)
+
+        Criterion: (P_i - P_o) ≤ f_d × f_e × f_t × P_b
+
+        Where:
+        - f_d = Design factor (0.75 for Riser/Flowline, 0.90 for Pipeline)
+        - f_e = Weld joint factor (1.0 for seamless)
+        - f_t = Temperature derating factor (1.0 for ambient)
+        - D_i = Inner diameter = D - 2t
+        """
+        fd = self._burst_design_factor(self.pipe.design_category)
+        fe = 1.0  # Weld joint factor
+        ft = 1.0  # Temperature factor
+        od = self.pipe.od_in
+        id_val = od - 2 * wt_eff
+        smys = self.pipe.smys_psi
+        uts = self.pipe.uts_psi
+
+        # Burst pressure per API RP 1111: P_b = 0.45 × (SMYS + UTS) × ln(D / D_i)
+        pb = 0.45 * (smys + uts) * math.log(od / id_val) if id_val > 0 else 0.0
+
+        # Allowable burst pressure
+        allowable_burst = fd * fe * ft * pb
+
+        # Net internal pressure
+        delta_p = p_internal - p_external
+
+        if delta_p <= 0:
+            sf = float("inf")
+        else:
+            sf = allowable_burst / delta_p
+
+        return {
+            "name": "Burst",
+            "pb": pb,
+            "allowable_burst": allowable_burst,
+            "safety_factor": sf,
+            "utilization": 0 if sf == float("inf") else 1 / sf,
+            "pass_fail": sf >= 1.0,
+            "details": {
+                "design_factor": fd,
+                "joint_factor": fe,
+                "temperature_factor": ft,
+                "delta_p": delta_p,
+                "p_internal": p_internal,
+                "p_external": p_external,
+                "od": od,
+                "id": id_val,
+                "wt_eff": wt_eff,
+                "smys": smys,
+                "uts": uts,
+            },
+        }
+
+    @instrument.timed("analyzer.compute_collapse")
+    def compute_collapse(self, p_internal: float, p_external: float, wt_eff: float) -> Dict[str, Any]:
+        """
+        External collapse check per API RP 1111 Section 4.3.2
+
+        Formulas:
+        - Yield Collapse: P_y = 2 × SMYS × (t/D)
+        - Elastic Collapse: P_e = 2 × E × (t/D)³ / (1 - ν²)
+        - Critical Collapse (Murphy-Langner): P_c = P_y × P_e / √(P_y² + P_e²)
+
+        Criterion: (P_o - P_i) ≤ f_o × P_c
+
+        Where:
+        - f_o = Collapse factor (0.70 for SMLS/ERW, 0.60 for DSAW)
+        """
+        od = self.pipe.od_in
+        smys = self.pipe.smys_psi
+        E = self.pipe.E_psi
+        nu = self.pipe.poisson
+        ovality = self.pipe.ovality
+        f_o = MANUFACTURING_COLLAPSE_FACTOR.get(self.pipe.manufacturing.upper(), 0.70)
+
+        t_over_d = wt_eff / od
+        d_over_t = od / wt_eff if wt_eff > 0 else float('inf')
+
+        # Yield collapse: P_y = 2 × SMYS × (t/D)
+        py = 2 * smys * t_over_d
+
+        # Elastic collapse (simplified): P_e = 2 × E × (t/D)³ / (1 - ν²)
+        pe = (2 * E * (t_over_d ** 3)) / (1 - nu ** 2)
+
+        # Critical collapse: P_c = P_y × P_e / √(P_y² + P_e²)
+        pc = (py * pe) / math.sqrt(py ** 2 + pe ** 2) if (py > 0 and pe > 0) else 0.0
+
+        # Allowable collapse pressure
+        allowable_collapse = f_o * pc
+
+        # Determine collapse mode
+        if py > 0 and pe > 0:
+            py_pe_ratio = py / pe
+            if py_pe_ratio < 1.5:
+                collapse_mode = "Elastic"
+            elif py_pe_ratio < 4.0:
+                collapse_mode = "Plastic"
+            else:
+                collapse_mode = "Yield"
+        else:
+            py_pe_ratio = 0.0
+            collapse_mode = "N/A"
+
+        # Net external pressure
+        delta_p = p_external - p_internal
+        if delta_p <= 0:
+            sf = float("inf")
+        else:
+            sf = allowable_collapse / delta_p
+
+        return {
+            "name": "Collapse",
+            "py": py,
+            "pe": pe,
+            "pc": pc,
+            "allowable_collapse": allowable_collapse,
+            "collapse_factor": f_o,
+            "collapse_mode": collapse_mode,
+            "ovality": ovality,
+            "safety_factor": sf,
+            "utilization": 0 if sf == float("inf") else 1 / sf,
+            "pass_fail": sf >= 1.0,
+            "details": {
+                "delta_p": delta_p,
+                "p_internal": p_internal,
+                "p_external": p_external,
+                "od": od,
+                "wt_eff": wt_eff,
+                "t_over_d": t_over_d,
+                "d_over_t": d_over_t,
+                "smys": smys,
+                "E": E,
+                "poisson": nu,
+                "py_pe_ratio": py_pe_ratio,
+            },
+        }
+
+    @instrument.timed("analyzer.compute_propagation")
+    def compute_propagation(self, p_internal: float, p_external: float, wt_eff: float) -> Dict[str, Any]:
+        """
+        Propagation buckling check per API RP 1111 Section 4.3.2.3
+
+        Formula: P_p = 35 × SMYS × (t/D)^2.5
+
+        Criterion: (P_o - P_i) ≤ f_p × P_p
+
+        Where:
+        - f_p = 0.80 (Propagation buckling design factor)
+        - P_p = Propagation pressure (the pressure at which a buckle propagates)
+
+        Note: Propagation buckling arrestors may be required if net external
+        pressure exceeds this limit.
+        """
+        od = self.pipe.od_in
+        smys = self.pipe.smys_psi
+        fp = 0.80
+        t_over_d = wt_eff / od
+        d_over_t = od / wt_eff if wt_eff > 0 else float('inf')
+
+        # Propagation pressure: P_p = 35 × SMYS × (t/D)^2.5
+        pp = 35 * smys * (t_over_d ** 2.5)
+
+        # Allowable propagation pressure
+        allowable_prop = fp * pp
+
+        # Net external pressure
+        delta_p = p_external - p_internal
+
+        if delta_p <= 0:
+            sf = float("inf")
+        else:
+            sf = allowable_prop / delta_p
+
+        return {
+            "name": "Propagation",
+            "pp": pp,
+            "allowable_prop": allowable_prop,
+            "design_factor": fp,
+            "safety_factor": sf,
+            "utilization": 0 if sf == float("inf") else 1 / sf,
+            "pass_fail": sf >= 1.0,
+            "details": {
+                "delta_p": delta_p,
+                "p_internal": p_internal,
+                "p_external": p_external,
+                "od": od,
+                "wt_eff": wt_eff,
+                "t_over_d": t_over_d,
+                "d_over_t": d_over_t,
+                "smys": smys,
+            },
+        }
+
+    @instrument.timed("analyzer.compute_hoop")
+    def compute_hoop(self, p_internal: float, p_external: float, wt_eff: float) -> Dict[str, Any]:
+        """
+        Hoop stress check per ASME B31.4 Section 402.3
+
+        Formula (Barlow for thin-wall): S_H = (P_i - P_o) × D / (2 × t)
+
+        Where:
+        - S_H = Hoop stress (psi)
+        - P_i = Internal pressure (psi)
+        - P_o = External pressure (psi)
+        - D = Outside diameter (inches)
+        - t = Wall thickness (inches)
+
+        Criterion: S_H ≤ F × SMYS
+
+        SPECIAL CASE: For Installation condition (empty pipe, Pi=0),
+        the hoop stress is caused by external pressure (compressive):
+        S_H = P_o × D / (2 × t)
+
+        This equation is applicable for D/t ≥ 20 (thin-wall assumption).
+        """
+        od = self.pipe.od_in
+        smys = self.pipe.smys_psi
+        design_factor = self._hoop_design_factor()
+        d_over_t = od / wt_eff if wt_eff > 0 else float('inf')
+
+        # Calculate differential pressure (always needed for details)
+        delta_p = p_internal - p_external
+
+        # Calculate hoop stress based on pressure conditions
+        if wt_eff <= 0 or od <= wt_eff:
+            hoop_stress = float("inf")
+        elif p_internal <= 0:
+            # Installation condition: empty pipe (Pi = 0)
+            # Hoop stress from external pressure (compressive)
+            # S_H = P_o × D / (2 × t)
+            hoop_stress = p_external * od / (2 * wt_eff)
+        else:
+            # Normal operation: differential pressure
+            # S_H = (P_i - P_o) × D / (2 × t)
+            if delta_p <= 0:
+                # External pressure exceeds internal - use absolute external pressure
+                hoop_stress = abs(delta_p) * od / (2 * wt_eff)
+            else:
+                hoop_stress = delta_p * od / (2 * wt_eff)
+
+        # Allowable stress: S_allowable = F × SMYS
+        allowable = design_factor * smys
+
+        # Safety factor: SF = S_allowable / S_H
+        if hoop_stress > 0:
+            sf = allowable / hoop_stress
+        else:
+            sf = float("inf")
+
+        return {
+            "name": "Hoop Stress",
+            "hoop_stress": hoop_stress,
+            "design_factor": design_factor,
+            "allowable": allowable,
+            "safety_factor": sf,
+            "utilization": 0 if sf == float("inf") else 1 / sf,
+            "pass_fail": sf >= 1.0,
+            "details": {
+                "delta_p": delta_p,
+                "p_internal": p_internal,
+                "p_external": p_external,
+                "od": od,
+                "wt_eff": wt_eff,
+                "d_over_t": d_over_t,
+                "smys": smys,
+            },
+        }
+
+    def analyze_condition(self, condition_name: str, p_internal: float, 
+                          use_mill_tolerance: bool, use_corrosion: bool) -> Dict[str, Any]:
+        """Analyze one life cycle condition"""
+        p_external = self.external_pressure_psi()
+        wt_eff = self.effective_wall_thickness(use_mill_tolerance, use_corrosion)
+        
+        # Calculate pipe weights for this condition
+        weights = calcs_weight.calculate_pipe_weights(
+            od_inches=self.pipe.od_in,
+            wt_inches=wt_eff,  # Use effective WT for this condition
+            fluid_sg=self.pipe.fluid_sg,
+            use_seawater=True
+        )
+
+        burst = self.compute_burst(p_internal, p_external, wt_eff)
+        collapse = self.compute_collapse(p_internal, p_external, wt_eff)
+        propagation = self.compute_propagation(p_internal, p_external, wt_eff)
+        hoop = self.compute_hoop(p_internal, p_external, wt_eff)
+        
+        # NEW: Calculate longitudinal tension (Section 4.3.1.1)
+        longitudinal = self.calculate_longitudinal_load(wt_eff, p_internal, condition_name)
+        
+        # NEW: Calculate combined loading (Section 4.3.1.2)
+        combined = self.calculate_combined_load(wt_eff, p_internal, condition_name)
+
+        checks = [burst, collapse, propagation, hoop]
+        limiting = min(
+            checks,
+            key=lambda c: c["safety_factor"] if c["safety_factor"] != float("inf") else float("inf"),
+        )
+        # Update all_pass to include longitudinal and combined checks
+        all_pass = all(c["pass_fail"] for c in checks) and longitudinal["passes"] and combined["passes"]
+
+        return {
+            "condition_name": condition_name,
+            "p_internal_psi": p_internal,
+            "p_external_psi": p_external,
+            "wt_nominal": self.pipe.wt_in,
+            "wt_effective": wt_eff,
+            "mill_tolerance_applied": use_mill_tolerance,
+            "corrosion_applied": use_corrosion,
+            "weights": weights,
+            "checks": checks,
+            "longitudinal": longitudinal,
+            "combined": combined,
+            "all_pass": all_pass,
+            "limiting": limiting,
+        }
+
+    @instrument.timed("analyzer.analyze_condition_at_position")
+    def analyze_condition_at_position(
+        self,
+        condition_name: str,  # "Installation", "Hydrotest", "Operation"
+        position: str,        # "Top" or "Bottom"
+        use_mill_tolerance: bool,
+        use_corrosion: bool
+    ) -> Dict[str, Any]:
+        """
+        Analyze one life cycle condition at a specific riser position
+
+        This is the NEW core analysis method that replaces analyze_condition()
+        for the 6-condition analysis (3 stages × 2 positions).
+
+        Key Differences from Old Method:
+        1. Position-dependent external pressure (Po)
+        2. Check-type-dependent internal pressure (Pi) for Operation
+        3. Position-dependent axial loading (T_a)
+
+        Parameters:
+        -----------
+        condition_name : str
+            "Installation", "Hydrotest", or "Operation"
+        position : str
+            "Top" or "Bottom"
+        use_mill_tolerance : bool
+            Apply 12.5% mill tolerance to WT
+        use_corrosion : bool
+            Apply corrosion allowance to WT
+
+        Returns:
+        --------
+        Dict containing:
+        - Position-specific pressures for each check
+        - All 7 check results
+        - Overall pass/fail status
+        """
+        # Calculate position-specific external pressure
+        p_external = self.external_pressure_psi_for_position(position)
+
+        # Calculate effective wall thickness (unchanged logic)
+        wt_eff = self.effective_wall_thickness(use_mill_tolerance, use_corrosion)
+
+        # Calculate pipe weights for this condition
+        weights = calcs_weight.calculate_pipe_weights(
+            od_inches=self.pipe.od_in,
+            wt_inches=wt_eff,
+            fluid_sg=self.pipe.fluid_sg,
+            use_seawater=True
+        )
+
+        # Run pressure-only checks with check-type-specific internal pressure
+        # NOW WITH MOP SUPPORT: position affects collapse/propagation pressures
+
+        # 1. Burst check - uses design pressure (no MOP)
+        p_i_burst = self.get_internal_pressure_for_check(condition_name, "burst", position)
+        burst = self.compute_burst(p_i_burst, p_external, wt_eff)
+
+        # 2. Collapse check - uses shut-in/MOP depending on position
+        p_i_collapse = self.get_internal_pressure_for_check(condition_name, "collapse", position)
+        collapse = self.compute_collapse(p_i_collapse, p_external, wt_eff)
+
+        # 3. Propagation check - uses shut-in/MOP depending on position
+        p_i_propagation = self.get_internal_pressure_for_check(condition_name, "propagation", position)
+        propagation = self.compute_propagation(p_i_propagation, p_external, wt_eff)
+
+        # 4. Hoop check - uses design pressure (no MOP)
+        p_i_hoop = self.get_internal_pressure_for_check(condition_name, "hoop", position)
+        hoop = self.compute_hoop(p_i_hoop, p_external, wt_eff)
+
+        # 5. Longitudinal tension - uses design pressure, POSITION-AWARE
+        p_i_longitudinal = self.get_internal_pressure_for_check(condition_name, "longitudinal", position)
+        longitudinal = self.calculate_longitudinal_load(
+            wt_eff, p_i_longitudinal, p_external, condition_name, position
+        )
+
+        # 6. Combined loading - uses design pressure, POSITION-AWARE
+        p_i_combined = self.get_internal_pressure_for_check(condition_name, "combined", position)
+        combined = self.calculate_combined_load(
+            wt_eff, p_i_combined, p_external, condition_name, position
+        )
+
+        # Collect pressure-only checks
+        checks = [burst, collapse, propagation, hoop]
+
+        # Find limiting check among pressure-only checks
+        limiting = min(
+            checks,
+            key=lambda c: c["safety_factor"] if c["safety_factor"] != float("inf") else float("inf"),
+        )
+
+        # Overall pass/fail includes all 6 checks (4 pressure + longitudinal + combined)
+        all_pass = (
+            all(c["pass_fail"] for c in checks) and
+            longitudinal["passes"] and
+            combined["passes"]
+        )
+
+        # Calculate MOP for information display
+        mop_psi = self.calculate_mop()
+        mop_active = (
+            condition_name == "Operation" and
+            self.load.shut_in_location == "Subsea Wellhead" and
+            position.lower() == "top"
+        )
+
+        return {
+            "condition_name": condition_name,
+            "position": position,
+            # Store pressures used for each check type (for UI display)
+            "p_internal_burst": p_i_burst,      # Used by: burst, hoop, longitudinal, combined
+            "p_internal_collapse": p_i_collapse,  # Used by: collapse, propagation
+            "p_external_psi": p_external,
+            "wt_nominal": self.pipe.wt_in,
+            "wt_effective": wt_eff,
+            "mill_tolerance_applied": use_mill_tolerance,
+            "corrosion_applied": use_corrosion,
+            "weights": weights,
+            "checks": checks,
+            "longitudinal": longitudinal,
+            "combined": combined,
+            "all_pass": all_pass,
+            "limiting": limiting,
+            # MOP information
+            "mop_psi": mop_psi,
+            "mop_active": mop_active,
+            "shut_in_location": self.load.shut_in_location,
+        }
+
+    def get_wt_type_description(self, use_mill_tolerance: bool, use_corrosion: bool) -> str:
+        """Generate description for wall thickness type"""
+        return lifecycle.wt_type_description(use_mill_tolerance, use_corrosion)
+
+    def get_wt_type_short(self, use_mill_tolerance: bool, use_corrosion: bool) -> str:
+        """Generate short key for wall thickness type"""
+        return lifecycle.wt_type_key(use_mill_tolerance, use_corrosion)
+
+    @instrument.timed("analyzer.run_all_conditions", allocations=True)
+    def run_all_conditions(self) -> Dict[str, Any]:
+        """
+        Analyze all life cycle conditions with multiple wall thickness types:
+
+        Installation (2 WT types × 2 positions = 4 sub-conditions):
+        - Nominal WT (no tolerance, no corrosion)
+        - Nominal - Tolerance (with mill tolerance)
+
+        Hydrotest (2 WT types × 2 positions = 4 sub-conditions):
+        - Nominal WT (no tolerance, no corrosion)
+        - Nominal - Tolerance (with mill tolerance)
+
+        Operation (4 WT types × 2 positions = 8 sub-conditions):
+        - Nominal WT (no tolerance, no corrosion)
+        - Nominal - Tolerance (with mill tolerance only)
+        - Nominal - Corrosion (with corrosion only)
+        - Nominal - Tolerance - Corrosion (with both)
+
+        Total: 16 sub-conditions
+
+        Returns:
+        --------
+        Dict with keys:
+        - pipe: Pipe properties
+        - loading: Loading conditions
+        - conditions: Nested dict organized by stage -> wt_type -> position
+        - all_conditions_pass: Boolean (True if all pass)
+        """
+        # Define wall thickness types for each life cycle stage
+        # Format: (use_mill_tolerance, use_corrosion)
+        installation_wt_types = [
+            (False, False),  # Nominal
+            (True, False),   # Nominal - Tolerance
+        ]
+
+        hydrotest_wt_types = [
+            (False, False),  # Nominal
+            (True, False),   # Nominal - Tolerance
+        ]
+
+        operation_wt_types = [
+            (False, False),  # Nominal
+            (True, False),   # Nominal - Tolerance
+            (False, True),   # Nominal - Corrosion
+            (True, True),    # Nominal - Tolerance - Corrosion
+        ]
+
+        positions = ["Top", "Bottom"]
+
+        results = {
+            "installation": {},
+            "hydrotest": {},
+            "operation": {},
+        }
+
+        # Analyze Installation conditions
+        for use_mill, use_corr in installation_wt_types:
+            wt_key = self.get_wt_type_short(use_mill, use_corr)
+            wt_desc = self.get_wt_type_description(use_mill, use_corr)
+            results["installation"][wt_key] = {
+                "description": wt_desc,
+                "positions": {}
+            }
+            for position in positions:
+                result = self.analyze_condition_at_position(
+                    condition_name="Installation",
+                    position=position,
+                    use_mill_tolerance=use_mill,
+                    use_corrosion=use_corr
+                )
+                result["wt_type_description"] = wt_desc
+                results["installation"][wt_key]["positions"][position.lower()] = result
+
+        # Analyze Hydrotest conditions
+        for use_mill, use_corr in hydrotest_wt_types:
+            wt_key = self.get_wt_type_short(use_mill, use_corr)
+            wt_desc = self.get_wt_type_description(use_mill, use_corr)
+            results["hydrotest"][wt_key] = {
+                "description": wt_desc,
+                "positions": {}
+            }
+            for position in positions:
+                result = self.analyze_condition_at_position(
+                    condition_name="Hydrotest",
+                    position=position,
+                    use_mill_tolerance=use_mill,
+                    use_corrosion=use_corr
+                )
+                result["wt_type_description"] = wt_desc
+                results["hydrotest"][wt_key]["positions"][position.lower()] = result
+
+        # Analyze Operation conditions
+        for use_mill, use_corr in operation_wt_types:
+            wt_key = self.get_wt_type_short(use_mill, use_corr)
+            wt_desc = self.get_wt_type_description(use_mill, use_corr)
+            results["operation"][wt_key] = {
+                "description": wt_desc,
+                "positions": {}
+            }
+            for position in positions:
+                result = self.analyze_condition_at_position(
+                    condition_name="Operation",
+                    position=position,
+                    use_mill_tolerance=use_mill,
+                    use_corrosion=use_corr
+                )
+                result["wt_type_description"] = wt_desc
+                results["operation"][wt_key]["positions"][position.lower()] = result
+
+        # Check if ALL conditions pass (iterate through all nested results)
+        all_pass = True
+        for stage_name, stage_data in results.items():
+            for wt_key, wt_data in stage_data.items():
+                for pos_key, pos_result in wt_data["positions"].items():
+                    if not pos_result["all_pass"]:
+                        all_pass = False
+
+        return {
+            "pipe": asdict(self.pipe),
+            "loading": asdict(self.load),
+            "conditions": results,
+            "all_conditions_pass": all_pass,
+        }
+
+
+# -----------------------------------------------------------------------------
+# Result presentation helpers (shared by the app and batch.report)
+# -----------------------------------------------------------------------------
+def build_verification_notes(pipe: PipeProperties, load: LoadingCondition, result: Dict[str, Any]) -> List[str]:
+    """Build automated verification warnings"""
+    notes: List[str] = []
+    d_over_t = pipe.od_in / max(pipe.wt_in, 1e-6)
+
+    # Check operation condition WT (use operation with_tol_corr top as representative - worst case)
+    if "operation" in result["conditions"]:
+        op_data = result["conditions"]["operation"]
+        if "with_tol_corr" in op_data and "positions" in op_data["with_tol_corr"]:
+            op_wt = op_data["with_tol_corr"]["positions"]["top"]["wt_effective"]
+            if op_wt < 0.1:
+                notes.append(f"⚠️ Operation WT very thin ({op_wt:.4f} in) after corrosion and mill tolerance")
+
+    if d_over_t > 120:
+        notes.append(f"⚠️ High D/t ratio ({d_over_t:.1f}); check fabrication tolerances")
+
+    if load.shut_in_pressure_psi > load.design_pressure_psi * 1.5:
+        notes.append("⚠️ Shut-in pressure > 1.5× design; confirm well control assumptions")
+
+    if pipe.fluid_sg < 0.02 or pipe.fluid_sg > 1.2:
+        notes.append(f"⚠️ Fluid SG ({pipe.fluid_sg}) outside typical range")
+
+    # Check if any condition fails (new nested structure)
+    for stage_name, stage_data in result["conditions"].items():
+        for wt_key, wt_data in stage_data.items():
+            for pos_key, pos_result in wt_data["positions"].items():
+                if not pos_result["all_pass"]:
+                    # Format condition name nicely
+                    stage = pos_result["condition_name"]
+                    wt_desc = pos_result.get("wt_type_description", wt_data["description"])
+                    position = pos_result["position"]
+                    notes.append(f"❌ {stage} ({wt_desc}) - {position} fails")
+
+    return notes
+
+
+def format_safety_factor(sf: float, check_name: str = "", p_internal: float = 0.0) -> str:
+    """
+    Format safety factor for display with descriptive text for infinite values
+
+    Parameters:
+    -----------
+    sf : float
+        Safety factor value
+    check_name : str
+        Name of check (for context)
+    p_internal : float
+        Internal pressure (for determining N/A reason)
+
+    Returns:
+    --------
+    str : Formatted safety factor text
+
+    Replaces float('inf') with user-friendly descriptions:
+    - "N/A (No internal pressure)" for burst/hoop during installation
+    - "N/A (Favorable loading)" for reverse loading cases
+    - ">999" for extremely high safety factors
+    """
+    if sf == float('inf'):
+        # Determine reason for infinite safety factor
+        if p_internal <= 0 and check_name in ["Burst", "Hoop Stress"]:
+            return "N/A (No internal pressure)"
+        else:
+            return "N/A (Favorable loading)"
+    elif sf > 999:
+        return ">999"
+    else:
+        return f"{sf:.2f}"
@@ -0,0 +1,270 @@
+"""
+Columnar Result Files - chunked .npy columns with a JSON manifest
+
+Large sweeps are written as they are produced, one chunk at a time, into a
+directory holding one .npy file per column plus manifest.json:
+
+    sweep/
+        manifest.json      rows, columns (dtype, shape), chunk sizes,
+                           category labels, free-form attrs
+        od.npy, wt.npy, all_pass.npy, min_sf.npy, ...
+
+Each column file grows by appending raw chunk bytes after a fixed-size .npy
+header that is rewritten with the final row count on close, so the files are
+ordinary .npy arrays (np.load works) but no chunk is ever held twice in
+memory. The manifest is rewritten after every chunk; a sweep interrupted
+before close() is still readable up to the last committed chunk.
+
+Reloading memory-maps the columns: nothing is parsed or copied until a
+slice is actually read, so a multi-GB sweep opens instantly:
+
+    ds = open_dataset("sweep")
+    passing = ds["all_pass"][:100_000]
+    df = ds.to_pandas(start=0, stop=10_000)
+
+Saved sweeps the web app may open live below sweep_root() ($RISER_SWEEP_ROOT,
+default sweeps/ in the repository); list_datasets() and resolve_dataset()
+keep lookups inside it.
+"""
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+MANIFEST = "manifest.json"
+SWEEP_ROOT_ENV = "RISER_SWEEP_ROOT"
+DEFAULT_SWEEP_ROOT = Path(__file__).resolve().parent.parent / "sweeps"
+FORMAT_VERSION = 1
+HEADER_LEN = 128   # bytes of every .npy header (a multiple of 64, as numpy writes them)
+
+
+def _npy_header(dtype: np.dtype, shape: Sequence[int]) -> bytes:
+    """Version 1.0 .npy header padded to exactly HEADER_LEN bytes."""
+    text = repr({'descr': np.lib.format.dtype_to_descr(dtype), 'fortran_order': False,
+                 'shape': tuple(int(s) for s in shape)})
+    body = HEADER_LEN - 10   # magic (6) + version (2) + header length (2)
+    if len(text) >= body:
+        raise ValueError(f"dtype {dtype} / shape {tuple(shape)} does not fit the .npy header")
+    return b'\x93NUMPY\x01\x00' + struct.pack('<H', body) + (text.ljust(body - 1) + '\n').encode('latin1')
+
+
+class ColumnarWriter:
+    """
+    Append equal-length column chunks to a columnar directory.
+
+    Parameters:
+    -----------
+    directory : str or Path
+        Output directory (created; existing column files are replaced)
+    categories : dict, optional
+        Column name -> labels for integer code columns (-1 = no label)
+    attrs : dict, optional
+        JSON-serializable metadata stored in the manifest
+    """
+
+    def __init__(self, directory, categories: Optional[Dict[str, Sequence[str]]] = None,
+                 attrs: Optional[Dict[str, Any]] = None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.categories = {k: list(v) for k, v in (categories or {}).items()}
+        self.attrs = dict(attrs or {})
+        self.rows = 0
+        self.chunks: List[int] = []
+        self._specs: Dict[str, Dict[str, Any]] = {}
+        self._files: Dict[str, Any] = {}
+        self._closed = False
+
+    def append(self, columns: Dict[str, np.ndarray]) -> None:
+        """Write one chunk; every column must have the same number of rows."""
+        if self._closed:
+            raise ValueError("ColumnarWriter is closed")
+        arrays = {name: np.ascontiguousarray(data) for name, data in columns.items()}
+        lengths = {len(a) for a in arrays.values()}
+        if len(lengths) != 1:
+            raise ValueError(f"Columns of a chunk differ in length: {sorted(lengths)}")
+        if self._specs and set(arrays) != set(self._specs):
+            raise ValueError(f"Chunk columns {sorted(arrays)} differ from {sorted(self._specs)}")
+        n = lengths.pop()
+
+        for name, data in arrays.items():
+            spec = self._specs.get(name)
+            if spec is None:
+                spec = {'file': f"{name}.npy", 'dtype': np.lib.format.dtype_to_descr(data.dtype),
+                        'shape': list(data.shape[1:])}
+                f = open(self.directory / spec['file'], 'wb')
+                f.write(_npy_header(data.dtype, (0,) + data.shape[1:]))
+                self._specs[name] = spec
+                self._files[name] = f
+            elif (np.lib.format.dtype_to_descr(data.dtype) != spec['dtype']
+                  or list(data.shape[1:]) != spec['shape']):
+                raise ValueError(f"Column '{name}' changed dtype or shape between chunks")
+            self._files[name].write(data.tobytes())
+
+        for f in self._files.values():
+            f.flush()
+        self.rows += n
+        self.chunks.append(n)
+        self._write_manifest(complete=False)
+
+    def close(self, complete: bool = True) -> None:
+        """
+        Finalize the .npy headers with the row count. The manifest is marked
+        complete unless complete=False (the writer stopped on an error).
+        """
+        if self._closed:
+            return
+        for name, f in self._files.items():
+            spec = self._specs[name]
+            f.seek(0)
+            f.write(_npy_header(np.lib.format.descr_to_dtype(spec['dtype']), [self.rows] + spec['shape']))
+            f.close()
+        self._closed = True
+        self._write_manifest(complete=complete)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(complete=exc_type is None)
+
+    def _write_manifest(self, complete: bool) -> None:
+        manifest = {
+            'format': 'riser-columnar',
+            'version': FORMAT_VERSION,
+            'rows': self.rows,
+            'complete': complete,
+            'chunks': self.chunks,
+            'columns': self._specs,
+            'categories': self.categories,
+            'attrs': self.attrs,
+        }
+        tmp = self.directory / (MANIFEST + '.tmp')
+        tmp.write_text(json.dumps(manifest, indent=1))
+        os.replace(tmp, self.directory / MANIFEST)
+
+
+class ColumnarDataset:
+    """
+    Read-only, memory-mapped view of a columnar directory.
+
+    Parameters:
+    -----------
+    directory : str or Path
+        Directory written by ColumnarWriter
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        manifest = json.loads((self.directory / MANIFEST).read_text())
+        if manifest.get('format') != 'riser-columnar':
+            raise ValueError(f"{self.directory}: not a columnar result directory")
+        self.rows: int = manifest['rows']
+        self.complete: bool = manifest['complete']
+        self.chunks: List[int] = manifest['chunks']
+        self.categories: Dict[str, List[str]] = manifest['categories']
+        self.attrs: Dict[str, Any] = manifest['attrs']
+        self._specs: Dict[str, Dict[str, Any]] = manifest['columns']
+        self._maps: Dict[str, np.ndarray] = {}
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._specs)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the column data on disk (committed rows only)."""
+        return sum(self[name].nbytes for name in self._specs)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __repr__(self) -> str:
+        state = "" if self.complete else ", incomplete"
+        return f"ColumnarDataset('{self.directory}', rows={self.rows}, columns={len(self._specs)}{state})"
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Whole column as a read-only memory map (rows committed in the manifest)."""
+        if name not in self._maps:
+            spec = self._specs[name]
+            dtype = np.lib.format.descr_to_dtype(spec['dtype'])
+            shape = tuple([self.rows] + spec['shape'])
+            if self.rows == 0:
+                self._maps[name] = np.zeros(shape, dtype=dtype)
+            else:
+                self._maps[name] = np.memmap(self.directory / spec['file'], dtype=dtype, mode='r',
+                                             offset=HEADER_LEN, shape=shape)
+        return self._maps[name]
+
+    def slice(self, start: int = 0, stop: Optional[int] = None,
+              columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """Rows [start, stop) of the given columns as memory-mapped views."""
+        return {name: self[name][start:stop] for name in (columns or self._specs)}
+
+    def labels(self, name: str, codes) -> np.ndarray:
+        """Decode a category column's codes to labels ('' for -1)."""
+        table = np.array(self.categories[name] + [''], dtype=object)
+        return table[np.asarray(codes)]
+
+    def to_pandas(self, columns: Optional[Sequence[str]] = None, start: int = 0,
+                  stop: Optional[int] = None, rows: Optional[np.ndarray] = None):
+        """
+        Rows [start, stop), or the given row indices, as a DataFrame indexed
+        by row number. Only 1-D columns are included by default; category
+        columns become pandas Categoricals. Only the selected rows are read
+        from disk.
+        """
+        import pandas as pd
+
+        if columns is None:
+            columns = [name for name, spec in self._specs.items() if not spec['shape']]
+        if rows is None:
+            rows = np.arange(self.rows)[start:stop]
+            select = slice(start, stop)
+        else:
+            rows = np.asarray(rows, dtype=np.int64)
+            select = rows
+        data = {}
+        for name in columns:
+            values = self[name][select]
+            if name in self.categories:
+                data[name] = pd.Categorical.from_codes(np.asarray(values, dtype=np.int64),
+                                                       categories=self.categories[name])
+            else:
+                data[name] = values
+        return pd.DataFrame(data, index=rows, copy=False)
+
+
+def open_dataset(directory) -> ColumnarDataset:
+    """Memory-map a columnar directory written by ColumnarWriter."""
+    return ColumnarDataset(directory)
+
+
+def sweep_root() -> Path:
+    """Directory of saved sweeps: $RISER_SWEEP_ROOT, else DEFAULT_SWEEP_ROOT."""
+    return Path(os.environ.get(SWEEP_ROOT_ENV) or DEFAULT_SWEEP_ROOT).resolve()
+
+
+def list_datasets(root) -> List[str]:
+    """Columnar directories below root, as sorted root-relative POSIX paths."""
+    root = Path(root)
+    if not root.is_dir():
+        return []
+    return sorted(path.parent.relative_to(root).as_posix() for path in root.rglob(MANIFEST)
+                  if path.parent != root)
+
+
+def resolve_dataset(root, name: str) -> Path:
+    """
+    Directory of a dataset listed by list_datasets(root).
+
+    Raises ValueError if name resolves (through '..' or symlinks) outside root.
+    """
+    root = Path(root).resolve()
+    path = (root / name).resolve()
+    if path == root or root not in path.parents:
+        raise ValueError(f"'{name}' is not a sweep below {root}")
+    return path
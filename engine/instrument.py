@@ -0,0 +1,306 @@
+"""
+Instrumentation - opt-in timing and cache counters for the hot paths
+
+The scalar analyzer's hot methods (LifeCycleAnalyzer.run_all_conditions,
+analyze_condition_at_position and every compute_* / calculate_*_load check)
+are decorated with timed(). While instrumentation is disabled (the default)
+the classes hold the plain methods, so calls cost nothing extra; enable()
+swaps the timing wrappers in and disable() swaps them back out. Once
+enabled, every call records its duration in a process-local registry: call count, cumulative time and
+percentiles over the most recent SAMPLE_WINDOW calls. Caches report lookups
+and misses (cache_lookup / cache_miss) so hit rates can be read back, and
+with allocations=True the per-analysis peak and retained memory is traced
+with tracemalloc (much slower; for diagnosis only).
+
+Enable it in code with enable(), or for whole processes - including batch
+and report worker processes, which inherit the environment - with:
+
+    RISER_INSTRUMENT=1                      # enable at import
+    RISER_INSTRUMENT=allocations            # ... and trace allocations
+    RISER_INSTRUMENT_FILE=prof-{pid}.json   # write snapshot() at exit
+
+snapshot() returns plain JSON-ready data; format_table() renders it for a
+terminal. python -m bench.profile and the web app's Instrumentation panel
+show the same registry.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+SAMPLE_WINDOW = 4096   # recent durations kept per timer for percentiles
+ENV_ENABLE = "RISER_INSTRUMENT"
+ENV_FILE = "RISER_INSTRUMENT_FILE"
+
+_enabled = False
+_allocations = False
+_started_tracing = False   # tracemalloc was started by enable(), so disable() stops it
+_lock = threading.Lock()
+_started = time.time()
+
+
+class _Timer:
+    __slots__ = ("count", "total_s", "max_s", "samples", "alloc_count", "alloc_peak", "alloc_peak_max",
+                 "alloc_net")
+
+    def __init__(self):
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.samples: Deque[float] = deque(maxlen=SAMPLE_WINDOW)
+        self.alloc_count = 0
+        self.alloc_peak = 0
+        self.alloc_peak_max = 0
+        self.alloc_net = 0
+
+
+_timers: Dict[str, _Timer] = {}
+_caches: Dict[str, Dict[str, int]] = {}
+_targets: List[Tuple[type, str, Callable, Callable]] = []   # (class, attribute, plain, wrapper)
+
+
+def _install() -> None:
+    """Put the timing wrappers on their classes while enabled, the plain methods otherwise."""
+    for owner, attr, func, wrapper in _targets:
+        current = owner.__dict__.get(attr)
+        if current is func or current is wrapper:   # leave methods patched by others alone
+            setattr(owner, attr, wrapper if _enabled else func)
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def allocations_enabled() -> bool:
+    return _allocations
+
+
+def enable(allocations: bool = False) -> None:
+    """Start collecting (allocations=True also traces memory per analysis with tracemalloc)."""
+    global _enabled, _allocations, _started_tracing
+    if allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracing = True
+    _allocations = allocations
+    _enabled = True
+    _install()
+
+
+def disable() -> None:
+    """Stop collecting; recorded data is kept until reset(). A trace started by someone else keeps running."""
+    global _enabled, _allocations, _started_tracing
+    if _started_tracing and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _enabled = _allocations = _started_tracing = False
+    _install()
+
+
+def reset() -> None:
+    """Clear every timer and cache counter."""
+    global _started
+    with _lock:
+        _timers.clear()
+        _caches.clear()
+        _started = time.time()
+
+
+def _record(name: str, elapsed_s: float, alloc: Optional[tuple] = None) -> None:
+    with _lock:
+        timer = _timers.get(name)
+        if timer is None:
+            timer = _timers[name] = _Timer()
+        timer.count += 1
+        timer.total_s += elapsed_s
+        timer.max_s = max(timer.max_s, elapsed_s)
+        timer.samples.append(elapsed_s)
+        if alloc is not None:
+            peak, net = alloc
+            timer.alloc_count += 1
+            timer.alloc_peak += peak
+            timer.alloc_peak_max = max(timer.alloc_peak_max, peak)
+            timer.alloc_net += net
+
+
+class _Timed:
+    """
+    Result of timed(): once its class is created it replaces itself there
+    with the plain method, or with the wrapper while enabled (see _install).
+    Called directly (a decorated plain function) it runs the wrapper.
+    """
+
+    def __init__(self, func: Callable, wrapper: Callable):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.wrapper = wrapper
+
+    def __set_name__(self, owner: type, attr: str) -> None:
+        _targets.append((owner, attr, self.func, self.wrapper))
+        setattr(owner, attr, self.wrapper if _enabled else self.func)
+
+    def __call__(self, *args, **kwargs):
+        return self.wrapper(*args, **kwargs)
+
+
+def timed(name: str, allocations: bool = False) -> Callable:
+    """
+    Decorator recording call durations under `name` while enabled.
+
+    Meant for methods: the class attribute is swapped between the plain
+    method and the timing wrapper by enable() / disable(), so a disabled
+    call does not go through a wrapper at all.
+
+    Parameters:
+    -----------
+    name : str
+        Registry key, e.g. 'analyzer.compute_burst'
+    allocations : bool
+        Also trace peak / retained bytes per call when enabled with
+        allocations=True (use on outermost calls only: nested traced calls
+        reset the tracemalloc peak of their caller)
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            trace = allocations and _allocations and tracemalloc.is_tracing()
+            if trace:
+                before = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                alloc = None
+                if trace:
+                    current, peak = tracemalloc.get_traced_memory()
+                    alloc = (max(peak - before, 0), current - before)
+                _record(name, elapsed, alloc)
+        return _Timed(func, wrapper)
+    return decorator
+
+
+def cache_lookup(name: str, hit: Optional[bool] = None) -> None:
+    """Count a lookup in cache `name` (hit=False also counts a miss; see cache_miss)."""
+    if not _enabled:
+        return
+    with _lock:
+        counts = _caches.setdefault(name, {"lookups": 0, "misses": 0})
+        counts["lookups"] += 1
+        if hit is False:
+            counts["misses"] += 1
+
+
+def cache_miss(name: str) -> None:
+    """Count a miss of cache `name` whose lookup was counted separately."""
+    if not _enabled:
+        return
+    with _lock:
+        _caches.setdefault(name, {"lookups": 0, "misses": 0})["misses"] += 1
+
+
+def _percentile(sorted_samples, q: float) -> Optional[float]:
+    if not sorted_samples:
+        return None
+    return sorted_samples[min(len(sorted_samples) - 1, int(q * len(sorted_samples)))]
+
+
+def snapshot() -> Dict[str, Any]:
+    """
+    Registry contents as JSON-ready data.
+
+    Returns:
+    --------
+    dict :
+    - enabled, allocations, pid, since (epoch seconds of the last reset)
+    - timers: name -> count, total_ms, mean_us, p50_us, p95_us, p99_us,
+      max_us (percentiles over the last SAMPLE_WINDOW calls) and, when
+      traced, alloc_peak_kib_mean, alloc_peak_kib_max, alloc_net_kib_mean
+    - caches: name -> lookups, hits, misses, hit_rate
+    """
+    with _lock:
+        timers = {}
+        for name, t in sorted(_timers.items()):
+            samples = sorted(t.samples)
+            entry = {
+                "count": t.count,
+                "total_ms": round(t.total_s * 1e3, 3),
+                "mean_us": round(t.total_s / t.count * 1e6, 2),
+                "p50_us": round(_percentile(samples, 0.50) * 1e6, 2),
+                "p95_us": round(_percentile(samples, 0.95) * 1e6, 2),
+                "p99_us": round(_percentile(samples, 0.99) * 1e6, 2),
+                "max_us": round(t.max_s * 1e6, 2),
+            }
+            if t.alloc_count:
+                entry["alloc_peak_kib_mean"] = round(t.alloc_peak / t.alloc_count / 1024, 2)
+                entry["alloc_peak_kib_max"] = round(t.alloc_peak_max / 1024, 2)
+                entry["alloc_net_kib_mean"] = round(t.alloc_net / t.alloc_count / 1024, 2)
+            timers[name] = entry
+        caches = {}
+        for name, counts in sorted(_caches.items()):
+            lookups, misses = counts["lookups"], min(counts["misses"], counts["lookups"])
+            caches[name] = {
+                "lookups": lookups,
+                "hits": lookups - misses,
+                "misses": misses,
+                "hit_rate": round((lookups - misses) / lookups, 4) if lookups else None,
+            }
+    return {
+        "enabled": _enabled,
+        "allocations": _allocations,
+        "pid": os.getpid(),
+        "since": round(_started, 3),
+        "timers": timers,
+        "caches": caches,
+    }
+
+
+def format_table(snap: Optional[Dict[str, Any]] = None) -> str:
+    """Plain-text tables of a snapshot (default: the current one)."""
+    snap = snapshot() if snap is None else snap
+    lines = []
+    if snap["timers"]:
+        width = max(len(name) for name in snap["timers"])
+        lines.append(f"{'Timer':<{width}}  {'calls':>9}  {'total ms':>10}  {'mean us':>9}  {'p50 us':>9}  "
+                     f"{'p95 us':>9}  {'p99 us':>9}  {'peak KiB':>9}")
+        for name, t in sorted(snap["timers"].items(), key=lambda item: -item[1]["total_ms"]):
+            peak = t.get("alloc_peak_kib_mean")
+            lines.append(f"{name:<{width}}  {t['count']:>9,}  {t['total_ms']:>10.1f}  {t['mean_us']:>9.1f}  "
+                         f"{t['p50_us']:>9.1f}  {t['p95_us']:>9.1f}  {t['p99_us']:>9.1f}  "
+                         f"{'-' if peak is None else f'{peak:.1f}':>9}")
+    else:
+        lines.append("No timed calls recorded" + ("" if snap["enabled"] else " (instrumentation is disabled)"))
+    if snap["caches"]:
+        width = max(len(name) for name in snap["caches"])
+        lines.append("")
+        lines.append(f"{'Cache':<{width}}  {'lookups':>9}  {'hits':>9}  {'misses':>9}  hit rate")
+        for name, c in snap["caches"].items():
+            rate = "-" if c["hit_rate"] is None else f"{c['hit_rate']:.1%}"
+            lines.append(f"{name:<{width}}  {c['lookups']:>9,}  {c['hits']:>9,}  {c['misses']:>9,}  {rate}")
+    return "\n".join(lines)
+
+
+def dump(path) -> None:
+    """Write snapshot() as JSON; '{pid}' in the path is replaced by the process id."""
+    with open(str(path).replace("{pid}", str(os.getpid())), "w", encoding="utf-8") as f:
+        json.dump(snapshot(), f, indent=2)
+
+
+def _configure_from_environment() -> None:
+    mode = os.environ.get(ENV_ENABLE, "").strip().lower()
+    if mode in ("", "0", "false", "no", "off"):
+        return
+    enable(allocations=mode == "allocations")
+    path = os.environ.get(ENV_FILE)
+    if path:
+        atexit.register(dump, path)
+
+
+_configure_from_environment()
@@ -0,0 +1,111 @@
+"""
+Vectorized Design Check Kernels - API RP 1111 / ASME B31.4 formulas on arrays
+
+Every function accepts NumPy arrays (or scalars) that broadcast against each
+other and returns arrays, so a whole grid of wall thicknesses, life cycle
+conditions and designs is evaluated in one pass. Units follow the caller:
+pressures, SMYS/UTS and E just have to be consistent (psi for app.py, ksi for
+main.py).
+
+Coefficients that differ between the two entry points (propagation formula,
+collapse factor) are parameters rather than constants. The scalar checks in
+calculations/calcs_* and engine.analyzer keep their own math-module versions
+of these formulas (a NumPy call per scalar costs ~10x); tests/test_engine.py
+keeps the two in step.
+"""
+
+import numpy as np
+
+INF = np.inf
+
+
+def safety_factor(allowable, demand):
+    """SF = allowable / demand, infinite where the demand is not positive."""
+    allowable, demand = np.broadcast_arrays(np.asarray(allowable, dtype=float),
+                                            np.asarray(demand, dtype=float))
+    sf = np.full(demand.shape, INF)
+    np.divide(allowable, demand, out=sf, where=demand > 0)
+    return sf
+
+
+def utilization_from_sf(sf):
+    """Utilization = 1 / SF, zero where SF is infinite."""
+    sf = np.asarray(sf, dtype=float)
+    util = np.zeros(sf.shape)
+    np.divide(1.0, sf, out=util, where=np.isfinite(sf))
+    return util
+
+
+def burst_pressure(od, wt, smys, uts):
+    """
+    Burst pressure per API RP 1111 Section 4.3.1.
+
+    Formula: P_b = 0.45 × (S + U) × ln(D / D_i), zero where D_i ≤ 0
+    """
+    od = np.asarray(od, dtype=float)
+    id_val = od - 2 * np.asarray(wt, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pb = 0.45 * (smys + uts) * np.log(od / id_val)
+    return np.where(id_val > 0, pb, 0.0)
+
+
+def collapse_pressures(od, wt, smys, E, poisson):
+    """
+    Yield, elastic and critical (Murphy-Langner) collapse pressures.
+
+    Formulas (API RP 1111 Section 4.3.2):
+    - P_y = 2 × S × (t/D)
+    - P_e = 2 × E × (t/D)³ / (1 - ν²)
+    - P_c = P_y × P_e / √(P_y² + P_e²), zero unless both are positive
+
+    Returns:
+    --------
+    tuple : (p_y, p_e, p_c) arrays
+    """
+    t_over_d = np.asarray(wt, dtype=float) / od
+    py = 2 * smys * t_over_d
+    pe = (2 * E * (t_over_d ** 3)) / (1 - poisson ** 2)
+    valid = (py > 0) & (pe > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pc = (py * pe) / np.sqrt(py ** 2 + pe ** 2)
+    return py, pe, np.where(valid, pc, 0.0)
+
+
+def propagation_pressure(od, wt, smys, coefficient=35.0, exponent=2.5):
+    """
+    Propagation buckling pressure P_p = C × S × (t/D)^n.
+
+    app.py uses C=35, n=2.5; calculations/calcs_propagation uses C=24, n=2.4.
+    """
+    t_over_d = np.asarray(wt, dtype=float) / od
+    with np.errstate(invalid='ignore'):
+        pp = coefficient * smys * (t_over_d ** exponent)
+    return np.where(t_over_d > 0, pp, 0.0)
+
+
+def barlow_hoop_stress(pressure, od, wt):
+    """Hoop stress S_H = P × D / (2 × t) (Barlow, thin wall)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return pressure * od / (2 * np.asarray(wt, dtype=float))
+
+
+def bending_strain_limit(od, wt, smys, E):
+    """Allowable bending strain ε_b = 2 × t × S / (D × E)."""
+    return 2 * np.asarray(wt, dtype=float) * smys / (od * E)
+
+
+def ovality_function(ovality):
+    """Ovality function g(δ) = max(1 - 3.5 × δ, 0)."""
+    return np.maximum(1 - 3.5 * np.asarray(ovality, dtype=float), 0.0)
+
+
+def void_submerged_weight_plf(od, wt, steel_density=490.0, water_density=64.0):
+    """
+    Empty-pipe submerged weight in lb/ft (calcs_weight.calculate_pipe_weights),
+    rounded to 2 decimals like the scalar implementation.
+    """
+    od_ft = np.asarray(od, dtype=float) / 12.0
+    id_ft = (od - 2.0 * np.asarray(wt, dtype=float)) / 12.0
+    a_steel = (np.pi / 4.0) * (od_ft ** 2 - id_ft ** 2)
+    a_outer = (np.pi / 4.0) * (od_ft ** 2)
+    return np.round(steel_density * a_steel - water_density * a_outer, 2)
@@ -0,0 +1,559 @@
+"""
+Vectorized Life Cycle Plan - the 16 sub-conditions of app.LifeCycleAnalyzer
+
+A life cycle plan is the fixed list of sub-conditions every design is checked
+against (psi units, Top/Bottom positions):
+- Installation: 2 WT types (Nominal, Nominal - Tolerance) × 2 positions
+- Hydrotest: 2 WT types × 2 positions
+- Operation: 4 WT types (tolerance / corrosion combinations) × 2 positions
+
+evaluate_designs() runs the burst, collapse, propagation, hoop, longitudinal
+and combined checks for N designs × 16 sub-conditions as (N, 16) arrays, so a
+standard thickness sweep or a batch of designs costs one NumPy pass instead
+of N × 16 scalar evaluations. export_sweep() writes the per-design summary
+of very large sweeps to columnar files (engine.columnar) chunk by chunk.
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engine import kernels
+from engine.columnar import ColumnarDataset, ColumnarWriter, open_dataset
+from engine.progress import ProgressToken
+
+# Material / design constants shared with app.py
+GRADE_PROPERTIES = {
+    # API 5L Grades (Specification for Line Pipe)
+    # Format: Grade: {SMYS (psi), UTS (psi)}
+    "A25": {"smys_psi": 25000, "uts_psi": 45000},
+    "A": {"smys_psi": 30000, "uts_psi": 48000},
+    "B": {"smys_psi": 35000, "uts_psi": 60000},
+    "X-42": {"smys_psi": 42000, "uts_psi": 60000},
+    "X-46": {"smys_psi": 46000, "uts_psi": 63000},
+    "X-52": {"smys_psi": 52000, "uts_psi": 66000},
+    "X-56": {"smys_psi": 56000, "uts_psi": 71000},
+    "X-60": {"smys_psi": 60000, "uts_psi": 75000},
+    "X-65": {"smys_psi": 65000, "uts_psi": 78000},
+    "X-70": {"smys_psi": 70000, "uts_psi": 82000},
+    "X-80": {"smys_psi": 80000, "uts_psi": 90000},
+    "X-90": {"smys_psi": 90000, "uts_psi": 100000},
+    "X-100": {"smys_psi": 100000, "uts_psi": 110000},
+    "X-120": {"smys_psi": 120000, "uts_psi": 130000},
+}
+
+MANUFACTURING_COLLAPSE_FACTOR = {
+    "SMLS": 0.70,
+    "ERW": 0.75,
+    "DSAW": 0.60,
+}
+
+DEFAULT_E_PSI = 2.9e7
+DEFAULT_POISSON = 0.30
+DEFAULT_WATER_DENSITY = 64.0  # lb/ft^3
+ATMOSPHERIC_PSI = 14.7
+FT_PER_M = 3.28084
+
+# Design life and corrosion parameters (from Team 8 data)
+DESIGN_LIFE_YEARS = 20
+CORROSION_RATE_PER_YEAR = 0.004  # inch/year
+MILL_TOLERANCE = 0.125  # 12.5% = wall thickness factor 0.875
+HYDROTEST_FACTOR = 1.25
+
+DEFAULT_CHUNK_SIZE = 4096  # designs per evaluate_designs call in summarize_in_chunks
+
+# Life cycle plan: stage -> WT types as (use_mill_tolerance, use_corrosion)
+STAGE_NAMES = {
+    "installation": "Installation",
+    "hydrotest": "Hydrotest",
+    "operation": "Operation",
+}
+STAGE_WT_TYPES = {
+    "installation": [(False, False), (True, False)],
+    "hydrotest": [(False, False), (True, False)],
+    "operation": [(False, False), (True, False), (False, True), (True, True)],
+}
+POSITIONS = ("Top", "Bottom")
+
+# Pressure-only checks considered for the limiting safety factor, in app order
+CHECK_NAMES = ("Burst", "Collapse", "Propagation", "Hoop Stress")
+
+
+def wt_type_key(use_mill_tolerance: bool, use_corrosion: bool) -> str:
+    """Short key for a wall thickness type"""
+    if not use_mill_tolerance and not use_corrosion:
+        return "nominal"
+    elif use_mill_tolerance and not use_corrosion:
+        return "with_tol"
+    elif not use_mill_tolerance and use_corrosion:
+        return "with_corr"
+    else:  # both
+        return "with_tol_corr"
+
+
+def wt_type_description(use_mill_tolerance: bool, use_corrosion: bool) -> str:
+    """Display description for a wall thickness type"""
+    if not use_mill_tolerance and not use_corrosion:
+        return "Nominal"
+    elif use_mill_tolerance and not use_corrosion:
+        return "Nominal - Tolerance"
+    elif not use_mill_tolerance and use_corrosion:
+        return "Nominal - Corrosion"
+    else:  # both
+        return "Nominal - Tolerance - Corrosion"
+
+
+def hoop_design_factor(design_category: str, fluid_type: str) -> float:
+    """Design factor per ASME B31.4/B31.8 based on category and fluid type"""
+    if design_category.lower() == "pipeline":
+        return 0.72
+    # Riser design factors
+    if fluid_type.lower() in ["gas", "wet gas"]:
+        return 0.50
+    if fluid_type.lower() in ["oil", "multiphase"]:
+        return 0.60
+    return 0.72
+
+
+def burst_design_factor(design_category: str) -> float:
+    """Burst design factor per API RP 1111 Section 4.3.1"""
+    return 0.90 if design_category.lower() == "pipeline" else 0.75
+
+
+def build_plan() -> List[Tuple[str, str, bool, bool, str]]:
+    """
+    The 16 sub-conditions in run_all_conditions order.
+
+    Returns:
+    --------
+    list of tuple : (stage_key, wt_key, use_mill_tolerance, use_corrosion, position)
+    """
+    plan = []
+    for stage_key, wt_types in STAGE_WT_TYPES.items():
+        for use_mill, use_corr in wt_types:
+            for position in POSITIONS:
+                plan.append((stage_key, wt_type_key(use_mill, use_corr), use_mill, use_corr, position))
+    return plan
+
+
+PLAN = build_plan()
+_STAGE_INDEX = np.array([list(STAGE_NAMES).index(p[0]) for p in PLAN])
+_USE_MILL = np.array([p[2] for p in PLAN])
+_USE_CORR = np.array([p[3] for p in PLAN])
+_IS_TOP = np.array([p[4] == "Top" for p in PLAN])
+_INSTALLATION, _HYDROTEST, _OPERATION = 0, 1, 2
+
+PLAN_LABELS = [
+    f"{STAGE_NAMES[stage]} ({wt_type_description(mill, corr)}) - {position}"
+    for stage, _, mill, corr, position in PLAN
+]
+
+
+def design_arrays(pipes: Sequence[Any], loads: Any) -> Dict[str, np.ndarray]:
+    """
+    Collect PipeProperties / LoadingCondition fields into column arrays.
+
+    Parameters:
+    -----------
+    pipes : sequence of PipeProperties
+        One entry per design
+    loads : LoadingCondition or sequence of LoadingCondition
+        A single loading condition is shared by every design
+
+    Returns:
+    --------
+    dict : Column name -> 1-D array of length len(pipes)
+    """
+    n = len(pipes)
+    if not isinstance(loads, (list, tuple)):
+        loads = [loads] * n
+    if len(loads) != n:
+        raise ValueError(f"Expected {n} loading conditions, got {len(loads)}")
+
+    return {
+        "od": np.array([p.od_in for p in pipes], dtype=float),
+        "wt": np.array([p.wt_in for p in pipes], dtype=float),
+        "smys": np.array([p.smys_psi for p in pipes], dtype=float),
+        "uts": np.array([p.uts_psi for p in pipes], dtype=float),
+        "E": np.array([p.E_psi for p in pipes], dtype=float),
+        "poisson": np.array([p.poisson for p in pipes], dtype=float),
+        "fluid_sg": np.array([p.fluid_sg for p in pipes], dtype=float),
+        "collapse_factor": np.array(
+            [MANUFACTURING_COLLAPSE_FACTOR.get(p.manufacturing.upper(), 0.70) for p in pipes], dtype=float),
+        "hoop_factor": np.array(
+            [hoop_design_factor(p.design_category, p.fluid_type) for p in pipes], dtype=float),
+        "burst_factor": np.array([burst_design_factor(p.design_category) for p in pipes], dtype=float),
+        "design_pressure": np.array([l.design_pressure_psi for l in loads], dtype=float),
+        "shut_in_pressure": np.array([l.shut_in_pressure_psi for l in loads], dtype=float),
+        "shut_in_top": np.array([l.shut_in_location == "Top of Riser" for l in loads], dtype=bool),
+        "water_depth_m": np.array([l.water_depth_m for l in loads], dtype=float),
+        "riser_length_m": np.array([l.riser_length_m for l in loads], dtype=float),
+    }
+
+
+def thickness_sweep_arrays(base_pipe: Any, load: Any, thicknesses) -> Dict[str, np.ndarray]:
+    """
+    Column arrays for one pipe evaluated at many wall thicknesses.
+
+    Equivalent to design_arrays() over copies of base_pipe with wt_in
+    replaced, without building a PipeProperties object per thickness
+    (e.g. thicknesses = pipe_catalog.rows_for_od(od)['wt']).
+    """
+    wt = np.asarray(thicknesses, dtype=float)
+    base = design_arrays([base_pipe], load)
+    cols = {k: np.repeat(v, len(wt)) for k, v in base.items()}
+    cols["wt"] = wt.copy()
+    return cols
+
+
+# Design inputs a sweep can vary: column name -> axis label
+SWEEP_PARAMETERS = {
+    "wt": "Wall Thickness (in)",
+    "water_depth_m": "Water Depth (m)",
+    "design_pressure": "Design Pressure (psi)",
+}
+
+# Checks reported by utilization_sweep (CHECK_NAMES plus the two non-pressure checks)
+UTILIZATION_CHECKS = CHECK_NAMES + ("Longitudinal", "Combined")
+
+
+def parameter_sweep_arrays(base_pipe: Any, load: Any, parameter: str, values) -> Dict[str, np.ndarray]:
+    """
+    Column arrays for one design with a single input varied.
+
+    Parameters:
+    -----------
+    base_pipe : PipeProperties
+        Pipe held fixed apart from the swept input
+    load : LoadingCondition
+        Loading held fixed apart from the swept input
+    parameter : str
+        Key of SWEEP_PARAMETERS; every other input (including riser length
+        and shut-in pressure) keeps its base value
+    values : array-like
+        Values of the swept input
+    """
+    if parameter not in SWEEP_PARAMETERS:
+        raise ValueError(f"Unknown sweep parameter '{parameter}' (expected one of {list(SWEEP_PARAMETERS)})")
+    values = np.asarray(values, dtype=float)
+    base = design_arrays([base_pipe], load)
+    cols = {k: np.repeat(v, len(values)) for k, v in base.items()}
+    cols[parameter] = values.copy()
+    return cols
+
+
+def _utilization(result: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Per-check utilization and its governing sub-condition from evaluate_designs() output."""
+    sf = np.concatenate([result["safety_factor"],
+                         result["longitudinal_sf"][..., None],
+                         result["combined_sf"][..., None]], axis=-1)
+    utilization = kernels.utilization_from_sf(sf)
+    governing_condition = np.argmax(utilization, axis=1)
+    return {
+        "utilization": utilization,
+        "governing": np.take_along_axis(utilization, governing_condition[:, None, :], axis=1)[:, 0, :],
+        "governing_condition": governing_condition,
+        "all_pass": result["all_pass"],
+    }
+
+
+def utilization_sweep(base_pipe: Any, load: Any, parameter: str, values) -> Dict[str, np.ndarray]:
+    """
+    Utilization (1 / SF) of every check and sub-condition along a sweep of
+    one input, from a single evaluate_designs() call.
+
+    Returns:
+    --------
+    dict :
+    - values (N,): swept input values
+    - utilization (N, 16, 6): per sub-condition (PLAN order) and check
+      (UTILIZATION_CHECKS order); 0 where the check sees no demand
+    - governing (N, 6): highest utilization of each check over the 16 sub-conditions
+    - governing_condition (N, 6): index into PLAN_LABELS of that sub-condition
+    - all_pass (N,): every sub-condition passes
+    """
+    designs = parameter_sweep_arrays(base_pipe, load, parameter, values)
+    return {"values": designs[parameter], **_utilization(evaluate_designs(designs))}
+
+
+def compare_designs(pipes: Sequence[Any], loads: Any) -> Dict[str, np.ndarray]:
+    """
+    Utilization of N design alternatives side by side, from a single
+    evaluate_designs() call.
+
+    Parameters:
+    -----------
+    pipes : sequence of PipeProperties
+        One entry per alternative
+    loads : LoadingCondition or sequence of LoadingCondition
+        As in design_arrays()
+
+    Returns:
+    --------
+    dict : utilization, governing, governing_condition and all_pass as in
+           utilization_sweep(), plus row_pass (N, 16): every check of the
+           sub-condition passes
+    """
+    result = evaluate_designs(design_arrays(pipes, loads))
+    return {**_utilization(result), "row_pass": result["row_pass"]}
+
+
+def evaluate_designs(designs: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Evaluate N designs against all 16 life cycle sub-conditions.
+
+    Parameters:
+    -----------
+    designs : dict
+        Column arrays from design_arrays() (length N each)
+
+    Returns:
+    --------
+    dict of arrays shaped (N, 16) unless noted:
+    - wt_effective, p_external, p_internal_burst, p_internal_collapse
+    - pb, py, pe, pc, pp, hoop_stress, t_eff, t_y, combined_ratio
+    - safety_factor (N, 16, 4): burst, collapse, propagation, hoop
+    - limiting_index: index into CHECK_NAMES of the limiting check
+    - limiting_sf: minimum pressure-check safety factor
+    - longitudinal_sf, longitudinal_pass, combined_sf, combined_pass
+    - row_pass: all six checks pass
+    - all_pass (N,): every sub-condition passes
+    """
+    col = {k: np.asarray(v)[:, None] for k, v in designs.items()}
+    od, smys = col["od"], col["smys"]
+    is_top = _IS_TOP[None, :]
+    stage = _STAGE_INDEX[None, :]
+
+    # External pressure: atmospheric at the top, plus hydrostatic at the bottom
+    depth_ft = col["water_depth_m"] * FT_PER_M
+    hydrostatic_psi = DEFAULT_WATER_DENSITY * depth_ft / 144.0
+    p_ext = np.where(is_top, ATMOSPHERIC_PSI, ATMOSPHERIC_PSI + hydrostatic_psi)
+
+    # Effective wall thickness per WT type
+    wt = np.where(_USE_MILL[None, :], col["wt"] * (1.0 - MILL_TOLERANCE), col["wt"])
+    wt = np.where(_USE_CORR[None, :], wt - CORROSION_RATE_PER_YEAR * DESIGN_LIFE_YEARS, wt)
+    wt_eff = np.maximum(wt, 0.001)
+
+    # Internal pressures (see LifeCycleAnalyzer.get_internal_pressure_for_check)
+    riser_length_ft = col["riser_length_m"] * FT_PER_M
+    fluid_density_pcf = col["fluid_sg"] * DEFAULT_WATER_DENSITY
+    head_psi = (fluid_density_pcf * riser_length_ft) / 144.0
+
+    base_hydrotest = col["design_pressure"] * HYDROTEST_FACTOR
+    p_hydrotest = np.where(is_top, np.maximum(base_hydrotest - head_psi, 0.0), base_hydrotest)
+
+    shut_in = col["shut_in_pressure"]
+    p_position = np.where(
+        col["shut_in_top"],
+        np.where(is_top, shut_in, shut_in + head_psi),
+        np.where(is_top, np.maximum(shut_in - head_psi, 0.0), shut_in),
+    )
+    p_operation_strength = np.where(is_top, p_position, col["design_pressure"])
+
+    p_strength = np.select([stage == _HYDROTEST, stage == _OPERATION],
+                           [p_hydrotest, p_operation_strength], 0.0)
+    p_stability = np.select([stage == _HYDROTEST, stage == _OPERATION],
+                            [p_hydrotest, p_position], 0.0)
+
+    # 1. Burst (strength pressure)
+    pb = kernels.burst_pressure(od, wt_eff, smys, col["uts"])
+    sf_burst = kernels.safety_factor(col["burst_factor"] * pb, p_strength - p_ext)
+
+    # 2. Collapse (stability pressure)
+    py, pe, pc = kernels.collapse_pressures(od, wt_eff, smys, col["E"], col["poisson"])
+    sf_collapse = kernels.safety_factor(col["collapse_factor"] * pc, p_ext - p_stability)
+
+    # 3. Propagation (stability pressure)
+    pp = kernels.propagation_pressure(od, wt_eff, smys, coefficient=35, exponent=2.5)
+    sf_propagation = kernels.safety_factor(0.80 * pp, p_ext - p_stability)
+
+    # 4. Hoop stress: external pressure alone for an empty pipe, |Pi - Po| otherwise
+    hoop_pressure = np.where(p_strength <= 0, p_ext, np.abs(p_strength - p_ext))
+    hoop_stress = np.where((wt_eff <= 0) | (od <= wt_eff), np.inf,
+                           kernels.barlow_hoop_stress(hoop_pressure, od, wt_eff))
+    sf_hoop = kernels.safety_factor(col["hoop_factor"] * smys, hoop_stress)
+
+    # 5. Longitudinal tension: T_eff = T_a - P_i × A_i + P_o × A_o ≤ 0.60 × T_y
+    a_outer = math.pi / 4 * od ** 2
+    a_inner = math.pi / 4 * (od - 2 * wt_eff) ** 2
+    a_steel = a_outer - a_inner
+    void_submerged_plf = kernels.void_submerged_weight_plf(od, wt_eff)
+    t_a = np.where(is_top, void_submerged_plf * riser_length_ft, 0.0)
+    t_eff = t_a - p_strength * a_inner + p_ext * a_outer
+    t_y = smys * a_steel
+    compression = t_eff <= 0
+    sf_longitudinal = kernels.safety_factor(0.60 * t_y, t_eff)
+    longitudinal_pass = compression | (sf_longitudinal >= 1.0)
+
+    # 6. Combined loading: √[(ΔP/P_b)² + (T_eff/T_y)²] ≤ design factor
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pressure_component = np.where(pb > 0, (p_strength - p_ext) / pb, 0.0)
+        tension_component = np.where(t_y > 0, t_eff / t_y, 0.0)
+    combined_ratio = np.sqrt(pressure_component ** 2 + tension_component ** 2)
+    combined_factor = np.where(stage == _OPERATION, 0.90, 0.96)
+    sf_combined = kernels.safety_factor(combined_factor, combined_ratio)
+    combined_pass = combined_ratio <= combined_factor
+
+    sf = np.stack([sf_burst, sf_collapse, sf_propagation, sf_hoop], axis=-1)
+    limiting_index = np.argmin(sf, axis=-1)
+    row_pass = (sf >= 1.0).all(axis=-1) & longitudinal_pass & combined_pass
+
+    return {
+        "wt_effective": wt_eff,
+        "p_external": p_ext,
+        "p_internal_burst": p_strength,
+        "p_internal_collapse": p_stability,
+        "pb": pb,
+        "py": py,
+        "pe": pe,
+        "pc": pc,
+        "pp": pp,
+        "hoop_stress": hoop_stress,
+        "t_eff": t_eff,
+        "t_y": t_y,
+        "combined_ratio": combined_ratio,
+        "safety_factor": sf,
+        "limiting_index": limiting_index,
+        "limiting_sf": np.take_along_axis(sf, limiting_index[..., None], axis=-1)[..., 0],
+        "longitudinal_sf": sf_longitudinal,
+        "longitudinal_pass": longitudinal_pass,
+        "combined_sf": sf_combined,
+        "combined_pass": combined_pass,
+        "row_pass": row_pass,
+        "all_pass": row_pass.all(axis=-1),
+    }
+
+
+def summary_arrays(result: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Per-design summary of evaluate_designs() output as arrays.
+
+    The limiting sub-condition is the first one holding the lowest
+    pressure-check safety factor, matching evaluate_standard_thicknesses.
+
+    Returns:
+    --------
+    dict : all_pass (bool), min_sf (float), limiting_condition (int8 index
+           into PLAN_LABELS) and limiting_check (int8 index into
+           CHECK_NAMES); the indices are -1 when min_sf is not finite
+    """
+    limiting_sf = result["limiting_sf"]
+    rows = np.argmin(limiting_sf, axis=-1)
+    idx = np.arange(len(rows))
+    min_sf = limiting_sf[idx, rows]
+    finite = np.isfinite(min_sf)
+    return {
+        "all_pass": result["all_pass"],
+        "min_sf": min_sf,
+        "limiting_condition": np.where(finite, rows, -1).astype(np.int8),
+        "limiting_check": np.where(finite, result["limiting_index"][idx, rows], -1).astype(np.int8),
+    }
+
+
+def summarize_designs(result: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """
+    Reduce evaluate_designs() output to one record per design.
+
+    Returns:
+    --------
+    list of dict : all_pass, min_sf, limiting_condition, limiting_check
+                   (see summary_arrays)
+    """
+    summary = summary_arrays(result)
+    labels = PLAN_LABELS + [""]
+    checks = list(CHECK_NAMES) + [""]
+    return [
+        {
+            "all_pass": bool(passed),
+            "min_sf": float(sf),
+            "limiting_condition": labels[row],
+            "limiting_check": checks[check],
+        }
+        for passed, sf, row, check in zip(summary["all_pass"], summary["min_sf"],
+                                          summary["limiting_condition"].tolist(),
+                                          summary["limiting_check"].tolist())
+    ]
+
+
+def summarize_in_chunks(designs: Dict[str, np.ndarray], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        progress: Optional[ProgressToken] = None) -> List[Dict[str, Any]]:
+    """
+    Evaluate and summarize designs chunk by chunk, reporting progress.
+
+    Parameters:
+    -----------
+    designs : dict
+        Column arrays from design_arrays() or thickness_sweep_arrays()
+    chunk_size : int
+        Designs per vectorized evaluation (bounds peak memory too)
+    progress : ProgressToken, optional
+        Advanced after each chunk; when cancelled, evaluation stops before
+        the next chunk
+
+    Returns:
+    --------
+    list of dict : summarize_designs() records for the designs evaluated,
+                   in input order (a prefix of the designs if cancelled)
+    """
+    n = len(designs["od"])
+    chunk_size = max(1, chunk_size)
+    records: List[Dict[str, Any]] = []
+    for start in range(0, n, chunk_size):
+        if progress is not None and progress.cancelled:
+            break
+        stop = min(start + chunk_size, n)
+        chunk = {k: v[start:stop] for k, v in designs.items()}
+        records.extend(summarize_designs(evaluate_designs(chunk)))
+        if progress is not None:
+            progress.advance(stop - start)
+    return records
+
+
+def export_sweep(designs: Dict[str, np.ndarray], directory, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 progress: Optional[ProgressToken] = None, detail: bool = False,
+                 attrs: Optional[Dict[str, Any]] = None) -> ColumnarDataset:
+    """
+    Evaluate designs chunk by chunk and write each chunk to a columnar
+    directory (engine.columnar) as soon as it is computed.
+
+    Parameters:
+    -----------
+    designs : dict
+        Column arrays from design_arrays() or thickness_sweep_arrays()
+    directory : str or Path
+        Output directory (one .npy per column plus manifest.json)
+    chunk_size : int
+        Designs per vectorized evaluation and per written chunk
+    progress : ProgressToken, optional
+        Advanced after each chunk; when cancelled, the rows written so far
+        are kept (fewer than attrs['requested_rows'])
+    detail : bool
+        Also write the (N, 16) 'limiting_sf' and 'row_pass' arrays
+    attrs : dict, optional
+        Metadata stored in the manifest
+
+    Returns:
+    --------
+    ColumnarDataset : The written sweep, memory-mapped
+    """
+    n = len(designs["od"])
+    chunk_size = max(1, chunk_size)
+    categories = {"limiting_condition": PLAN_LABELS, "limiting_check": list(CHECK_NAMES)}
+    attrs = dict(attrs or {}, requested_rows=n)
+    with ColumnarWriter(directory, categories=categories, attrs=attrs) as writer:
+        for start in range(0, n, chunk_size):
+            if progress is not None and progress.cancelled:
+                break
+            stop = min(start + chunk_size, n)
+            chunk = {k: np.asarray(v[start:stop]) for k, v in designs.items()}
+            result = evaluate_designs(chunk)
+            columns = dict(chunk)
+            columns.update(summary_arrays(result))
+            if detail:
+                columns["limiting_sf"] = result["limiting_sf"]
+                columns["row_pass"] = result["row_pass"]
+            writer.append(columns)
+            if progress is not None:
+                progress.advance(stop - start)
+    return open_dataset(directory)
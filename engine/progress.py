@@ -0,0 +1,175 @@
+"""
+Progress and Cancellation - shared token polled by long-running loops
+
+A ProgressToken is passed into a long computation (standard-thickness
+evaluation, batch runs, main.py scenario loops). The computation calls
+advance() after each chunk and checks `cancelled` before starting the next
+one; on cancellation it stops and returns the results finished so far
+instead of being killed.
+
+Observers get throttled snapshots (completed, total, rate, ETA) through a
+callback, which the CLI prints to the terminal and app.py feeds into
+st.progress. Tokens are thread-safe, so cancel() may be called from a signal
+handler, a UI thread or another worker thread.
+"""
+
+import signal
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional, TextIO
+
+DEFAULT_MIN_INTERVAL_S = 0.1   # callback throttle
+
+
+class ProgressToken:
+    """
+    Completed-unit counter with a cancellation flag.
+
+    Parameters:
+    -----------
+    total : int, optional
+        Expected number of units (None when unknown, e.g. streamed inputs)
+    callback : callable, optional
+        Called with snapshot() at most every min_interval_s, and always on
+        finish() and cancel()
+    min_interval_s : float
+        Minimum time between callback invocations
+    """
+
+    def __init__(self, total: Optional[int] = None,
+                 callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 min_interval_s: float = DEFAULT_MIN_INTERVAL_S):
+        self.total = total
+        self.callback = callback
+        self.min_interval_s = min_interval_s
+        self.completed = 0
+        self.started = time.perf_counter()
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._last_report = 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self) -> None:
+        """Request cancellation; loops stop before their next chunk."""
+        self._cancel.set()
+        self._report(force=True)
+
+    def add_total(self, n: int) -> None:
+        """Grow the expected total (for inputs discovered while running)."""
+        with self._lock:
+            self.total = (self.total or 0) + n
+
+    def advance(self, n: int = 1) -> bool:
+        """Record n finished units. Returns False once cancelled."""
+        with self._lock:
+            self.completed += n
+        self._report()
+        return not self.cancelled
+
+    def finish(self) -> Dict[str, Any]:
+        """Report the final state and return it."""
+        return self._report(force=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current progress.
+
+        Returns:
+        --------
+        dict : completed, total, fraction, elapsed_s, rate_per_s, eta_s, cancelled
+               (fraction / eta_s are None when the total is unknown)
+        """
+        with self._lock:
+            completed, total = self.completed, self.total
+        elapsed = time.perf_counter() - self.started
+        rate = completed / elapsed if elapsed > 0 else 0.0
+        fraction = eta = None
+        if total:
+            fraction = min(completed / total, 1.0)
+            if rate > 0:
+                eta = max(total - completed, 0) / rate
+        return {
+            "completed": completed,
+            "total": total,
+            "fraction": fraction,
+            "elapsed_s": elapsed,
+            "rate_per_s": rate,
+            "eta_s": eta,
+            "cancelled": self.cancelled,
+        }
+
+    def _report(self, force: bool = False) -> Optional[Dict[str, Any]]:
+        if self.callback is None and not force:
+            return None
+        now = time.perf_counter()
+        if not force and now - self._last_report < self.min_interval_s:
+            return None
+        self._last_report = now
+        snap = self.snapshot()
+        if self.callback is not None:
+            self.callback(snap)
+        return snap
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """Seconds as H:MM:SS / M:SS ('?' when unknown)."""
+    if seconds is None:
+        return "?"
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
+
+
+def format_progress(snap: Dict[str, Any], unit: str = "unit(s)") -> str:
+    """One-line description, e.g. '120/400 scenario(s) (30.0%) 85.2/s, ETA 0:03'."""
+    if snap["total"]:
+        text = f"{snap['completed']}/{snap['total']} {unit} ({snap['fraction']:.1%})"
+    else:
+        text = f"{snap['completed']} {unit}"
+    text += f" {snap['rate_per_s']:.1f}/s"
+    if snap["eta_s"] is not None and not snap["cancelled"] and snap["completed"] < snap["total"]:
+        text += f", ETA {format_duration(snap['eta_s'])}"
+    else:
+        text += f", elapsed {format_duration(snap['elapsed_s'])}"
+    if snap["cancelled"]:
+        text += " - cancelled"
+    return text
+
+
+def terminal_reporter(stream: TextIO = sys.stderr, unit: str = "unit(s)") -> Callable[[Dict[str, Any]], None]:
+    """Callback that redraws one progress line on an interactive terminal."""
+    def report(snap: Dict[str, Any]) -> None:
+        stream.write("\r" + format_progress(snap, unit).ljust(79))
+        stream.flush()
+    return report
+
+
+@contextmanager
+def cancel_on_interrupt(token: ProgressToken):
+    """
+    First Ctrl+C cancels the token (the run winds down and keeps its partial
+    results); a second Ctrl+C interrupts immediately. No-op off the main thread.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        yield token
+        return
+
+    previous = signal.getsignal(signal.SIGINT)
+
+    def handler(signum, frame):
+        if token.cancelled:
+            signal.signal(signal.SIGINT, previous)
+            raise KeyboardInterrupt
+        token.cancel()
+
+    signal.signal(signal.SIGINT, handler)
+    try:
+        yield token
+    finally:
+        signal.signal(signal.SIGINT, previous)
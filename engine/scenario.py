@@ -0,0 +1,316 @@
+"""
+Vectorized Scenario Evaluation - main.py's life cycle model on thickness grids
+
+main.analyze_scenario checks every standard wall thickness against three
+life cycle conditions (Installation, Hydrotest, Operation) with HAT/LAT
+loading and ksi units, building a detailed result dict per check. For batch
+work only the utilizations matter, so this module evaluates the whole
+(thickness × condition) grid - for one scenario or many stacked together -
+in a single NumPy pass.
+
+Design factors come from the calculations/* modules so both paths share one
+source for every code constant.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from calculations import calcs_burst, calcs_collapse
+from engine import kernels
+from reference_data import asme_b36_10
+
+# Life cycle condition definitions
+# All conditions include: Burst, Collapse, Propagation, Bending, and Hoop checks
+LIFE_CYCLE_CONDITIONS = {
+    'installation': {
+        'name': 'Installation',
+        'description': 'Empty pipe during installation - nominal WT',
+        'use_corrosion_allowance': False,
+        'use_mill_tolerance': False,  # Use nominal WT for installation
+        'internal_pressure_factor': 0.0,  # Empty pipe - no internal pressure
+        'external_pressure_factor': 1.0,  # Full external pressure (hydrostatic/annulus)
+        'bending_strain_key': 'bending_strain_installation',  # Higher bending during lay
+        'notes': 'Empty pipe, external pressure + bending during lay operations'
+    },
+    'hydrotest': {
+        'name': 'Hydrotest',
+        'description': 'Pressure testing at 1.25x design pressure - nominal WT',
+        'use_corrosion_allowance': False,
+        'use_mill_tolerance': False,  # Use nominal WT for hydrotest
+        'internal_pressure_factor': None,  # Uses hydrotest_pressure_psi from input (1.25x design)
+        'external_pressure_factor': 1.0,  # Full external pressure (hydrostatic/annulus)
+        'bending_strain_key': 'bending_strain',  # Same bending as operation
+        'notes': 'Elevated internal pressure (1.25x), external pressure, bending'
+    },
+    'operation': {
+        'name': 'Operation',
+        'description': 'Normal operation with corroded wall thickness + mill tolerance',
+        'use_corrosion_allowance': True,
+        'use_mill_tolerance': True,  # Apply mill tolerance for design
+        'internal_pressure_factor': 1.0,  # Design internal pressure
+        'external_pressure_factor': 1.0,  # Full external pressure (hydrostatic/annulus)
+        'bending_strain_key': 'bending_strain',  # Design bending strain
+        'notes': 'Mill tolerance + corrosion allowance deducted from wall thickness'
+    }
+}
+
+CONDITION_ORDER = ['installation', 'hydrotest', 'operation']
+CHECK_ORDER = ['burst', 'collapse', 'propagation', 'bending', 'hoop']
+
+HOOP_DESIGN_FACTOR = 0.72
+PROPAGATION_FACTOR = 0.80
+
+_USE_MILL = np.array([LIFE_CYCLE_CONDITIONS[c]['use_mill_tolerance'] for c in CONDITION_ORDER])
+_USE_CORR = np.array([LIFE_CYCLE_CONDITIONS[c]['use_corrosion_allowance'] for c in CONDITION_ORDER])
+
+
+def scenario_parameters(scenario: Dict[str, Any], project_info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resolve the scalar inputs of one scenario exactly as main.analyze_condition does.
+
+    Raises KeyError / TypeError for malformed scenarios, like main.py.
+
+    Returns:
+    --------
+    dict : Scalars plus per-condition lists 'p_internal_psi', 'p_o_hat_psi',
+           'p_o_lat_psi' and 'bending_strain'
+    """
+    loads = scenario['loads']
+    geometry = scenario['geometry']
+    material = scenario['material']
+
+    depth_hat_m = loads.get('depth_hat_m', loads.get('depth_m', 40.0))
+    depth_lat_m = loads.get('depth_lat_m', loads.get('depth_m', 40.0))
+    if loads['design_external_pressure_psi'] is not None and loads['use_annulus_pressure']:
+        p_o_hat_psi = p_o_lat_psi = loads['design_external_pressure_psi']
+    else:
+        water_density = project_info.get('water_density_seawater', 64.0)
+        p_o_hat_psi = water_density * (depth_hat_m * 3.28084) / 144.0
+        p_o_lat_psi = water_density * (depth_lat_m * 3.28084) / 144.0
+
+    design_p_i_psi = loads['design_internal_pressure_psi']
+    design_bending_strain = loads['bending_strain']
+    p_internal, p_external_hat, p_external_lat, bending = [], [], [], []
+    for cond_key in CONDITION_ORDER:
+        condition = LIFE_CYCLE_CONDITIONS[cond_key]
+        p_external_hat.append(p_o_hat_psi * condition['external_pressure_factor'])
+        p_external_lat.append(p_o_lat_psi * condition['external_pressure_factor'])
+        if cond_key == 'hydrotest':
+            hydrotest_factor = project_info.get('hydrotest_factor', 1.25)
+            p_internal.append(loads.get('hydrotest_pressure_psi', design_p_i_psi * hydrotest_factor))
+        else:
+            p_internal.append(design_p_i_psi * condition['internal_pressure_factor'])
+        bending.append(loads.get(condition['bending_strain_key'], design_bending_strain))
+
+    return {
+        'name': scenario['name'],
+        'type': scenario['type'],
+        'manufacturing': scenario['manufacturing'],
+        'grade': material['grade'],
+        'od': geometry['od_inches'],
+        'ovality': geometry['ovality'],
+        'corrosion_allowance': geometry.get('corrosion_allowance_inches', 0.0),
+        'mill_tolerance': geometry.get('mill_tolerance_percent', 0.0),
+        'smys': material['smys_ksi'],
+        'uts': material['uts_ksi'],
+        'E': material['modulus_of_elasticity_ksi'],
+        'poisson': material['poisson_ratio'],
+        'p_o_hat_psi': p_external_hat,
+        'p_o_lat_psi': p_external_lat,
+        'p_internal_psi': p_internal,
+        'bending_strain': bending,
+        'burst_factor': (calcs_burst.get_design_factor(scenario['type'])
+                         * calcs_burst.get_weld_factor(scenario['manufacturing'])
+                         * calcs_burst.get_temperature_factor()),
+        'collapse_factor': calcs_collapse.get_collapse_factor(scenario['manufacturing']),
+    }
+
+
+def _stack(params: Sequence[Dict[str, Any]], thicknesses: Sequence[Sequence[float]]) -> Dict[str, np.ndarray]:
+    """Repeat scenario parameters per thickness row; per-condition values become (R, 3)."""
+    counts = [len(t) for t in thicknesses]
+    scalar_keys = ['od', 'ovality', 'corrosion_allowance', 'mill_tolerance', 'smys', 'uts', 'E',
+                   'poisson', 'burst_factor', 'collapse_factor']
+    cols = {k: np.repeat(np.array([p[k] for p in params], dtype=float), counts)[:, None]
+            for k in scalar_keys}
+    for k in ('p_internal_psi', 'p_o_hat_psi', 'p_o_lat_psi', 'bending_strain'):
+        cols[k] = np.repeat(np.array([p[k] for p in params], dtype=float), counts, axis=0)
+    cols['nominal_wt'] = np.concatenate([np.asarray(t, dtype=float) for t in thicknesses])[:, None]
+    return cols
+
+
+def evaluate_grid(cols: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Evaluate stacked (thickness row × condition) inputs.
+
+    Parameters:
+    -----------
+    cols : dict
+        Arrays from _stack(): (R, 1) scalars and (R, 3) per-condition values
+
+    Returns:
+    --------
+    dict : 'effective_wt' (R, 3), 'utilization' and 'pass' dicts keyed by
+           check name with (R, 3) arrays, 'condition_pass' (R, 3) and
+           'all_pass' (R,)
+    """
+    od, smys, E = cols['od'], cols['smys'], cols['E']
+
+    # Effective wall thickness (get_effective_wall_thickness)
+    wt = cols['nominal_wt']
+    wt = np.where(_USE_MILL[None, :], wt * (1.0 - cols['mill_tolerance'] / 100.0), wt)
+    wt = np.where(_USE_CORR[None, :], wt - cols['corrosion_allowance'], wt)
+    wt = np.maximum(wt, 0.001)
+
+    p_i_psi = cols['p_internal_psi']
+    p_i = p_i_psi / 1000.0
+    p_o_hat = cols['p_o_hat_psi'] / 1000.0
+    p_o_lat = cols['p_o_lat_psi'] / 1000.0
+
+    util: Dict[str, np.ndarray] = {}
+    passed: Dict[str, np.ndarray] = {}
+
+    def _ratio(demand, allowable):
+        # utilization = demand / allowable for positive demand, else 0
+        out = np.zeros(np.broadcast(demand, allowable).shape)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(demand, allowable, out=out, where=np.broadcast_to(demand > 0, out.shape))
+        return out
+
+    # 1. Burst at LAT
+    allowable_burst = cols['burst_factor'] * kernels.burst_pressure(od, wt, cols['smys'], cols['uts'])
+    burst_diff = p_i - p_o_lat
+    passed['burst'] = burst_diff <= allowable_burst
+    util['burst'] = _ratio(burst_diff, allowable_burst)
+
+    # 2. Collapse at HAT (calcs_collapse falls back to P_y for pure yield collapse)
+    py, pe, pc = kernels.collapse_pressures(od, wt, smys, E, cols['poisson'])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(pe > 0, py / pe, np.inf)
+    pc = np.where((py > 0) & (pe > 0), pc, np.where(ratio >= 4.0, py, 0.0))
+    allowable_collapse = cols['collapse_factor'] * pc
+    collapse_diff = p_o_hat - p_i
+    passed['collapse'] = collapse_diff <= allowable_collapse
+    util['collapse'] = _ratio(collapse_diff, allowable_collapse)
+
+    # 3. Propagation at HAT on net external pressure (P_p = 24 × S × (t/D)^2.4)
+    valid = (od > 0) & (wt > 0) & (smys > 0)
+    pp = kernels.propagation_pressure(od, wt, smys, coefficient=24, exponent=2.4)
+    allowable_prop = np.where(valid, PROPAGATION_FACTOR * pp, 0.0)
+    net_external = p_o_hat - p_i
+    invalid = (allowable_prop <= 0) & (net_external > 0)
+    passed['propagation'] = (net_external <= 0) | (~invalid & (net_external <= allowable_prop))
+    util['propagation'] = np.where(invalid, np.inf, _ratio(net_external, allowable_prop))
+
+    # 4. Combined bending + pressure at HAT: ε/ε_b + (P_o - P_i)/P_c ≤ g(δ)
+    eps_b = kernels.bending_strain_limit(od, wt, smys, E)
+    g_delta = kernels.ovality_function(cols['ovality'])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bending_component = np.where(eps_b > 0, cols['bending_strain'] / eps_b, np.inf)
+        pressure_component = np.where(pc > 0, (p_o_hat - p_i) / pc, np.inf)
+        interaction = bending_component + pressure_component
+        util['bending'] = interaction / g_delta
+    passed['bending'] = interaction <= g_delta
+
+    # 5. Hoop stress (internal pressure only, psi) per ASME B31.4 Sec 402.3
+    hoop_stress = kernels.barlow_hoop_stress(p_i_psi, od, wt)
+    allowable_hoop = HOOP_DESIGN_FACTOR * (smys * 1000.0)
+    passed['hoop'] = hoop_stress <= allowable_hoop
+    util['hoop'] = np.where((p_i_psi > 0) & (hoop_stress > 0), hoop_stress / allowable_hoop, 0.0)
+
+    condition_pass = np.logical_and.reduce([passed[c] for c in CHECK_ORDER])
+    return {
+        'effective_wt': wt,
+        'utilization': util,
+        'pass': passed,
+        'condition_pass': condition_pass,
+        'all_pass': condition_pass.all(axis=1),
+    }
+
+
+def _finite(value: float) -> Optional[float]:
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+
+def _summary(params: Dict[str, Any], thicknesses: List[float], grid: Dict[str, np.ndarray],
+             start: int) -> Dict[str, Any]:
+    n = len(thicknesses)
+    all_pass = grid['all_pass'][start:start + n]
+    passing = np.flatnonzero(all_pass)
+    recommended = thicknesses[passing[0]] if len(passing) else None
+    row = start + (passing[0] if len(passing) else n - 1)
+
+    utilizations: Dict[str, Dict[str, Optional[float]]] = {}
+    governing = None
+    for c, cond_key in enumerate(CONDITION_ORDER):
+        utilizations[cond_key] = {}
+        for check in CHECK_ORDER:
+            util = _finite(grid['utilization'][check][row, c])
+            utilizations[cond_key][check] = util
+            if util is not None and (governing is None or util > governing['utilization']):
+                governing = {'condition': cond_key, 'check': check, 'utilization': util}
+
+    return {
+        'scenario_name': params['name'],
+        'scenario_type': params['type'],
+        'od': params['od'],
+        'grade': params['grade'],
+        'least_thickness': recommended,
+        'recommended_thickness': recommended,
+        'all_pass': recommended is not None,
+        'evaluated_thickness': thicknesses[row - start],
+        'utilizations': utilizations,
+        'governing': governing,
+    }
+
+
+def summarize_scenarios(items: Sequence[Tuple[Dict[str, Any], Dict[str, Any]]]) -> List[Any]:
+    """
+    Summarize many scenarios with one vectorized evaluation.
+
+    The summary matches batch.runner.summarize_analysis(main.analyze_scenario(...)):
+    utilizations are reported at the least passing standard thickness, or at
+    the thickest standard size when none passes.
+
+    Parameters:
+    -----------
+    items : sequence of (scenario, project_info)
+
+    Returns:
+    --------
+    list : Per item, a summary dict, None when the OD has no standard
+           thicknesses (like main.analyze_scenario), or the Exception raised
+           by a malformed scenario
+    """
+    out: List[Any] = [None] * len(items)
+    params, thicknesses, index = [], [], []
+    for i, (scenario, project_info) in enumerate(items):
+        try:
+            p = scenario_parameters(scenario, project_info)
+            wts = asme_b36_10.get_standard_thicknesses(p['od'])
+        except Exception as e:
+            out[i] = e
+            continue
+        if not wts:
+            continue
+        params.append(p)
+        thicknesses.append(list(wts))
+        index.append(i)
+
+    if params:
+        grid = evaluate_grid(_stack(params, thicknesses))
+        start = 0
+        for p, wts, i in zip(params, thicknesses, index):
+            out[i] = _summary(p, wts, grid, start)
+            start += len(wts)
+    return out
+
+
+def summarize_scenario(scenario: Dict[str, Any], project_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Summarize one scenario (None if no standard thicknesses); raises on bad input."""
+    result = summarize_scenarios([(scenario, project_info)])[0]
+    if isinstance(result, Exception):
+        raise result
+    return result
@@ -17,6 +17,7 @@ Life Cycle Conditions:
 
 import json
 import math
+import os
 import sys
 from pathlib import Path
 
@@ -24,41 +25,11 @@ from pathlib import Path
 from reference_data import asme_b36_10
 from calculations import calcs_burst, calcs_collapse, calcs_propagation, calcs_bending, calcs_hoop
 
-
-# Life cycle condition definitions
-# All conditions include: Burst, Collapse, Propagation, Bending, and Hoop checks
-LIFE_CYCLE_CONDITIONS = {
-    'installation': {
-        'name': 'Installation',
-        'description': 'Empty pipe during installation - nominal WT',
-        'use_corrosion_allowance': False,
-        'use_mill_tolerance': False,  # Use nominal WT for installation
-        'internal_pressure_factor': 0.0,  # Empty pipe - no internal pressure
-        'external_pressure_factor': 1.0,  # Full external pressure (hydrostatic/annulus)
-        'bending_strain_key': 'bending_strain_installation',  # Higher bending during lay
-        'notes': 'Empty pipe, external pressure + bending during lay operations'
-    },
-    'hydrotest': {
-        'name': 'Hydrotest',
-        'description': 'Pressure testing at 1.25x design pressure - nominal WT',
-        'use_corrosion_allowance': False,
-        'use_mill_tolerance': False,  # Use nominal WT for hydrotest
-        'internal_pressure_factor': None,  # Uses hydrotest_pressure_psi from input (1.25x design)
-        'external_pressure_factor': 1.0,  # Full external pressure (hydrostatic/annulus)
-        'bending_strain_key': 'bending_strain',  # Same bending as operation
-        'notes': 'Elevated internal pressure (1.25x), external pressure, bending'
-    },
-    'operation': {
-        'name': 'Operation',
-        'description': 'Normal operation with corroded wall thickness + mill tolerance',
-        'use_corrosion_allowance': True,
-        'use_mill_tolerance': True,  # Apply mill tolerance for design
-        'internal_pressure_factor': 1.0,  # Design internal pressure
-        'external_pressure_factor': 1.0,  # Full external pressure (hydrostatic/annulus)
-        'bending_strain_key': 'bending_strain',  # Design bending strain
-        'notes': 'Mill tolerance + corrosion allowance deducted from wall thickness'
-    }
-}
+# Life cycle condition definitions are shared with the vectorized engine
+# (engine/scenario.py), which batch tools use to evaluate thickness grids at once
+from engine.scenario import LIFE_CYCLE_CONDITIONS
+from engine.progress import ProgressToken, cancel_on_interrupt, format_progress
+from batch.schema import validate_scenario
 
 
 def load_input_data(filename='reference_data/input_data.json'):
@@ -705,24 +676,74 @@ def main():
     scenarios = data['scenarios']
     
     print(f"Loaded {len(scenarios)} scenario(s) for analysis.")
-    
-    # Analyze each scenario
+
+    # Check every scenario before analyzing any; invalid ones are skipped
+    valid = []
     for i, scenario in enumerate(scenarios, 1):
-        print(f"\n\n{'='*90}")
-        print(f"ANALYZING SCENARIO {i} of {len(scenarios)}")
-        print(f"{'='*90}")
-        
-        # Run analysis
-        result = analyze_scenario(scenario, project_info)
-        
-        # Print results
-        print_results(result)
+        errors = validate_scenario(scenario, project_info)
+        if errors:
+            name = scenario.get('name', '?') if isinstance(scenario, dict) else '?'
+            print(f"\nSkipping scenario {i} ({name}): {len(errors)} input error(s)")
+            for error in errors:
+                print(f"  - {error}")
+        else:
+            valid.append(scenario)
+    scenarios = valid
+
+    # Optional vendor pipe catalog (CSV, converted once and memory-mapped)
+    catalog_path = os.environ.get('RISER_CATALOG')
+    if catalog_path:
+        from reference_data import external_catalog
+        catalog = external_catalog.load_catalog(catalog_path)
+        asme_b36_10.use_catalog(catalog)
+        print(f"Using pipe catalog '{catalog_path}' ({len(catalog)} rows)")
+
+    # Optional on-disk result cache: unchanged scenarios are not recomputed
+    cache = None
+    cache_dir = os.environ.get('RISER_CACHE_DIR')
+    if cache_dir:
+        from batch.cache import ResultCache, cache_key
+        cache = ResultCache(cache_dir)
+        print(f"Using result cache in '{cache_dir}'")
+    
+    # Analyze each scenario (Ctrl+C stops after the current scenario)
+    progress = ProgressToken(total=len(scenarios))
+    with cancel_on_interrupt(progress):
+        for i, scenario in enumerate(scenarios, 1):
+            if progress.cancelled:
+                break
+            print(f"\n\n{'='*90}")
+            print(f"ANALYZING SCENARIO {i} of {len(scenarios)}")
+            if i > 1:
+                print(format_progress(progress.snapshot(), "scenario(s)"))
+            print(f"{'='*90}")
+            
+            # Run analysis
+            if cache is not None:
+                key = cache_key(scenario, project_info, kind='analysis')
+                result = cache.get_or_compute(key, lambda: analyze_scenario(scenario, project_info))
+            else:
+                result = analyze_scenario(scenario, project_info)
+            
+            # Print results
+            print_results(result)
+            progress.advance()
     
     print("\n\n" + "="*90)
-    print("ANALYSIS COMPLETE")
-    print("="*90)
-    print("\nAll scenarios have been analyzed.")
-    print("Review the results above for design compliance.\n")
+    if progress.cancelled:
+        print("ANALYSIS CANCELLED")
+        print("="*90)
+        print(f"\n{progress.completed} of {len(scenarios)} scenario(s) were analyzed before stopping.")
+        print("Results for those scenarios are shown above.\n")
+    else:
+        print("ANALYSIS COMPLETE")
+        print("="*90)
+        print("\nAll scenarios have been analyzed.")
+        print("Review the results above for design compliance.\n")
+    if cache is not None:
+        stats = cache.stats()
+        print(f"Cache: {stats['hits']} hit(s), {stats['misses']} miss(es) "
+              f"({stats['hit_rate']:.1%} hit rate), {stats['entries']} entries\n")
 
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@ Reference data for riser design analysis
 
 This package contains:
 - asme_b36_10: ASME B36.10M pipe schedule database
+- pipe_catalog: The same catalog as a NumPy structured array with section properties
+- external_catalog: Vendor CSV catalogs converted to memory-mapped column files
 - input_data.json: Sample input configurations
 - riser_database.json: Test riser configurations
 """
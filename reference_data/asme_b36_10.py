@@ -5,8 +5,18 @@ Data extracted from official ASME B36.10/B36.19 specification
 
 Structure: OD (inches) -> {schedule_name: wall_thickness_inches}
 Version: 2.0 - Updated December 2025
+
+Lookups are indexed once at import: the OD keys are kept in a sorted list so
+an OD is matched to the nearest table entry within OD_TOLERANCE by bisection
+(8.63 finds 8.625, 6.63 finds 6.625), and an (od, wt) -> schedule names
+reverse index answers schedule queries without scanning the table.
+
+use_catalog() routes the query functions to an external vendor catalog
+(reference_data.external_catalog) instead of the built-in table.
 """
 
+from bisect import bisect_left, insort
+
 # ASME B36.10 Schedule Database
 # OD (inches) -> {schedule_name: wall_thickness_inches}
 # Data from ASME B36.10/B36.19 specification tables
@@ -29,7 +39,6 @@ PIPE_SCHEDULE_DATA = {
     6.625: {"5S": 0.109, "5": 0.109, "10S": 0.134, "10": 0.134, "40S": 0.28, "STD": 0.28, "40": 0.28, "80S": 0.432, "XS": 0.432, "80": 0.432, "120": 0.562, "160": 0.718, "XXS": 0.864},
     7.625: {"40S": 0.301, "STD": 0.301, "80S": 0.5, "XS": 0.5, "XXS": 0.875},
     8.625: {"5S": 0.109, "5": 0.109, "10S": 0.148, "10": 0.148, "20": 0.25, "30": 0.277, "40S": 0.322, "STD": 0.322, "40": 0.322, "60": 0.406, "80S": 0.5, "XS": 0.5, "80": 0.5, "100": 0.593, "120": 0.718, "140": 0.812, "XXS": 0.875, "160": 0.906},
-    8.63: {"5S": 0.109, "5": 0.109, "10S": 0.148, "10": 0.148, "20": 0.25, "30": 0.277, "40S": 0.322, "STD": 0.322, "40": 0.322, "60": 0.406, "80S": 0.5, "XS": 0.5, "80": 0.5, "100": 0.593, "120": 0.718, "140": 0.812, "XXS": 0.875, "160": 0.906},
     9.63: {"40S": 0.342, "STD": 0.342, "80S": 0.5, "XS": 0.5},
     10.75: {"5S": 0.134, "5": 0.134, "10S": 0.165, "10": 0.165, "20": 0.25, "30": 0.307, "40S": 0.365, "STD": 0.365, "40": 0.365, "60": 0.5, "80S": 0.5, "XS": 0.5, "80": 0.593, "100": 0.718, "120": 0.843, "140": 1.0, "160": 1.125},
     11.75: {"40S": 0.375, "STD": 0.375, "80S": 0.5, "XS": 0.5},
@@ -54,6 +63,83 @@ PIPE_SCHEDULES = {}
 for od, schedules in PIPE_SCHEDULE_DATA.items():
     PIPE_SCHEDULES[od] = sorted(set(schedules.values()))
 
+# ODs closer than this to a table entry are treated as that size (in).
+# Adjacent standard sizes are at least 0.135" apart.
+OD_TOLERANCE = 0.01
+
+# Sorted OD keys for bisect lookup (includes ODs added by add_custom_od)
+_SORTED_ODS = sorted(PIPE_SCHEDULES)
+
+# (od, wt) -> schedule names in table order, with the thicknesses of each OD
+# sorted for tolerance matching and the smallest gap between them
+_SCHEDULE_NAMES = {}
+_SORTED_THICKNESSES = {}
+_MIN_THICKNESS_GAP = {}
+for od, schedules in PIPE_SCHEDULE_DATA.items():
+    for schedule_name, thickness in schedules.items():
+        _SCHEDULE_NAMES.setdefault((od, thickness), []).append(schedule_name)
+    _SORTED_THICKNESSES[od] = sorted(set(schedules.values()))
+    gaps = [b - a for a, b in zip(_SORTED_THICKNESSES[od], _SORTED_THICKNESSES[od][1:])]
+    _MIN_THICKNESS_GAP[od] = min(gaps) if gaps else float("inf")
+
+# External catalog answering the query functions (None: built-in table)
+_active_catalog = None
+
+
+def use_catalog(catalog):
+    """
+    Answer get_standard_thicknesses, get_schedule_data,
+    get_schedule_for_thickness and get_available_od_sizes from `catalog`.
+    
+    Parameters:
+    -----------
+    catalog : external_catalog.ExternalCatalog or None
+        Loaded catalog, or None to restore the built-in ASME table
+    """
+    global _active_catalog
+    _active_catalog = catalog
+
+
+def get_active_catalog():
+    """The external catalog set by use_catalog(), or None."""
+    return _active_catalog
+
+
+def active_catalog_id():
+    """Fingerprint of the active external catalog (None for the built-in table)."""
+    return None if _active_catalog is None else _active_catalog.fingerprint
+
+
+def find_standard_od(od, tolerance=OD_TOLERANCE):
+    """
+    Find the table OD nearest to `od`.
+    
+    Parameters:
+    -----------
+    od : float
+        Outer diameter in inches
+    tolerance : float
+        Maximum difference from a table OD (default OD_TOLERANCE)
+        
+    Returns:
+    --------
+    float : The matching table OD key
+            Returns None if no table OD is within tolerance
+    """
+    if od in PIPE_SCHEDULES:
+        return od
+    try:
+        i = bisect_left(_SORTED_ODS, od)
+    except TypeError:
+        return None
+    best = None
+    for j in (i - 1, i):
+        if 0 <= j < len(_SORTED_ODS):
+            diff = abs(_SORTED_ODS[j] - od)
+            if diff <= tolerance and (best is None or diff < abs(best - od)):
+                best = _SORTED_ODS[j]
+    return best
+
 
 def get_standard_thicknesses(od):
     """
@@ -69,8 +155,11 @@ def get_standard_thicknesses(od):
     list : List of standard wall thicknesses in inches (sorted ascending)
            Returns None if OD is not in the standard table
     """
-    if od in PIPE_SCHEDULES:
-        return sorted(PIPE_SCHEDULES[od])
+    if _active_catalog is not None:
+        return _active_catalog.get_standard_thicknesses(od)
+    key = find_standard_od(od)
+    if key is not None:
+        return list(PIPE_SCHEDULES[key])
     else:
         return None
 
@@ -89,8 +178,11 @@ def get_schedule_data(od):
     dict : Dictionary mapping schedule names to thicknesses
            Returns None if OD is not in the standard table
     """
-    if od in PIPE_SCHEDULE_DATA:
-        return PIPE_SCHEDULE_DATA[od]
+    if _active_catalog is not None:
+        return _active_catalog.get_schedule_data(od)
+    key = find_standard_od(od)
+    if key in PIPE_SCHEDULE_DATA:
+        return PIPE_SCHEDULE_DATA[key]
     else:
         return None
 
@@ -113,15 +205,30 @@ def get_schedule_for_thickness(od, thickness, tolerance=0.001):
     list : List of schedule names that match the thickness
            Returns empty list if no match found
     """
-    if od not in PIPE_SCHEDULE_DATA:
+    if _active_catalog is not None:
+        return _active_catalog.get_schedule_for_thickness(od, thickness, tolerance)
+    key = find_standard_od(od)
+    if key not in _SORTED_THICKNESSES:
         return []
     
-    schedules = []
-    for schedule_name, sched_thickness in PIPE_SCHEDULE_DATA[od].items():
-        if abs(sched_thickness - thickness) <= tolerance:
-            schedules.append(schedule_name)
+    # Exact standard thickness: no other one can be within tolerance
+    names = _SCHEDULE_NAMES.get((key, thickness))
+    if names is not None and tolerance < _MIN_THICKNESS_GAP[key]:
+        return list(names)
+    
+    # Standard thicknesses within tolerance (usually exactly one)
+    thicknesses = _SORTED_THICKNESSES[key]
+    i = bisect_left(thicknesses, thickness - tolerance)
+    matches = []
+    while i < len(thicknesses) and thicknesses[i] <= thickness + tolerance:
+        if abs(thicknesses[i] - thickness) <= tolerance:
+            matches.append(thicknesses[i])
+        i += 1
     
-    return schedules
+    if len(matches) == 1:
+        return list(_SCHEDULE_NAMES[(key, matches[0])])
+    # Several thicknesses match: keep the table order of their schedules
+    return [name for name, t in PIPE_SCHEDULE_DATA[key].items() if t in matches]
 
 
 def get_thickness_with_schedule(od, thickness, tolerance=0.001):
@@ -159,6 +266,8 @@ def get_available_od_sizes():
     --------
     list : Sorted list of available OD sizes in inches
     """
+    if _active_catalog is not None:
+        return _active_catalog.get_available_od_sizes()
     return sorted(PIPE_SCHEDULES.keys())
 
 
@@ -166,6 +275,10 @@ def add_custom_od(od, wall_thicknesses):
     """
     Add a custom OD with associated wall thicknesses to the schedule.
     
+    The lookup indexes and the array catalog (pipe_catalog.CATALOG) are
+    updated too. Custom thicknesses have no schedule designation; replacing
+    the thicknesses of a table OD keeps the schedules of those still listed.
+    
     Parameters:
     -----------
     od : float
@@ -173,7 +286,26 @@ def add_custom_od(od, wall_thicknesses):
     wall_thicknesses : list
         List of wall thicknesses in inches
     """
+    from reference_data import pipe_catalog
+    
+    if od not in PIPE_SCHEDULES:
+        insort(_SORTED_ODS, od)
     PIPE_SCHEDULES[od] = sorted(wall_thicknesses)
+    
+    # Drop schedules of table thicknesses that are no longer listed
+    listed = set(PIPE_SCHEDULES[od])
+    for thickness in set(PIPE_SCHEDULE_DATA.get(od, {}).values()) - listed:
+        _SCHEDULE_NAMES.pop((od, thickness), None)
+    scheduled = sorted(t for t in set(PIPE_SCHEDULE_DATA.get(od, {}).values()) if t in listed)
+    if scheduled:
+        _SORTED_THICKNESSES[od] = scheduled
+        gaps = [b - a for a, b in zip(scheduled, scheduled[1:])]
+        _MIN_THICKNESS_GAP[od] = min(gaps) if gaps else float("inf")
+    else:
+        _SORTED_THICKNESSES.pop(od, None)
+        _MIN_THICKNESS_GAP.pop(od, None)
+    
+    pipe_catalog.set_od_rows(od, PIPE_SCHEDULES[od])
 
 
 def get_pipe_properties(od, wt):
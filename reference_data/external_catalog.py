@@ -0,0 +1,370 @@
+"""
+External Pipe Catalogs - vendor CSV catalogs as memory-mapped column files
+
+Vendor catalogs (tens of thousands of OD / WT / grade SKUs) are converted
+once from CSV into a binary columnar file next to the CSV (or in a cache
+directory). Later runs memory-map that file instead of parsing the CSV, so
+loading is nearly instant and the pages are shared by every worker process
+that maps the same file.
+
+CSV columns (header names are case-insensitive):
+- od (or od_in, od_inches)          required, inches
+- wt (or wt_in, wall_thickness)     required, inches
+- schedule                          optional, e.g. "40" or "STD"
+- grade                             optional, e.g. "X-65"
+- sku                               optional, vendor part number
+- smys_psi, uts_psi                 optional
+
+Usage:
+    catalog = load_catalog("vendor.csv")
+    asme_b36_10.use_catalog(catalog)   # asme_b36_10 queries now use it
+
+Binary layout: magic, header length, JSON header (row count, per-column
+dtype / offset, source fingerprint), then each column as a contiguous
+64-byte aligned array. Rows are sorted by (od, wt) and an OD index
+(unique ODs and their first row) is stored with the columns.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from reference_data import pipe_catalog
+from reference_data.asme_b36_10 import OD_TOLERANCE
+
+MAGIC = b"RISERCAT\x01\n"
+ALIGN = 64
+BINARY_SUFFIX = ".cat"
+
+COLUMN_ALIASES = {
+    'od': ('od', 'od_in', 'od_inches'),
+    'wt': ('wt', 'wt_in', 'wall_thickness', 'wall_thickness_in'),
+    'schedule': ('schedule', 'sch'),
+    'grade': ('grade',),
+    'sku': ('sku', 'part_number'),
+    'smys_psi': ('smys_psi', 'smys'),
+    'uts_psi': ('uts_psi', 'uts'),
+}
+NUMERIC_COLUMNS = ('od', 'wt', 'smys_psi', 'uts_psi')
+TEXT_COLUMNS = ('schedule', 'grade', 'sku')
+
+
+def _fingerprint(path: Path) -> Dict[str, Any]:
+    """Identify a source CSV by size, mtime and content hash."""
+    stat = path.stat()
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest.hexdigest()}
+
+
+def read_csv(csv_path) -> Dict[str, np.ndarray]:
+    """
+    Parse a catalog CSV into column arrays sorted by (od, wt).
+
+    Raises ValueError naming the line of the first invalid row.
+    """
+    csv_path = Path(csv_path)
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        try:
+            header = [h.strip().lower() for h in next(reader)]
+        except StopIteration:
+            raise ValueError(f"{csv_path}: empty catalog") from None
+        positions = {}
+        for column, aliases in COLUMN_ALIASES.items():
+            for alias in aliases:
+                if alias in header:
+                    positions[column] = header.index(alias)
+                    break
+        for required in ('od', 'wt'):
+            if required not in positions:
+                raise ValueError(f"{csv_path}: missing required column '{required}'")
+
+        values: Dict[str, List[Any]] = {column: [] for column in positions}
+        for line_no, row in enumerate(reader, start=2):
+            if not any(cell.strip() for cell in row):
+                continue
+            for column, pos in positions.items():
+                cell = row[pos].strip() if pos < len(row) else ''
+                if column in NUMERIC_COLUMNS:
+                    try:
+                        value = float(cell) if cell else float('nan')
+                    except ValueError:
+                        raise ValueError(f"{csv_path}:{line_no}: {column} '{cell}' is not a number") from None
+                    if column in ('od', 'wt') and not (value > 0):
+                        raise ValueError(f"{csv_path}:{line_no}: {column} must be positive")
+                    values[column].append(value)
+                else:
+                    values[column].append(cell)
+
+    columns: Dict[str, np.ndarray] = {}
+    for column, data in values.items():
+        if column in NUMERIC_COLUMNS:
+            columns[column] = np.asarray(data, dtype='f8')
+        else:
+            encoded = [s.encode('utf-8') for s in data]
+            width = max((len(s) for s in encoded), default=1) or 1
+            columns[column] = np.asarray(encoded, dtype=f'S{width}')
+
+    if np.any(columns['wt'] * 2 >= columns['od']):
+        raise ValueError(f"{csv_path}: wall thickness must be less than OD / 2")
+    order = np.lexsort((columns['wt'], columns['od']))
+    return {column: data[order] for column, data in columns.items()}
+
+
+def convert_csv(csv_path, binary_path=None) -> Path:
+    """
+    Convert a catalog CSV into the binary columnar format (atomic write).
+
+    Parameters:
+    -----------
+    csv_path : str or Path
+        Source catalog CSV
+    binary_path : str or Path, optional
+        Output file (default: the CSV path with '.cat' appended)
+
+    Returns:
+    --------
+    Path : The written binary catalog
+    """
+    csv_path = Path(csv_path)
+    binary_path = Path(binary_path) if binary_path else csv_path.with_name(csv_path.name + BINARY_SUFFIX)
+    source = _fingerprint(csv_path)
+    columns = read_csv(csv_path)
+
+    od_values, od_starts = np.unique(columns['od'], return_index=True)
+    columns['_od_values'] = od_values
+    columns['_od_starts'] = np.append(od_starts, len(columns['od'])).astype('i8')
+
+    specs, offset = [], 0
+    for name, data in columns.items():
+        offset = -(-offset // ALIGN) * ALIGN
+        specs.append({'name': name, 'dtype': data.dtype.str, 'shape': list(data.shape), 'offset': offset})
+        offset += data.nbytes
+    header = json.dumps({
+        'rows': int(len(columns['od'])),
+        'columns': specs,
+        'source': {'path': str(csv_path), **source},
+    }).encode('utf-8')
+    data_start = -(-(len(MAGIC) + 8 + len(header)) // ALIGN) * ALIGN
+
+    binary_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=binary_path.parent, prefix='.tmp-', suffix=BINARY_SUFFIX)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(MAGIC + struct.pack('<Q', len(header)) + header)
+            for spec in specs:
+                f.seek(data_start + spec['offset'])
+                f.write(np.ascontiguousarray(columns[spec['name']]).tobytes())
+        os.replace(tmp_name, binary_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return binary_path
+
+
+def _read_header(binary_path: Path):
+    with open(binary_path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{binary_path}: not a binary pipe catalog")
+        (length,) = struct.unpack('<Q', f.read(8))
+        header = json.loads(f.read(length).decode('utf-8'))
+    data_start = -(-(len(MAGIC) + 8 + length) // ALIGN) * ALIGN
+    return header, data_start
+
+
+class ExternalCatalog:
+    """
+    Memory-mapped pipe catalog answering the asme_b36_10 query functions.
+
+    Parameters:
+    -----------
+    binary_path : str or Path
+        File written by convert_csv()
+    """
+
+    def __init__(self, binary_path):
+        self.path = Path(binary_path)
+        header, data_start = _read_header(self.path)
+        self.source = header['source']
+        self.rows = header['rows']
+        self.columns: Dict[str, np.ndarray] = {}
+        for spec in header['columns']:
+            shape = tuple(spec['shape'])
+            if shape[0] == 0:
+                self.columns[spec['name']] = np.zeros(shape, dtype=spec['dtype'])
+            else:
+                self.columns[spec['name']] = np.memmap(self.path, dtype=spec['dtype'], mode='r',
+                                                       offset=data_start + spec['offset'], shape=shape)
+        self._od_values = self.columns.pop('_od_values')
+        self._od_starts = self.columns.pop('_od_starts')
+        self._od_list = self._od_values.tolist()
+
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of the source CSV (part of result cache keys)."""
+        return self.source['sha256']
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __repr__(self) -> str:
+        return f"ExternalCatalog('{self.path}', rows={self.rows}, ods={len(self._od_list)})"
+
+    # -------------------------------------------------------------------------
+    # Row access
+    # -------------------------------------------------------------------------
+    def find_od(self, od: float, tolerance: float = OD_TOLERANCE) -> Optional[int]:
+        """Index of the nearest catalog OD within tolerance, or None."""
+        i = bisect_left(self._od_list, od)
+        best = None
+        for j in (i - 1, i):
+            if 0 <= j < len(self._od_list):
+                diff = abs(self._od_list[j] - od)
+                if diff <= tolerance and (best is None or diff < abs(self._od_list[best] - od)):
+                    best = j
+        return best
+
+    def _slice(self, od: float) -> Optional[slice]:
+        j = self.find_od(od)
+        if j is None:
+            return None
+        return slice(int(self._od_starts[j]), int(self._od_starts[j + 1]))
+
+    def column(self, name: str, od: Optional[float] = None) -> np.ndarray:
+        """A column (memory-mapped), optionally limited to one OD."""
+        data = self.columns[name]
+        if od is None:
+            return data
+        rows = self._slice(od)
+        return data[rows] if rows is not None else data[:0]
+
+    def _text(self, name: str, rows: slice) -> List[str]:
+        if name not in self.columns:
+            return [''] * (rows.stop - rows.start)
+        return [s.decode('utf-8') for s in self.columns[name][rows].tolist()]
+
+    # -------------------------------------------------------------------------
+    # asme_b36_10 query interface
+    # -------------------------------------------------------------------------
+    def get_standard_thicknesses(self, od: float, grade: Optional[str] = None) -> Optional[List[float]]:
+        """Unique wall thicknesses of an OD (optionally one grade), ascending."""
+        rows = self._slice(od)
+        if rows is None:
+            return None
+        wt = self.columns['wt'][rows]
+        if grade is not None and 'grade' in self.columns:
+            wt = wt[self.columns['grade'][rows] == grade.encode('utf-8')]
+        return np.unique(wt).tolist() or None
+
+    def get_schedule_data(self, od: float) -> Optional[Dict[str, float]]:
+        """Schedule name -> thickness for an OD (rows without a schedule are skipped)."""
+        rows = self._slice(od)
+        if rows is None:
+            return None
+        data: Dict[str, float] = {}
+        for name, wt in zip(self._text('schedule', rows), self.columns['wt'][rows].tolist()):
+            if name and name not in data:
+                data[name] = wt
+        return data
+
+    def get_schedule_for_thickness(self, od: float, thickness: float, tolerance: float = 0.001) -> List[str]:
+        """Schedule names of an OD whose thickness is within tolerance."""
+        rows = self._slice(od)
+        if rows is None:
+            return []
+        wt = self.columns['wt'][rows]
+        lo = np.searchsorted(wt, thickness - tolerance, side='left')
+        hi = np.searchsorted(wt, thickness + tolerance, side='right')
+        names: List[str] = []
+        window = slice(rows.start + int(lo), rows.start + int(hi))
+        for name, t in zip(self._text('schedule', window), self.columns['wt'][window].tolist()):
+            if name and abs(t - thickness) <= tolerance and name not in names:
+                names.append(name)
+        return names
+
+    def get_available_od_sizes(self) -> List[float]:
+        return list(self._od_list)
+
+    def rows_for_od(self, od: float) -> np.ndarray:
+        """One OD as pipe_catalog rows (one per unique WT; 'schedules' sized to fit)."""
+        rows = self._slice(od)
+        if rows is None:
+            return pipe_catalog.new_rows(0)
+        wt_all = self.columns['wt'][rows]
+        schedule_all = self._text('schedule', rows)
+        wts, first = np.unique(wt_all, return_index=True)
+        bounds = list(first) + [len(wt_all)]
+        schedules = []
+        for k in range(len(wts)):
+            names = []
+            for name in schedule_all[bounds[k]:bounds[k + 1]]:
+                if name and name not in names:
+                    names.append(name)
+            schedules.append(names)
+        joined = ['/'.join(names) for names in schedules]
+        out = pipe_catalog.new_rows(len(wts), joined)
+        out['od'] = self._od_list[self.find_od(od)]
+        out['wt'] = wts
+        out['schedules'] = joined
+        out['schedule_mask'] = [
+            sum(1 << pipe_catalog.SCHEDULE_CODES[n] for n in names if n in pipe_catalog.SCHEDULE_CODES)
+            for names in schedules
+        ]
+        return pipe_catalog.fill_properties(out)
+
+
+def default_binary_path(csv_path, cache_dir=None) -> Path:
+    """Where the binary copy of a CSV catalog lives."""
+    csv_path = Path(csv_path)
+    if cache_dir is None:
+        return csv_path.with_name(csv_path.name + BINARY_SUFFIX)
+    key = hashlib.sha256(str(csv_path.resolve()).encode('utf-8')).hexdigest()[:16]
+    return Path(cache_dir) / f"{csv_path.stem}-{key}{BINARY_SUFFIX}"
+
+
+def load_catalog(path, cache_dir=None) -> ExternalCatalog:
+    """
+    Open a catalog, converting the CSV first if its binary copy is missing
+    or out of date.
+
+    Parameters:
+    -----------
+    path : str or Path
+        Catalog CSV, or an already converted binary file
+    cache_dir : str or Path, optional
+        Directory for the binary copy (default: next to the CSV)
+
+    Returns:
+    --------
+    ExternalCatalog : Memory-mapped catalog
+    """
+    path = Path(path)
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) == MAGIC:
+            return ExternalCatalog(path)
+
+    binary_path = default_binary_path(path, cache_dir)
+    if binary_path.exists():
+        try:
+            header, _ = _read_header(binary_path)
+            source = header['source']
+            stat = path.stat()
+            if source['size'] == stat.st_size and source['mtime_ns'] == stat.st_mtime_ns:
+                return ExternalCatalog(binary_path)
+        except (ValueError, KeyError, OSError):
+            pass  # unreadable or stale - reconvert
+    return ExternalCatalog(convert_csv(path, binary_path))
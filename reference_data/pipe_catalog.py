@@ -0,0 +1,245 @@
+"""
+Pipe Catalog - ASME B36.10M as a flat NumPy structured array
+
+One row per standard (OD, wall thickness) pair, sorted by OD then WT, with
+section properties and weights precomputed for every row:
+
+    od, wt, id, d_over_t, area, moment_of_inertia, section_modulus,
+    radius_of_gyration, weight_plf, submerged_weight_plf,
+    schedule_mask, schedules
+
+Filters are vectorized masks rather than dict walks, e.g.
+
+    rows = CATALOG[(CATALOG['d_over_t'] < 30) & (CATALOG['od'] >= 10)]
+    std = CATALOG[has_schedule(CATALOG, 'STD')]
+
+and sweeps / optimizers take the 'wt' column of rows_for_od(od) directly.
+The dict API in asme_b36_10 remains the source data and is unchanged;
+asme_b36_10.add_custom_od() replaces the rows of its OD via set_od_rows().
+"""
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from reference_data import asme_b36_10
+
+STEEL_DENSITY_PCF = 490.0     # lb/ft³ (calcs_weight.STEEL_DENSITY_PCF)
+SEAWATER_DENSITY_PCF = 64.0   # lb/ft³ (calcs_weight.SEAWATER_DENSITY_PCF)
+
+SCHEDULES_WIDTH = 32   # minimum characters of the 'schedules' field
+
+
+def catalog_dtype(schedules_width: int = SCHEDULES_WIDTH) -> np.dtype:
+    """Row dtype with a 'schedules' field of at least SCHEDULES_WIDTH characters."""
+    return np.dtype([
+        ('od', 'f8'),                    # in
+        ('wt', 'f8'),                    # in
+        ('id', 'f8'),                    # in
+        ('d_over_t', 'f8'),
+        ('area', 'f8'),                  # in² (steel)
+        ('moment_of_inertia', 'f8'),     # in⁴
+        ('section_modulus', 'f8'),       # in³
+        ('radius_of_gyration', 'f8'),    # in
+        ('weight_plf', 'f8'),            # lb/ft, dry steel
+        ('submerged_weight_plf', 'f8'),  # lb/ft, empty pipe in seawater
+        ('schedule_mask', 'u4'),         # bit i set -> SCHEDULE_NAMES[i]
+        ('schedules', f'U{max(schedules_width, SCHEDULES_WIDTH)}'),   # e.g. "40S/STD/40"
+    ])
+
+
+CATALOG_DTYPE = catalog_dtype()
+
+
+def new_rows(count: int, schedules: Sequence[str] = ()) -> np.ndarray:
+    """Zeroed rows whose 'schedules' field fits the longest of the given joined names."""
+    return np.zeros(count, dtype=catalog_dtype(max((len(s) for s in schedules), default=0)))
+
+
+def _schedule_names(schedule_data) -> tuple:
+    names = []
+    for schedules in schedule_data.values():
+        for name in schedules:
+            if name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+# Schedule designations in first-seen table order; position = bit in schedule_mask
+SCHEDULE_NAMES = _schedule_names(asme_b36_10.PIPE_SCHEDULE_DATA)
+SCHEDULE_CODES = {name: code for code, name in enumerate(SCHEDULE_NAMES)}
+
+
+def section_properties(od, wt) -> Dict[str, np.ndarray]:
+    """
+    Vectorized version of asme_b36_10.get_pipe_properties.
+
+    Parameters:
+    -----------
+    od, wt : float or array
+        Outer diameter and wall thickness in inches (broadcast together)
+
+    Returns:
+    --------
+    dict : 'id', 'cross_section_area' (in²), 'moment_of_inertia' (in⁴),
+           'section_modulus' (in³), 'radius_of_gyration' (in) arrays
+    """
+    od = np.asarray(od, dtype=float)
+    wt = np.asarray(wt, dtype=float)
+    inner = od - 2 * wt
+    area = np.pi / 4 * (od ** 2 - inner ** 2)
+    inertia = np.pi / 64 * (od ** 4 - inner ** 4)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        radius = np.sqrt(inertia / area)
+    return {
+        'id': inner,
+        'cross_section_area': area,
+        'moment_of_inertia': inertia,
+        'section_modulus': inertia / (od / 2),
+        'radius_of_gyration': radius,
+    }
+
+
+def schedule_mask(*names: str) -> int:
+    """Bit mask selecting any of the given schedule designations."""
+    mask = 0
+    for name in names:
+        if name not in SCHEDULE_CODES:
+            raise KeyError(f"Unknown schedule '{name}'; expected one of {', '.join(SCHEDULE_NAMES)}")
+        mask |= 1 << SCHEDULE_CODES[name]
+    return mask
+
+
+def has_schedule(catalog: np.ndarray, *names: str) -> np.ndarray:
+    """Boolean mask of rows belonging to any of the given schedules."""
+    return (catalog['schedule_mask'] & np.uint32(schedule_mask(*names))) != 0
+
+
+def build_catalog(schedule_data: Optional[Dict[float, Dict[str, float]]] = None) -> np.ndarray:
+    """
+    Flatten an OD -> {schedule: wt} table into a catalog array.
+
+    Parameters:
+    -----------
+    schedule_data : dict, optional
+        Schedule table (default: asme_b36_10.PIPE_SCHEDULE_DATA). Schedule
+        names must be in SCHEDULE_NAMES.
+
+    Returns:
+    --------
+    np.ndarray : CATALOG_DTYPE rows sorted by (od, wt), one per unique pair
+    """
+    if schedule_data is None:
+        schedule_data = asme_b36_10.PIPE_SCHEDULE_DATA
+
+    masks: Dict[tuple, int] = {}
+    names: Dict[tuple, list] = {}
+    for od, schedules in schedule_data.items():
+        for name, wt in schedules.items():
+            key = (float(od), float(wt))
+            masks[key] = masks.get(key, 0) | schedule_mask(name)
+            names.setdefault(key, []).append(name)
+
+    keys = sorted(masks)
+    joined = ['/'.join(names[k]) for k in keys]
+    catalog = new_rows(len(keys), joined)
+    if not keys:
+        return catalog
+    catalog['od'] = [k[0] for k in keys]
+    catalog['wt'] = [k[1] for k in keys]
+    catalog['schedule_mask'] = [masks[k] for k in keys]
+    catalog['schedules'] = joined
+    return fill_properties(catalog)
+
+
+def fill_properties(catalog: np.ndarray) -> np.ndarray:
+    """Compute the section property and weight columns from 'od' and 'wt' (in place)."""
+    props = section_properties(catalog['od'], catalog['wt'])
+    catalog['id'] = props['id']
+    catalog['d_over_t'] = catalog['od'] / catalog['wt']
+    catalog['area'] = props['cross_section_area']
+    catalog['moment_of_inertia'] = props['moment_of_inertia']
+    catalog['section_modulus'] = props['section_modulus']
+    catalog['radius_of_gyration'] = props['radius_of_gyration']
+
+    # Weights per foot: steel area in ft² × density (calcs_weight.calculate_pipe_weights)
+    area_ft2 = catalog['area'] / 144.0
+    outer_ft2 = (np.pi / 4 * catalog['od'] ** 2) / 144.0
+    catalog['weight_plf'] = STEEL_DENSITY_PCF * area_ft2
+    catalog['submerged_weight_plf'] = STEEL_DENSITY_PCF * area_ft2 - SEAWATER_DENSITY_PCF * outer_ft2
+    return catalog
+
+
+def rows_for_od(od: float, catalog: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Catalog rows of one OD (nearest table OD within asme_b36_10.OD_TOLERANCE),
+    sorted by wall thickness. Empty if the OD is not a standard size.
+
+    Without `catalog`, an external catalog activated with
+    asme_b36_10.use_catalog() is used in place of CATALOG.
+    """
+    if catalog is None:
+        external = asme_b36_10.get_active_catalog()
+        if external is not None:
+            return external.rows_for_od(od)
+        catalog = CATALOG
+        key = asme_b36_10.find_standard_od(od)
+        if key is None:
+            return catalog[:0]
+    else:
+        key = od
+    start, stop = np.searchsorted(catalog['od'], [key - 1e-9, key + 1e-9])
+    return catalog[start:stop]
+
+
+def select(catalog: Optional[np.ndarray] = None, od_min: Optional[float] = None,
+           od_max: Optional[float] = None, d_over_t_min: Optional[float] = None,
+           d_over_t_max: Optional[float] = None, wt_min: Optional[float] = None,
+           wt_max: Optional[float] = None, schedules: Optional[Sequence[str]] = None) -> np.ndarray:
+    """
+    Rows matching every given bound (inclusive) and, if given, any schedule.
+
+    Example: select(od_min=10, d_over_t_max=30, schedules=['STD', 'XS'])
+    """
+    if catalog is None:
+        catalog = CATALOG
+    mask = np.ones(len(catalog), dtype=bool)
+    for field, low, high in (('od', od_min, od_max), ('d_over_t', d_over_t_min, d_over_t_max),
+                             ('wt', wt_min, wt_max)):
+        if low is not None:
+            mask &= catalog[field] >= low
+        if high is not None:
+            mask &= catalog[field] <= high
+    if schedules:
+        mask &= has_schedule(catalog, *schedules)
+    return catalog[mask]
+
+
+def set_od_rows(od: float, wall_thicknesses: Sequence[float]) -> None:
+    """
+    Replace the CATALOG rows of one OD (asme_b36_10.add_custom_od).
+
+    Thicknesses that were already listed for the OD keep their schedules;
+    new ones have none.
+    """
+    global CATALOG
+    old = rows_for_od(od, CATALOG)
+    known = {float(row['wt']): (int(row['schedule_mask']), str(row['schedules'])) for row in old}
+    wts = sorted(set(float(wt) for wt in wall_thicknesses))
+    rows = new_rows(len(wts))
+    rows['od'] = od
+    rows['wt'] = wts
+    rows['schedule_mask'] = [known.get(wt, (0, ''))[0] for wt in wts]
+    rows['schedules'] = [known.get(wt, (0, ''))[1] for wt in wts]
+    fill_properties(rows)
+
+    keep = (CATALOG['od'] < od - 1e-9) | (CATALOG['od'] > od + 1e-9)
+    catalog = np.concatenate([CATALOG[keep], rows])
+    catalog = catalog[np.lexsort((catalog['wt'], catalog['od']))]
+    catalog.flags.writeable = False
+    CATALOG = catalog
+
+
+# Built once at import; read-only so views handed out cannot corrupt it
+CATALOG = build_catalog()
+CATALOG.flags.writeable = False
@@ -0,0 +1,7 @@
+"""
+Local HTTP/JSON analysis service for other tools
+
+This package contains:
+- batcher: Micro-batching of concurrent requests into one engine call
+- server: asyncio HTTP server and entry point (python -m service)
+"""
@@ -0,0 +1,9 @@
+"""Allow running the analysis service with ``python -m service``."""
+
+import sys
+
+from service.server import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
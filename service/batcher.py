@@ -0,0 +1,261 @@
+"""
+Micro-Batcher - merge concurrent analysis requests into one engine call
+
+Requests that arrive within a few milliseconds of each other are queued and
+evaluated together by engine.lifecycle.evaluate_designs, so N concurrent
+clients cost one vectorized pass instead of N scalar run_all_conditions
+calls. Evaluation runs on a single background thread; the event loop keeps
+accepting requests (which form the next batch) while a batch is computed.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import MISSING, fields
+from typing import Any, Dict, List, Optional, Tuple
+
+from batch import fleet
+from engine import lifecycle
+from engine.analyzer import PipeProperties, LoadingCondition
+
+DEFAULT_MAX_BATCH = 1024      # designs per engine call
+DEFAULT_MAX_DELAY_S = 0.002   # wait after the first request for others to join
+LATENCY_WINDOW = 2048         # recent request latencies kept for percentiles
+
+
+def _build(cls, data: Any, label: str):
+    """
+    Construct a dataclass from a JSON object, coercing numeric fields.
+
+    Raises ValueError with a client-readable message on missing, unknown or
+    mistyped fields, so one bad design never reaches the shared batch.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"'{label}' must be an object")
+    known = {f.name: f for f in fields(cls)}
+    unknown = sorted(set(data) - set(known))
+    if unknown:
+        raise ValueError(f"Unknown {label} field(s): {', '.join(unknown)}")
+    missing = [name for name, f in known.items()
+               if name not in data and f.default is MISSING]
+    if missing:
+        raise ValueError(f"Missing {label} field(s): {', '.join(missing)}")
+
+    values = {}
+    for name, value in data.items():
+        if known[name].type is float:
+            if isinstance(value, bool):
+                raise ValueError(f"{label}.{name} must be a number")
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"{label}.{name} must be a number") from None
+            if not math.isfinite(value):
+                raise ValueError(f"{label}.{name} must be finite")
+        elif not isinstance(value, str):
+            raise ValueError(f"{label}.{name} must be a string")
+        values[name] = value
+    return cls(**values)
+
+
+def parse_design(data: Any) -> Tuple[PipeProperties, LoadingCondition]:
+    """
+    Parse one {"pipe": {...}, "load": {...}} design request.
+
+    Field names are those of engine.analyzer.PipeProperties and
+    LoadingCondition (psi / inch / m units, as in app.py). Designs outside
+    the physical limits of batch.fleet.design_errors raise ValueError too.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Design must be an object with 'pipe' and 'load'")
+    pipe = _build(PipeProperties, data.get("pipe"), "pipe")
+    load = _build(LoadingCondition, data.get("load"), "load")
+    errors = fleet.design_errors(pipe, load)
+    if errors:
+        raise ValueError("Invalid design: " + "; ".join(errors))
+    return pipe, load
+
+
+def _number(value) -> Optional[float]:
+    """JSON-safe float: infinite safety factors (no demand) become null."""
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def _condition_rows(result: Dict[str, Any], i: int) -> List[Dict[str, Any]]:
+    """Per sub-condition detail for design i (vectorized run_all_conditions)."""
+    sf = result["safety_factor"][i]
+    rows = []
+    for j, (stage, wt_key, _, _, position) in enumerate(lifecycle.PLAN):
+        rows.append({
+            "condition": lifecycle.PLAN_LABELS[j],
+            "stage": stage,
+            "wt_type": wt_key,
+            "position": position,
+            "wt_effective_in": _number(result["wt_effective"][i, j]),
+            "p_internal_psi": _number(result["p_internal_burst"][i, j]),
+            "p_external_psi": _number(result["p_external"][i, j]),
+            "burst_sf": _number(sf[j, 0]),
+            "collapse_sf": _number(sf[j, 1]),
+            "propagation_sf": _number(sf[j, 2]),
+            "hoop_sf": _number(sf[j, 3]),
+            "longitudinal_sf": _number(result["longitudinal_sf"][i, j]),
+            "combined_sf": _number(result["combined_sf"][i, j]),
+            "limiting_check": lifecycle.CHECK_NAMES[result["limiting_index"][i, j]],
+            "pass": bool(result["row_pass"][i, j]),
+        })
+    return rows
+
+
+def evaluate(pipes: List[PipeProperties], loads: List[LoadingCondition],
+             details: List[bool]) -> List[Dict[str, Any]]:
+    """
+    Evaluate designs in one engine call and build one JSON record each.
+
+    Parameters:
+    -----------
+    pipes, loads : list
+        One PipeProperties / LoadingCondition per design
+    details : list of bool
+        Include the 16 sub-condition rows for that design
+
+    Returns:
+    --------
+    list of dict : all_pass, min_sf, limiting_condition, limiting_check
+                   (+ conditions when detail was requested)
+    """
+    result = lifecycle.evaluate_designs(lifecycle.design_arrays(pipes, list(loads)))
+    records = lifecycle.summarize_designs(result)
+    for i, record in enumerate(records):
+        record["min_sf"] = _number(record["min_sf"])
+        if details[i]:
+            record["conditions"] = _condition_rows(result, i)
+    return records
+
+
+class MicroBatcher:
+    """
+    Queue of pending designs flushed as one vectorized evaluation.
+
+    Parameters:
+    -----------
+    max_batch : int
+        Maximum designs per engine call
+    max_delay_s : float
+        How long the first queued request waits for others to join its batch
+    """
+
+    def __init__(self, max_batch: int = DEFAULT_MAX_BATCH, max_delay_s: float = DEFAULT_MAX_DELAY_S):
+        self.max_batch = max_batch
+        self.max_delay_s = max_delay_s
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="riser-engine")
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.designs = 0
+        self.batches = 0
+        self.largest_batch = 0
+        self.engine_seconds = 0.0
+
+    def start(self) -> None:
+        """Pre-warm the engine and start the batching task on the running loop."""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        warm_pipe = PipeProperties(
+            od_in=10.75, wt_in=0.5, grade="X-52", manufacturing="SMLS",
+            design_category="Riser", fluid_type="Oil", fluid_sg=0.8,
+            smys_psi=52000.0, uts_psi=66000.0, ovality_type="Other Type", ovality=0.005,
+        )
+        warm_load = LoadingCondition(
+            design_pressure_psi=1500.0, shut_in_pressure_psi=1400.0,
+            shut_in_location="Subsea Wellhead", water_depth_m=100.0, riser_length_m=120.0,
+        )
+        evaluate([warm_pipe], [warm_load], [True])
+
+    async def stop(self) -> None:
+        """Cancel the batching task and release the engine thread."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._executor.shutdown(wait=True)
+
+    async def submit(self, pipes: List[PipeProperties], loads: List[LoadingCondition],
+                     details: List[bool]) -> List[Dict[str, Any]]:
+        """Queue designs (one request) and wait for their records."""
+        future = asyncio.get_running_loop().create_future()
+        started = time.perf_counter()
+        await self._queue.put((pipes, loads, details, future))
+        try:
+            return await future
+        finally:
+            self.requests += 1
+            self._latencies.append(time.perf_counter() - started)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            size = len(batch[0][0])
+            if size < self.max_batch and self.max_delay_s > 0:
+                await asyncio.sleep(self.max_delay_s)
+            while size < self.max_batch and not self._queue.empty():
+                item = self._queue.get_nowait()
+                batch.append(item)
+                size += len(item[0])
+
+            pipes, loads, details = [], [], []
+            for item_pipes, item_loads, item_details, _ in batch:
+                pipes.extend(item_pipes)
+                loads.extend(item_loads)
+                details.extend(item_details)
+
+            started = time.perf_counter()
+            try:
+                records = await loop.run_in_executor(self._executor, evaluate, pipes, loads, details)
+            except Exception as e:
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            finally:
+                self.engine_seconds += time.perf_counter() - started
+
+            self.batches += 1
+            self.designs += size
+            self.largest_batch = max(self.largest_batch, size)
+            offset = 0
+            for item_pipes, _, _, future in batch:
+                count = len(item_pipes)
+                if not future.done():  # client may have disconnected
+                    future.set_result(records[offset:offset + count])
+                offset += count
+
+    def stats(self) -> Dict[str, Any]:
+        """Throughput, batching and latency counters since start."""
+        latencies = sorted(self._latencies)
+
+        def percentile(q):
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000, 3)
+
+        return {
+            "requests": self.requests,
+            "designs": self.designs,
+            "batches": self.batches,
+            "mean_batch_size": round(self.designs / self.batches, 2) if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "engine_seconds": round(self.engine_seconds, 6),
+            "engine_designs_per_second": round(self.designs / self.engine_seconds, 1) if self.engine_seconds else None,
+            "latency_ms_p50": percentile(0.50),
+            "latency_ms_p95": percentile(0.95),
+            "latency_ms_p99": percentile(0.99),
+        }
@@ -0,0 +1,285 @@
+"""
+Analysis Service - local HTTP/JSON front end for the life cycle analyzer
+
+Usage:
+    python -m service
+    python -m service --host 127.0.0.1 --port 8765 --max-batch 2048 --max-delay-ms 1
+
+Endpoints (JSON in, JSON out):
+- GET  /health   - liveness, uptime and calculation version
+- GET  /metrics  - request, batching, throughput and latency counters
+- POST /analyze  - one design: {"pipe": {...}, "load": {...}, "detail": false}
+- POST /batch    - many designs: {"designs": [...], "detail": false}
+
+Built on asyncio streams only (no web framework). HTTP/1.1 keep-alive is
+supported so clients can reuse one connection for many requests.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from batch.cache import calculation_version
+from service.batcher import DEFAULT_MAX_BATCH, DEFAULT_MAX_DELAY_S, MicroBatcher, parse_design
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 64 * 1024 * 1024
+MAX_DESIGNS_PER_REQUEST = 100_000
+
+_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    411: "Length Required", 413: "Payload Too Large", 500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    """Request error reported to the client as {"error": message}."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class AnalysisService:
+    """
+    Pre-warmed analysis engine behind a minimal asyncio HTTP server.
+
+    Parameters:
+    -----------
+    max_batch : int
+        Maximum designs merged into one engine call
+    max_delay_s : float
+        Micro-batching window after the first queued request
+    """
+
+    def __init__(self, max_batch: int = DEFAULT_MAX_BATCH, max_delay_s: float = DEFAULT_MAX_DELAY_S):
+        self.batcher = MicroBatcher(max_batch=max_batch, max_delay_s=max_delay_s)
+        self.started = time.time()
+        self.http_requests = 0
+        self.http_errors = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        """Warm the engine and start listening. Port 0 picks a free port."""
+        self.batcher.start()
+        self.started = time.time()
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+
+    # -------------------------------------------------------------------------
+    # Endpoints
+    # -------------------------------------------------------------------------
+    def health(self) -> Dict[str, Any]:
+        return {
+            "status": "ok",
+            "uptime_s": round(time.time() - self.started, 3),
+            "version": calculation_version(),
+        }
+
+    def metrics(self) -> Dict[str, Any]:
+        uptime = time.time() - self.started
+        stats = self.batcher.stats()
+        stats.update({
+            "uptime_s": round(uptime, 3),
+            "http_requests": self.http_requests,
+            "http_errors": self.http_errors,
+            "designs_per_second": round(stats["designs"] / uptime, 1) if uptime > 0 else 0.0,
+            "max_batch": self.batcher.max_batch,
+            "max_delay_ms": self.batcher.max_delay_s * 1000,
+        })
+        return stats
+
+    async def analyze(self, payload: Any) -> Dict[str, Any]:
+        try:
+            pipe, load = parse_design(payload)
+        except ValueError as e:
+            raise HTTPError(400, str(e)) from None
+        detail = bool(payload.get("detail", False))
+        records = await self.batcher.submit([pipe], [load], [detail])
+        return records[0]
+
+    async def analyze_batch(self, payload: Any) -> Dict[str, Any]:
+        """
+        Evaluate many designs; invalid ones get {"error": ...} in place so
+        the rest of the request is still analyzed.
+        """
+        if not isinstance(payload, dict) or not isinstance(payload.get("designs"), list):
+            raise HTTPError(400, "Body must be an object with a 'designs' list")
+        designs = payload["designs"]
+        if len(designs) > MAX_DESIGNS_PER_REQUEST:
+            raise HTTPError(413, f"At most {MAX_DESIGNS_PER_REQUEST} designs per request")
+        default_detail = bool(payload.get("detail", False))
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(designs)
+        pipes, loads, details, positions = [], [], [], []
+        for i, design in enumerate(designs):
+            try:
+                pipe, load = parse_design(design)
+            except ValueError as e:
+                results[i] = {"error": str(e)}
+                continue
+            pipes.append(pipe)
+            loads.append(load)
+            details.append(bool(design.get("detail", default_detail)))
+            positions.append(i)
+
+        if pipes:
+            records = await self.batcher.submit(pipes, loads, details)
+            for i, record in zip(positions, records):
+                results[i] = record
+        errors = sum(1 for r in results if "error" in r)
+        return {"count": len(results), "errors": errors, "results": results}
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Dict[str, Any]:
+        """Route one request to its endpoint and return the JSON response body."""
+        routes = {
+            "/health": ("GET", None),
+            "/metrics": ("GET", None),
+            "/analyze": ("POST", self.analyze),
+            "/batch": ("POST", self.analyze_batch),
+        }
+        path = path.split("?", 1)[0].rstrip("/") or "/"
+        if path not in routes:
+            raise HTTPError(404, f"Unknown endpoint {path}")
+        allowed, handler = routes[path]
+        if method != allowed:
+            raise HTTPError(405, f"{path} expects {allowed}")
+        if path == "/health":
+            return self.health()
+        if path == "/metrics":
+            return self.metrics()
+        try:
+            payload = json.loads(body or b"null")
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise HTTPError(400, f"Invalid JSON: {e}") from None
+        return await handler(payload)
+
+    # -------------------------------------------------------------------------
+    # HTTP/1.1 plumbing
+    # -------------------------------------------------------------------------
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+        """Read one request; None when the client closed the connection."""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError:
+            raise HTTPError(413, "Request headers too large") from None
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, _ = lines[0].split(" ", 2)
+        except ValueError:
+            raise HTTPError(400, "Malformed request line") from None
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        body = b""
+        if method == "POST":
+            if "content-length" not in headers:
+                raise HTTPError(411, "Content-Length required")
+            try:
+                length = int(headers["content-length"])
+            except ValueError:
+                raise HTTPError(400, "Invalid Content-Length") from None
+            if length > MAX_BODY_BYTES:
+                raise HTTPError(413, f"Body exceeds {MAX_BODY_BYTES} bytes")
+            try:
+                body = await reader.readexactly(length)
+            except asyncio.IncompleteReadError:
+                return None
+        return method.upper(), target, headers, body
+
+    @staticmethod
+    def _response(status: int, payload: Dict[str, Any], keep_alive: bool) -> bytes:
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        return head.encode("latin-1") + body
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, target, headers, body = request
+                    keep_alive = headers.get("connection", "").lower() != "close"
+                    self.http_requests += 1
+                    status, payload = 200, await self.dispatch(method, target, body)
+                except HTTPError as e:
+                    self.http_errors += 1
+                    status, payload = e.status, {"error": str(e)}
+                except Exception as e:
+                    self.http_errors += 1
+                    status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+                writer.write(self._response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m service",
+        description="Serve life cycle design checks over local HTTP/JSON with request micro-batching.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument(
+        "--max-batch", type=int, default=DEFAULT_MAX_BATCH,
+        help="Maximum designs merged into one engine call",
+    )
+    parser.add_argument(
+        "--max-delay-ms", type=float, default=DEFAULT_MAX_DELAY_S * 1000,
+        help="Micro-batching window after the first queued request (0 disables waiting)",
+    )
+    return parser
+
+
+async def serve(host: str, port: int, max_batch: int, max_delay_s: float) -> None:
+    service = AnalysisService(max_batch=max_batch, max_delay_s=max_delay_s)
+    server = await service.start(host, port)
+    print(f"Riser analysis service listening on http://{host}:{service.port}", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Service entry point. Returns a process exit code."""
+    args = build_parser().parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_batch, args.max_delay_ms / 1000.0))
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -9,7 +9,7 @@ This script tests:
 """
 
 import math
-from app import PipeProperties, LoadingCondition, LifeCycleAnalyzer
+from engine.analyzer import PipeProperties, LoadingCondition, LifeCycleAnalyzer
 
 print("=" * 80)
 print("CALCULATION VERIFICATION TEST")
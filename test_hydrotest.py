@@ -8,7 +8,7 @@ This script tests the hydrotest pressure implementation to verify:
 """
 
 import sys
-from app import PipeProperties, LoadingCondition, LifeCycleAnalyzer
+from engine.analyzer import PipeProperties, LoadingCondition, LifeCycleAnalyzer
 
 print("=" * 80)
 print("Hydrotest Pressure Test - API RP 1111 Appendix C")
@@ -8,7 +8,7 @@ This script tests the MOP implementation to verify:
 """
 
 import sys
-from app import PipeProperties, LoadingCondition, LifeCycleAnalyzer
+from engine.analyzer import PipeProperties, LoadingCondition, LifeCycleAnalyzer
 
 print("=" * 80)
 print("MOP (Maximum Operating Pressure) Test")
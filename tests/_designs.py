@@ -0,0 +1,59 @@
+"""
+Shared test helpers: reproducible random riser designs and progress tokens
+
+Imported by the test modules that need them (from _designs import
+random_designs); not a test module itself.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine.analyzer import PipeProperties, LoadingCondition
+from engine.lifecycle import GRADE_PROPERTIES
+from engine.progress import ProgressToken
+
+
+def random_designs(n, seed=7):
+    """n (PipeProperties, LoadingCondition) pairs as two lists; equal seeds give equal designs."""
+    rng = random.Random(seed)
+    pipes, loads = [], []
+    for _ in range(n):
+        grade = rng.choice(list(GRADE_PROPERTIES))
+        pipes.append(PipeProperties(
+            od_in=rng.choice([4.5, 8.63, 10.75, 16.0, 24.0]),
+            wt_in=rng.uniform(0.1, 1.5),
+            grade=grade,
+            manufacturing=rng.choice(["SMLS", "ERW", "DSAW"]),
+            design_category=rng.choice(["Riser", "Pipeline"]),
+            fluid_type=rng.choice(["Gas", "Oil", "Multiphase", "Wet Gas"]),
+            fluid_sg=rng.uniform(0.1, 1.1),
+            smys_psi=GRADE_PROPERTIES[grade]["smys_psi"],
+            uts_psi=GRADE_PROPERTIES[grade]["uts_psi"],
+            ovality_type="Other Type",
+            ovality=0.005,
+        ))
+        loads.append(LoadingCondition(
+            design_pressure_psi=rng.uniform(0, 6000),
+            shut_in_pressure_psi=rng.uniform(0, 5000),
+            shut_in_location=rng.choice(["Subsea Wellhead", "Top of Riser"]),
+            water_depth_m=rng.uniform(0, 3000),
+            riser_length_m=rng.uniform(0, 3000),
+        ))
+    return pipes, loads
+
+
+def random_fleet(n, seed=7):
+    """n random designs as batch.fleet riser tuples (name, pipe, load)."""
+    pipes, loads = random_designs(n, seed)
+    return [(f"R{i}", pipe, load) for i, (pipe, load) in enumerate(zip(pipes, loads))]
+
+
+def cancel_after(n):
+    """Token that cancels itself once n units have completed."""
+    token = ProgressToken(min_interval_s=0.0)
+    token.callback = lambda snap: token.cancel() if snap["completed"] >= n and not snap["cancelled"] else None
+    return token
@@ -12,7 +12,7 @@ from typing import Dict, Any
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import from app.py
-from app import PipeProperties, LoadingCondition, LifeCycleAnalyzer
+from engine.analyzer import PipeProperties, LoadingCondition, LifeCycleAnalyzer
 
 def test_multiphase_riser():
     """Test with Team 8 Multiphase Riser (ID 3) configuration"""
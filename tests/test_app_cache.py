@@ -0,0 +1,119 @@
+"""
+Test script for cached analyses in app.py
+Equal inputs must hash equally, the Streamlit app must reuse a cached result
+across reruns instead of running the analyzer again, and the standard
+thickness sweep must fill in from a background job
+"""
+
+import sys
+import threading
+import time
+from dataclasses import replace
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app
+from engine import lifecycle
+from engine.analyzer import LifeCycleAnalyzer
+from _designs import random_designs
+
+APP_PATH = str(Path(__file__).parent.parent / "app.py")
+
+
+def _calculate(at):
+    next(b for b in at.button if b.label.startswith("🔍 Calculate")).click().run()
+
+
+def test_analysis_key_is_canonical():
+    pipes, loads = random_designs(2)
+    pipe, load = pipes[0], loads[0]
+    assert app.analysis_key(pipe, load) == app.analysis_key(replace(pipe), replace(load))
+    assert app.analysis_key(pipe, load) != app.analysis_key(replace(pipe, wt_in=pipe.wt_in + 0.01), load)
+    assert app.analysis_key(pipe, load) != app.analysis_key(pipe, loads[1])
+
+
+def test_reruns_reuse_cached_result(monkeypatch):
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    calls = []
+    run_all_conditions = LifeCycleAnalyzer.run_all_conditions
+
+    def counted(self):
+        calls.append(self.pipe.wt_in)
+        return run_all_conditions(self)
+
+    monkeypatch.setattr(LifeCycleAnalyzer, "run_all_conditions", counted)
+    st.cache_data.clear()
+
+    at = AppTest.from_file(APP_PATH, default_timeout=60).run()
+    assert not at.exception and calls == []
+    _calculate(at)
+    assert not at.exception and len(calls) == 1
+    tabs = len(at.tabs)
+    assert tabs > 0
+
+    # Results stay shown on the next rerun without recomputing
+    at.run()
+    assert len(calls) == 1 and len(at.tabs) == tabs
+
+    # A new session with the same inputs hits the shared cache
+    other = AppTest.from_file(APP_PATH, default_timeout=60).run()
+    _calculate(other)
+    assert not other.exception and len(calls) == 1
+
+
+def test_standard_thickness_jobs_are_shared_per_input():
+    pipes, loads = random_designs(2)
+    jobs = app.StandardThicknessJobs(workers=1, max_jobs=1)
+    future, token = jobs.submit(pipes[0], loads[0])
+    assert jobs.submit(replace(pipes[0]), replace(loads[0]))[0] is future
+
+    report = future.result(timeout=60)
+    expected = app.evaluate_standard_thicknesses(pipes[0], loads[0])
+    assert report["table"].equals(expected) and token.completed == len(expected)
+
+    jobs.submit(pipes[1], loads[1])[0].result(timeout=60)
+    assert jobs.submit(pipes[0], loads[0])[0] is not future   # evicted (max_jobs=1)
+
+
+def test_main_results_render_before_standard_thicknesses(monkeypatch):
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    release = threading.Event()
+    summarize_in_chunks = lifecycle.summarize_in_chunks
+
+    def blocked(*args, **kwargs):
+        release.wait(60)
+        return summarize_in_chunks(*args, **kwargs)
+
+    monkeypatch.setattr(lifecycle, "summarize_in_chunks", blocked)
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+    at = AppTest.from_file(APP_PATH, default_timeout=60).run()
+    _calculate(at)
+    summary = next(t for t in at.tabs if t.label == "Summary")
+    assert not at.exception and len(summary.dataframe) == 1
+
+    at.session_state["result_tabs"] = "Standard Thicknesses"
+    at.run()
+    std_tab = next(t for t in at.tabs if t.label == "Standard Thicknesses")
+    assert len(std_tab.get("progress")) == 1 and len(std_tab.dataframe) == 0
+
+    release.set()
+    for _ in range(200):
+        at.run()
+        std_tab = next(t for t in at.tabs if t.label == "Standard Thicknesses")
+        if len(std_tab.dataframe):
+            break
+        time.sleep(0.05)
+    assert not at.exception and len(std_tab.dataframe) == 1
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,62 @@
+"""
+Test script for the fragment / lazy tab layout of app.py
+Only the selected result tabs may render their content, and editing inputs
+must flag the shown results as stale without replacing them
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+APP_PATH = str(Path(__file__).parent.parent / "app.py")
+
+
+def _tab(at, label):
+    return next(t for t in at.tabs if t.label == label)
+
+
+def _calculated_app():
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=60).run()
+    next(b for b in at.button if b.label.startswith("🔍 Calculate")).click().run()
+    assert not at.exception
+    return at
+
+
+def test_hidden_tabs_are_not_rendered():
+    at = _calculated_app()
+    assert len(_tab(at, "Summary").dataframe) == 1
+    assert len(_tab(at, "Installation").metric) == 0
+    assert len(_tab(at, "Verification").json) == 0
+
+    at.session_state["result_tabs"] = "Installation"
+    at.run()
+    installation = _tab(at, "Installation")
+    assert not at.exception and len(installation.metric) > 0
+    assert len(_tab(at, "Summary").dataframe) == 0
+    # Only the open WT type and position are built
+    assert len(_tab(at, "Top Position").metric) > 0
+    assert len(_tab(at, "Bottom Position").metric) == 0
+
+    at.session_state["installation_nominal_position_tabs"] = "Bottom Position"
+    at.run()
+    assert len(_tab(at, "Top Position").metric) == 0
+    assert len(_tab(at, "Bottom Position").metric) > 0
+
+
+def test_edited_inputs_flag_results_as_stale():
+    at = _calculated_app()
+    stale = "Inputs changed since the last calculation"
+    assert not any(stale in w.value for w in at.warning)
+
+    at.number_input[1].set_value(0.812).run()   # Wall Thickness (in)
+    assert not at.exception and any(stale in w.value for w in at.warning)
+    assert len(_tab(at, "Summary").dataframe) == 1   # previous results still shown
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
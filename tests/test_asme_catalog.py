@@ -0,0 +1,75 @@
+"""
+Test script for the indexed ASME B36.10 catalog lookups
+Checks tolerance-aware OD matching, the (od, wt) -> schedule index and
+custom ODs
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from reference_data import asme_b36_10, pipe_catalog
+
+
+def test_nearby_od_matches_table_entry():
+    # Rounded ODs used in the riser database resolve to the exact sizes
+    assert asme_b36_10.find_standard_od(8.63) == 8.625
+    assert asme_b36_10.find_standard_od(6.63) == 6.625
+    assert asme_b36_10.get_standard_thicknesses(8.63) == asme_b36_10.get_standard_thicknesses(8.625)
+    assert asme_b36_10.get_schedule_data(6.63) is asme_b36_10.PIPE_SCHEDULE_DATA[6.625]
+    # Sizes that are not in the table are still rejected
+    assert asme_b36_10.find_standard_od(7.0) is None
+    assert asme_b36_10.get_standard_thicknesses(7.0) is None
+    assert 8.63 not in asme_b36_10.PIPE_SCHEDULE_DATA
+
+
+def test_schedule_lookup_matches_linear_scan():
+    for od, schedules in asme_b36_10.PIPE_SCHEDULE_DATA.items():
+        for wt in sorted(set(schedules.values())):
+            for delta in (-0.002, -0.001, -0.0005, 0.0, 0.0005, 0.001, 0.002):
+                for tol in (0.0, 0.001, 0.01):
+                    expected = [name for name, t in schedules.items() if abs(t - (wt + delta)) <= tol]
+                    assert asme_b36_10.get_schedule_for_thickness(od, wt + delta, tol) == expected
+    assert asme_b36_10.get_schedule_for_thickness(8.63, 0.5) == ["80S", "XS", "80"]
+    assert asme_b36_10.get_schedule_for_thickness(7.0, 0.5) == []
+
+
+@pytest.fixture
+def restore_tables(monkeypatch):
+    """Undo add_custom_od: the dict tables, lookup indexes and the array catalog."""
+    for name in ("PIPE_SCHEDULES", "_SCHEDULE_NAMES", "_SORTED_THICKNESSES", "_MIN_THICKNESS_GAP"):
+        monkeypatch.setattr(asme_b36_10, name, dict(getattr(asme_b36_10, name)))
+    monkeypatch.setattr(asme_b36_10, "_SORTED_ODS", list(asme_b36_10._SORTED_ODS))
+    monkeypatch.setattr(pipe_catalog, "CATALOG", pipe_catalog.CATALOG)
+
+
+def test_custom_od_is_indexed(restore_tables):
+    asme_b36_10.add_custom_od(7.25, [0.3, 0.2])
+    assert asme_b36_10.get_standard_thicknesses(7.252) == [0.2, 0.3]
+    assert 7.25 in asme_b36_10.get_available_od_sizes()
+    assert asme_b36_10.get_schedule_for_thickness(7.25, 0.3) == []
+
+    # The array catalog serves the same thicknesses to the app's sweeps
+    rows = pipe_catalog.rows_for_od(7.252)
+    assert rows["wt"].tolist() == [0.2, 0.3] and rows["schedules"].tolist() == ["", ""]
+    assert rows["area"][0] == pytest.approx(asme_b36_10.get_pipe_properties(7.25, 0.2)["cross_section_area"])
+    assert len(pipe_catalog.CATALOG) == sum(len(v) for v in asme_b36_10.PIPE_SCHEDULES.values())
+    assert not pipe_catalog.CATALOG.flags.writeable
+
+
+def test_custom_thicknesses_of_table_od(restore_tables):
+    asme_b36_10.add_custom_od(8.625, [0.322, 0.45])   # STD kept, 0.45 custom, the rest dropped
+    assert asme_b36_10.get_schedule_for_thickness(8.625, 0.322) == ["40S", "STD", "40"]
+    assert asme_b36_10.get_schedule_for_thickness(8.625, 0.5) == []
+    rows = pipe_catalog.rows_for_od(8.625)
+    assert rows["wt"].tolist() == [0.322, 0.45]
+    assert rows["schedules"].tolist() == ["40S/STD/40", ""]
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
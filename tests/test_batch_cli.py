@@ -0,0 +1,94 @@
+"""
+Test script for the batch CLI (python -m batch)
+Runs the reference scenario files and checks the JSON Lines summaries
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import main as riser_main
+from batch import cli, runner
+
+REFERENCE_DIR = Path(__file__).parent.parent / "reference_data"
+INPUT_FILE = REFERENCE_DIR / "input_data.json"
+
+
+def test_expand_inputs_directory_and_glob():
+    """Directories and globs expand to unique JSON files"""
+    files = runner.expand_inputs([str(REFERENCE_DIR), str(REFERENCE_DIR / "*.json")])
+    names = [f.name for f in files]
+    assert "input_data.json" in names
+    assert "riser_database.json" in names
+    assert len(names) == len(set(names))
+
+
+def test_summary_matches_main_analysis():
+    """Streamed summaries agree with main.analyze_scenario"""
+    data = riser_main.load_input_data(str(INPUT_FILE))
+    out = io.StringIO()
+    units = runner.iter_units([INPUT_FILE])
+    counts = cli.write_records(cli.run_units(units, workers=1), out)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert counts == {'total': len(data['scenarios']), 'errors': 0}
+
+    for scenario, record in zip(data['scenarios'], records):
+        expected = riser_main.analyze_scenario(scenario, data['project_info'])
+        assert record['scenario_name'] == scenario['name']
+        assert record['least_thickness'] == expected['least_thickness']
+        assert record['recommended_thickness'] == expected['recommended_thickness']
+        assert set(record['utilizations']) == {'installation', 'hydrotest', 'operation'}
+        print(f"  {record['scenario_name']:40s} WT={record['recommended_thickness']} "
+              f"governing={record['governing']['condition']}/{record['governing']['check']}")
+
+
+def test_process_pool_and_error_records(tmp_path):
+    """Worker pool returns every unit; malformed scenarios become error records"""
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps({"scenarios": [{"name": "missing geometry"}]}))
+    output = tmp_path / "out.jsonl"
+
+    exit_code = cli.main([str(INPUT_FILE), str(bad), "--workers", "2", "--output", str(output)])
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+
+    assert exit_code == 1
+    assert len(records) == 4
+    errors = [r for r in records if 'error' in r]
+    assert len(errors) == 1 and errors[0]['id'].endswith("bad.json#0")
+
+
+
+def test_malformed_file_between_valid_files(tmp_path):
+    """A truncated .json file becomes one error record; later files still run"""
+    data = json.loads(INPUT_FILE.read_text())
+    first, broken, last = tmp_path / "a.json", tmp_path / "b.json", tmp_path / "c.json"
+    first.write_text(json.dumps(data))
+    broken.write_text(json.dumps(data)[:-300])
+    last.write_text(json.dumps(data))
+    output = tmp_path / "out.jsonl"
+
+    exit_code = cli.main([str(first), str(broken), str(last), "--workers", "1", "--output", str(output)])
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+
+    n = len(data['scenarios'])
+    assert exit_code == 1
+    assert [r['source'] for r in records].count(str(last)) == n
+    errors = [r for r in records if 'error' in r]
+    assert len(errors) == 1 and errors[0]['id'] == f"{broken}#file"
+    assert "Unreadable file" in errors[0]['error']
+
+
+if __name__ == "__main__":
+    import tempfile
+    test_expand_inputs_directory_and_glob()
+    test_summary_matches_main_analysis()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_process_pool_and_error_records(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        test_malformed_file_between_valid_files(Path(tmp))
+    print("\n[SUCCESS] Batch CLI tests completed")
@@ -0,0 +1,122 @@
+"""
+Test script for the benchmark suite (bench package)
+The suite must cover every calculation function, produce repeat statistics,
+store baselines as JSON and fail the gate when a benchmark regresses in time
+or in peak memory
+"""
+
+import importlib
+import inspect
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench import cli, harness, suite
+
+FAST = "calcs.calcs_burst.get_temperature_factor"
+
+
+def test_every_calcs_function_is_benchmarked():
+    for path in sorted((Path(__file__).parent.parent / "calculations").glob("calcs_*.py")):
+        module = importlib.import_module(f"calculations.{path.stem}")
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            if func.__module__ == module.__name__ and not name.startswith(("_", "verify_")):
+                assert f"calcs.{path.stem}.{name}" in suite.BENCHMARKS
+
+    names = set(suite.BENCHMARKS)
+    assert {"analyzer.run_all_conditions", "app.evaluate_standard_thicknesses",
+            "app.find_closest_passing_standard_wt", "main.analyze_scenario",
+            "batch.export_sweep[1M]", "batch.run_chunk[1k]"} <= names
+    assert all(not b.large for b in suite.select(quick=True))
+    assert [b.name for b in suite.select(["calcs_hoop.get_"])] == ["calcs.calcs_hoop.get_design_factor_asme"]
+
+
+def test_committed_baselines_cover_the_suite():
+    # The default gate compares against these; a missing entry would be 'new' and never fail
+    for path, key in [(cli.DEFAULT_BASELINE, "median_s"), (cli.DEFAULT_MEMORY_BASELINE, "peak_bytes")]:
+        baseline = harness.load_baseline(path)
+        assert baseline is not None and "cpu_count" in baseline["machine"]
+        assert set(suite.BENCHMARKS) <= set(baseline["benchmarks"])
+        assert all(key in entry for entry in baseline["benchmarks"].values())
+
+
+def test_setups_run():
+    # Every benchmark except the 1M-design ones builds and runs once
+    for bench in suite.select(quick=True):
+        bench.setup()()
+
+
+def test_measure_statistics():
+    calls = []
+    bench = harness.Benchmark("count", lambda: lambda: calls.append(1), "test", repeat=4, warmup=2)
+    stats = harness.measure(bench, min_time_s=0.001)
+    assert stats["repeat"] == 4 and stats["number"] >= 1
+    assert 0 < stats["min_s"] <= stats["median_s"] and stats["stdev_s"] >= 0
+    assert len(calls) >= 2 + 4 * stats["number"]
+
+
+def test_measure_memory():
+    size = 4 << 20
+    bench = harness.Benchmark("alloc", lambda: lambda: [bytearray(size // 4) for _ in range(4)], "test", items=4)
+    stats = harness.measure_memory(bench, top=3)
+    assert size <= stats["retained_bytes"] <= stats["peak_bytes"] < 2 * size
+    assert stats["unreleased_bytes"] < size // 100
+    assert stats["peak_bytes_per_item"] == stats["peak_bytes"] / 4
+    assert stats["top_sites"][0]["site"].startswith("tests/test_bench.py:")
+
+    stats = harness.measure_memory(suite.BENCHMARKS["app.evaluate_standard_thicknesses"])
+    assert stats["items"] > 1 and stats["retained_bytes"] > 0   # the DataFrame
+
+
+def test_compare_and_baseline_merge(tmp_path):
+    path = tmp_path / "baseline.json"
+    harness.save_baseline(path, {"a": {"median_s": 1.0}, "b": {"median_s": 1.0}})
+    harness.save_baseline(path, {"b": {"median_s": 2.0}})   # merged: a kept
+    baseline = harness.load_baseline(path)
+    assert baseline["benchmarks"] == {"a": {"median_s": 1.0}, "b": {"median_s": 2.0}}
+    assert "python" in baseline["machine"]
+
+    rows = harness.compare({"a": {"median_s": 1.3}, "b": {"median_s": 1.0}, "c": {"median_s": 1.0}},
+                           baseline, threshold=0.2)
+    assert [r["status"] for r in rows] == ["regressed", "improved", "new"]
+    assert harness.compare({"a": {"median_s": 1.15}}, baseline, threshold=0.2)[0]["status"] == "ok"
+    assert harness.load_baseline(tmp_path / "missing.json") is None
+
+
+def test_cli_gate(tmp_path, capsys):
+    path = tmp_path / "baseline.json"
+    args = ["-k", FAST, "--baseline", str(path), "--repeat", "3", "--min-time", "0.001"]
+    assert cli.main(args) == 2                                    # no baseline: nothing to gate on
+    assert cli.main(args + ["--save"]) == 0
+    assert cli.main(args + ["--threshold", "100", "--json", str(tmp_path / "out.json")]) == 0
+    assert json.loads((tmp_path / "out.json").read_text())["comparison"][0]["name"] == FAST
+
+    doc = json.loads(path.read_text())
+    doc["benchmarks"][FAST]["median_s"] /= 1000                 # the code "got" 1000x slower
+    path.write_text(json.dumps(doc))
+    assert cli.main(args) == 1
+    assert "regressed" in capsys.readouterr().out
+    assert cli.main(["-k", "no-such-benchmark"]) == 2
+
+
+def test_cli_memory_gate(tmp_path, capsys):
+    path = tmp_path / "memory.json"
+    args = ["--memory", "-k", "analyzer.run_all_conditions", "--baseline", str(path)]
+    assert cli.main(args + ["--save"]) == 0
+    assert cli.main(args + ["--sites", "2"]) == 0
+    assert "engine/analyzer.py" in capsys.readouterr().out
+
+    doc = json.loads(path.read_text())
+    doc["benchmarks"]["analyzer.run_all_conditions"]["peak_bytes"] //= 2
+    path.write_text(json.dumps(doc))
+    assert cli.main(args) == 1
+    assert harness.compare({"a": {"peak_bytes": 0}}, {"benchmarks": {"a": {"peak_bytes": 0}}},
+                           metric="peak_bytes")[0]["status"] == "ok"
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,128 @@
+"""
+Test script for columnar sweep export (engine.columnar, lifecycle.export_sweep)
+Sweeps written chunk by chunk must reload memory-mapped with the same values
+as the in-memory summaries
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app
+from batch import sweep
+from engine import lifecycle
+from engine.columnar import ColumnarWriter, list_datasets, open_dataset, resolve_dataset, sweep_root
+from _designs import cancel_after, random_designs
+
+
+def test_export_matches_in_memory_summaries(tmp_path):
+    pipes, loads = random_designs(1)
+    wts = np.linspace(0.2, 1.5, 1000)
+    designs = lifecycle.thickness_sweep_arrays(pipes[0], loads[0], wts)
+    ds = lifecycle.export_sweep(designs, tmp_path / "sweep", chunk_size=128, detail=True)
+
+    assert ds.complete and len(ds) == 1000 and ds.chunks[:2] == [128, 128]
+    assert isinstance(ds["wt"], np.memmap) and np.array_equal(ds["wt"], wts)
+    assert ds["limiting_sf"].shape == (1000, 16)
+
+    expected = lifecycle.summarize_in_chunks(designs, chunk_size=128)
+    df = ds.to_pandas(start=100, stop=300)
+    assert list(df.index) == list(range(100, 300))
+    for i in (100, 150, 299):
+        row = df.loc[i]
+        assert bool(row["all_pass"]) == expected[i]["all_pass"]
+        assert row["min_sf"] == expected[i]["min_sf"]
+        assert row["limiting_condition"] == expected[i]["limiting_condition"]
+        assert row["limiting_check"] == expected[i]["limiting_check"]
+
+    # Plain .npy files: numpy can load them without the manifest
+    assert np.array_equal(np.load(tmp_path / "sweep" / "min_sf.npy"), ds["min_sf"])
+
+    passing = np.flatnonzero(ds["all_pass"])
+    picked = ds.to_pandas(columns=["wt", "all_pass"], rows=passing[:5])
+    assert picked["all_pass"].all() and list(picked.index) == list(passing[:5])
+
+
+def test_interrupted_writer_is_readable_up_to_last_chunk(tmp_path):
+    writer = ColumnarWriter(tmp_path / "partial", attrs={"od": 16.0})
+    for start in range(0, 30, 10):
+        writer.append({"x": np.arange(start, start + 10, dtype=float),
+                       "flag": np.arange(start, start + 10) % 2 == 0})
+    # Not closed: headers still say 0 rows, the manifest has the committed ones
+    ds = open_dataset(tmp_path / "partial")
+    assert not ds.complete and len(ds) == 30 and ds.attrs == {"od": 16.0}
+    assert np.array_equal(ds["x"], np.arange(30.0))
+    writer.close()
+    assert json.loads((tmp_path / "partial" / "manifest.json").read_text())["complete"]
+
+    with pytest.raises(ValueError):
+        ColumnarWriter(tmp_path / "bad").append({"a": np.zeros(3), "b": np.zeros(4)})
+
+
+def test_cancelled_export_keeps_written_rows(tmp_path):
+    pipes, loads = random_designs(50)
+    designs = lifecycle.design_arrays(pipes, loads)
+    token = cancel_after(20)
+    ds = lifecycle.export_sweep(designs, tmp_path / "cancelled", chunk_size=10, progress=token)
+    assert len(ds) == 20 and ds.attrs["requested_rows"] == 50
+    assert np.array_equal(ds["od"], designs["od"][:20])
+
+
+RISERS_CSV = """name,od,wt,grade,design_pressure,shut_in_pressure,water_depth,fluid_type,fluid_sg
+Riser A,16,0.75,X-52,1400,1236,920,Multiphase,0.57
+Riser B,8.63,0.5,X-52,230,195,960,Oil,0.82
+"""
+
+
+def test_sweep_cli_writes_below_the_sweep_root(tmp_path, monkeypatch):
+    monkeypatch.setenv("RISER_SWEEP_ROOT", str(tmp_path / "sweeps"))
+    risers = tmp_path / "risers.csv"
+    risers.write_text(RISERS_CSV)
+    assert sweep.main([str(risers)]) == 0
+    assert sweep.main([str(risers), "--wt", "0.2", "1.5", "300", "-o", "runs/wt", "--chunk-size", "128"]) == 0
+    assert list_datasets(sweep_root()) == ["risers", "runs/wt"]
+
+    ds = open_dataset(sweep_root() / "runs" / "wt")
+    assert len(ds) == 600 and ds.complete and ds.attrs["risers"] == 2
+    assert np.array_equal(ds["wt"][:300], np.linspace(0.2, 1.5, 300))
+    fleet_sweep = open_dataset(sweep_root() / "risers")
+    assert fleet_sweep["wt"].tolist() == [0.75, 0.5]
+    assert sweep.main([str(risers), "--wt", "1.5", "0.2", "10"]) == 2
+    assert sweep.main([str(tmp_path / "missing.csv")]) == 2
+
+
+def test_datasets_are_confined_to_the_root(tmp_path):
+    root = tmp_path / "sweeps"
+    designs = lifecycle.design_arrays(*random_designs(5))
+    lifecycle.export_sweep(designs, root / "inside")
+    lifecycle.export_sweep(designs, tmp_path / "outside")
+    (root / "link").symlink_to(tmp_path / "outside")
+    assert resolve_dataset(root, "inside") == (root / "inside").resolve()
+    for name in ("../outside", "link", str(tmp_path / "outside"), "."):
+        with pytest.raises(ValueError):
+            resolve_dataset(root, name)
+
+
+def test_app_browses_sweeps_from_the_root(tmp_path, monkeypatch):
+    from streamlit.testing.v1 import AppTest
+
+    monkeypatch.setenv("RISER_SWEEP_ROOT", str(tmp_path))
+    designs = lifecycle.design_arrays(*random_designs(50))
+    ds = lifecycle.export_sweep(designs, tmp_path / "fleet")
+    at = AppTest.from_file(str(Path(__file__).parent.parent / "app.py"), default_timeout=60).run()
+    assert at.selectbox(key="sweep_dir").options == ["fleet"]
+    at.selectbox(key="sweep_dir").select("fleet").run()
+    at.checkbox(key="sweep_passing").check().run()
+    assert not at.exception
+    assert len(at.dataframe[-1].value) == int(ds["all_pass"].sum())
+    assert app.passing_rows(tmp_path / "fleet").tolist() == np.flatnonzero(ds["all_pass"]).tolist()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
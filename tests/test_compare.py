@@ -0,0 +1,100 @@
+"""
+Test script for the design alternative comparison (Compare tab of app.py)
+All alternatives must be evaluated in one engine call that agrees with the
+analyzer, laid out as aligned utilization columns with changes highlighted
+"""
+
+import math
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app
+from engine import lifecycle
+from engine.analyzer import LifeCycleAnalyzer
+from _designs import random_designs
+
+APP_PATH = str(Path(__file__).parent.parent / "app.py")
+
+
+def test_alternatives_replace_only_given_fields():
+    pipes, loads = random_designs(1, seed=5)
+    pipe, load = pipes[0], loads[0]
+    rows = [
+        {"Alternative": "Base"},
+        {"Alternative": "Base", "WT (in)": pipe.wt_in * 1.2, "Grade": "X-65", "Manufacturing": float("nan")},
+        {"Alternative": None, "Manufacturing": "DSAW", "Shut-in Location": "Top of Riser"},
+        {"Alternative": "Too thick", "WT (in)": pipe.od_in},
+    ]
+    names, alt_pipes, alt_loads, problems = app.alternative_designs(pipe, load, rows)
+    assert names == ["Base", "Base'", "Alternative 3"]
+    assert alt_pipes[0] == pipe and alt_loads[0] == load
+    assert alt_pipes[1] == replace(pipe, wt_in=pipe.wt_in * 1.2, grade="X-65", smys_psi=65000, uts_psi=78000)
+    assert alt_pipes[2].manufacturing == "DSAW" and alt_loads[2].shut_in_location == "Top of Riser"
+    assert len(problems) == 1 and problems[0].startswith("Too thick:")
+
+
+def test_comparison_matches_analyzer():
+    pipes, loads = random_designs(6, seed=21)
+    comparison = lifecycle.compare_designs(pipes, loads)
+    assert comparison["utilization"].shape == (6, len(lifecycle.PLAN), len(lifecycle.UTILIZATION_CHECKS))
+    for n, (pipe, load) in enumerate(zip(pipes, loads)):
+        expected = LifeCycleAnalyzer(pipe, load).run_all_conditions()
+        rows = [pos for stage in expected["conditions"].values()
+                for wt_data in stage.values() for pos in wt_data["positions"].values()]
+        for j, row in enumerate(rows):
+            sfs = [c["safety_factor"] for c in row["checks"]]
+            sfs += [row["longitudinal"]["safety_factor"], row["combined"]["safety_factor"]]
+            for sf, util in zip(sfs, comparison["utilization"][n, j]):
+                assert util == 0 if not math.isfinite(sf) else math.isclose(util, 1 / sf, rel_tol=1e-9)
+            assert bool(comparison["row_pass"][n, j]) == row["all_pass"]
+        assert bool(comparison["all_pass"][n]) == expected["all_conditions_pass"]
+
+
+def test_frames_align_and_highlight_changes():
+    pipes, loads = random_designs(1, seed=5)
+    pipe, load = pipes[0], loads[0]
+    names, alt_pipes, alt_loads, _ = app.alternative_designs(
+        pipe, load, [{"Alternative": "Base"}, {"Alternative": "Thin", "WT (in)": pipe.wt_in * 0.5}])
+    comparison = lifecycle.compare_designs(alt_pipes, alt_loads)
+
+    df = app.comparison_frame(comparison, names)
+    assert list(df.columns) == names and len(df) == len(lifecycle.PLAN) * len(lifecycle.UTILIZATION_CHECKS)
+    collapse = app.comparison_frame(comparison, names, "Collapse")
+    assert list(collapse.index) == lifecycle.PLAN_LABELS
+    assert np.allclose(collapse["Thin"], np.round(comparison["utilization"][1, :, 1] * 100, 1))
+
+    styles = app.comparison_styles(df)
+    assert (styles["Base"][df["Base"] < 100] == "").all()
+    higher = df["Thin"] >= df["Base"] + app.COMPARE_DIFF_PCT
+    assert higher.any() and styles["Thin"][higher & (df["Thin"] < 100)].str.contains("#fef3c7").all()
+    assert styles["Thin"][df["Thin"] >= 100].str.contains("font-weight").all()
+
+    summary = app.comparison_summary_frame(comparison, names)
+    assert list(summary.columns) == names and summary.loc["Status", "Base"] in ("PASS", "FAIL")
+
+
+def test_compare_tab_renders():
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=60).run()
+    next(b for b in at.button if b.label.startswith("🔍 Calculate")).click().run()
+    at.session_state["result_tabs"] = "Compare"
+    at.run()
+    compare = next(t for t in at.tabs if t.label == "Compare")
+    # alternatives editor, summary and utilization table
+    assert not at.exception and len(compare.dataframe) == 3
+
+    at.selectbox(key="compare_view").select("Collapse").run()
+    compare = next(t for t in at.tabs if t.label == "Compare")
+    assert not at.exception and len(compare.dataframe[2].value) == len(lifecycle.PLAN)
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
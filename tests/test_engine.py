@@ -0,0 +1,167 @@
+"""
+Test script for the shared vectorized engine (engine package)
+Checks engine.lifecycle against app.LifeCycleAnalyzer and engine.scenario
+against main.analyze_scenario
+"""
+
+import contextlib
+import io
+import json
+import math
+import subprocess
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import main as riser_main
+from engine.analyzer import LifeCycleAnalyzer
+from batch import runner
+from _designs import random_designs
+from calculations import calcs_bending, calcs_burst, calcs_collapse, calcs_hoop, calcs_propagation
+from engine import kernels, lifecycle, scenario as engine_scenario
+
+REFERENCE_DIR = Path(__file__).parent.parent / "reference_data"
+
+
+def test_lifecycle_matches_analyzer():
+    """All 16 sub-conditions agree with run_all_conditions for random designs"""
+    pipes, loads = random_designs(60)
+    result = lifecycle.evaluate_designs(lifecycle.design_arrays(pipes, loads))
+    summaries = lifecycle.summarize_designs(result)
+
+    for i, (pipe, load) in enumerate(zip(pipes, loads)):
+        expected = LifeCycleAnalyzer(pipe, load).run_all_conditions()
+        rows = [
+            pos_result
+            for stage_data in expected["conditions"].values()
+            for wt_data in stage_data.values()
+            for pos_result in wt_data["positions"].values()
+        ]
+        assert len(rows) == len(lifecycle.PLAN)
+        for j, row in enumerate(rows):
+            for check, sf in zip(row["checks"], result["safety_factor"][i, j]):
+                assert check["safety_factor"] == sf or math.isclose(check["safety_factor"], sf, rel_tol=1e-9)
+            assert row["limiting"]["name"] == lifecycle.CHECK_NAMES[result["limiting_index"][i, j]]
+            assert row["longitudinal"]["passes"] == bool(result["longitudinal_pass"][i, j])
+            assert row["combined"]["passes"] == bool(result["combined_pass"][i, j])
+            assert row["all_pass"] == bool(result["row_pass"][i, j])
+        assert expected["all_conditions_pass"] == summaries[i]["all_pass"]
+
+
+def test_utilization_sweep_matches_analyzer():
+    """Each sweep point agrees with run_all_conditions for the varied input"""
+    pipes, loads = random_designs(3, seed=11)
+    sweeps = {
+        "wt": ("wt_in", np.linspace(0.2, 1.5, 4)),
+        "water_depth_m": ("water_depth_m", np.linspace(0, 3000, 4)),
+        "design_pressure": ("design_pressure_psi", np.linspace(0, 6000, 4)),
+    }
+    for pipe, load in zip(pipes, loads):
+        for parameter, (field, values) in sweeps.items():
+            sweep = lifecycle.utilization_sweep(pipe, load, parameter, values)
+            assert sweep["utilization"].shape == (4, len(lifecycle.PLAN), len(lifecycle.UTILIZATION_CHECKS))
+            for i, value in enumerate(values):
+                if field == "wt_in":
+                    expected = LifeCycleAnalyzer(replace(pipe, wt_in=value), load).run_all_conditions()
+                else:
+                    expected = LifeCycleAnalyzer(pipe, replace(load, **{field: value})).run_all_conditions()
+                rows = [pos for stage in expected["conditions"].values()
+                        for wt_data in stage.values() for pos in wt_data["positions"].values()]
+                for j, row in enumerate(rows):
+                    sfs = [c["safety_factor"] for c in row["checks"]]
+                    sfs += [row["longitudinal"]["safety_factor"], row["combined"]["safety_factor"]]
+                    for sf, util in zip(sfs, sweep["utilization"][i, j]):
+                        assert util == 0 if not math.isfinite(sf) else math.isclose(util, 1 / sf, rel_tol=1e-9)
+                assert expected["all_conditions_pass"] == bool(sweep["all_pass"][i])
+            governing = sweep["utilization"].max(axis=1)
+            assert np.array_equal(sweep["governing"], governing)
+
+
+def test_kernels_match_scalar_calcs():
+    """The math-module scalar formulas in calculations/ equal the NumPy kernels"""
+    def close(scalar, array):
+        return math.isclose(scalar, float(array), rel_tol=1e-12)
+
+    rng = np.random.default_rng(3)
+    for _ in range(200):
+        od, smys, uts = rng.uniform(2, 36), rng.uniform(35, 80), rng.uniform(60, 100)
+        wt, E, nu = rng.uniform(0.05, 0.3) * od, rng.uniform(28e3, 30e3), rng.uniform(0.25, 0.35)
+        pressure, ovality = rng.uniform(0, 10), rng.uniform(0, 0.05)
+        assert close(calcs_burst.calculate_burst_pressure(od, wt, smys, uts)["burst_pressure"],
+                     kernels.burst_pressure(od, wt, smys, uts))
+        py, pe, pc = kernels.collapse_pressures(od, wt, smys, E, nu)
+        assert close(calcs_collapse.calculate_yield_collapse(od, wt, smys), py)
+        assert close(calcs_collapse.calculate_elastic_collapse(od, wt, E, nu), pe)
+        assert close(calcs_collapse.calculate_critical_collapse(float(py), float(pe))["critical_collapse"], pc)
+        assert close(calcs_propagation.calculate_propagation_pressure(od, wt, smys)["propagation_pressure"],
+                     kernels.propagation_pressure(od, wt, smys, coefficient=24, exponent=2.4))
+        assert close(calcs_hoop.calculate_hoop_stress_barlow(pressure, od, wt)["hoop_stress"],
+                     kernels.barlow_hoop_stress(pressure, od, wt))
+        assert close(calcs_bending.calculate_bending_strain_limit(od, wt, smys, E),
+                     kernels.bending_strain_limit(od, wt, smys, E))
+        assert close(calcs_bending.calculate_ovality_function(ovality), kernels.ovality_function(ovality))
+
+
+def test_scenario_summaries_match_main():
+    """Vectorized thickness grids reproduce the main.analyze_scenario summaries"""
+    for name in ["input_data.json", "riser_database.json"]:
+        data = json.load(open(REFERENCE_DIR / name))
+        project_info = data.get("project_info", {})
+        scenarios = data.get("scenarios") or list(data["risers"].values())
+        summaries = engine_scenario.summarize_scenarios([(s, project_info) for s in scenarios])
+
+        for scenario, summary in zip(scenarios, summaries):
+            with contextlib.redirect_stdout(io.StringIO()):
+                full = riser_main.analyze_scenario(scenario, project_info)
+            if full is None:
+                assert summary is None
+                continue
+            expected = runner.summarize_analysis(full)
+            assert summary["recommended_thickness"] == expected["recommended_thickness"]
+            assert summary["governing"]["check"] == expected["governing"]["check"]
+            for cond, checks in expected["utilizations"].items():
+                for check, util in checks.items():
+                    got = summary["utilizations"][cond][check]
+                    assert (util is None and got is None) or math.isclose(util, got, rel_tol=1e-9, abs_tol=1e-12)
+
+
+def test_bad_scenario_is_isolated():
+    good = json.load(open(REFERENCE_DIR / "input_data.json"))
+    items = [({"name": "broken"}, {}), (good["scenarios"][0], good["project_info"])]
+    bad, ok = engine_scenario.summarize_scenarios(items)
+    assert isinstance(bad, KeyError)
+    assert ok["scenario_name"] == good["scenarios"][0]["name"]
+
+
+def test_design_bending_strain_is_required():
+    # main.analyze_scenario has no default for loads.bending_strain; neither has the engine
+    data = json.load(open(REFERENCE_DIR / "input_data.json"))
+    scenario = json.loads(json.dumps(data["scenarios"][0]))
+    del scenario["loads"]["bending_strain"]
+    for analyze in (riser_main.analyze_scenario, engine_scenario.summarize_scenario):
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                analyze(scenario, data["project_info"])
+        except KeyError as e:
+            assert e.args == ("bending_strain",)
+        else:
+            raise AssertionError(f"{analyze.__name__} accepted a scenario without bending_strain")
+
+
+def test_analyzer_import_is_light():
+    # Worker processes import the analyzer (and app) without Streamlit/pandas
+    code = ("import sys, engine.analyzer, app; "
+            "print('streamlit' in sys.modules, 'pandas' in sys.modules)")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                         cwd=str(Path(__file__).parent.parent), check=True)
+    assert out.stdout.split() == ["False", "False"]
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
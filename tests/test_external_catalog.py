@@ -0,0 +1,131 @@
+"""
+Test script for external pipe catalogs (reference_data.external_catalog)
+A CSV copy of the ASME table must answer every asme_b36_10 query exactly
+like the built-in table once converted and memory-mapped
+"""
+
+import csv
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batch import cli
+from batch.cache import cache_key
+from reference_data import asme_b36_10, external_catalog, pipe_catalog
+
+REFERENCE_DIR = Path(__file__).parent.parent / "reference_data"
+
+
+@pytest.fixture(autouse=True)
+def builtin_catalog():
+    yield
+    asme_b36_10.use_catalog(None)
+
+
+def _write_asme_csv(path, grades=("X-52", "X-65")):
+    """The built-in table as a vendor CSV, one SKU per schedule and grade."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["SKU", "OD", "WT", "Schedule", "Grade", "SMYS_psi"])
+        for od, schedules in asme_b36_10.PIPE_SCHEDULE_DATA.items():
+            for name, wt in schedules.items():
+                for grade in grades:
+                    writer.writerow([f"P-{od}-{name}-{grade}", od, wt, name, grade, 52000])
+    return path
+
+
+def test_queries_match_builtin_table(tmp_path):
+    catalog = external_catalog.load_catalog(_write_asme_csv(tmp_path / "vendor.csv"))
+    assert len(catalog) == 2 * sum(len(s) for s in asme_b36_10.PIPE_SCHEDULE_DATA.values())
+
+    probes = [(od, wt) for od, s in asme_b36_10.PIPE_SCHEDULE_DATA.items() for wt in s.values()]
+    probes += [(8.63, 0.5), (6.63, 0.28), (7.0, 0.5), (10.75, 0.3655)]
+    builtin = [(asme_b36_10.get_standard_thicknesses(od), asme_b36_10.get_schedule_data(od),
+                asme_b36_10.get_schedule_for_thickness(od, wt),
+                asme_b36_10.get_schedule_for_thickness(od, wt, tolerance=0.05)) for od, wt in probes]
+    rows = [pipe_catalog.rows_for_od(od) for od, _ in probes]
+    sizes = asme_b36_10.get_available_od_sizes()
+
+    asme_b36_10.use_catalog(catalog)
+    assert asme_b36_10.get_available_od_sizes() == sizes
+    for (od, wt), expected, expected_rows in zip(probes, builtin, rows):
+        got = (asme_b36_10.get_standard_thicknesses(od), asme_b36_10.get_schedule_data(od),
+               asme_b36_10.get_schedule_for_thickness(od, wt),
+               asme_b36_10.get_schedule_for_thickness(od, wt, tolerance=0.05))
+        assert got[:2] == expected[:2]
+        assert sorted(got[2]) == sorted(expected[2]) and sorted(got[3]) == sorted(expected[3])
+        got_rows = pipe_catalog.rows_for_od(od)
+        assert np.array_equal(got_rows["wt"], expected_rows["wt"])
+        assert np.array_equal(got_rows["schedule_mask"], expected_rows["schedule_mask"])
+        assert np.allclose(got_rows["submerged_weight_plf"], expected_rows["submerged_weight_plf"])
+
+
+def test_binary_file_is_reused_and_rebuilt_when_csv_changes(tmp_path):
+    path = _write_asme_csv(tmp_path / "vendor.csv")
+    first = external_catalog.load_catalog(path)
+    assert isinstance(first.columns["wt"], np.memmap)
+    mtime = first.path.stat().st_mtime_ns
+
+    second = external_catalog.load_catalog(path)
+    assert second.path.stat().st_mtime_ns == mtime and second.fingerprint == first.fingerprint
+
+    with open(path, "a", newline="") as f:
+        f.write("P-NEW,31.5,0.75,,X-70,70000\n")
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+    third = external_catalog.load_catalog(path)
+    assert third.fingerprint != first.fingerprint
+    assert third.get_standard_thicknesses(31.5) == [0.75]
+    assert third.get_schedule_data(31.5) == {}
+    assert external_catalog.load_catalog(third.path).rows == third.rows   # binary opened directly
+
+
+def test_grade_filter_and_invalid_rows(tmp_path):
+    path = tmp_path / "vendor.csv"
+    path.write_text("od,wt,grade\n12.75,0.5,X-65\n12.75,0.375,X-52\n12.75,0.5,X-52\n")
+    catalog = external_catalog.load_catalog(path, cache_dir=tmp_path / "cache")
+    assert catalog.path.parent == tmp_path / "cache"
+    assert catalog.get_standard_thicknesses(12.75) == [0.375, 0.5]
+    assert catalog.get_standard_thicknesses(12.75, grade="X-65") == [0.5]
+
+    path.write_text("od,wt,schedule\n" + "".join(f"12.75,0.5,VENDOR-SCHEDULE-{i}\n" for i in range(3)))
+    rows = external_catalog.load_catalog(path, cache_dir=tmp_path / "cache").rows_for_od(12.75)
+    assert rows["schedules"][0] == "/".join(f"VENDOR-SCHEDULE-{i}" for i in range(3))   # not truncated
+
+    path.write_text("od,wt\n12.75,abc\n")
+    with pytest.raises(ValueError, match=":2:"):
+        external_catalog.load_catalog(path)
+    path.write_text("od,thickness\n12.75,0.5\n")
+    with pytest.raises(ValueError, match="'wt'"):
+        external_catalog.load_catalog(path)
+
+
+def test_batch_cli_uses_catalog(tmp_path):
+    path = tmp_path / "vendor.csv"
+    # A single wall thickness per OD
+    with open(path, "w") as f:
+        f.write("od,wt\n")
+        for od in asme_b36_10.PIPE_SCHEDULE_DATA:
+            f.write(f"{od},{od / 2.2:.4f}\n")
+    scenario = json.load(open(REFERENCE_DIR / "input_data.json"))["scenarios"][0]
+    plain_key = cache_key(scenario, {})
+
+    out = tmp_path / "out.jsonl"
+    assert cli.main([str(REFERENCE_DIR / "input_data.json"), "-w", "2", "--catalog", str(path),
+                     "-o", str(out)]) == 0
+    assert (tmp_path / "vendor.csv.cat").exists()
+    assert all("error" not in json.loads(line) for line in open(out))
+    assert cache_key(scenario, {}) != plain_key   # results keyed by the active catalog
+
+    assert cli.main([str(REFERENCE_DIR / "input_data.json"), "--catalog", str(tmp_path / "missing.csv"),
+                     "-o", str(out)]) == 2
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,127 @@
+"""
+Test script for bulk riser analysis (batch.fleet)
+Uploaded riser files must be validated row by row, summarized with the
+vectorized engine and streamed in full to gzip JSON Lines in input order
+"""
+
+import gzip
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app
+from batch import fleet
+from engine.analyzer import LifeCycleAnalyzer
+from _designs import cancel_after, random_fleet
+
+CSV = b"""name,od,wt,grade,design_pressure,shut_in_pressure,water_depth,fluid_type,fluid_sg,manufacturing
+Riser A,16,0.75,X-52,1400,1236,920,Multiphase,0.57,SMLS
+Riser B,8.63,0.5,X-52,230,195,960,Oil,0.82,
+Bad,16,9,X-99,abc,,920,Steam,0.5,SMLS
+"""
+
+
+def test_csv_rows_are_validated():
+    risers, rejected = fleet.parse_risers(CSV, "field.csv")
+    assert [name for name, _, _ in risers] == ["Riser A", "Riser B"]
+    assert risers[1][1].manufacturing == "SMLS" and risers[1][2].riser_length_m == 960
+    assert rejected == [{"row": 3, "name": "Bad", "errors": [
+        "grade: must be one of " + ", ".join(fleet.GRADE_PROPERTIES),
+        "fluid_type: must be one of Gas, Oil, Multiphase, Wet Gas",
+        "design_pressure: must be a number",
+        "shut_in_pressure: required",
+    ]}]
+
+
+def test_json_reference_risers_match_app_inputs():
+    data = json.dumps(app.TEAM8_REFERENCE).encode()
+    risers, rejected = fleet.parse_risers(data, "team8.json")
+    assert rejected == [] and [r[0] for r in risers] == list(app.TEAM8_REFERENCE)
+    name, pipe, load = risers[0]
+    ref = app.TEAM8_REFERENCE[name]
+    assert (pipe.od_in, pipe.wt_in, pipe.smys_psi, pipe.ovality) == (ref["od"], ref["wt"], 52000, ref["ovality"])
+    assert load.shut_in_pressure_psi == ref["shut_in_pressure"] and load.riser_length_m == ref["water_depth"]
+
+
+def test_summary_matches_analyzer():
+    risers = random_fleet(40)
+    summary = fleet.analyze_fleet(risers, chunk_size=16)
+    assert [r["name"] for r in summary] == [name for name, _, _ in risers]
+    for record, (_, pipe, load) in zip(summary, risers):
+        assert record["all_pass"] == LifeCycleAnalyzer(pipe, load).run_all_conditions()["all_conditions_pass"]
+    df = app.bulk_summary_frame(summary)
+    assert len(df) == 40 and df["Utilization (%)"].is_monotonic_decreasing
+
+
+def test_full_results_stream_in_order(tmp_path):
+    risers = random_fleet(fleet.INLINE_FULL_RESULTS_MAX + 10)   # large enough for the process pool
+    path = tmp_path / "full.jsonl.gz"
+    assert fleet.write_full_results(risers, path, workers=2) == len(risers)
+    with gzip.open(path, "rt") as f:
+        lines = f.read().splitlines()
+    assert lines == fleet.full_result_lines(risers)
+    first = json.loads(lines[0])
+    assert first["name"] == "R0" and len(first["result"]["conditions"]) == 3
+
+    run = fleet.FleetRun(risers[:30], tmp_path / "run.jsonl.gz")
+    run.progress = cancel_after(fleet.FULL_RESULTS_CHUNK)
+    assert len(run.run()) == 30 and run.written == fleet.FULL_RESULTS_CHUNK
+
+
+def test_app_shows_finished_bulk_run(tmp_path):
+    from concurrent.futures import Future
+    from streamlit.testing.v1 import AppTest
+
+    run = fleet.FleetRun(random_fleet(5), str(tmp_path / "run.jsonl.gz"))
+    future = Future()
+    future.set_result(run.run())
+
+    at = AppTest.from_file(str(Path(__file__).parent.parent / "app.py"), default_timeout=60)
+    at.session_state["bulk_job"] = (future, run)
+    at.run()
+    assert not at.exception
+    assert any(m.label == "Risers" and m.value == "5" for m in at.metric)
+    assert any(len(df.value) == 5 for df in at.dataframe)
+
+    # A running job shows its progress and the summary once it is ready
+    at.session_state["bulk_job"] = (Future(), run)
+    at.run()
+    assert not at.exception and len(at.get("progress")) == 1
+    assert any(b.label == "Cancel" for b in at.button)
+
+
+def test_full_results_download_parts(tmp_path):
+    path = tmp_path / "run.jsonl.gz"
+    data = os.urandom(2500)
+    path.write_bytes(data)
+    parts = app.download_parts(str(path), part_bytes=1000)
+    assert parts == [(0, 1000), (1000, 1000), (2000, 500)]
+    assert b"".join(app.read_part(str(path), *part) for part in parts) == data
+    assert app.download_parts(str(path)) == [(0, 2500)]
+    path.write_bytes(b"")
+    assert app.download_parts(str(path)) == [(0, 0)]
+
+
+def test_bulk_runs_clean_up_their_files():
+    runs = app.BulkRuns(workers=1, ttl_s=3600)
+    first = runs.start(random_fleet(300))
+    second = runs.start(random_fleet(3), previous=first)   # replaces the session's running job
+    second[0].result(timeout=60)   # one worker: the first run has stopped by now
+    assert first[1].progress.cancelled and not os.path.exists(first[1].path)
+    assert os.path.dirname(second[1].path) == runs.directory and os.path.getsize(second[1].path) > 0
+
+    assert runs.prune() == 0                   # finished, but not yet expired
+    runs.ttl_s = 0
+    time.sleep(0.01)
+    assert runs.prune() == 1 and not os.path.exists(second[1].path)
+    assert os.listdir(runs.directory) == []
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
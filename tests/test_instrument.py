@@ -0,0 +1,159 @@
+"""
+Test script for the hot-path instrumentation (engine.instrument)
+Nothing may be recorded while disabled; once enabled every check must be
+counted with consistent percentiles, cache hit rates and allocations, and
+the registry must be exportable from the CLI, the environment and the app
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batch import cache as result_cache
+from bench import profile, suite
+from engine import instrument
+from engine.analyzer import LifeCycleAnalyzer
+
+ROOT_DIR = Path(__file__).parent.parent
+APP_PATH = str(ROOT_DIR / "app.py")
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    instrument.disable()
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_disabled_records_nothing():
+    # disabled, the class holds the plain methods: no wrapper on the call path
+    assert not hasattr(LifeCycleAnalyzer.run_all_conditions, "__wrapped__")
+    assert not hasattr(LifeCycleAnalyzer.compute_burst, "__wrapped__")
+    LifeCycleAnalyzer(*suite.reference_riser()).run_all_conditions()
+    instrument.cache_lookup("test", hit=True)
+    snap = instrument.snapshot()
+    assert snap["enabled"] is False and snap["timers"] == {} and snap["caches"] == {}
+    assert "disabled" in instrument.format_table(snap)
+
+
+def test_counts_and_percentiles_per_check():
+    analyzer = LifeCycleAnalyzer(*suite.reference_riser())
+    instrument.enable()
+    assert LifeCycleAnalyzer.compute_burst.__wrapped__.__name__ == "compute_burst"
+    plain = analyzer.run_all_conditions()
+    analyzer.run_all_conditions()
+    timers = instrument.snapshot()["timers"]
+
+    # 2 analyses x 16 sub-conditions; burst runs for the pressure and hydrotest checks
+    assert timers["analyzer.run_all_conditions"]["count"] == 2
+    assert timers["analyzer.analyze_condition_at_position"]["count"] == 32
+    for check in ("compute_collapse", "compute_propagation", "compute_hoop", "calculate_combined_load"):
+        assert timers[f"analyzer.{check}"]["count"] == 32
+    for t in timers.values():
+        assert 0 < t["p50_us"] <= t["p95_us"] <= t["p99_us"] <= t["max_us"]
+    assert timers["analyzer.run_all_conditions"]["total_ms"] >= timers["analyzer.analyze_condition_at_position"]["total_ms"]
+    assert "alloc_peak_kib_mean" not in timers["analyzer.run_all_conditions"]
+
+    # Instrumented results are unchanged
+    instrument.disable()
+    assert analyzer.run_all_conditions() == plain
+    instrument.reset()
+    assert instrument.snapshot()["timers"] == {}
+
+
+def test_toggling_keeps_patched_methods(monkeypatch):
+    def patched(self):
+        return {}
+
+    monkeypatch.setattr(LifeCycleAnalyzer, "run_all_conditions", patched)
+    instrument.enable()
+    instrument.disable()
+    assert LifeCycleAnalyzer.run_all_conditions is patched
+
+
+def test_cache_hit_rates(tmp_path):
+    instrument.enable()
+    store = result_cache.ResultCache(tmp_path)
+    assert store.get("ab" * 32) is None
+    store.put("ab" * 32, {"value": 1})
+    store.get("ab" * 32)
+    store.get("ab" * 32)
+    instrument.cache_lookup("app.analysis")
+    instrument.cache_lookup("app.analysis")
+    instrument.cache_miss("app.analysis")
+    caches = instrument.snapshot()["caches"]
+    assert caches["batch.result_cache"] == {"lookups": 3, "hits": 2, "misses": 1, "hit_rate": 0.6667}
+    assert caches["app.analysis"]["hit_rate"] == 0.5
+    assert "batch.result_cache" in instrument.format_table()
+
+
+def test_allocations_per_analysis():
+    was_tracing = tracemalloc.is_tracing()
+    instrument.enable(allocations=True)
+    LifeCycleAnalyzer(*suite.reference_riser()).run_all_conditions()
+    t = instrument.snapshot()["timers"]["analyzer.run_all_conditions"]
+    assert 0 < t["alloc_peak_kib_mean"] <= t["alloc_peak_kib_max"]
+    assert "alloc_peak_kib_mean" not in instrument.snapshot()["timers"]["analyzer.compute_burst"]
+    instrument.disable()
+    assert tracemalloc.is_tracing() == was_tracing
+
+
+def test_disable_keeps_a_foreign_trace():
+    was_tracing = tracemalloc.is_tracing()
+    tracemalloc.start()   # e.g. python -X tracemalloc or the memory benchmark
+    try:
+        instrument.enable(allocations=True)
+        LifeCycleAnalyzer(*suite.reference_riser()).run_all_conditions()
+        instrument.disable()
+        assert tracemalloc.is_tracing()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+
+def test_profile_cli(tmp_path, capsys):
+    out = tmp_path / "profile.json"
+    assert profile.main(["-n", "3", "--json", str(out)]) == 0
+    assert "analyzer.compute_burst" in capsys.readouterr().out
+    doc = json.loads(out.read_text())
+    assert doc["risers"] == 3 and doc["timers"]["analyzer.run_all_conditions"]["count"] == 3
+    assert not instrument.enabled()
+    assert profile.main([str(tmp_path / "missing.csv")]) == 2
+
+
+def test_environment_enables_and_dumps(tmp_path):
+    code = ("from bench import suite\nfrom engine.analyzer import LifeCycleAnalyzer\n"
+            "LifeCycleAnalyzer(*suite.reference_riser()).run_all_conditions()\n")
+    env = dict(os.environ, RISER_INSTRUMENT="1", RISER_INSTRUMENT_FILE=str(tmp_path / "prof-{pid}.json"))
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, env=env, check=True)
+    (dump,) = tmp_path.glob("prof-*.json")
+    assert json.loads(dump.read_text())["timers"]["analyzer.run_all_conditions"]["count"] == 1
+
+
+def test_app_panel_renders():
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    st.cache_data.clear()   # other app tests may have cached the reference analysis
+    at = AppTest.from_file(APP_PATH, default_timeout=60).run()
+    at.checkbox(key="instrument_on").check().run()
+    next(b for b in at.button if b.label.startswith("🔍 Calculate")).click().run()
+    assert not at.exception
+    # the panel renders after the analysis: timers and cache tables include its calls
+    timers, caches = at.dataframe[-2].value, at.dataframe[-1].value
+    assert "analyzer.run_all_conditions" in set(timers["Timer"])
+    assert list(caches["Cache"]) == ["app.analysis"] and caches["Misses"][0] == 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
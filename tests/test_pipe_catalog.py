@@ -0,0 +1,74 @@
+"""
+Test script for the array-backed pipe catalog (reference_data.pipe_catalog)
+Checks the catalog against the ASME B36.10 dict API and the thickness sweep
+against per-design evaluation
+"""
+
+import math
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app
+from calculations import calcs_weight
+from engine import lifecycle
+from reference_data import asme_b36_10, pipe_catalog
+from _designs import random_designs
+
+CATALOG = pipe_catalog.CATALOG
+
+
+def test_catalog_matches_schedule_tables():
+    assert len(CATALOG) == sum(len(v) for v in asme_b36_10.PIPE_SCHEDULES.values())
+    for od in asme_b36_10.get_available_od_sizes():
+        rows = pipe_catalog.rows_for_od(od)
+        assert rows["wt"].tolist() == asme_b36_10.get_standard_thicknesses(od)
+        for row in rows:
+            wt = float(row["wt"])
+            assert row["schedules"] == "/".join(asme_b36_10.get_schedule_for_thickness(od, wt))
+            props = asme_b36_10.get_pipe_properties(od, wt)
+            assert math.isclose(row["area"], props["cross_section_area"], rel_tol=1e-12)
+            assert math.isclose(row["section_modulus"], props["section_modulus"], rel_tol=1e-12)
+    assert len(pipe_catalog.rows_for_od(8.63)) == len(pipe_catalog.rows_for_od(8.625))
+    assert len(pipe_catalog.rows_for_od(7.0)) == 0
+
+
+def test_weights_match_calcs_weight():
+    row = pipe_catalog.rows_for_od(16.0)[pipe_catalog.rows_for_od(16.0)["wt"] == 0.5][0]
+    weights = calcs_weight.calculate_pipe_weights(16.0, 0.5, 0.8)
+    assert round(float(row["weight_plf"]), 2) == weights["void_dry_weight_plf"]
+    assert round(float(row["submerged_weight_plf"]), 2) == weights["void_submerged_weight_plf"]
+
+
+def test_vectorized_filters():
+    rows = pipe_catalog.select(od_min=10, d_over_t_max=30)
+    expected = [(od, wt) for od, wts in asme_b36_10.PIPE_SCHEDULES.items() for wt in wts
+                if od >= 10 and od / wt <= 30]
+    assert sorted(zip(rows["od"].tolist(), rows["wt"].tolist())) == sorted(expected)
+
+    std = CATALOG[pipe_catalog.has_schedule(CATALOG, "STD")]
+    assert len(std) == sum("STD" in s for s in asme_b36_10.PIPE_SCHEDULE_DATA.values())
+    assert all("STD" in s.split("/") for s in std["schedules"])
+
+
+def test_thickness_sweep_matches_per_design_arrays():
+    pipes, loads = random_designs(5)
+    for pipe, load in zip(pipes, loads):
+        wts = pipe_catalog.rows_for_od(pipe.od_in)["wt"]
+        sweep = lifecycle.thickness_sweep_arrays(pipe, load, wts)
+        per_design = lifecycle.design_arrays([replace(pipe, wt_in=float(wt)) for wt in wts], load)
+        for key, column in per_design.items():
+            np.testing.assert_array_equal(sweep[key], column)
+
+        df = app.evaluate_standard_thicknesses(pipe, load)
+        assert df["WT (in)"].tolist() == wts.tolist()
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
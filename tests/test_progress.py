@@ -0,0 +1,78 @@
+"""
+Test script for progress reporting and cooperative cancellation
+(engine.progress) in the engine, the batch CLI and app.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app
+from batch import cli, runner
+from engine import lifecycle
+from engine.progress import ProgressToken, format_progress
+from _designs import cancel_after, random_designs
+
+REFERENCE_DIR = Path(__file__).parent.parent / "reference_data"
+
+
+def test_snapshot_rate_and_eta():
+    seen = []
+    token = ProgressToken(total=10, callback=seen.append, min_interval_s=0.0)
+    assert token.advance(4)
+    snap = token.snapshot()
+    assert snap["completed"] == 4 and snap["fraction"] == 0.4
+    assert snap["rate_per_s"] > 0 and snap["eta_s"] is not None
+    assert seen and seen[-1]["completed"] == 4
+    token.cancel()
+    assert not token.advance()
+    assert "cancelled" in format_progress(token.finish(), "design(s)")
+
+
+def test_cancelled_chunks_return_partial_prefix():
+    pipes, loads = random_designs(50)
+    designs = lifecycle.design_arrays(pipes, loads)
+    full = lifecycle.summarize_in_chunks(designs, chunk_size=10)
+    assert full == lifecycle.summarize_designs(lifecycle.evaluate_designs(designs))
+
+    token = cancel_after(20)
+    partial = lifecycle.summarize_in_chunks(designs, chunk_size=10, progress=token)
+    assert token.cancelled and partial == full[:20]
+
+
+def test_standard_thicknesses_report_progress():
+    pipes, loads = random_designs(1)
+    token = ProgressToken()
+    df = app.evaluate_standard_thicknesses(pipes[0], loads[0], progress=token)
+    assert token.total == len(df) and token.completed == len(df)
+
+    # advanced per chunk of thicknesses, so a cancelled evaluation stops part-way
+    chunk = max(1, len(df) // app.STANDARD_WT_PROGRESS_STEPS)
+    token = cancel_after(3)
+    partial = app.evaluate_standard_thicknesses(pipes[0], loads[0], progress=token)
+    assert token.cancelled and 3 <= len(partial) < 3 + chunk and len(partial) < len(df)
+    assert partial.equals(df.iloc[:len(partial)])
+
+
+def _units(n):
+    files = runner.expand_inputs([str(REFERENCE_DIR / "input_data.json")])
+    base = list(runner.iter_units(files))
+    return [dict(base[i % len(base)], index=i) for i in range(n)]
+
+
+def test_batch_run_cancels_with_partial_results():
+    for workers in (1, 2):
+        token = cancel_after(8)
+        records = list(cli.run_units(_units(200), workers=workers, chunk_size=4,
+                                     max_pending=8, progress=token))
+        assert token.cancelled
+        assert 8 <= len(records) < 200
+        assert token.completed == len(records)
+        assert all("error" not in r for r in records)
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
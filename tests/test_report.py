@@ -0,0 +1,95 @@
+"""
+Test script for the HTML design reports (batch.report)
+Every riser must get a self-contained report with the app's summary values
+and notes, written in input order by the process pool, plus a linked index
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app
+from batch import fleet, report
+from engine.analyzer import LifeCycleAnalyzer, build_verification_notes, format_safety_factor
+from _designs import cancel_after, random_fleet
+
+
+def _reference_risers():
+    risers, _ = fleet.parse_risers(json.dumps(app.TEAM8_REFERENCE).encode(), "team8.json")
+    return risers
+
+
+def test_report_holds_summary_and_notes():
+    name, pipe, load = _reference_risers()[0]
+    result = LifeCycleAnalyzer(pipe, load).run_all_conditions()
+    html = report.render_riser_report(name, pipe, load, result, generated="2024-01-01 00:00")
+
+    assert html.startswith("<!DOCTYPE html>") and "<link" not in html and "<script" not in html
+    assert "@page" in html and name in html
+    assert ("ALL CONDITIONS PASS" in html) == result["all_conditions_pass"]
+    for note in build_verification_notes(pipe, load, result):
+        assert f"<li>{note}</li>" in html
+    top = result["conditions"]["operation"]["with_tol_corr"]["positions"]["top"]
+    assert f"{top['wt_effective']:.4f}" in html
+    assert format_safety_factor(top["limiting"]["safety_factor"]) in html
+    assert html.count('<div class="condition">') == 16
+
+
+def test_names_are_escaped():
+    _, pipe, load = _reference_risers()[0]
+    html = report.render_riser_report("<b>A&B</b>", pipe, load)
+    assert "&lt;b&gt;A&amp;B&lt;/b&gt;" in html and "<b>A&B</b>" not in html
+    assert report.report_filename(7, "<b>A&B</b>") == "0007-b-a-b-b.html"
+    assert report.report_filename(8, "///") == "0008-riser.html"
+
+
+def test_pool_writes_reports_in_order(tmp_path):
+    risers = random_fleet(report.INLINE_REPORTS_MAX + 5)   # large enough for the process pool
+    rows = report.write_reports(risers, tmp_path, workers=2)
+    assert [row["name"] for row in rows] == [name for name, _, _ in risers]
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted([row["file"] for row in rows] + ["index.html"])
+
+    index = (tmp_path / "index.html").read_text(encoding="utf-8")
+    assert all(f'href="{row["file"]}"' in index for row in rows)
+    for row, (name, pipe, load) in zip(rows, risers):
+        assert row["all_pass"] == LifeCycleAnalyzer(pipe, load).run_all_conditions()["all_conditions_pass"]
+    assert name in (tmp_path / rows[-1]["file"]).read_text(encoding="utf-8")
+
+
+def test_cancelled_run_indexes_written_reports(tmp_path):
+    risers = random_fleet(15)
+    rows = report.write_reports(risers, tmp_path, progress=cancel_after(report.REPORT_CHUNK))
+    assert len(rows) == report.REPORT_CHUNK
+    assert len(list(tmp_path.glob("*.html"))) == report.REPORT_CHUNK + 1
+
+
+def test_cli_skips_rejected_rows(tmp_path):
+    src = tmp_path / "field.csv"
+    src.write_bytes(b"name,od,wt,grade,design_pressure,shut_in_pressure,water_depth,fluid_type,fluid_sg\n"
+                    b"Riser A,16,0.75,X-52,1400,1236,920,Multiphase,0.57\n"
+                    b"Bad,16,9,X-52,1400,1236,920,Multiphase,0.57\n")
+    assert report.main([str(src), "-o", str(tmp_path / "out")]) == 1
+    assert sorted(p.name for p in (tmp_path / "out").iterdir()) == ["0001-riser-a.html", "index.html"]
+
+
+
+def test_app_renders_the_report_only_for_a_download(monkeypatch):
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    calls = []
+    monkeypatch.setattr(report, "render_riser_report", lambda *args, **kwargs: calls.append(args) or "")
+    st.cache_data.clear()
+    at = AppTest.from_file(str(Path(__file__).parent.parent / "app.py"), default_timeout=60).run()
+    next(b for b in at.button if b.label.startswith("🔍 Calculate")).click().run()
+    assert not at.exception
+    assert "⬇️ Download HTML report" in [b.label for b in at.get("download_button")]
+    assert calls == []
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
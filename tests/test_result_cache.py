@@ -0,0 +1,143 @@
+"""
+Test script for the on-disk result cache (batch.cache)
+Checks key canonicalization, cached batch summaries, eviction and multi-process writes
+"""
+
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batch import cache as result_cache
+from batch import runner
+
+INPUT_FILE = Path(__file__).parent.parent / "reference_data" / "input_data.json"
+
+
+def test_key_is_canonical_and_versioned():
+    scenario = {"name": "A", "geometry": {"od_inches": 16.0, "wt": 0.5}}
+    reordered = {"geometry": {"wt": 0.5, "od_inches": 16.0}, "name": "A"}
+    info = {"water_density_seawater": 64.0}
+
+    key = result_cache.cache_key(scenario, info)
+    assert key == result_cache.cache_key(reordered, info)
+    assert key != result_cache.cache_key(scenario, {"water_density_seawater": 63.0})
+    assert key != result_cache.cache_key(scenario, info, kind="summary")
+    assert key != result_cache.cache_key(scenario, info, version="other-calc-version")
+    assert len(result_cache.calculation_version()) == 16
+
+
+def test_cached_summaries_match_computed(tmp_path):
+    units = list(runner.iter_units([INPUT_FILE]))
+    runner.configure_cache(str(tmp_path))
+    try:
+        first = [runner.run_unit(u) for u in units]
+        second = [runner.run_unit(u) for u in units]
+        stats = runner.get_cache().stats()
+    finally:
+        runner.configure_cache(None)
+
+    assert [r["cached"] for r in first] == [False] * len(units)
+    assert [r["cached"] for r in second] == [True] * len(units)
+    for a, b in zip(first, second):
+        for key in ("elapsed_ms", "cached"):
+            a.pop(key), b.pop(key)
+        assert a == b
+    assert stats["hits"] == len(units) and stats["misses"] == len(units)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_eviction_keeps_cache_within_budget(tmp_path, monkeypatch):
+    monkeypatch.setattr(result_cache, "EVICT_CHECK_INTERVAL", 1)
+    store = result_cache.ResultCache(tmp_path, max_bytes=4000)
+    payload = {"values": list(range(150))}   # ~600 bytes per entry
+    for i in range(40):
+        store.put(f"{i:064x}", payload)
+    assert store.size_bytes() <= 4000
+    assert store.evictions > 0
+    # The most recent entry always survives
+    assert store.get(f"{39:064x}") == payload
+
+
+def test_in_flight_writes_are_not_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(result_cache, "EVICT_CHECK_INTERVAL", 1)
+    store = result_cache.ResultCache(tmp_path, max_bytes=1000)
+    (tmp_path / "ab").mkdir()
+    in_flight = tmp_path / "ab" / ".tmp-writer.json"   # older writers used a .json suffix
+    in_flight.write_text("x" * 5000)
+    store.put("ab" * 32, {"value": 1})
+    assert store.size_bytes() < 1000 and store.evictions == 0
+    assert in_flight.exists()
+
+
+def _age(path, seconds):
+    old = path.stat().st_mtime - seconds
+    os.utime(path, (old, old))
+
+
+def test_stale_lock_is_broken_but_fresh_lock_is_kept(tmp_path):
+    store = result_cache.ResultCache(tmp_path, max_bytes=0)
+    store.put("ab" * 32, {"value": 1})
+    lock = tmp_path / ".evict.lock"
+    lock.write_text("other")
+    assert store.evict() == 0 and lock.exists()
+
+    _age(lock, result_cache.LOCK_STALE_SECONDS + 1)
+    assert store.evict() == 0 and not lock.exists()
+    assert store.evict() == 1
+
+
+def test_stale_lock_is_not_broken_twice(tmp_path):
+    # A second breaker must not delete the lock a new holder took after the first break
+    store = result_cache.ResultCache(tmp_path)
+    lock = tmp_path / ".evict.lock"
+    lock.write_text("new holder")
+    _age(lock, result_cache.LOCK_STALE_SECONDS + 1)
+    claim = tmp_path / ".evict.lock.break"
+    claim.write_text("first breaker")
+    store.evict()
+    assert lock.exists() and claim.exists()
+
+
+def test_release_keeps_lock_taken_by_another_process(tmp_path):
+    store = result_cache.ResultCache(tmp_path, max_bytes=0)
+    store.put("ab" * 32, {"value": 1})
+    lock = tmp_path / ".evict.lock"
+    real_entries = store._entries
+
+    def entries_then_relock():
+        lock.write_text("new holder")   # our lock was broken and re-taken mid-pass
+        return real_entries()
+
+    store._entries = entries_then_relock
+    assert store.evict() == 1
+    assert lock.read_text() == "new holder"
+
+
+def _write_same_keys(directory):
+    store = result_cache.ResultCache(directory)
+    for i in range(50):
+        store.put(f"{i:064x}", {"i": i, "pad": "x" * 200})
+        value = store.get(f"{(i * 7) % 50:064x}")
+        assert value is None or value["pad"] == "x" * 200
+    return store.writes
+
+
+def test_concurrent_processes_never_see_partial_entries(tmp_path):
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        writes = list(pool.map(_write_same_keys, [str(tmp_path)] * 4))
+    assert writes == [50] * 4
+    store = result_cache.ResultCache(tmp_path)
+    assert store.stats()["entries"] == 50
+    for path in tmp_path.glob("??/*.json"):
+        json.loads(path.read_text())
+    assert not list(tmp_path.glob("??/.tmp-*"))
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
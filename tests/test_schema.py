@@ -0,0 +1,92 @@
+"""
+Test script for scenario input validation (batch.schema)
+Every shipped scenario must validate; malformed scenarios must report all
+errors with paths and be diverted to the reject file by the batch CLI
+"""
+
+import copy
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batch import cli, schema
+
+REFERENCE_DIR = Path(__file__).parent.parent / "reference_data"
+
+
+def _scenario():
+    return json.load(open(REFERENCE_DIR / "input_data.json"))["scenarios"][0]
+
+
+def test_reference_scenarios_are_valid():
+    for name in ("input_data.json", "input_data_examples.json", "riser_database.json"):
+        data = json.load(open(REFERENCE_DIR / name))
+        scenarios = data.get("scenarios") or list(data.get("risers", {}).values())
+        for scenario in scenarios:
+            assert schema.validate_scenario(scenario, data.get("project_info")) == [], scenario["name"]
+
+
+def test_all_errors_reported_with_paths():
+    bad = copy.deepcopy(_scenario())
+    del bad["name"]
+    bad["type"] = "riser"
+    bad["geometry"]["od_inches"] = -4.5
+    bad["geometry"]["ovality"] = float("nan")
+    bad["material"] = "X-65"
+    bad["loads"]["design_internal_pressure_psi"] = "5000"
+    bad["loads"]["use_annulus_pressure"] = 1
+    bad["loads"]["design_external_pressure_psi"] = None   # nullable
+    assert schema.validate_scenario(bad, {"hydrotest_factor": 0}) == [
+        "name: required",
+        "type: must be one of Riser, Flowline, Pipeline",
+        "geometry.od_inches: must be > 0",
+        "geometry.ovality: must be finite",
+        "material: must be an object",
+        "loads.design_internal_pressure_psi: must be a number",
+        "loads.use_annulus_pressure: must be true or false",
+        "project_info.hydrotest_factor: must be > 0",
+    ]
+    assert schema.validate_scenario(None) == ["must be an object"]
+
+
+def test_validation_costs_microseconds():
+    scenario = _scenario()
+    n = 20000
+    start = time.perf_counter()
+    for _ in range(n):
+        schema.validate_scenario(scenario)
+    assert (time.perf_counter() - start) / n < 50e-6
+
+
+def test_batch_cli_rejects_invalid_and_runs_the_rest(tmp_path):
+    campaign = tmp_path / "campaign.jsonl"
+    good = _scenario()
+    bad = copy.deepcopy(good)
+    del bad["loads"]["bending_strain"]
+    bad["geometry"]["od_inches"] = 0
+    with open(campaign, "w") as f:
+        for scenario in (good, bad, good):
+            f.write(json.dumps(scenario) + "\n")
+
+    out, reject = tmp_path / "out.jsonl", tmp_path / "reject.jsonl"
+    assert cli.main([str(campaign), "-w", "1", "-o", str(out), "--reject", str(reject)]) == 1
+    records = [json.loads(line) for line in open(out)]
+    assert len(records) == 2 and all("error" not in r for r in records)
+    rejected = [json.loads(line) for line in open(reject)]
+    assert len(rejected) == 1 and rejected[0]["id"].endswith("#2")
+    assert rejected[0]["errors"] == ["geometry.od_inches: must be > 0", "loads.bending_strain: required"]
+    assert rejected[0]["scenario"] == bad
+
+    # Without --reject the invalid scenario becomes an error record with its errors
+    assert cli.main([str(campaign), "-w", "1", "-o", str(out)]) == 1
+    errors = [r for r in map(json.loads, open(out)) if "error" in r]
+    assert len(errors) == 1 and len(errors[0]["validation_errors"]) == 2
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
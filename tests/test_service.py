@@ -0,0 +1,147 @@
+"""
+Test script for the local analysis service (python -m service)
+Starts the server on a free localhost port and checks the endpoints,
+micro-batching and per-design error isolation
+"""
+
+import asyncio
+import http.client
+import json
+import math
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine import lifecycle
+from service.server import AnalysisService
+from _designs import random_designs
+
+
+class _RunningService:
+    """Run an AnalysisService on its own event loop thread."""
+
+    def __init__(self, **kwargs):
+        self.loop = asyncio.new_event_loop()
+        self.service = AnalysisService(**kwargs)
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.service.start("127.0.0.1", 0), self.loop).result(10)
+        return self
+
+    def __exit__(self, *exc):
+        asyncio.run_coroutine_threadsafe(self.service.stop(), self.loop).result(10)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(10)
+        self.loop.close()
+
+    def request(self, method, path, payload=None, conn=None):
+        own = conn is None
+        conn = conn or http.client.HTTPConnection("127.0.0.1", self.service.port, timeout=10)
+        body = None if payload is None else json.dumps(payload)
+        conn.request(method, path, body=body, headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+        data = json.loads(response.read())
+        if own:
+            conn.close()
+        return response.status, data
+
+
+def _payloads(n, seed=11):
+    pipes, loads = random_designs(n, seed=seed)
+    return pipes, loads, [{"pipe": asdict(p), "load": asdict(l)} for p, l in zip(pipes, loads)]
+
+
+def _same(a, b):
+    return (a is None and b is None) or math.isclose(a, b, rel_tol=1e-12)
+
+
+def test_health_and_errors():
+    with _RunningService() as running:
+        status, body = running.request("GET", "/health")
+        assert status == 200 and body["status"] == "ok" and body["version"]
+
+        assert running.request("GET", "/nope")[0] == 404
+        assert running.request("GET", "/analyze")[0] == 405
+        status, body = running.request("POST", "/analyze", {"pipe": {"od_in": 10.75}, "load": {}})
+        assert status == 400 and "Missing pipe field" in body["error"]
+
+
+def test_physically_invalid_designs_are_rejected():
+    _, _, payloads = _payloads(1)
+    pipe, load = payloads[0]["pipe"], payloads[0]["load"]
+    bad = [
+        ({**pipe, "od_in": 0}, load, "pipe.od_in: must be > 0"),
+        ({**pipe, "wt_in": 0}, load, "pipe.wt_in: must be > 0"),
+        ({**pipe, "wt_in": pipe["od_in"] / 2}, load, "pipe.wt_in: must be less than od_in / 2"),
+        (pipe, {**load, "design_pressure_psi": -100}, "load.design_pressure_psi: must be >= 0"),
+    ]
+    with _RunningService() as running:
+        for bad_pipe, bad_load, message in bad:
+            status, body = running.request("POST", "/analyze", {"pipe": bad_pipe, "load": bad_load})
+            assert status == 400 and message in body["error"]
+        designs = [{"pipe": p, "load": l} for p, l, _ in bad] + payloads
+        status, body = running.request("POST", "/batch", {"designs": designs})
+
+    assert status == 200 and body["count"] == 5 and body["errors"] == 4
+    for result, (_, _, message) in zip(body["results"], bad):
+        assert message in result["error"]
+    assert "all_pass" in body["results"][4]
+
+
+def test_concurrent_requests_are_batched_and_match_engine():
+    pipes, loads, payloads = _payloads(200)
+    expected = lifecycle.summarize_designs(
+        lifecycle.evaluate_designs(lifecycle.design_arrays(pipes, loads)))
+
+    with _RunningService(max_delay_s=0.005) as running:
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            responses = list(pool.map(lambda p: running.request("POST", "/analyze", p), payloads))
+        _, metrics = running.request("GET", "/metrics")
+
+    for (status, got), want in zip(responses, expected):
+        assert status == 200
+        assert got["all_pass"] == want["all_pass"]
+        assert got["limiting_condition"] == want["limiting_condition"]
+        assert _same(got["min_sf"], want["min_sf"])
+
+    assert metrics["designs"] == 200 and metrics["requests"] == 200
+    assert metrics["batches"] < 200  # concurrent requests shared engine calls
+
+
+def test_batch_endpoint_detail_and_isolation():
+    pipes, loads, payloads = _payloads(5)
+    payloads.insert(2, {"pipe": {**payloads[0]["pipe"], "wt_in": "thick"}, "load": payloads[0]["load"]})
+
+    with _RunningService() as running:
+        conn = http.client.HTTPConnection("127.0.0.1", running.service.port, timeout=10)
+        status, body = running.request("POST", "/batch", {"designs": payloads, "detail": True}, conn=conn)
+        # Same keep-alive connection serves the next request
+        status2, single = running.request("POST", "/analyze", payloads[0], conn=conn)
+        conn.close()
+
+    assert status == 200 and status2 == 200
+    assert body["count"] == 6 and body["errors"] == 1
+    assert "wt_in must be a number" in body["results"][2]["error"]
+
+    result = lifecycle.evaluate_designs(lifecycle.design_arrays(pipes, loads))
+    good = body["results"][:2] + body["results"][3:]
+    for i, record in enumerate(good):
+        assert len(record["conditions"]) == len(lifecycle.PLAN)
+        for j, row in enumerate(record["conditions"]):
+            assert row["condition"] == lifecycle.PLAN_LABELS[j]
+            assert row["pass"] == bool(result["row_pass"][i, j])
+            sf = float(result["safety_factor"][i, j, 0])
+            assert _same(row["burst_sf"], sf if math.isfinite(sf) else None)
+    assert "conditions" not in single and single["all_pass"] == good[0]["all_pass"]
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,115 @@
+"""
+Test script for the SQLite riser / results store (batch.store)
+Imports the 24-riser database, records batch runs and checks the indexed
+queries against the records themselves
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batch import cli, store
+
+REFERENCE_DIR = Path(__file__).parent.parent / "reference_data"
+RISER_DB = str(REFERENCE_DIR / "riser_database.json")
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    """Store with the riser database imported and analyzed twice via the CLI."""
+    db = tmp_path / "fleet.db"
+    out = tmp_path / "out.jsonl"
+    assert store.main([str(db), "import", RISER_DB]) == 0
+    for label in ("first", "rerun"):
+        assert cli.main([RISER_DB, "-w", "1", "--store", str(db), "--store-label", label,
+                         "-o", str(out)]) == 0
+    records = [json.loads(line) for line in open(out)]
+    with store.RiserStore(db) as s:
+        yield s, records
+
+
+def test_runs_accumulate_and_latest_is_default(fleet):
+    s, records = fleet
+    n = len(records)
+    assert s.stats()["risers"] == n and s.stats()["runs"] == 2 and s.stats()["results"] == 2 * n
+    assert len(s.query()) == n and {r["run_id"] for r in s.query()} == {2}
+    assert len(s.query(latest=False)) == 2 * n
+    history = s.history(records[0]["id"])
+    assert [r["run_id"] for r in history] == [1, 2]
+    assert s.get_riser(records[0]["id"])["name"] == records[0]["scenario_name"]
+
+
+def test_earlier_run_is_queryable(fleet, capsys):
+    s, records = fleet
+    n = len(records)
+    first = s.query(run_id=1)
+    assert len(first) == n and {r["run_id"] for r in first} == {1}
+    assert len(s.query(run_id=1, latest=False)) == n
+    assert store.main([s.path, "query", "--run", "1", "--min", "0"]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == len(s.query(run_id=1, min_utilization=0))
+
+
+def test_relative_and_absolute_paths_share_a_riser(tmp_path, monkeypatch):
+    monkeypatch.chdir(REFERENCE_DIR)
+    db = tmp_path / "fleet.db"
+    for path in ("riser_database.json", RISER_DB):
+        assert cli.main([path, "-w", "1", "--store", str(db), "-o", str(tmp_path / "out.jsonl")]) == 0
+    with store.RiserStore(db) as s:
+        assert s.stats()["risers"] == 24 and s.stats()["results"] == 48
+        assert [r["run_id"] for r in s.history("riser_database.json#1")] == [1, 2]
+        assert s.history(f"{RISER_DB}#1") == s.history("riser_database.json#1")
+
+
+def test_utilization_threshold_query(fleet):
+    s, records = fleet
+    expected = {r["id"] for r in records
+                if (r.get("utilizations", {}).get("operation", {}).get("burst") or 0) > 0.9}
+    hot = s.query(condition="operation", check="burst", min_utilization=0.9)
+    assert {r["id"] for r in hot} == expected and expected
+    assert all(r["utilization"] > 0.9 for r in hot)
+
+    governed = {r["id"] for r in records if (r.get("governing") or {}).get("check") == "burst"}
+    assert {r["id"] for r in s.query(governing_check="burst")} == governed
+
+    with pytest.raises(ValueError):
+        s.query(condition="operation", check="collapse")
+
+
+def test_riser_filters_use_indexes(fleet):
+    s, records = fleet
+    riser = s.risers()[0]
+    by_od = s.risers(od=riser["od"])
+    assert by_od and all(abs(r["od"] - riser["od"]) <= 0.01 for r in by_od)
+    deep = s.risers(min_depth=100.0)
+    assert all(r["depth_m"] >= 100.0 for r in deep)
+    graded = s.query(grade=riser["grade"])
+    assert graded and all(r["grade"] == riser["grade"] for r in graded)
+
+    plan = s.conn.execute("EXPLAIN QUERY PLAN SELECT * FROM utilizations "
+                          "WHERE condition = 'operation' AND check_name = 'collapse' "
+                          "AND utilization > 0.9").fetchall()
+    assert "utilizations_value" in " ".join(row["detail"] for row in plan)
+
+
+def test_bulk_insert_batches(tmp_path):
+    with store.RiserStore(tmp_path / "bulk.db") as s:
+        run_id = s.start_run("bulk")
+        records = [{"id": f"r{i}", "od": 10.75, "grade": "X-65", "all_pass": True,
+                    "governing": {"condition": "operation", "check": "hoop", "utilization": i / 5000},
+                    "utilizations": {"operation": {"hoop": i / 5000, "burst": None}}}
+                   for i in range(5000)]
+        sink = store.ResultSink(s, run_id, batch_size=700)
+        for record in records:
+            sink.add(record)
+        sink.flush()
+        assert sink.written == 5000 and s.stats()["utilizations"] == 10000
+        assert len(s.query(min_utilization=0.9)) == 499
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
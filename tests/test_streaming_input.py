@@ -0,0 +1,125 @@
+"""
+Test script for the constant-memory scenario readers (batch.streaming)
+Checks the incremental JSON parser against json.load and the JSON Lines reader
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batch import streaming
+
+REFERENCE_DIR = Path(__file__).parent.parent / "reference_data"
+
+
+def test_incremental_parser_matches_json_load(monkeypatch):
+    """Tiny chunks force every token to straddle a buffer boundary"""
+    monkeypatch.setattr(streaming, "CHUNK_SIZE", 7)
+    for name, collection in [("input_data.json", "scenarios"), ("riser_database.json", "risers")]:
+        path = REFERENCE_DIR / name
+        expected = json.load(open(path))
+        header = {}
+        streamed = list(streaming.iter_json_scenarios(path, header))
+
+        if collection == "scenarios":
+            assert [s for _, s in streamed] == expected["scenarios"]
+            assert header["project_info"] == expected["project_info"]
+        else:
+            assert dict(streamed) == expected["risers"]
+        print(f"  {name}: {len(streamed)} scenarios streamed")
+
+
+def test_top_level_array_and_single_object(tmp_path):
+    array_file = tmp_path / "array.json"
+    array_file.write_text(json.dumps([{"name": "a", "x": 1.25e3}, {"name": "b"}]))
+    assert [s["name"] for _, s in streaming.iter_scenarios(array_file)] == ["a", "b"]
+
+    single_file = tmp_path / "single.json"
+    single_file.write_text(json.dumps({"name": "only", "geometry": {"od_inches": 16.0}}))
+    assert list(streaming.iter_scenarios(single_file)) == [("0", {"name": "only", "geometry": {"od_inches": 16.0}})]
+
+
+def test_jsonl_reader_header_and_bad_lines(tmp_path):
+    path = tmp_path / "scenarios.jsonl"
+    path.write_text(
+        json.dumps({"project_info": {"water_density_seawater": 64.0}}) + "\n"
+        + json.dumps({"name": "one"}) + "\n\n"
+        + "{not json\n"
+        + json.dumps({"name": "two"}) + "\n"
+    )
+    header = {}
+    rows = list(streaming.iter_scenarios(path, header))
+    assert header["project_info"]["water_density_seawater"] == 64.0
+    assert [key for key, _ in rows] == ["2", "4", "5"]
+    assert isinstance(rows[1][1], json.JSONDecodeError)
+
+
+def test_malformed_element_fails_without_reading_on(monkeypatch):
+    """A bad element raises at once; only values cut off by the window read on"""
+    monkeypatch.setattr(streaming, "CHUNK_SIZE", 64)
+    good = json.dumps({"name": "ok", "notes": "x" * 200})
+    text = '{"scenarios": [' + good + ', {"name": "bad", "od": 16.0.5},' + ", ".join([good] * 10000) + "]}"
+    source = io.StringIO(text)
+    stream = streaming._StreamBuffer(source)
+    stream.expect("{")
+    assert stream.value() == "scenarios"
+    stream.expect(":")
+    rows = streaming._iter_array(stream)
+    assert next(rows)[1]["name"] == "ok"
+    try:
+        next(rows)
+    except json.JSONDecodeError:
+        pass
+    else:
+        raise AssertionError("malformed element was accepted")
+    assert source.tell() < 1000
+
+    monkeypatch.setattr(streaming, "MAX_VALUE_CHARS", 500)
+    stream = streaming._StreamBuffer(io.StringIO(good + "[" + ", ".join([good] * 100) + "]"))
+    assert stream.value()["name"] == "ok"
+    try:
+        stream.value()
+    except ValueError as e:
+        assert "exceeds 500 characters" in str(e)
+    else:
+        raise AssertionError("oversized value was buffered")
+
+
+def test_prefetch_is_bounded_and_propagates_errors():
+    produced = []
+
+    def source():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    reader = streaming.prefetch(source(), maxsize=4)
+    assert next(reader) == 0
+    # Reader thread may run ahead by at most the queue size (+1 in hand)
+    import time
+    time.sleep(0.2)
+    assert len(produced) <= 1 + 4 + 1
+    assert list(reader) == list(range(1, 100))
+
+    def failing():
+        yield 1
+        raise ValueError("broken input")
+
+    items = []
+    try:
+        for item in streaming.prefetch(failing(), maxsize=2):
+            items.append(item)
+    except ValueError as e:
+        assert str(e) == "broken input"
+    else:
+        raise AssertionError("reader error was not re-raised")
+    assert items == [1]
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,56 @@
+"""
+Test script for the utilization sweep charts in app.py
+Charts must be built from one engine sweep as WebGL traces and render in the
+Sweeps tab of the Streamlit app
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app
+from engine import lifecycle
+from _designs import random_designs
+
+APP_PATH = str(Path(__file__).parent.parent / "app.py")
+
+
+def test_figures_use_webgl_traces():
+    pipes, loads = random_designs(1)
+    pipe, load = pipes[0], loads[0]
+    low, high, current = app.sweep_range(pipe, load, "wt")
+    assert low < current < high < pipe.od_in / 2
+    sweep = lifecycle.utilization_sweep(pipe, load, "wt", np.linspace(low, high, 500))
+
+    fig = app.utilization_figure(sweep, "wt", current)
+    assert [t.name for t in fig.data] == list(lifecycle.UTILIZATION_CHECKS)
+    assert all(t.type == "scattergl" and len(t.x) == 500 for t in fig.data)
+    assert np.array_equal(fig.data[0].y, sweep["governing"][:, 0])
+
+    fig = app.utilization_figure(sweep, "wt", current, check="Collapse")
+    assert [t.name for t in fig.data] == lifecycle.PLAN_LABELS
+
+
+def test_sweeps_tab_renders():
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=60).run()
+    next(b for b in at.button if b.label.startswith("🔍 Calculate")).click().run()
+    at.session_state["result_tabs"] = "Sweeps"
+    at.run()
+    sweeps = next(t for t in at.tabs if t.label == "Sweeps")
+    assert not at.exception and len(sweeps.get("plotly_chart")) == 1
+
+    at.selectbox(key="chart_parameter").select("water_depth_m").run()
+    at.selectbox(key="chart_view").select("Combined").run()
+    sweeps = next(t for t in at.tabs if t.label == "Sweeps")
+    assert not at.exception and len(sweeps.get("plotly_chart")) == 1
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
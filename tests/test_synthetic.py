@@ -0,0 +1,97 @@
+"""
+Test script for the synthetic scenario generator (batch.synthetic)
+Generated scenarios must be valid, reproducible and prefix-stable, follow the
+fitted distributions, and load in main.py, the batch CLI and the bulk riser
+reader
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import main
+from batch import cli, fleet, runner, synthetic
+from batch.schema import validate_scenario
+from reference_data import asme_b36_10
+
+MODEL = synthetic.load_model()
+
+
+def test_valid_reproducible_and_prefix_stable():
+    scenarios = list(synthetic.iter_synthetic(MODEL, 2 * synthetic.BLOCK + 7, seed=5))
+    assert len(scenarios) == 2 * synthetic.BLOCK + 7
+    assert all(not validate_scenario(s, MODEL["project_info"]) for s in scenarios)
+    assert list(synthetic.iter_synthetic(MODEL, 100, seed=5)) == scenarios[:100]
+    assert list(synthetic.iter_synthetic(MODEL, 100, seed=6)) != scenarios[:100]
+    assert len({s["name"] for s in scenarios}) == len(scenarios)
+
+
+def test_follows_fitted_distributions():
+    assert MODEL["scenarios_fitted"] == 27     # 24 database risers + 3 input_data.json scenarios
+    scenarios = list(synthetic.iter_synthetic(MODEL, 5000, seed=1))
+    types = [s["type"] for s in scenarios]
+    for value, weight in zip(MODEL["type"]["values"], MODEL["type"]["weights"]):
+        assert abs(types.count(value) / len(types) - weight) < 0.03
+
+    standard_ods = set(asme_b36_10.get_available_od_sizes())
+    assert {s["geometry"]["od_inches"] for s in scenarios} <= standard_ods
+    loads = [s["loads"] for s in scenarios]
+    assert all(l["depth_hat_m"] >= l["depth_lat_m"] for l in loads)
+    assert all(abs(l["hydrotest_pressure_psi"] - 1.25 * l["design_internal_pressure_psi"]) < 0.01 for l in loads)
+    design = np.array([l["design_internal_pressure_psi"] for l in loads])
+    assert MODEL["design_pressure_psi"]["min"] <= design.min() and design.max() <= MODEL["design_pressure_psi"]["max"]
+
+
+def test_scenario_formats_load_in_main_and_batch(tmp_path):
+    path = tmp_path / "synthetic.jsonl"
+    assert synthetic.main(["-n", "20", "--seed", "2", "-o", str(path)]) == 0
+    units = list(runner.iter_file_units(path))
+    assert len(units) == 20 and units[0]["project_info"] == MODEL["project_info"]
+    out = tmp_path / "results.jsonl"
+    assert cli.main([str(path), "--output", str(out), "--no-progress"]) == 0
+    assert len(out.read_text().splitlines()) == 20
+
+    document = tmp_path / "synthetic.json"
+    assert synthetic.main(["-n", "5", "--seed", "2", "-o", str(document)]) == 0
+    data = json.loads(document.read_text())
+    assert data["scenarios"] == [u["scenario"] for u in units[:5]]
+    result = main.analyze_scenario(data["scenarios"][0], data["project_info"])
+    assert isinstance(result, dict)
+
+
+def test_riser_rows_load_as_bulk_risers():
+    buf = io.StringIO()
+    rows = synthetic.iter_synthetic(MODEL, 300, seed=4, kind="riser")
+    assert synthetic.write_synthetic(rows, buf, "csv") == 300
+    risers, rejected = fleet.parse_risers(buf.getvalue().encode(), "synthetic.csv")
+    assert len(risers) == 300 and rejected == []
+    assert all(pipe.wt_in in asme_b36_10.get_standard_thicknesses(pipe.od_in) for _, pipe, _ in risers)
+    summary = fleet.analyze_fleet(risers[:50])
+    assert len(summary) == 50 and any(r["all_pass"] for r in summary)
+
+
+def test_riser_rows_without_standard_thicknesses(monkeypatch):
+    # an active external catalog may not list a generated OD
+    monkeypatch.setattr(asme_b36_10, "get_standard_thicknesses", lambda od: None)
+    rows = list(synthetic.iter_synthetic(MODEL, 20, seed=4, kind="riser"))
+    assert all(r["wt"] == round(r["od"] / 20.0, 3) for r in rows)
+
+
+def test_cli_model_and_errors(tmp_path, capsys):
+    assert synthetic.main(["--show-model"]) == 0
+    assert json.loads(capsys.readouterr().out)["scenarios_fitted"] == 27
+    empty = tmp_path / "empty.json"
+    empty.write_text('{"scenarios": []}')
+    assert synthetic.main(["--source", str(empty)]) == 2
+    assert synthetic.main(["-n", "-1"]) == 2
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))